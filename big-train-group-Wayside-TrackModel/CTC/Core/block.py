@@ -64,6 +64,7 @@ class Block:
     Operational State:
         is_open (bool): Block open/closed status (True = open, False = closed)
         failed (bool): Block failure status (True = failed, False = operational)
+        statusVersion (int): Class-wide counter bumped on any open/failed change
         occupied (bool): Current occupation state
         occupyingTrain (object): Train currently in block
         authority (int): Current authority (0 or 1)
@@ -122,6 +123,10 @@ class Block:
             - __str__(), __repr__(): String representations for logging
     """
     
+    # Bumped whenever any block opens, closes, fails or is restored, so route
+    # tables can tell the set of operational blocks changed without scanning
+    statusVersion = 0
+    
     def __init__(self, track_block_data):
         """
         Initialize Block with data from Track Reader
@@ -318,6 +323,7 @@ class Block:
         self.is_open = open
         
         if old_status != open:
+            Block.statusVersion += 1
             status_text = "opened" if open else "closed"
             logger.info(f"Block {self.blockID} {status_text}")
     
@@ -333,6 +339,7 @@ class Block:
         self.failed = failed
         
         if old_status != failed:
+            Block.statusVersion += 1
             if failed:
                 reason_text = f" ({reason})" if reason else ""
                 logger.error(f"Block {self.blockID} failed{reason_text}")
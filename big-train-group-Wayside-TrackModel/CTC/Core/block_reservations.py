@@ -0,0 +1,230 @@
+"""
+Block Reservations Module
+========================
+Space-time reservation table for CTC blocks.
+
+This module handles:
+- Deriving per-block occupancy intervals from a route's traversal times
+- Storing the intervals per block in arrays sorted by start time
+- Answering "is this block free during [t1, t2]?" and "which trains conflict?"
+
+Each block keeps its reservations sorted by start time together with the
+longest reservation stored for it. Any interval that overlaps [t1, t2] must
+start between t1 - longest and t2, so a query is two binary searches plus the
+handful of candidates between them: O(log n + k) for n reservations on the
+block and k candidates.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+import logging
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def route_block_intervals(route, base_time: datetime, margin: timedelta = timedelta(0)) -> List[Tuple[Tuple[str, int], datetime, datetime]]:
+    """
+    Get the time interval a route occupies each of its remaining blocks
+
+    Args:
+        route: Route with blockSequence and cumulativeTime prefix sums
+        base_time: Time the train is at the start of its current block
+        margin: Padding added before and after every interval
+
+    Returns:
+        List of ((line, block_id), start, end) from the route's current block on
+    """
+    block_sequence = getattr(route, 'blockSequence', None)
+    if not block_sequence:
+        return []
+
+    cumulative_time = route.get_cumulative_times()
+    current_index = min(getattr(route, 'currentBlockIndex', 0), len(block_sequence))
+    offset = cumulative_time[current_index]
+
+    intervals = []
+    for i in range(current_index, len(block_sequence)):
+        block = block_sequence[i]
+        key = (getattr(block, 'line', None), block.blockID)
+        start = base_time + timedelta(seconds=cumulative_time[i] - offset) - margin
+        end = base_time + timedelta(seconds=cumulative_time[i + 1] - offset) + margin
+        intervals.append((key, start, end))
+    return intervals
+
+
+class BlockReservationTable:
+    """
+    Per-block sorted time intervals reserved by scheduled and running trains.
+
+    Attributes:
+        margin (timedelta): Padding added around every route interval
+        blockReservations (Dict[Tuple[str, int], List[Tuple[datetime, datetime, str]]]):
+            (line, block) -> reservations (start, end, train_id) sorted by start
+        blockStarts (Dict[Tuple[str, int], List[datetime]]): (line, block) -> sorted start times
+        longestReservation (Dict[Tuple[str, int], timedelta]): (line, block) -> longest stored reservation
+        trainBlocks (Dict[str, Set[Tuple[str, int]]]): Train ID -> blocks it has reservations on
+    """
+
+    def __init__(self, margin: timedelta = timedelta(0)):
+        self.margin = margin
+        self.blockReservations = {}
+        self.blockStarts = {}
+        self.longestReservation = {}
+        self.trainBlocks = {}
+
+    # === Updating reservations ===
+
+    def reserve(self, key: Tuple[str, int], train_id: str, start: datetime, end: datetime) -> None:
+        """
+        Add one reservation of a block
+
+        Args:
+            key: (line, block_id)
+            train_id: Train holding the reservation
+            start: Reservation start time
+            end: Reservation end time (not before start)
+        """
+        reservations = self.blockReservations.setdefault(key, [])
+        starts = self.blockStarts.setdefault(key, [])
+        index = bisect_right(starts, start)
+        starts.insert(index, start)
+        reservations.insert(index, (start, end, train_id))
+
+        duration = end - start
+        if duration > self.longestReservation.get(key, timedelta(0)):
+            self.longestReservation[key] = duration
+        self.trainBlocks.setdefault(train_id, set()).add(key)
+
+    def reserve_route(self, train_id: str, route, base_time: datetime) -> int:
+        """
+        Replace a train's reservations with the intervals of its route
+
+        Args:
+            train_id: Train following the route
+            route: Route to reserve
+            base_time: Time the train is at the start of its current block
+
+        Returns:
+            Number of block reservations made
+        """
+        self.release(train_id)
+        intervals = route_block_intervals(route, base_time, self.margin)
+        for key, start, end in intervals:
+            self.reserve(key, train_id, start, end)
+        logger.debug(f"Reserved {len(intervals)} block intervals for train {train_id}")
+        return len(intervals)
+
+    def release(self, train_id: str) -> None:
+        """
+        Remove every reservation held by a train
+
+        Args:
+            train_id: Train whose reservations are removed
+        """
+        for key in self.trainBlocks.pop(train_id, ()):
+            kept = [entry for entry in self.blockReservations.get(key, ()) if entry[2] != train_id]
+            if kept:
+                self.blockReservations[key] = kept
+                self.blockStarts[key] = [entry[0] for entry in kept]
+                self.longestReservation[key] = max(entry[1] - entry[0] for entry in kept)
+            else:
+                self.blockReservations.pop(key, None)
+                self.blockStarts.pop(key, None)
+                self.longestReservation.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all reservations"""
+        self.blockReservations.clear()
+        self.blockStarts.clear()
+        self.longestReservation.clear()
+        self.trainBlocks.clear()
+
+    # === Queries ===
+
+    def get_overlapping(self, key: Tuple[str, int], start: datetime, end: Optional[datetime] = None,
+                        ignore_train: str = None) -> List[Tuple[datetime, datetime, str]]:
+        """
+        Get reservations of a block that overlap [start, end]
+
+        Args:
+            key: (line, block_id)
+            start: Query start time
+            end: Query end time, or None for an open-ended query
+            ignore_train: Optional train whose own reservations are skipped
+
+        Returns:
+            Overlapping reservations (start, end, train_id) sorted by start
+        """
+        starts = self.blockStarts.get(key)
+        if not starts:
+            return []
+        reservations = self.blockReservations[key]
+        first = bisect_left(starts, start - self.longestReservation[key])
+        last = len(starts) if end is None else bisect_right(starts, end)
+
+        return [
+            entry for entry in reservations[first:last]
+            if entry[1] >= start and entry[2] != ignore_train
+        ]
+
+    def is_free(self, key: Tuple[str, int], start: datetime, end: Optional[datetime] = None,
+                ignore_train: str = None) -> bool:
+        """
+        Check whether a block has no reservations during [start, end]
+
+        Args:
+            key: (line, block_id)
+            start: Query start time
+            end: Query end time, or None for "from start onwards"
+            ignore_train: Optional train whose own reservations are ignored
+
+        Returns:
+            True if no other train has the block reserved in the interval
+        """
+        return not self.get_overlapping(key, start, end, ignore_train)
+
+    def find_conflicts(self, key: Tuple[str, int], start: datetime, end: Optional[datetime] = None,
+                       ignore_train: str = None) -> List[str]:
+        """
+        Get the trains holding reservations of a block during [start, end]
+
+        Args:
+            key: (line, block_id)
+            start: Query start time
+            end: Query end time, or None for "from start onwards"
+            ignore_train: Optional train whose own reservations are ignored
+
+        Returns:
+            Conflicting train IDs in order of their reservation start
+        """
+        trains = []
+        for _, _, train_id in self.get_overlapping(key, start, end, ignore_train):
+            if train_id not in trains:
+                trains.append(train_id)
+        return trains
+
+    def find_route_conflicts(self, train_id: str, route, base_time: datetime) -> Dict[Tuple[str, int], List[str]]:
+        """
+        Get the other trains whose reservations overlap a route's block intervals
+
+        Args:
+            train_id: Train that would follow the route (its own reservations are ignored)
+            route: Route to check
+            base_time: Time the train is at the start of its current block
+
+        Returns:
+            (line, block_id) -> conflicting train IDs, only for blocks with conflicts
+        """
+        conflicts = {}
+        for key, start, end in route_block_intervals(route, base_time, self.margin):
+            trains = self.find_conflicts(key, start, end, ignore_train=train_id)
+            if trains:
+                conflicts.setdefault(key, [])
+                conflicts[key].extend(t for t in trains if t not in conflicts[key])
+        return conflicts
+
+    def get_train_blocks(self, train_id: str) -> Set[Tuple[str, int]]:
+        """Get the blocks a train currently holds reservations on"""
+        return set(self.trainBlocks.get(train_id, ()))
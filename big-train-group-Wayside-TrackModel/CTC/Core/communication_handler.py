@@ -29,6 +29,10 @@ CTC → Wayside Communication:
 - Each controller receives full line information but only acts on blocks they manage
 - Controllers use their blocksCovered boolean list to filter relevant commands
 - This ensures all controllers have full situational awareness
+- Routine train updates are sent as sparse (block, speed, authority, target,
+  station, distance) tuples holding only the entries that differ from the last
+  command set sent to that controller; controllers without command_train_delta()
+  still receive full line arrays
 
 Wayside → CTC Communication:
 - Wayside controllers only send data for blocks they manage
@@ -50,12 +54,18 @@ import threading
 import logging
 import time
 
+from .route import Route
+from .event_scheduler import EventScheduler
+
 # Import simulation time (lazy import to avoid circular dependencies)
 # from Master_Interface.master_control import get_time
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Simulated seconds between successive yard departure commands
+DEPARTURE_COMMAND_INTERVAL = timedelta(seconds=2)
+
 
 def _get_simulation_time():
     """Get simulation time with lazy import to avoid circular dependencies"""
@@ -100,18 +110,27 @@ class CommunicationHandler:
         message_queue (Queue): Thread-safe message processing queue
         throughput_by_line (Dict[str, int]): Throughput tracking by line
         
+    Timed Command Sequences:
+        eventScheduler (EventScheduler): Sim-time scheduler for delayed commands (shared with CTCSystem)
+        departureCommandEvents (Dict[str, List[ScheduledEvent]]): Train ID -> pending departure commands
+        lastCommandSets (Dict[WaysideController, Dict[int, tuple]]): Controller -> command set it last received
+        
     Methods Overview:
         Wayside Integration:
             - provide_wayside_controller(controller, blocksCovered, redLine): Register controllers
             - update_occupied_blocks(occupiedBlocks, sender): Receive occupation updates
             - update_switch_positions(switchPositions, sender): Receive switch updates
             - update_railway_crossings(railwayCrossings, sender): Receive crossing updates
+            - update_occupied_blocks_delta(changedBlocks, sender): Receive changed occupation entries only
+            - update_switch_positions_delta(changedSwitches, sender): Receive changed switch entries only
+            - update_railway_crossings_delta(changedCrossings, sender): Receive changed crossing entries only
             
         Command Distribution:
             - send_train_commands(speeds, authorities, blocks, flags, stations, distances): Send block-specific commands
             - send_train_commands_for_route(train_id, route): Send commands for newly routed trains
             - send_departure_commands(train_id, route): Send yard departure sequences
             - send_updated_train_commands(line): Send batched updates for line
+            - send_train_command_set(line, commands): Send only the command entries each controller is missing
             
         Switch & Infrastructure Control:
             - command_switch(controller, switchPositions): Send switch commands
@@ -219,9 +238,22 @@ class CommunicationHandler:
             }
         }
         
+        # Controllers whose own full snapshot has seeded the line state, per data type
+        self.snapshotControllers = {'occupied': set(), 'switches': set(), 'crossings': set()}
+        
         # Basic train tracking - simplified
         self.active_train_routes = {}      # Dict[str, Route] - train_id -> route for switch calculation
         
+        # Timed command sequences run from the sim-time scheduler instead of one
+        # thread per train. CTCSystem replaces this with its own scheduler, which
+        # system_tick drives, so sequences follow pause and the time multiplier.
+        self.eventScheduler = EventScheduler()
+        self.departureCommandEvents = {}   # Dict[str, List[ScheduledEvent]] - train_id -> pending commands
+        
+        # Command set each controller last received, indexed by current block:
+        # {block: (speed, authority, target_block, next_station, blocks_away)}
+        self.lastCommandSets = {}          # Dict[WaysideController, Dict[int, tuple]]
+        
         # Yard connection data removed - now managed by CTC system
         
         # Throughput tracking by line
@@ -241,65 +273,43 @@ class CommunicationHandler:
     
     # Methods from UML
     
-    def _reassemble_line_state(self, data_type: str, line_name: str) -> List[bool]:
+    def _store_controller_snapshot(self, data_type: str, line_name: str, values: List[bool],
+                                   sending_controller) -> bool:
         """
-        Reassemble complete line state from all controllers for that line.
+        Copy the blocks a controller manages from its full snapshot into the stored line state
+        
+        Only the sender's own published values are stored, so the baseline its
+        later deltas are compared against is exactly what it last sent.
         
         Args:
             data_type: Type of data ('occupied', 'switches', 'crossings')
             line_name: Line name ('Red' or 'Green')
+            values: Block-length array published by the controller
+            sending_controller: Controller that sent the snapshot
             
         Returns:
-            Complete line state array assembled from all controllers on that line
+            True if this is the controller's first snapshot or any managed block changed
         """
-        # Get line length
-        line_length = self._get_line_length(line_name)
-        if line_length <= 0:
-            return []
+        blocks_covered = self.controller_block_coverage.get(sending_controller, [])
+        line_state = self.previous_line_states.setdefault(line_name, {}).get(data_type)
+        if line_state is None:
+            line_state = [False] * len(blocks_covered)
+            self.previous_line_states[line_name][data_type] = line_state
         
-        # Initialize line state array
-        line_state = [False] * line_length
+        seeded = self.snapshotControllers.setdefault(data_type, set())
+        has_changes = sending_controller not in seeded
+        seeded.add(sending_controller)
         
-        # Collect data from all controllers on this line
-        for controller in self.wayside_controllers:
-            # Determine controller's line
-            controller_line = None
-            if hasattr(controller, 'redLine'):
-                controller_line = 'Red' if controller.redLine else 'Green'
-            else:
-                # Try to determine from controller ID
-                controller_id = getattr(controller, 'controller_id', '')
-                if 'Red' in controller_id:
-                    controller_line = 'Red'
-                else:
-                    controller_line = 'Green'  # Default
-            
-            # Skip controllers not on this line
-            if controller_line != line_name:
-                continue
-            
-            # Get controller's block coverage
-            if controller not in self.controller_block_coverage:
+        for block_number, covers_block in enumerate(blocks_covered):
+            if not covers_block or block_number >= len(values):
                 continue
-            
-            blocks_covered = self.controller_block_coverage[controller]
-            
-            # Get controller's current data based on data type
-            controller_data = None
-            if data_type == 'occupied':
-                controller_data = getattr(controller, 'block_occupancy', None)
-            elif data_type == 'switches':
-                controller_data = getattr(controller, 'switch_positions', None)
-            elif data_type == 'crossings':
-                controller_data = getattr(controller, 'railroad_crossings', None)
-            
-            # Merge controller's data into line state
-            if controller_data and len(controller_data) == len(blocks_covered):
-                for i, (covers_block, data_value) in enumerate(zip(blocks_covered, controller_data)):
-                    if covers_block and i < line_length:
-                        line_state[i] = data_value
-        
-        return line_state
+            if block_number >= len(line_state):
+                line_state.extend([False] * (block_number + 1 - len(line_state)))
+            value = bool(values[block_number])
+            if line_state[block_number] != value:
+                line_state[block_number] = value
+                has_changes = True
+        return has_changes
     
     def update_occupied_blocks(self, occupiedBlocks: List[bool], sending_controller=None) -> None:
         """
@@ -327,39 +337,14 @@ class CommunicationHandler:
             logger.warning(f"Could not determine line for controller {controller_id}")
             return
         
-        # Reassemble complete line state from all controllers on this line
-        current_line_state = self._reassemble_line_state('occupied', line_name)
-        previous_line_state = self.previous_line_states[line_name]['occupied']
-        
-        # Check for changes in the complete line state
-        has_changes = False
-        if previous_line_state is None:
-            # First time receiving data - treat as change
-            has_changes = True
-        elif len(current_line_state) != len(previous_line_state):
-            # Array length changed - treat as change
-            has_changes = True
-        else:
-            # Compare line occupation states
-            for i, (current, previous) in enumerate(zip(current_line_state, previous_line_state)):
-                if current != previous:
-                    has_changes = True
-                    break
+        # Store this controller's own snapshot as the baseline for its later deltas
+        has_changes = self._store_controller_snapshot('occupied', line_name, occupiedBlocks, sending_controller)
         
-        # Only show debug output when the complete line state has changed
-        if has_changes:
-            occupied_count = sum(current_line_state) if current_line_state else 0
-            occupied_blocks = [i for i, occupied in enumerate(current_line_state) if occupied] if current_line_state else []
-            
-            print(f"[CTC_DEBUG] WAYSIDE DATA CHANGED: update_occupied_blocks()")
-            print(f"  Line: {line_name}")
-            print(f"  Controller: {controller_id}")
-            print(f"  Total blocks: {len(current_line_state) if current_line_state else 0}")
-            print(f"  Occupied count: {occupied_count}")
-            print(f"  Occupied blocks: {occupied_blocks[:10]}{'...' if len(occupied_blocks) > 10 else ''}")
-            
-            # Store current line state for next comparison
-            self.previous_line_states[line_name]['occupied'] = current_line_state.copy() if current_line_state else []
+        if has_changes and logger.isEnabledFor(logging.DEBUG):
+            line_state = self.previous_line_states[line_name]['occupied']
+            occupied_blocks = [i for i, occupied in enumerate(line_state) if occupied]
+            logger.debug(f"Wayside occupancy changed on {line_name} line (controller {controller_id}): "
+                         f"{len(occupied_blocks)} occupied {occupied_blocks[:10]}{'...' if len(occupied_blocks) > 10 else ''}")
         
         message = {
             'type': 'occupied_blocks_update',
@@ -421,54 +406,16 @@ class CommunicationHandler:
         # Determine line name from controller
         line_name = "Red" if getattr(sending_controller, 'redLine', False) else "Green"
         
-        # Reassemble complete line state from all controllers on this line
-        current_line_state = self._reassemble_line_state('switches', line_name)
-        
-        # Get previous line state for comparison
-        previous_line_state = self.previous_line_states[line_name]['switches']
+        # Store this controller's own snapshot as the baseline for its later deltas
+        has_changes = self._store_controller_snapshot('switches', line_name, switchPositions, sending_controller)
         
-        # Check for changes at line level
-        has_changes = False
-        if not previous_line_state:
-            # First time receiving data for this line - treat as change
-            has_changes = True
-        elif len(current_line_state) != len(previous_line_state):
-            # Array length changed - treat as change
-            has_changes = True
-        else:
-            # Compare line states
-            for i, (current, previous) in enumerate(zip(current_line_state, previous_line_state)):
-                if current != previous:
-                    has_changes = True
-                    break
-        
-        # Only show debug output when line state changes are detected
-        if has_changes:
-            # Filter to only show blocks that both have switches AND are active
-            active_switches_with_infrastructure = self._get_blocks_with_infrastructure_and_state(
-                current_line_state, sending_controller, 'switchPresent'
+        if has_changes and logger.isEnabledFor(logging.DEBUG):
+            # Only show blocks that both have switches AND are active
+            active_switches = self._get_blocks_with_infrastructure_and_state(
+                self.previous_line_states[line_name]['switches'], sending_controller, 'switchPresent'
             )
-            
-            # Get total switches for reference
-            total_switches = 0
-            if self.ctc_system and sending_controller:
-                for i in range(len(current_line_state) if current_line_state else 0):
-                    try:
-                        block = self.ctc_system.get_block_by_line_new(line_name, i)
-                        if block and hasattr(block, 'switchPresent') and getattr(block, 'switchPresent'):
-                            total_switches += 1
-                    except:
-                        pass
-            
-            print(f"[CTC_DEBUG] WAYSIDE DATA CHANGED: update_switch_positions()")
-            print(f"  Line: {line_name}")
-            print(f"  Controller: {controller_id}")
-            print(f"  Switch array length: {len(current_line_state) if current_line_state else 0}")
-            print(f"  Active switches: {len(active_switches_with_infrastructure)}/{total_switches}")
-            print(f"  Active switch blocks: {active_switches_with_infrastructure}")
-            
-            # Store current line state for next comparison
-            self.previous_line_states[line_name]['switches'] = current_line_state.copy() if current_line_state else []
+            logger.debug(f"Wayside switch positions changed on {line_name} line (controller {controller_id}): "
+                         f"active switch blocks {active_switches}")
         
         message = {
             'type': 'switch_positions_update',
@@ -497,54 +444,16 @@ class CommunicationHandler:
         # Determine line name from controller
         line_name = "Red" if getattr(sending_controller, 'redLine', False) else "Green"
         
-        # Reassemble complete line state from all controllers on this line
-        current_line_state = self._reassemble_line_state('crossings', line_name)
-        
-        # Get previous line state for comparison
-        previous_line_state = self.previous_line_states[line_name]['crossings']
+        # Store this controller's own snapshot as the baseline for its later deltas
+        has_changes = self._store_controller_snapshot('crossings', line_name, railwayCrossings, sending_controller)
         
-        # Check for changes at line level
-        has_changes = False
-        if not previous_line_state:
-            # First time receiving data for this line - treat as change
-            has_changes = True
-        elif len(current_line_state) != len(previous_line_state):
-            # Array length changed - treat as change
-            has_changes = True
-        else:
-            # Compare line states
-            for i, (current, previous) in enumerate(zip(current_line_state, previous_line_state)):
-                if current != previous:
-                    has_changes = True
-                    break
-        
-        # Only show debug output when line state changes are detected
-        if has_changes:
-            # Filter to only show blocks that both have railway crossings AND are active
-            active_crossings_with_infrastructure = self._get_blocks_with_infrastructure_and_state(
-                current_line_state, sending_controller, 'crossingPresent'
+        if has_changes and logger.isEnabledFor(logging.DEBUG):
+            # Only show blocks that both have railway crossings AND are active
+            active_crossings = self._get_blocks_with_infrastructure_and_state(
+                self.previous_line_states[line_name]['crossings'], sending_controller, 'crossingPresent'
             )
-            
-            # Get total crossings for reference
-            total_crossings = 0
-            if self.ctc_system and sending_controller:
-                for i in range(len(current_line_state) if current_line_state else 0):
-                    try:
-                        block = self.ctc_system.get_block_by_line_new(line_name, i)
-                        if block and hasattr(block, 'crossingPresent') and getattr(block, 'crossingPresent'):
-                            total_crossings += 1
-                    except:
-                        pass
-            
-            print(f"[CTC_DEBUG] WAYSIDE DATA CHANGED: update_railway_crossings()")
-            print(f"  Line: {line_name}")
-            print(f"  Controller: {controller_id}")
-            print(f"  Crossing array length: {len(current_line_state) if current_line_state else 0}")
-            print(f"  Active crossings: {len(active_crossings_with_infrastructure)}/{total_crossings}")
-            print(f"  Active crossing blocks: {active_crossings_with_infrastructure}")
-            
-            # Store current line state for next comparison
-            self.previous_line_states[line_name]['crossings'] = current_line_state.copy() if current_line_state else []
+            logger.debug(f"Wayside crossings changed on {line_name} line (controller {controller_id}): "
+                         f"active crossing blocks {active_crossings}")
         
         message = {
             'type': 'railway_crossings_update',
@@ -555,6 +464,110 @@ class CommunicationHandler:
         self.message_queue.put(message)
         logger.debug(f"Received railway crossings update: {len(railwayCrossings)} block-length array from {controller_id}")
     
+    def update_occupied_blocks_delta(self, changedBlocks: Dict[int, bool], sending_controller=None) -> None:
+        """
+        Receive only the occupation entries that changed since the controller's last publish
+        
+        Controllers call this once they have published a full array through
+        update_occupied_blocks(). Updates with no real changes are dropped;
+        the CTC System counts stationary trains on its own tick.
+        
+        Args:
+            changedBlocks: Block number -> new occupation state for changed blocks only
+            sending_controller: Controller that sent this data (for filtering)
+        """
+        line_name = "Red" if getattr(sending_controller, 'redLine', False) else "Green"
+        changes = self._apply_line_state_changes('occupied', line_name, changedBlocks, sending_controller)
+        if not changes:
+            return
+        
+        message = {
+            'type': 'occupied_blocks_delta',
+            'data': changes,
+            'sender': sending_controller,
+            'line': line_name,
+            'timestamp': _get_simulation_time()
+        }
+        self.message_queue.put(message)
+        logger.debug(f"Received {len(changes)} block occupancy changes for {line_name} line: {sorted(changes.items())}")
+    
+    def update_switch_positions_delta(self, changedSwitches: Dict[int, bool], sending_controller=None) -> None:
+        """
+        Receive only the switch positions that changed since the controller's last publish
+        
+        Args:
+            changedSwitches: Block number -> new switch position for changed blocks only
+            sending_controller: Controller that sent this data (for filtering)
+        """
+        line_name = "Red" if getattr(sending_controller, 'redLine', False) else "Green"
+        changes = self._apply_line_state_changes('switches', line_name, changedSwitches, sending_controller)
+        if not changes:
+            return
+        
+        message = {
+            'type': 'switch_positions_delta',
+            'data': changes,
+            'sender': sending_controller,
+            'line': line_name,
+            'timestamp': _get_simulation_time()
+        }
+        self.message_queue.put(message)
+        logger.debug(f"Received {len(changes)} switch position changes for {line_name} line")
+    
+    def update_railway_crossings_delta(self, changedCrossings: Dict[int, bool], sending_controller=None) -> None:
+        """
+        Receive only the crossing states that changed since the controller's last publish
+        
+        Args:
+            changedCrossings: Block number -> new crossing state for changed blocks only
+            sending_controller: Controller that sent this data (for filtering)
+        """
+        line_name = "Red" if getattr(sending_controller, 'redLine', False) else "Green"
+        changes = self._apply_line_state_changes('crossings', line_name, changedCrossings, sending_controller)
+        if changes:
+            self.current_railway_crossings.update(changes)
+            logger.debug(f"Received {len(changes)} railway crossing changes for {line_name} line")
+    
+    def _apply_line_state_changes(self, data_type: str, line_name: str, changes: Dict[int, bool],
+                                  sending_controller) -> Dict[int, bool]:
+        """
+        Apply a controller's changed entries to the stored line state
+        
+        Entries for blocks the controller does not manage, or that match the
+        stored line state already, are dropped.
+        
+        Args:
+            data_type: Type of data ('occupied', 'switches', 'crossings')
+            line_name: Line name ('Red' or 'Green')
+            changes: Block number -> new value
+            sending_controller: Controller that sent the changes
+            
+        Returns:
+            Entries that actually changed the line state
+        """
+        blocks_covered = self.controller_block_coverage.get(sending_controller)
+        if blocks_covered is None:
+            logger.error(f"PROTOCOL VIOLATION: Controller {getattr(sending_controller, 'controller_id', 'Unknown')} not found in block coverage mapping for {data_type} changes. Controller must be registered via provide_wayside_controller().")
+            return {}
+        
+        line_state = self.previous_line_states.setdefault(line_name, {}).get(data_type)
+        if line_state is None:
+            line_state = [False] * len(blocks_covered)
+            self.previous_line_states[line_name][data_type] = line_state
+        
+        applied = {}
+        for block_number, value in changes.items():
+            if not (0 <= block_number < len(blocks_covered) and blocks_covered[block_number]):
+                logger.debug(f"Discarding {data_type} change for block {block_number} (not managed by controller)")
+                continue
+            if block_number >= len(line_state):
+                line_state.extend([False] * (block_number + 1 - len(line_state)))
+            value = bool(value)
+            if line_state[block_number] != value:
+                line_state[block_number] = value
+                applied[block_number] = value
+        return applied
+    
     def schedule_route(self, route) -> None:
         """
         Store accepted route for timed execution (no immediate wayside communication)
@@ -763,7 +776,7 @@ class CommunicationHandler:
             ValueError: If controller doesn't meet protocol requirements
         """
 
-        print(f"[CTC_DEBUG]  REGISTERING CONTROLLER: {waysideController.controller_id}")
+        logger.debug(f"Registering wayside controller {getattr(waysideController, 'controller_id', 'Unknown')}")
         # STRICT PROTOCOL VALIDATION
         if not blocksCovered or not isinstance(blocksCovered, list):
             error_msg = f"PROTOCOL VIOLATION: blocksCovered must be a non-empty List[bool], got {type(blocksCovered)}"
@@ -811,15 +824,8 @@ class CommunicationHandler:
         # Store block coverage in internal mapping for reliable access
         self.controller_block_coverage[waysideController] = blocksCovered
         
-        # Enhanced debug output for controller registration
-        line_name = "Red" if redLine else "Green"
-        print(f"[CTC_DEBUG]   WAYSIDE CONTROLLER REGISTRATION:")
-        print(f"[CTC_DEBUG]   Controller ID: {waysideController.controller_id}")
-        print(f"[CTC_DEBUG]   Line: {line_name}")
-        print(f"[CTC_DEBUG]   Managed blocks: {managed_blocks}")
-        print(f"[CTC_DEBUG]   Includes yard (block 0): {'✓ YES' if 0 in managed_blocks else '✗ NO'}")
-        print(f"[CTC_DEBUG]   Block coverage array length: {len(blocksCovered)}")
-        print(f"[CTC_DEBUG]   ✓ Registration successful")
+        logger.debug(f"Controller {waysideController.controller_id} coverage: {len(blocksCovered)} block array, "
+                     f"yard {'included' if 0 in managed_blocks else 'not included'}")
         
         # Map blocks to controller
         for block in managed_blocks:
@@ -907,26 +913,10 @@ class CommunicationHandler:
             nextStation: List of next station IDs for each train (indexed by current block)
             blocksAway: List of route distances from current block to target block (indexed by current block)
         """
-        # Group controllers by line instead of by individual blocks
-        line_controllers = {'Red': [], 'Green': [], 'Blue': []}
-        
-        # Organize controllers by line
-        for controller in self.wayside_controllers:
-            if hasattr(controller, 'redLine'):
-                if controller.redLine:
-                    line_controllers['Red'].append(controller)
-                else:
-                    line_controllers['Green'].append(controller)
-            else:
-                # Try to determine line from controller ID if redLine attribute missing
-                controller_id = getattr(controller, 'controller_id', '')
-                if 'Red' in controller_id:
-                    line_controllers['Red'].append(controller)
-                elif 'Blue' in controller_id:
-                    line_controllers['Blue'].append(controller)
-                else:
-                    # Default to Green for unknown controllers
-                    line_controllers['Green'].append(controller)
+        # Every controller receiving the arrays ends up with exactly this command set
+        command_set = self._command_set_from_arrays(
+            suggestedSpeed, authority, blockNum, nextStation, blocksAway
+        )
         
         # Determine which line(s) are affected by these commands
         affected_lines = set()
@@ -941,20 +931,16 @@ class CommunicationHandler:
         
         # Send complete line information to all controllers on each affected line
         for line_name in affected_lines:
-            controllers_on_line = line_controllers.get(line_name, [])
+            controllers_on_line = self._get_controllers_for_line(line_name)
             
             for controller in controllers_on_line:
                 if hasattr(controller, 'command_train'):
-                    # Enhanced debug logging
-                    controller_id = getattr(controller, 'controller_id', 'Unknown')
-                    active_commands = [(i, speed, auth, block) for i, (speed, auth, block) in enumerate(zip(suggestedSpeed, authority, blockNum)) if speed > 0 or auth > 0 or block > 0]
-                    
-                    print(f"[CTC_DEBUG]  SENDING TO WAYSIDE: command_train()")
-                    print(f"  Controller: {controller_id}")
-                    print(f"  Line: {line_name}")
-                    print(f"  Total array length: {len(blockNum)}")
-                    print(f"  Active commands: {len(active_commands)}")
-                    print(f"  Command details: {active_commands[:5]}{'...' if len(active_commands) > 5 else ''}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        controller_id = getattr(controller, 'controller_id', 'Unknown')
+                        active_commands = [(i, speed, auth, block) for i, (speed, auth, block) in enumerate(zip(suggestedSpeed, authority, blockNum)) if speed > 0 or auth > 0 or block > 0]
+                        logger.debug(f"Sending command_train() to {controller_id} on {line_name} line: "
+                                     f"{len(active_commands)} active of {len(blockNum)} "
+                                     f"{active_commands[:5]}{'...' if len(active_commands) > 5 else ''}")
                     
                     # Send the entire command lists (for the whole line) to this controller
                     # The wayside controller will filter based on its blocks_covered_bool
@@ -966,10 +952,110 @@ class CommunicationHandler:
                         nextStation,     # Full list for entire line
                         blocksAway       # Full list for entire line
                     )
+                    self.lastCommandSets[controller] = command_set
                     logger.debug(f"Full line commands sent to {line_name} line controller {controller_id} for {len(blockNum)} blocks")
                 else:
                     logger.error(f"Controller does not support command_train method")
     
+    def send_train_command_set(self, line_name: str, commands: Dict[int, Tuple[int, int, int, int, int]]) -> int:
+        """
+        Send a line's train commands, deduplicated per controller
+        
+        Each controller only receives the entries that differ from the command
+        set it last received, as (block, speed, authority, target, station,
+        distance) tuples. Entries it had that are no longer commanded are sent
+        as all-zero tuples to clear them. Controllers without
+        command_train_delta() get the full line arrays instead, and only when
+        their command set changed.
+        
+        Args:
+            line_name: Line the commands are for
+            commands: Current block -> (speed, authority, target block, next station, blocks away)
+            
+        Returns:
+            Number of controllers sent to
+        """
+        controllers_sent = 0
+        for controller in self._get_controllers_for_line(line_name):
+            previous = self.lastCommandSets.get(controller, {})
+            changes = [(block,) + command for block, command in commands.items() if previous.get(block) != command]
+            changes.extend((block, 0, 0, 0, 0, 0) for block in previous if block not in commands)
+            if not changes:
+                continue
+            
+            try:
+                if hasattr(controller, 'command_train_delta'):
+                    controller.command_train_delta(sorted(changes))
+                else:
+                    line_length = self._get_line_length(line_name)
+                    if line_length <= 0:
+                        logger.error(f"Invalid line length for {line_name} line: {line_length}")
+                        continue
+                    controller.command_train(*self._command_arrays_from_set(commands, line_length))
+                self.lastCommandSets[controller] = dict(commands)
+                controllers_sent += 1
+            except Exception as e:
+                logger.error(f"Failed to send commands to controller {getattr(controller, 'controller_id', 'Unknown')}: {e}")
+        
+        logger.debug(f"{line_name} line commands ({len(commands)} entries) sent to {controllers_sent} controllers")
+        return controllers_sent
+    
+    def _get_controllers_for_line(self, line_name: str) -> List:
+        """
+        Get the registered wayside controllers on a line
+        
+        Args:
+            line_name: Line name ('Red', 'Green', 'Blue')
+            
+        Returns:
+            Controllers on the line, in registration order
+        """
+        controllers = []
+        for controller in self.wayside_controllers:
+            if hasattr(controller, 'redLine'):
+                controller_line = 'Red' if controller.redLine else 'Green'
+            else:
+                # Try to determine line from controller ID if redLine attribute missing
+                controller_id = getattr(controller, 'controller_id', '')
+                if 'Red' in controller_id:
+                    controller_line = 'Red'
+                elif 'Blue' in controller_id:
+                    controller_line = 'Blue'
+                else:
+                    # Default to Green for unknown controllers
+                    controller_line = 'Green'
+            if controller_line == line_name:
+                controllers.append(controller)
+        return controllers
+    
+    @staticmethod
+    def _command_set_from_arrays(suggestedSpeed: List[int], authority: List[int], blockNum: List[int],
+                                 nextStation: List[int], blocksAway: List[int]) -> Dict[int, Tuple[int, int, int, int, int]]:
+        """Get the non-empty entries of full line command arrays as a command set"""
+        command_set = {}
+        for i, command in enumerate(zip(suggestedSpeed, authority, blockNum, nextStation, blocksAway)):
+            if any(command):
+                command_set[i] = tuple(command)
+        return command_set
+    
+    @staticmethod
+    def _command_arrays_from_set(commands: Dict[int, Tuple[int, int, int, int, int]], line_length: int) -> Tuple[List[int], ...]:
+        """Expand a command set into the six full line arrays taken by command_train()"""
+        suggested_speeds = [0] * line_length
+        authorities = [0] * line_length
+        block_nums = [0] * line_length
+        update_flags = [0] * line_length
+        next_stations = [0] * line_length
+        blocks_away = [0] * line_length
+        for block, (speed, authority, target, station, distance) in commands.items():
+            if block < line_length:
+                suggested_speeds[block] = speed
+                authorities[block] = authority
+                block_nums[block] = target
+                next_stations[block] = station
+                blocks_away[block] = distance
+        return suggested_speeds, authorities, block_nums, update_flags, next_stations, blocks_away
+    
     
     
     
@@ -984,6 +1070,10 @@ class CommunicationHandler:
         if train_id in self.active_train_routes:
             del self.active_train_routes[train_id]
         
+        # Drop any departure commands still waiting to be sent
+        for event in self.departureCommandEvents.pop(train_id, []):
+            self.eventScheduler.cancel(event)
+        
         logger.info(f"Train {train_id} removed from active route tracking")
     
     
@@ -1032,6 +1122,11 @@ class CommunicationHandler:
                 self._update_switch_positions_internal(data)
             elif msg_type == 'railway_crossings_update':
                 self._update_railway_crossings_internal(data)
+            elif msg_type == 'occupied_blocks_delta':
+                self._update_occupied_blocks_delta_internal(data, message)
+            elif msg_type == 'switch_positions_delta':
+                if self.ctc_system and hasattr(self.ctc_system, 'process_switch_position_changes'):
+                    self.ctc_system.process_switch_position_changes(data, message.get('line'))
         finally:
             # Clear the sender after processing
             self._current_message_sender = None
@@ -1061,7 +1156,7 @@ class CommunicationHandler:
             self._process_train_movements(filtered_blocks)
             
             # Send updated commands for affected trains using corrected batched approach
-            print(f"  OCCUPANCY UPDATE: Sending updated batched train commands due to block occupancy changes")
+            logger.debug("Occupancy changed - sending updated batched train commands")
             self.send_updated_train_commands()
             
             # Update switches based on new train positions
@@ -1069,7 +1164,30 @@ class CommunicationHandler:
         
         # Forward filtered data to CTC System if connected (always forward for state consistency)
         if self.ctc_system and hasattr(self.ctc_system, 'process_occupied_blocks'):
-            self.ctc_system.process_occupied_blocks(filtered_blocks)
+            # Determine line from sending controller
+            sending_controller = getattr(self, '_current_message_sender', None)
+            line_name = "Red" if getattr(sending_controller, 'redLine', False) else "Green"
+            self.ctc_system.process_occupied_blocks(filtered_blocks, line_name)
+    
+    def _update_occupied_blocks_delta_internal(self, changes, message):
+        """
+        Internal method to process changed occupation entries
+        
+        Changes were already filtered against the controller's managed blocks, so
+        only the changed blocks (and their trains) are processed.
+        """
+        if not changes:
+            return
+        
+        logger.debug("Occupancy changed - sending updated batched train commands")
+        self.send_updated_train_commands()
+        
+        # Update switches based on new train positions
+        self._update_switches_for_routes()
+        
+        # Forward changes to CTC System
+        if self.ctc_system and hasattr(self.ctc_system, 'process_occupied_block_changes'):
+            self.ctc_system.process_occupied_block_changes(changes, message.get('line'))
     
     def _update_switch_positions_internal(self, switch_positions):
         """
@@ -1239,13 +1357,13 @@ class CommunicationHandler:
         Send commands when train departs from yard
         Sends commands for first 4 blocks with 2-second delays to all controllers on line
         
+        The first command is sent immediately; the rest are registered with
+        the sim-time event scheduler, so no thread is started per departure.
+        
         Args:
             train_id: ID of departing train
             route: Train's route
         """
-        import threading
-        import time
-        
         # DEBUG: Function entry
         print(f"DEBUG: send_departure_commands() called for train {train_id}")
 
@@ -1317,72 +1435,95 @@ class CommunicationHandler:
         print(f"   Departure commands for blocks: {first_4_blocks}")
         logger.info(f"Departure commands for train {train_id} will be sent to all controllers on {train_line} line for blocks: {first_4_blocks}")
             
-        # Send commands for first 4 blocks with simulation-time-aware delays
-        def send_sequential_commands():
-            for i in range(len(first_4_blocks)):
-                
-                if i > 0:
-                    # Wait for 2 seconds in simulation time
-                    start_time = _get_simulation_time()
-                    target_time = start_time + timedelta(seconds=2)
-                    
-                    # Poll simulation time until 2 seconds have passed
-                    while _get_simulation_time() < target_time:
-                        time.sleep(0.1)  # Small real-time sleep to prevent CPU spinning
-                
-                block_id = first_4_blocks[i]
-                next_station = self._get_next_station_for_route(route, block_id)
-                
-                # Calculate blocks away from train's current position (starting at yard = block 0)
-                blocks_away_distance = i  # Distance from yard to this block (0 for first block, 1 for second, etc.)
-                
-                # Create dynamic line-length arrays with command at yard position (index 0)
-                suggested_speeds = [0] * line_length  # Initialize with stop commands
-                authorities = [0] * line_length       # Initialize with no authority
-                block_nums = [0] * line_length        # Initialize with zeros - only commanded blocks get actual block numbers
-                update_flags = [0] * line_length      # All new commands
-                next_stations = [0] * line_length     # No station info by default
-                blocks_away = [0] * line_length       # Initialize with zeros - only commanded blocks get actual distances
-                
-                # Calculate safe authority and speed using centralized method
-                # This ensures consistency with regular train commands
-                safe_authority, safe_speed = self.calculate_authority_and_speed(train_id, block_id, route)
-                
-                print(f"DEBUG: Block {block_id} - Safe authority: {safe_authority}, Safe speed: {safe_speed} (centralized calculation)")
-                
-                # CRITICAL FIX: Set authority at command position (index 0) not target block positions
-                # This ensures the Wayside controller receives the correct authority for the departure command
-                authorities[0] = safe_authority  # Authority for the command being sent FROM yard TO target block
-                
-                # Set command for yard position (index 0) with the current block's data using calculated values
-                suggested_speeds[0] = safe_speed          # Use calculated safe speed
-                block_nums[0] = block_id                  # Set the actual block being commanded
-                update_flags[0] = 0                       # New command
-                next_stations[0] = next_station           # Next station for this block
-                blocks_away[0] = blocks_away_distance     # Distance from yard to this block
-                
-                # Send command to all controllers on the train's line
-                controllers_sent = 0
-                
-                for controller in line_controllers:
-                    try:
-                        controller.command_train(
-                            suggested_speeds, authorities, block_nums,
-                            update_flags, next_stations, blocks_away
-                        )
-                        controllers_sent += 1
-                    except Exception as e:
-                        logger.error(f"Failed to send departure command to controller: {e}")
-                
-                logger.info(f"Departure command {i+1}/4 sent for train {train_id} to block {block_id} broadcasted to {controllers_sent} controllers on {train_line} line")
-            
+        # Replace any departure sequence still pending for this train
+        for event in self.departureCommandEvents.pop(train_id, []):
+            self.eventScheduler.cancel(event)
+        
+        # Send the first command now and schedule the rest 2 simulated seconds apart
+        self._send_departure_command(train_id, route, first_4_blocks, 0, line_controllers, train_line, line_length)
         
-        # Start sequential command sending in background thread
-        command_thread = threading.Thread(target=send_sequential_commands)
-        command_thread.daemon = True
-        command_thread.start()
+        start_time = _get_simulation_time()
+        pending_events = []
+        for i in range(1, len(first_4_blocks)):
+            pending_events.append(self.eventScheduler.schedule(
+                start_time + DEPARTURE_COMMAND_INTERVAL * i,
+                self._send_departure_command,
+                train_id, route, first_4_blocks, i, line_controllers, train_line, line_length,
+                name=f"departure command {i+1} {train_id}"))
+        if pending_events:
+            self.departureCommandEvents[train_id] = pending_events
         
-        logger.info(f"Started sequential departure commands for train {train_id} from yard to all controllers on {train_line} line")
+        logger.info(f"Scheduled sequential departure commands for train {train_id} from yard to all controllers on {train_line} line")
+    
+    def _send_departure_command(self, train_id: str, route, departure_blocks: List[int], index: int,
+                                line_controllers: List, train_line: str, line_length: int) -> None:
+        """
+        Send one yard departure command to all controllers on the train's line
+        
+        Args:
+            train_id: ID of departing train
+            route: Train's route
+            departure_blocks: First route blocks after the yard
+            index: Position of the commanded block in departure_blocks
+            line_controllers: Controllers on the train's line
+            train_line: Line name
+            line_length: Number of blocks on the line (array length)
+        """
+        # Forget this command's event once it runs
+        pending_events = self.departureCommandEvents.get(train_id)
+        if pending_events:
+            pending_events[:] = [event for event in pending_events if event.pending]
+            if not pending_events:
+                del self.departureCommandEvents[train_id]
+        
+        block_id = departure_blocks[index]
+        next_station = self._get_next_station_for_route(route, block_id)
+        
+        # Calculate blocks away from train's current position (starting at yard = block 0)
+        blocks_away_distance = index  # Distance from yard to this block (0 for first block, 1 for second, etc.)
+        
+        # Create dynamic line-length arrays with command at yard position (index 0)
+        suggested_speeds = [0] * line_length  # Initialize with stop commands
+        authorities = [0] * line_length       # Initialize with no authority
+        block_nums = [0] * line_length        # Initialize with zeros - only commanded blocks get actual block numbers
+        update_flags = [0] * line_length      # All new commands
+        next_stations = [0] * line_length     # No station info by default
+        blocks_away = [0] * line_length       # Initialize with zeros - only commanded blocks get actual distances
+        
+        # Calculate safe authority and speed using centralized method
+        # This ensures consistency with regular train commands
+        safe_authority, safe_speed = self.calculate_authority_and_speed(train_id, block_id, route)
+        
+        print(f"DEBUG: Block {block_id} - Safe authority: {safe_authority}, Safe speed: {safe_speed} (centralized calculation)")
+        
+        # CRITICAL FIX: Set authority at command position (index 0) not target block positions
+        # This ensures the Wayside controller receives the correct authority for the departure command
+        authorities[0] = safe_authority  # Authority for the command being sent FROM yard TO target block
+        
+        # Set command for yard position (index 0) with the current block's data using calculated values
+        suggested_speeds[0] = safe_speed          # Use calculated safe speed
+        block_nums[0] = block_id                  # Set the actual block being commanded
+        update_flags[0] = 0                       # New command
+        next_stations[0] = next_station           # Next station for this block
+        blocks_away[0] = blocks_away_distance     # Distance from yard to this block
+        
+        # Send command to all controllers on the train's line
+        controllers_sent = 0
+        
+        command_set = {0: (safe_speed, safe_authority, block_id, next_station, blocks_away_distance)}
+        
+        for controller in line_controllers:
+            try:
+                controller.command_train(
+                    suggested_speeds, authorities, block_nums,
+                    update_flags, next_stations, blocks_away
+                )
+                self.lastCommandSets[controller] = command_set
+                controllers_sent += 1
+            except Exception as e:
+                logger.error(f"Failed to send departure command to controller: {e}")
+        
+        logger.info(f"Departure command {index+1}/4 sent for train {train_id} to block {block_id} broadcasted to {controllers_sent} controllers on {train_line} line")
     
     def _process_train_movements(self, occupied_blocks):
         """Process train movements based on block occupation updates"""
@@ -1396,13 +1537,15 @@ class CommunicationHandler:
         """
         Send updated commands for all trains on specified line(s) when block occupations change.
         Commands are sent TO train's current block FOR block 4 positions ahead in route.
-        All trains' commands are batched per line before transmission.
+        All trains' commands are batched per line into one command set, and each
+        controller only receives the entries that changed since its last set
+        (see send_train_command_set), so unchanged trains are not resent.
         
         IMPORTANT: Command Structure
         - Commands sent TO train's current block controller
-        - blockNum[current_block] = target block 4 positions ahead in route
-        - blocksAway[current_block] = route distance to target block (NOT arithmetic difference)
-        - Array indexed by current block position, contains commands for target blocks
+        - Entry key = train's current block
+        - target = block 4 positions ahead in route
+        - distance = route distance to target block (NOT arithmetic difference)
         
         Args:
             line_name: Specific line to update (Red/Green), or None for all lines
@@ -1435,36 +1578,16 @@ class CommunicationHandler:
                     if train_line == line:
                         trains_on_line.append((train_id, train))
             
-            if not trains_on_line:
-                logger.debug(f"No active trains found on {line} line")
-                continue
-            
-            # Get line length for command arrays
-            line_length = self._get_line_length(line)
-            if line_length <= 0:
-                logger.error(f"Invalid line length for {line} line: {line_length}")
-                continue
-            
-            # Initialize command arrays for entire line (indexed by current block)
-            suggested_speeds = [0] * line_length    # Default to stop
-            authorities = [0] * line_length         # Default to no authority  
-            block_nums = [0] * line_length          # Target block IDs (4 positions ahead)
-            update_flags = [0] * line_length        # All new commands
-            next_stations = [0] * line_length       # Station IDs
-            blocks_away = [0] * line_length         # Route distances
+            # Command set for the line, indexed by each train's current block
+            commands = {}
             
-            # Process each train and add commands to arrays
+            # Process each train and add its command entry
             for train_id, train in trains_on_line:
                 try:
                     # Get train's current position
                     current_block_id = getattr(train.currentBlock, 'blockID', train.currentBlock)
                     route = train.route
                     
-                    # Validate current block is within line bounds
-                    if current_block_id >= line_length:
-                        logger.warning(f"Train {train_id} current block {current_block_id} exceeds line length {line_length}")
-                        continue
-                    
                     # Calculate target block (4 positions ahead in route)
                     # COMMAND LOGIC: Find the block that is 4 route positions ahead of train's current position
                     target_block_id = self._get_target_block_for_train(train_id, route, 4)
@@ -1491,19 +1614,11 @@ class CommunicationHandler:
                     # STATION LOGIC: Determine which station the train is heading to
                     next_station = self._get_next_station_for_route(route, target_block_id)
                     
-                    # Set commands in arrays at current block position
-                    # CRITICAL ARRAY STRUCTURE:
-                    # - Array index = train's CURRENT block (where train is now)
-                    # - Array values = commands for TARGET block (where train will be)
-                    # - blockNum[current] = target block ID (NOT current block ID)
-                    # - blocksAway[current] = route distance from current to target
+                    # CRITICAL COMMAND STRUCTURE:
+                    # - Key = train's CURRENT block (where train is now)
+                    # - Values = commands for TARGET block (where train will be)
                     # - Commands sent TO current block controller FOR target block
-                    suggested_speeds[current_block_id] = speed            # Speed for target block
-                    authorities[current_block_id] = authority             # Authority for target block  
-                    block_nums[current_block_id] = target_block_id        # TARGET block ID (4 ahead)
-                    update_flags[current_block_id] = 0                   # New command
-                    next_stations[current_block_id] = next_station       # Station train is going to
-                    blocks_away[current_block_id] = route_distance       # Route hops (not arithmetic)
+                    commands[current_block_id] = (speed, authority, target_block_id, next_station, route_distance)
                     
                     logger.debug(f"Commands set for train {train_id}: current={current_block_id}, target={target_block_id}, distance={route_distance}")
                     
@@ -1511,18 +1626,11 @@ class CommunicationHandler:
                     logger.error(f"Error processing commands for train {train_id}: {e}")
                     continue
             
-            # Send batched commands for entire line
-            if any(block_nums):  # Only send if we have actual commands
-                print(f"📡 BATCHED COMMANDS: Sending updated commands for {len(trains_on_line)} trains on {line} line")
-                print(f"   Target blocks: {[block_id for block_id in block_nums if block_id > 0]}")
-                
-                self.send_train_commands(
-                    suggested_speeds, authorities, block_nums,
-                    update_flags, next_stations, blocks_away
-                )
-                logger.info(f"Batched commands sent for {len(trains_on_line)} trains on {line} line")
-            else:
-                logger.debug(f"No commands to send for {line} line")
+            # Send only what each controller's last command set is missing
+            # (an empty set clears the entries of trains that have left the line)
+            controllers_sent = self.send_train_command_set(line, commands)
+            if controllers_sent:
+                logger.info(f"Batched commands for {len(commands)} trains sent to {controllers_sent} controllers on {line} line")
     
     def _get_line_for_block(self, block_id: int) -> str:
         """
@@ -1917,11 +2025,16 @@ class CommunicationHandler:
         next_block_2 = None
         
         if route and hasattr(route, 'blockSequence'):
-            route_blocks = [getattr(block, 'blockID', getattr(block, 'block_number', block)) for block in route.blockSequence]
-            
             # Find current block in route to get next blocks
             try:
-                current_index = route_blocks.index(block_id)
+                if isinstance(route, Route):
+                    # Next occurrence from the train's position (routes may loop)
+                    current_index = route.find_block_index(block_id, route.currentBlockIndex)
+                    if current_index is None:
+                        raise ValueError(block_id)
+                else:
+                    route_blocks = [getattr(block, 'blockID', getattr(block, 'block_number', block)) for block in route.blockSequence]
+                    current_index = route_blocks.index(block_id)
                 
                 # Get next block objects for speed calculation
                 if current_index + 1 < len(route.blockSequence):
@@ -2221,11 +2334,16 @@ class CommunicationHandler:
                 current_index = route.currentBlockIndex if hasattr(route, 'currentBlockIndex') else 0
                 target_index = None
                 
-                for i, block in enumerate(route.blockSequence):
-                    block_id = getattr(block, 'blockID', block)
-                    if block_id == target_block_id:
-                        target_index = i
-                        break
+                if isinstance(route, Route):
+                    target_index = route.find_block_index(target_block_id, current_index)
+                    if target_index is None and route.contains_block(target_block_id):
+                        target_index = route.get_block_positions(target_block_id)[-1]
+                else:
+                    for i, block in enumerate(route.blockSequence):
+                        block_id = getattr(block, 'blockID', block)
+                        if block_id == target_block_id:
+                            target_index = i
+                            break
                 
                 if target_index is not None:
                     return target_index - current_index
@@ -2241,6 +2359,8 @@ class CommunicationHandler:
     
     def _is_block_on_route(self, block_id: int, route) -> bool:
         """Check if block is part of the route"""
+        if isinstance(route, Route):
+            return route.contains_block(block_id)
         if hasattr(route, 'blockSequence'):
             route_blocks = [getattr(b, 'blockID', b) for b in route.blockSequence]
             return block_id in route_blocks
@@ -44,6 +44,9 @@ from .communication_handler import CommunicationHandler
 from .display_manager import DisplayManager
 from .failure_manager import FailureManager
 from .route_manager import RouteManager
+from .event_scheduler import EventScheduler
+from .throughput_counter import ThroughputCounter
+from .block_reservations import BlockReservationTable, route_block_intervals
 from .block import Block
 from .route import Route
 from .train import Train
@@ -52,6 +55,16 @@ from .train import Train
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Scheduled yard departures may trigger up to 5 seconds early and up to 60 seconds late
+DEPARTURE_EARLY_TOLERANCE = timedelta(seconds=5)
+DEPARTURE_LATE_TOLERANCE = timedelta(seconds=60)
+
+# Padding around each route's estimated block times in the reservation table
+RESERVATION_MARGIN = timedelta(seconds=30)
+
+# State domains with version counters - the UI only refreshes views of domains whose version moved
+STATE_DOMAINS = ('trains', 'blocks', 'warnings', 'routes', 'throughput', 'clock')
+
 
 class CTCSystem(QObject):
     """
@@ -81,6 +94,7 @@ class CTCSystem(QObject):
         trackLayout (TrackLayoutReader): Track model reference
         routeManager (RouteManager): Route generation and management
         throughputMetrics (List[int]): System throughput tracking
+        lineThroughput (Dict[str, ThroughputCounter]): Sliding one-hour ticket counters by line
         blockMetrics (List[int]): Block utilization metrics
         
     Data Storage:
@@ -94,6 +108,12 @@ class CTCSystem(QObject):
         scheduledClosures (List[dict]): Scheduled maintenance closures (moved from FailureManager)
         scheduledOpenings (List[dict]): Scheduled maintenance openings (moved from FailureManager)
         
+    Sim-Time Event Scheduling:
+        eventScheduler (EventScheduler): Min-heap of timed events run by system_tick
+        closureEvents (Dict[str, ScheduledEvent]): Closure ID -> pending closure event
+        openingEvents (Dict[str, ScheduledEvent]): Related closure ID -> pending opening event
+        departureEvents (Dict[str, ScheduledEvent]): Train ID -> pending yard departure event
+        
     Yard Management:
         yard_connections (Dict[str, List[Dict]]): Centralized yard connection data
         line_yard_blocks (Dict[str, int]): Yard exit blocks by line
@@ -104,6 +124,7 @@ class CTCSystem(QObject):
         selected_train (str): Currently selected train for UI
         selected_block (Tuple[str, int]): Currently selected block for UI
         switch_positions (Dict[str, Dict]): Switch position tracking
+        domainVersions (Dict[str, int]): Version counter per state domain, bumped on every change
         
     Train ID Management:
         line_counters (Dict[str, int]): Train ID counters by line
@@ -130,7 +151,8 @@ class CTCSystem(QObject):
             - get_block_by_line_new(line, block_number): Get block by line
             - get_block_by_number(block_number, preferred_line): Find block across lines
             - validate_block_exists(block_number, line): Validate block existence
-            - process_occupied_blocks(occupied_blocks): Handle occupation updates
+            - process_occupied_blocks(occupied_blocks, line): Handle occupation updates
+            - process_occupied_block_changes(changed_blocks, line): Handle changed occupation entries only
             
         Communication & Control:
             - provide_wayside_controller(controller, blocksCovered, redLine): Register controllers
@@ -210,13 +232,19 @@ class CTCSystem(QObject):
         self.trackLayout = track_reader # Track Model reference
         self.routeManager = None       # Route Manager (will be set later)
         self.throughputMetrics = []    # List[int] - Legacy compatibility
-        self.ticket_purchase_history = []  # List[Dict] - New ticket-based throughput tracking
+        self.lineThroughput = {        # Dict[str, ThroughputCounter] - line -> last-hour ticket counter
+            line: ThroughputCounter() for line in ('Blue', 'Red', 'Green')
+        }
         self.blockMetrics = []         # List[int]
         
         # Additional attributes needed for implementation
         self.blocks = {}               # Dict[Tuple[str, int], Block] - (line, block_number) -> Block object
+        self.line_blocks = {}          # Dict[str, List[Optional[Block]]] - line -> blocks indexed by block number
         self.routes = {}               # Dict[str, Route] - route_id -> Route object
         self.trains = {}               # Dict[str, Train] - train_id -> Train object
+        self.route_block_index = {}    # Dict[int, List[Tuple[Train, int]]] - block number -> (train, route position)
+        self.indexed_routes = {}       # Dict[str, Tuple[Train, Route]] - train_id -> route held in route_block_index
+        self.blockReservations = BlockReservationTable(RESERVATION_MARGIN)  # (line, block) -> sorted time intervals per train
         
         # Yard connection management (centralized in CTC system)
         self.yard_connections = {}     # Dict[str, List[Dict]] - line -> yard connection info
@@ -241,6 +269,10 @@ class CTCSystem(QObject):
             self.system_time_multiplier = 1.0  # Time acceleration
             self.active_lines = getattr(track_reader, 'selected_lines', ["Blue"])  # Lines currently active
             self.switch_positions = {}  # {switch_id: {line, block, position}}
+            self.domainVersions = {domain: 0 for domain in STATE_DOMAINS}  # {domain: version}
+            self.lastHourlyRates = None  # Last per-line throughput pushed to the display manager
+            self.lastClockMinute = None  # Simulated minute the 'clock' domain was last bumped for
+            self.deltaOccupancyLines = set()  # Lines whose wayside only reports occupancy changes
             
         # Train ID management attributes (from train_id_manager)
         self.line_counters = {"Blue": 1, "Green": 1, "Red": 1}
@@ -271,6 +303,13 @@ class CTCSystem(QObject):
         # Departure time tracking for automatic departure triggering
         self.departure_triggered = set()  # Set of train IDs that have already triggered departure
         
+        # Sim-time event scheduler - closures, openings and departures register here
+        # so each tick only runs the events that are due
+        self.eventScheduler = EventScheduler()
+        self.closureEvents = {}    # Dict[str, ScheduledEvent] - closure ID -> event
+        self.openingEvents = {}    # Dict[str, ScheduledEvent] - related closure ID -> event
+        self.departureEvents = {}  # Dict[str, ScheduledEvent] - train ID -> event
+        
         # Initialize components
         self._initialize_components()
         
@@ -286,6 +325,13 @@ class CTCSystem(QObject):
         if hasattr(self, 'routeManager') and self.routeManager:
             self.routeManager.blocks = self.blocks
             logger.info(f"Passed {len(self.blocks)} blocks to RouteManager for pathfinding")
+            # Precompute route tables so dispatching never searches the track
+            self.routeManager.build_route_tables()
+        
+        # State signals also bump the versions of the domains they change
+        self.trains_updated.connect(lambda: self.mark_changed('trains', 'blocks'))
+        self.maintenance_updated.connect(lambda: self.mark_changed('blocks', 'warnings'))
+        self.warnings_updated.connect(lambda: self.mark_changed('warnings'))
         
         logger.info("CTC System initialized")
     
@@ -339,12 +385,26 @@ class CTCSystem(QObject):
                 return block
         
         # Search all lines for this block number
-        for (line, num), block in self.blocks.items():
-            if num == block_number:
-                return block
+        for line_table in self.line_blocks.values():
+            if 0 <= block_number < len(line_table) and line_table[block_number]:
+                return line_table[block_number]
         
         return None
     
+    def _index_block(self, line: str, block_number: int, block: Block) -> None:
+        """
+        Store a block in its line's array-backed block table
+        
+        Args:
+            line: Line name
+            block_number: Block number (index into the line table)
+            block: Block object
+        """
+        line_table = self.line_blocks.setdefault(line, [])
+        if block_number >= len(line_table):
+            line_table.extend([None] * (block_number + 1 - len(line_table)))
+        line_table[block_number] = block
+    
     def find_block_for_destination(self, destination_block_number: int, train_id: str = None) -> Optional[Block]:
         """
         Find a block object for a given destination block number.
@@ -528,11 +588,41 @@ class CTCSystem(QObject):
             self.warnings_updated.emit()
             self.state_changed.emit()
     
+    def mark_changed(self, *domains: str) -> None:
+        """
+        Bump the version counters of changed state domains
+        
+        Args:
+            domains: Changed domains ('trains', 'blocks', 'warnings', 'routes', 'throughput', 'clock')
+        """
+        with self._lock:
+            for domain in domains:
+                self.domainVersions[domain] = self.domainVersions.get(domain, 0) + 1
+    
+    def _set_suggested_speed(self, train_id: str, speed: int) -> None:
+        """
+        Record a train's suggested speed, marking the trains domain if it changed
+        
+        Args:
+            train_id: ID of the train
+            speed: Suggested speed command
+        """
+        if train_id in self.trainSuggestedSpeeds and self.trainSuggestedSpeeds[train_id] == speed:
+            return
+        self.trainSuggestedSpeeds[train_id] = speed
+        self.mark_changed('trains')
+    
+    def get_domain_versions(self) -> Dict[str, int]:
+        """Get a copy of the state domain version counters"""
+        with self._lock:
+            return dict(self.domainVersions)
+    
     def update_track_status(self, line: str, block: int, status: str) -> None:
         """Update track status for a specific block"""
         if line not in self.trackStatus:
             self.trackStatus[line] = {}
         self.trackStatus[line][block] = status
+        self.mark_changed('blocks', 'warnings')
         self.state_changed.emit()
     
     def get_track_status(self, line: str, block: int) -> Optional[str]:
@@ -542,6 +632,7 @@ class CTCSystem(QObject):
     def update_railway_crossing(self, line: str, block: int, status: str) -> None:
         """Update railway crossing status"""
         self.railwayCrossings[(line, block)] = status
+        self.mark_changed('blocks', 'warnings')
         self.state_changed.emit()
     
     def get_railway_crossing_status(self, line: str, block: int) -> Optional[str]:
@@ -701,22 +792,19 @@ class CTCSystem(QObject):
         try:
             current_time = _get_simulation_time()
             
-            # Add to new ticket purchase history with line tracking
-            purchase_entry = {
-                'tickets': tickets,
-                'line': line,
-                'timestamp': current_time
-            }
-            self.ticket_purchase_history.append(purchase_entry)
+            # Add to the line's sliding-window counter
+            if line in self.lineThroughput:
+                self.lineThroughput[line].add(tickets, current_time)
             
             # Legacy support - keep old throughputMetrics for compatibility
             self.throughputMetrics.append(tickets)
-            
-            # Clean up old data (older than 1 hour)
-            self._cleanup_old_throughput_data()
+            if len(self.throughputMetrics) > 3600:  # Keep 1 hour of data assuming 1 entry per second
+                del self.throughputMetrics[0]
             
             # Calculate current hourly throughput
             hourly_rates = self.calculate_hourly_throughput()
+            self.lastHourlyRates = hourly_rates
+            self.mark_changed('throughput')
             
             # Update display with calculated rates - use per-line data for proper display
             if self.displayManager:
@@ -735,6 +823,7 @@ class CTCSystem(QObject):
     def calculate_hourly_throughput(self, line: str = None) -> Dict[str, int]:
         """
         Calculate hourly throughput based on ticket purchases in the last hour
+        (to one-minute bucket resolution)
         
         Args:
             line: Optional line filter. If None, returns all lines
@@ -744,29 +833,16 @@ class CTCSystem(QObject):
         """
         try:
             current_time = _get_simulation_time()
-            cutoff_time = current_time - timedelta(hours=1)
-            
-            # Filter purchases from last hour
-            recent_purchases = [
-                purchase for purchase in self.ticket_purchase_history
-                if purchase['timestamp'] >= cutoff_time
-            ]
-            
-            # Calculate throughput by line
-            hourly_rates = {'Blue': 0, 'Red': 0, 'Green': 0}
-            
-            for purchase in recent_purchases:
-                purchase_line = purchase.get('line')
-                tickets = purchase.get('tickets', 0)
-                
-                if purchase_line in hourly_rates:
-                    hourly_rates[purchase_line] += tickets
             
             # Return specific line or all lines
             if line:
-                return {line: hourly_rates.get(line, 0)}
+                counter = self.lineThroughput.get(line)
+                return {line: counter.get_total(current_time) if counter else 0}
             else:
-                return hourly_rates
+                return {
+                    line_name: counter.get_total(current_time)
+                    for line_name, counter in self.lineThroughput.items()
+                }
                 
         except Exception as e:
             logger.error(f"Error calculating hourly throughput: {e}")
@@ -785,26 +861,20 @@ class CTCSystem(QObject):
         hourly_rates = self.calculate_hourly_throughput(line)
         return hourly_rates.get(line, 0)
     
-    def _cleanup_old_throughput_data(self):
-        """
-        Remove throughput data older than 1 hour to prevent memory buildup
+    def get_throughput_history(self, line: str) -> List[Tuple[datetime, int]]:
         """
-        try:
-            current_time = _get_simulation_time()
-            cutoff_time = current_time - timedelta(hours=1)
-            
-            # Clean up new ticket purchase history
-            self.ticket_purchase_history = [
-                purchase for purchase in self.ticket_purchase_history
-                if purchase['timestamp'] >= cutoff_time
-            ]
+        Get per-minute ticket counts for a line over the last hour
+        
+        Args:
+            line: Line name (Blue, Red, Green)
             
-            # Clean up legacy throughputMetrics (keep only recent entries)
-            if len(self.throughputMetrics) > 3600:  # Keep 1 hour of data assuming 1 entry per second
-                self.throughputMetrics = self.throughputMetrics[-3600:]
-                
-        except Exception as e:
-            logger.error(f"Error cleaning up throughput data: {e}")
+        Returns:
+            List of (minute start time, tickets) tuples, oldest first
+        """
+        counter = self.lineThroughput.get(line)
+        if not counter:
+            return []
+        return counter.get_history(_get_simulation_time())
     
     def schedule_route(self, route: Route) -> None:
         """
@@ -815,6 +885,7 @@ class CTCSystem(QObject):
         """
         # Store route
         self.routes[route.routeID] = route
+        self.mark_changed('routes')
         
         # Schedule with communication handler
         if self.communicationHandler:
@@ -844,6 +915,11 @@ class CTCSystem(QObject):
             if not self.routeManager.validate_route(route):
                 return "ERROR: Route no longer valid"
             
+            # Report trains already holding the route's blocks at the same time
+            conflicts = self.find_route_conflicts(route)
+            if conflicts:
+                logger.warning(f"Route {route.routeID} overlaps reservations on {len(conflicts)} blocks: {conflicts}")
+            
             # Activate route
             if route.trainID:
                 route.activate_route(route.trainID)
@@ -854,13 +930,15 @@ class CTCSystem(QObject):
         except Exception as e:
             return f"ERROR: {str(e)}"
     
-    def validate_closure(self, block: Block, time: datetime) -> bool:
+    def validate_closure(self, block: Block, time: datetime, duration: timedelta = None) -> bool:
         """
         Validate block closure feasibility
         
         Args:
             block: Block to close
             time: Closure time
+            duration: Optional closure length; without it the block is treated as
+                closed from time onwards
             
         Returns:
             True if closure is feasible
@@ -870,27 +948,53 @@ class CTCSystem(QObject):
             return False
         
         block_id = block.blockID
-        if block_id not in self.blocks:
+        line = getattr(block, 'line', None)
+        actual_block = self.get_block_by_line_new(line, block_id) if line else self.blocks.get(block_id)
+        if not actual_block:
             return False
         
-        actual_block = self.blocks[block_id]
-        
         # Check if block is currently occupied
         if actual_block.occupied:
             logger.warning(f"Block {block_id} closure denied: currently occupied")
             return False
         
-        # Check scheduled occupations
-        for train in self.trains.values():
-            if hasattr(train, 'route') and train.route:
-                route = train.route
-                # Check if train's route uses this block at the closure time
-                if self._route_uses_block_at_time(route, block_id, time):
-                    logger.warning(f"Block {block_id} closure denied: scheduled train conflict")
-                    return False
+        # Check scheduled occupations in the space-time reservation table
+        end_time = time + duration if duration else None
+        conflicts = self.blockReservations.find_conflicts((line, block_id), time, end_time)
+        if conflicts:
+            logger.warning(f"Block {block_id} closure denied: scheduled train conflict with {', '.join(conflicts)}")
+            return False
+        
+        # Reservations are projected when a route is indexed and go stale as trains
+        # fall behind, so re-project every train that still has the block ahead
+        # from its current route position
+        for train, i in self.route_block_index.get(block_id, ()):
+            train_id = self._get_train_id(train)
+            route = getattr(train, 'route', None)
+            if self.indexed_routes.get(train_id, (None, None))[1] is not route:
+                continue
+            if i < getattr(route, 'currentBlockIndex', 0):
+                continue
+            if self._route_uses_block_at_time(route, line, block_id, time, end_time):
+                logger.warning(f"Block {block_id} closure denied: train {train_id} still has it ahead on its route")
+                return False
         
         logger.info(f"Block {block_id} closure validated for {time}")
         return True
+    
+    def find_route_conflicts(self, route: Route, train_id: str = None) -> Dict[Tuple[str, int], List[str]]:
+        """
+        Find trains whose block reservations overlap a route's estimated block times
+        
+        Args:
+            route: Route to check
+            train_id: Train that would follow the route (its own reservations are ignored)
+            
+        Returns:
+            (line, block) -> conflicting train IDs, only for blocks with conflicts
+        """
+        train_id = train_id or getattr(route, 'trainID', None)
+        return self.blockReservations.find_route_conflicts(train_id, route, self._get_reservation_base_time(route))
 
     def system_tick(self, current_time: datetime) -> None:
         """
@@ -902,36 +1006,46 @@ class CTCSystem(QObject):
         self.system_time = current_time
         logger.debug(f"System tick: {current_time}")
         
+        # Time-dependent displays (ETAs, closure status) only change per minute
+        clock_minute = current_time.replace(second=0, microsecond=0)
+        if clock_minute != self.lastClockMinute:
+            self.lastClockMinute = clock_minute
+            self.mark_changed('clock')
+        
         # Update all trains
         self._update_trains()
         
         # Update routes
         self._update_routes()
         
-        # Check for scheduled departures and automatically trigger dispatch_train_from_yard
-        self._check_departure_times(current_time)
+        # Count trains standing still on lines that only report occupancy changes
+        self._refresh_stationary_trains()
+        
+        # Run due scheduled events (departures, closures, openings) - only events
+        # whose due time has passed are popped from the scheduler heap
+        events_run = self.eventScheduler.run_due(current_time)
+        if events_run:
+            logger.debug(f"Ran {events_run} scheduled events")
         
         # Check for failures and conflicts
         self.check_system_state()
         
-        # Process scheduled closures (moved from FailureManager)
-        closure_actions = self.process_scheduled_closures()
-        opening_actions = self.process_scheduled_openings()
-        if closure_actions or opening_actions:
-            logger.debug(f"Processed {len(closure_actions)} closures, {len(opening_actions)} openings")
-        
         # Commands are now sent only on events (routing, rerouting, block occupation updates)
         # No continuous command sending
         
         # Update metrics including throughput cleanup and calculation
         self._update_metrics()
         
-        # Clean up old throughput data and calculate current rates
-        self._cleanup_old_throughput_data()
-        
-        # Calculate current hourly throughput per line
+        # Calculate current hourly throughput per line (counters expire old
+        # buckets themselves, so there is no history to clean up)
         hourly_rates = self.calculate_hourly_throughput()
         
+        # Only push throughput to the display when a line's rate changed
+        if hourly_rates == self.lastHourlyRates:
+            return
+        self.lastHourlyRates = hourly_rates
+        self.mark_changed('throughput')
+        
         # Update display manager with per-line throughput if available
         if self.displayManager and hourly_rates:
             # Update all line throughput data at once to emit single signal
@@ -1011,7 +1125,7 @@ class CTCSystem(QObject):
             
             self.trains[train_id] = train
             self.trainAuthorities[train_id] = 1
-            self.trainSuggestedSpeeds[train_id] = 0
+            self._set_suggested_speed(train_id, 0)
             self.active_train_ids.add(train_id)
             
             # Train location tracking is handled by wayside controller reports
@@ -1032,8 +1146,9 @@ class CTCSystem(QObject):
                 return False
             
             self.trains[train_id] = train
+            self.update_route_index(train)
             self.trainAuthorities[train_id] = getattr(train, 'authority', 1)
-            self.trainSuggestedSpeeds[train_id] = getattr(train, 'speed', 0)
+            self._set_suggested_speed(train_id, getattr(train, 'speed', 0))
             self.active_train_ids.add(train_id)
             self.trains_updated.emit()
             self.state_changed.emit()
@@ -1066,6 +1181,8 @@ class CTCSystem(QObject):
             # Deactivate route
             if hasattr(train, 'route') and train.route:
                 train.route.deactivate_route()
+            self._remove_route_index(train_id)
+            self.eventScheduler.cancel(self.departureEvents.pop(train_id, None))
             
             del self.trains[train_id]
             
@@ -1074,6 +1191,7 @@ class CTCSystem(QObject):
                 del self.trainAuthorities[train_id]
             if train_id in self.trainSuggestedSpeeds:
                 del self.trainSuggestedSpeeds[train_id]
+                self.mark_changed('trains')
             
             # Remove from active trains
             if train_id in self.activeTrains:
@@ -1122,24 +1240,20 @@ class CTCSystem(QObject):
         Returns:
             Block object for the specific line or None if not found
         """
-        for block in self.blocks.values():
-            if (hasattr(block, 'line') and block.line == line and 
-                block.blockID == block_number):
-                return block
-        
-        return None
+        return self._get_block_by_index(block_number, line)
     
     def get_all_blocks(self) -> Dict[int, Block]:
         """Get all blocks in system"""
         return self.blocks.copy()
     
-    def process_occupied_blocks(self, occupied_blocks: List[bool]) -> None:
+    def process_occupied_blocks(self, occupied_blocks: List[bool], line: str = None) -> None:
         """
         Process occupied blocks update from wayside
         Updates block objects, train objects, and route objects based on occupation changes
         
         Args:
             occupied_blocks: List of block occupation states (block index -> occupation)
+            line: Line the update belongs to (defaults to the first loaded line)
         """
         logger.debug(f"Processing {len(occupied_blocks)} block occupancy updates")
         
@@ -1149,64 +1263,135 @@ class CTCSystem(QObject):
         # Process each block in the occupied_blocks array
         for block_index, is_occupied in enumerate(occupied_blocks):
             # Find the corresponding block object
-            block_obj = self._get_block_by_index(block_index)
+            block_obj = self._get_block_by_index(block_index, line)
             if not block_obj:
                 logger.debug(f"No block object found for index {block_index}")
                 continue
             
-            block_id = block_obj.blockID
-            old_occupation = block_obj.occupied
-            
-            # Update block occupation status
-            block_obj.update_occupation(is_occupied)
+            self._apply_block_occupancy(block_obj, is_occupied, line, trains_moved)
+        
+        self._finish_occupancy_update(trains_moved)
+        
+        logger.debug(f"Completed processing {len(occupied_blocks)} block occupancy updates")
+    
+    def process_occupied_block_changes(self, changed_blocks: Dict[int, bool], line: str = None) -> None:
+        """
+        Process only the occupation entries that changed on a line
+        Cost is proportional to the number of changes. Trains that stay in their
+        block are counted by system_tick instead (see _refresh_stationary_trains)
+        
+        Args:
+            changed_blocks: Block number -> new occupation state
+            line: Line the changes belong to (defaults to the first loaded line)
+        """
+        if line:
+            self.deltaOccupancyLines.add(line)
+        if not changed_blocks:
+            return
+        
+        trains_moved = set()
+        
+        for block_index, is_occupied in changed_blocks.items():
+            block_obj = self._get_block_by_index(block_index, line)
+            if not block_obj:
+                logger.debug(f"No block object found for index {block_index}")
+                continue
             
-            # Handle occupation changes
-            if old_occupation != is_occupied:
-                if is_occupied:
-                    # Block became occupied - find which train entered
-                    train = self._find_train_for_occupied_block(block_obj)
-                    if train:
-                        # Update block with train reference
-                        block_obj.add_train(train)
-                        
-                        # Update train location
-                        old_block = train.currentBlock
-                        train.update_location(block_obj, 0.0)
-                        
-                        # Update train movement history for emergency detection
-                        train.update_movement_history(block_id)
-                        
-                        # Track train for route updates
-                        trains_moved.add(train.trainID)
-                        
-                        logger.info(f"Train {train.trainID} entered block {block_id}")
-                        
-                        # Remove train from old block if different
-                        if old_block and old_block.blockID != block_id:
-                            old_block_obj = self.get_block_by_number(old_block.blockID)
-                            if old_block_obj and old_block_obj.occupyingTrain == train:
-                                old_block_obj.remove_train()
-                    else:
-                        logger.warning(f"Block {block_id} became occupied but no train found")
-                
+            self._apply_block_occupancy(block_obj, is_occupied, line, trains_moved)
+        
+        self._finish_occupancy_update(trains_moved)
+        logger.debug(f"Completed processing {len(changed_blocks)} block occupancy changes")
+    
+    def _refresh_stationary_trains(self) -> None:
+        """
+        Update movement history for trains still in their block on delta-reporting lines
+        
+        Full occupancy updates count stationary trains as they arrive; lines that
+        only report changes send nothing while trains stand still, so they are
+        counted once per system tick for emergency detection.
+        """
+        if not self.deltaOccupancyLines:
+            return
+        for train in self.trains.values():
+            block_obj = getattr(train, 'currentBlock', None)
+            if (block_obj and getattr(block_obj, 'line', None) in self.deltaOccupancyLines and
+                    block_obj.occupied and block_obj.occupyingTrain is train):
+                train.update_movement_history(block_obj.blockID)
+    
+    def _apply_block_occupancy(self, block_obj: Block, is_occupied: bool, line: str, trains_moved: Set[str]) -> None:
+        """
+        Apply one block's occupation state and reassign trains when it changes
+        
+        Args:
+            block_obj: Block reported by the wayside
+            is_occupied: New occupation state
+            line: Line the block belongs to
+            trains_moved: Set collecting IDs of trains that entered a new block
+        """
+        block_id = block_obj.blockID
+        old_occupation = block_obj.occupied
+        
+        # Update block occupation status
+        block_obj.update_occupation(is_occupied)
+        
+        # Handle occupation changes
+        if old_occupation != is_occupied:
+            self.mark_changed('blocks')
+            if is_occupied:
+                # Block became occupied - find which train entered
+                train = self._find_train_for_occupied_block(block_obj)
+                if train:
+                    # Update block with train reference
+                    block_obj.add_train(train)
+                    
+                    # Update train location
+                    old_block = train.currentBlock
+                    train.update_location(block_obj, 0.0)
+                    
+                    # Update train movement history for emergency detection
+                    train.update_movement_history(block_id)
+                    
+                    # Track train for route updates
+                    trains_moved.add(train.trainID)
+                    
+                    logger.info(f"Train {train.trainID} entered block {block_id}")
+                    
+                    # Remove train from old block if different
+                    if old_block and old_block.blockID != block_id:
+                        old_block_obj = self.get_block_by_number(old_block.blockID, line)
+                        if old_block_obj and old_block_obj.occupyingTrain == train:
+                            old_block_obj.remove_train()
                 else:
-                    # Block became unoccupied
-                    if block_obj.occupyingTrain:
-                        departing_train = block_obj.occupyingTrain
-                        
-                        # Update train movement history
-                        departing_train.update_movement_history(block_id)
-                        
-                        # Remove train from block
-                        block_obj.remove_train()
-                        
-                        logger.info(f"Train {departing_train.trainID} left block {block_id}")
+                    logger.warning(f"Block {block_id} became occupied but no train found")
             
-            # Always update movement history for trains currently in blocks
-            elif is_occupied and block_obj.occupyingTrain:
-                # Train still in same block - update movement history for emergency detection
-                train = block_obj.occupyingTrain
-                train.update_movement_history(block_id)
+            else:
+                # Block became unoccupied
+                if block_obj.occupyingTrain:
+                    departing_train = block_obj.occupyingTrain
+                    
+                    # Update train movement history
+                    departing_train.update_movement_history(block_id)
+                    
+                    # Remove train from block
+                    block_obj.remove_train()
+                    
+                    logger.info(f"Train {departing_train.trainID} left block {block_id}")
+        
+        # Always update movement history for trains currently in blocks
+        elif is_occupied and block_obj.occupyingTrain:
+            # Train still in same block - update movement history for emergency detection
+            train = block_obj.occupyingTrain
+            train.update_movement_history(block_id)
+    
+    def _finish_occupancy_update(self, trains_moved: Set[str]) -> None:
+        """
+        Update routes and commands for trains that moved, then notify the UI
+        
+        Args:
+            trains_moved: IDs of trains that entered a new block
+        """
+        if trains_moved:
+            self.mark_changed('trains')
         
         # Update route progress for all trains that moved
         for train_id in trains_moved:
@@ -1232,8 +1417,6 @@ class CTCSystem(QObject):
         # Emit signal for UI updates if available
         if hasattr(self, 'block_updates_signal'):
             self.block_updates_signal.emit()
-        
-        logger.debug(f"Completed processing {len(occupied_blocks)} block occupancy updates")
     
     def _get_blocks_with_switches(self, line: str) -> List[int]:
         """
@@ -1298,30 +1481,66 @@ class CTCSystem(QObject):
         # Process switch positions only for blocks that have switches
         for block_num in switch_blocks:
             if block_num < len(switch_positions):
-                switch_position = switch_positions[block_num]
-                
-                # Update block switch position if block exists
-                block_key = (line, block_num)
-                if block_key in self.blocks:
-                    block = self.blocks[block_key]
-                    if hasattr(block, 'set_switch_position'):
-                        old_position = getattr(block, 'switchPosition', None)
-                        block.set_switch_position(switch_position)
-                        
-                        if old_position != switch_position:
-                            position_name = "reverse" if switch_position else "normal"
-                            logger.info(f"{line} line block {block_num} switch updated to {position_name} position")
-                            updates_applied += 1
-                
-                # Update switch positions tracking
-                switch_id = f"{line}_Block_{block_num}"
-                position_name = "reverse" if switch_position else "normal"
-                self.update_switch_position(switch_id, line, block_num, position_name)
+                if self._apply_switch_position(line, block_num, switch_positions[block_num]):
+                    updates_applied += 1
             else:
                 logger.debug(f"Switch block {block_num} not in wayside data (block {block_num} >= array length {len(switch_positions)}) - expected when wayside controller doesn't control this switch")
         
         logger.debug(f"Applied {updates_applied} switch position updates on {line} line (blocks with switches: {switch_blocks})")
     
+    def process_switch_position_changes(self, changed_switches: Dict[int, bool], line: str) -> None:
+        """
+        Process only the switch positions that changed on a line
+        
+        Args:
+            changed_switches: Block number -> new switch position
+                            Entries for blocks without switches are ignored
+            line: The line name ("Red", "Green", "Blue") that this data is for
+        """
+        updates_applied = 0
+        for block_num, switch_position in changed_switches.items():
+            block = self._get_block_by_index(block_num, line)
+            if not block or not getattr(block, 'switchPresent', False):
+                continue
+            if self._apply_switch_position(line, block_num, switch_position):
+                updates_applied += 1
+        
+        logger.debug(f"Applied {updates_applied} switch position changes on {line} line")
+    
+    def _apply_switch_position(self, line: str, block_num: int, switch_position: bool) -> bool:
+        """
+        Apply one switch position reported by the wayside
+        
+        Args:
+            line: Line name
+            block_num: Block number of the switch
+            switch_position: Switch position (False = normal, True = reverse)
+            
+        Returns:
+            True if the block's switch position changed
+        """
+        changed = False
+        
+        # Update block switch position if block exists
+        block_key = (line, block_num)
+        if block_key in self.blocks:
+            block = self.blocks[block_key]
+            if hasattr(block, 'set_switch_position'):
+                old_position = getattr(block, 'switchPosition', None)
+                block.set_switch_position(switch_position)
+                
+                if old_position != switch_position:
+                    position_name = "reverse" if switch_position else "normal"
+                    logger.info(f"{line} line block {block_num} switch updated to {position_name} position")
+                    self.mark_changed('blocks')
+                    changed = True
+        
+        # Update switch positions tracking
+        switch_id = f"{line}_Block_{block_num}"
+        position_name = "reverse" if switch_position else "normal"
+        self.update_switch_position(switch_id, line, block_num, position_name)
+        return changed
+    
     def process_railway_crossings(self, railway_crossings: List[bool]) -> None:
         """
         Process railway crossings update from wayside
@@ -1379,6 +1598,8 @@ class CTCSystem(QObject):
             # Set up component references
             self.communicationHandler.ctc_system = self
             self.communicationHandler.track_reader = self.trackLayout
+            # Timed command sequences share the system scheduler driven by system_tick
+            self.communicationHandler.eventScheduler = self.eventScheduler
             # Initialize yard connections after track reader is set
             self._initialize_yard_connections()
             self.failureManager.ctc_system = self
@@ -1439,6 +1660,7 @@ class CTCSystem(QObject):
                             
                             # Store in line-aware structure
                             self.blocks[(line, block_number)] = block
+                            self._index_block(line, block_number, block)
                             
                             blocks_loaded_for_line += 1
                             total_blocks_loaded += 1
@@ -1512,6 +1734,7 @@ class CTCSystem(QObject):
                         
                         # Store in line-aware structure
                         self.blocks[(line, 0)] = yard_block
+                        self._index_block(line, 0, yard_block)
                         logger.info(f"Created yard block for {line} line with connections to blocks: {yard_connected_blocks}")
                     else:
                         logger.warning(f"No yard connections found for {line} line in track data")
@@ -1709,83 +1932,137 @@ class CTCSystem(QObject):
         if len(self.blockMetrics) > 3600:  # Keep 1 hour of data
             self.blockMetrics = self.blockMetrics[-3600:]
     
-    def _check_departure_times(self, current_time: datetime) -> None:
+    def _schedule_departure(self, train_id: str, route: Route) -> None:
         """
-        Check for scheduled departures and automatically trigger dispatch_train_from_yard
+        Register a yard departure with the event scheduler, replacing any
+        departure already pending for the train
         
         Args:
-            current_time: Current system time
+            train_id: ID of train departing from yard
+            route: Route whose scheduledDeparture sets the departure time
+        """
+        self.eventScheduler.cancel(self.departureEvents.pop(train_id, None))
+        
+        scheduled_departure = getattr(route, 'scheduledDeparture', None)
+        if not scheduled_departure:
+            return
+        
+        # Only handle yard departures automatically
+        starting_from_yard = (hasattr(route, 'startBlock') and route.startBlock and 
+                            getattr(route.startBlock, 'blockID', None) == 0)
+        if not starting_from_yard:
+            return
+        
+        self.departureEvents[train_id] = self.eventScheduler.schedule(
+            scheduled_departure - DEPARTURE_EARLY_TOLERANCE,
+            self._trigger_scheduled_departure, train_id, route,
+            name=f"departure {train_id}")
+    
+    def _trigger_scheduled_departure(self, train_id: str, route: Route) -> None:
         """
+        Scheduler callback: automatically trigger dispatch_train_from_yard
+        for a train whose scheduled departure time has arrived
+        
+        Args:
+            train_id: ID of train departing from yard
+            route: Route the departure was scheduled for
+        """
+        self.departureEvents.pop(train_id, None)
+        current_time = self.system_time
         timestamp = current_time.strftime("%H:%M:%S.%f")[:-3] if current_time else "??:??:??"
         
-        # Check all trains for scheduled departures
-        for train_id, train in self.trains.items():
-            # Skip trains that have already had their departure triggered
-            if train_id in self.departure_triggered:
-                continue
-                
-            # Check if train has a route with scheduled departure
-            if not hasattr(train, 'route') or not train.route:
-                continue
-                
-            route = train.route
-            scheduled_departure = getattr(route, 'scheduledDeparture', None)
-            
-            if not scheduled_departure:
-                continue
-                
-            # Check if train is starting from yard (block 0)
-            starting_from_yard = (hasattr(route, 'startBlock') and route.startBlock and 
-                                getattr(route.startBlock, 'blockID', None) == 0)
-            
-            if not starting_from_yard:
-                continue  # Only handle yard departures automatically
-                
-            # Check if departure time has arrived (with small tolerance for timing precision)
-            time_diff = (current_time - scheduled_departure).total_seconds()
-            
-            # Trigger departure if current time is at or past departure time (within 1 minute tolerance)
-            if -5 <= time_diff <= 60:  # Allow 5 seconds early, up to 60 seconds late
-                print(f"[{timestamp}]   DEPARTURE SCHEDULER: Triggering departure for train {train_id}")
-                print(f"[{timestamp}]   Scheduled: {scheduled_departure.strftime('%H:%M:%S')}")
-                print(f"[{timestamp}]   Current:   {current_time.strftime('%H:%M:%S')}")
-                print(f"[{timestamp}]   Time diff: {time_diff:.1f} seconds")
-                
-                # Mark departure as triggered to prevent duplicate calls
-                self.departure_triggered.add(train_id)
-                
-                # Call dispatch_train_from_yard to send departure commands
-                try:
-                    self.dispatch_train_from_yard(train_id)
-                    logger.info(f"Automatic departure triggered for train {train_id} at scheduled time")
-                except Exception as e:
-                    logger.error(f"Error triggering automatic departure for train {train_id}: {e}")
-                    # Remove from triggered set so it can be retried
-                    self.departure_triggered.discard(train_id)
-    
-    def _route_uses_block_at_time(self, route: Route, block_id: int, time: datetime) -> bool:
-        """Check if route uses specific block at given time"""
-        # This would check route timing and block sequence
-        # Simplified implementation
-        if hasattr(route, 'blockSequence'):
-            return any(block.blockID == block_id for block in route.blockSequence)
-        return False
+        # Skip stale events (train removed or rerouted) and trains already dispatched
+        train = self.trains.get(train_id)
+        if not train or getattr(train, 'route', None) is not route:
+            return
+        if train_id in self.departure_triggered:
+            return
+        
+        scheduled_departure = getattr(route, 'scheduledDeparture', None)
+        if not scheduled_departure:
+            return
+        
+        # Departure time was moved later without rescheduling - wait for it
+        time_diff = (current_time - scheduled_departure).total_seconds()
+        if time_diff < -DEPARTURE_EARLY_TOLERANCE.total_seconds():
+            self._schedule_departure(train_id, route)
+            return
+        
+        # Too late to trigger (within 1 minute tolerance)
+        if time_diff > DEPARTURE_LATE_TOLERANCE.total_seconds():
+            logger.warning(f"Scheduled departure for train {train_id} missed by {time_diff:.1f} seconds")
+            return
+        
+        print(f"[{timestamp}]   DEPARTURE SCHEDULER: Triggering departure for train {train_id}")
+        print(f"[{timestamp}]   Scheduled: {scheduled_departure.strftime('%H:%M:%S')}")
+        print(f"[{timestamp}]   Current:   {current_time.strftime('%H:%M:%S')}")
+        print(f"[{timestamp}]   Time diff: {time_diff:.1f} seconds")
+        
+        # Mark departure as triggered to prevent duplicate calls
+        self.departure_triggered.add(train_id)
+        
+        # Call dispatch_train_from_yard to send departure commands
+        try:
+            self.dispatch_train_from_yard(train_id)
+            logger.info(f"Automatic departure triggered for train {train_id} at scheduled time")
+        except Exception as e:
+            logger.error(f"Error triggering automatic departure for train {train_id}: {e}")
+            # Remove from triggered set and retry on the next tick
+            self.departure_triggered.discard(train_id)
+            self.departureEvents[train_id] = self.eventScheduler.schedule(
+                current_time + timedelta(seconds=1),
+                self._trigger_scheduled_departure, train_id, route,
+                name=f"departure {train_id}")
     
-    def _get_block_by_index(self, block_index: int) -> Optional[Block]:
+    def _route_uses_block_at_time(self, route: Route, line: Optional[str], block_id: int,
+                                  time: datetime, end_time: Optional[datetime] = None) -> bool:
+        """
+        Check if a route occupies a block during [time, end_time], using block
+        times projected from the route's current position
+        
+        Args:
+            route: Route to check
+            line: Line of the block (None matches any line)
+            block_id: Block number
+            time: Start of the window
+            end_time: End of the window (None = open-ended)
+        """
+        base_time = self._get_reservation_base_time(route)
+        return any(
+            key[1] == block_id and (line is None or key[0] in (None, line))
+            and end >= time and (end_time is None or start <= end_time)
+            for key, start, end in route_block_intervals(route, base_time, RESERVATION_MARGIN)
+        )
+    
+    def _get_reservation_base_time(self, route: Route) -> datetime:
+        """
+        Get the time a route's train is at the start of its current block:
+        the scheduled departure for trains still waiting to leave, otherwise now
+        """
+        scheduled_departure = getattr(route, 'scheduledDeparture', None)
+        if (getattr(route, 'currentBlockIndex', 0) == 0 and isinstance(scheduled_departure, datetime)
+                and scheduled_departure > self.system_time):
+            return scheduled_departure
+        return self.system_time
+    
+    def _get_block_by_index(self, block_index: int, line: str = None) -> Optional[Block]:
         """
         Find block object by index from occupied_blocks array
-        Maps array index to actual block objects based on controller coverage
+        Array index maps directly to block number in the line's block table
         
         Args:
             block_index: Index in the occupied_blocks array
+            line: Line name (defaults to the first loaded line)
             
         Returns:
             Block object if found, None otherwise
         """
-        # For now, assume index directly maps to block number
-        # This should be enhanced to handle proper controller-to-block mapping
-        for (line, block_number), block_obj in self.blocks.items():
-            if block_number == block_index:
+        if line is None:
+            line = next(iter(self.line_blocks), None)
+        line_table = self.line_blocks.get(line)
+        if line_table and 0 <= block_index < len(line_table):
+            block_obj = line_table[block_index]
+            if block_obj:
                 return block_obj
         
         logger.debug(f"No block found for index {block_index}")
@@ -1803,32 +2080,35 @@ class CTCSystem(QObject):
             Train object that should be in this block, or None if no train found
         """
         block_id = block_obj.blockID
+        block_line = getattr(block_obj, 'line', None)
         logger.debug(f"Finding train for newly occupied block {block_id}")
         
         # Check trains with active routes for this block
         candidate_trains = []
         
-        for train in self.trains.values():
-            if not hasattr(train, 'route') or not train.route:
-                continue
-                
+        for train, i in self.route_block_index.get(block_id, ()):
             route = train.route
-            if not hasattr(route, 'blockSequence') or not route.blockSequence:
+            # Skip entries for routes replaced or changed outside update_route_index
+            if self.indexed_routes.get(self._get_train_id(train), (None, None))[1] is not route:
                 continue
-                
-            # Check if this block is in the train's route
-            for i, route_block in enumerate(route.blockSequence):
-                if route_block.blockID == block_id:
-                    current_index = getattr(route, 'currentBlockIndex', 0)
-                    
-                    # Calculate progression from current position
-                    blocks_ahead = i - current_index
-                    
-                    # Accept trains that are progressing forward (0 to 2 blocks ahead)
-                    # This handles trains advancing normally or spanning multiple blocks
-                    if 0 <= blocks_ahead <= 2:
-                        candidate_trains.append((train, blocks_ahead, i))
-                        logger.debug(f"Train {train.trainID} candidate: route_pos={i}, current_index={current_index}, blocks_ahead={blocks_ahead}")
+            if i >= len(route.blockSequence):
+                continue
+            
+            # Skip routes on a different line that reuse the block number
+            route_line = getattr(route.blockSequence[i], 'line', None)
+            if isinstance(block_line, str) and isinstance(route_line, str) and route_line != block_line:
+                continue
+            
+            current_index = getattr(route, 'currentBlockIndex', 0)
+            
+            # Calculate progression from current position
+            blocks_ahead = i - current_index
+            
+            # Accept trains that are progressing forward (0 to 2 blocks ahead)
+            # This handles trains advancing normally or spanning multiple blocks
+            if 0 <= blocks_ahead <= 2:
+                candidate_trains.append((train, blocks_ahead, i))
+                logger.debug(f"Train {train.trainID} candidate: route_pos={i}, current_index={current_index}, blocks_ahead={blocks_ahead}")
         
         # If we have route-based candidates, choose the best one
         if candidate_trains:
@@ -1865,6 +2145,54 @@ class CTCSystem(QObject):
         logger.debug(f"No train found for newly occupied block {block_id}")
         return None
 
+    def update_route_index(self, train) -> None:
+        """
+        Re-index a train's route in the block -> (train, route position) index
+        Call whenever a train's route is assigned, replaced or cleared
+        
+        Args:
+            train: Train whose route changed
+        """
+        train_id = self._get_train_id(train)
+        self._remove_route_index(train_id)
+        self.mark_changed('routes', 'trains')
+        
+        route = getattr(train, 'route', None)
+        block_sequence = getattr(route, 'blockSequence', None) if route else None
+        if not block_sequence:
+            return
+        
+        for i, route_block in enumerate(block_sequence):
+            self.route_block_index.setdefault(route_block.blockID, []).append((train, i))
+        self.indexed_routes[train_id] = (train, route)
+        
+        # Reserve the route's estimated block times for closure and conflict checks
+        try:
+            self.blockReservations.reserve_route(train_id, route, self._get_reservation_base_time(route))
+        except Exception as e:
+            logger.warning(f"Could not reserve block times for train {train_id}: {e}")
+        logger.debug(f"Indexed {len(block_sequence)} route positions for train {train_id}")
+    
+    def _remove_route_index(self, train_id: str) -> None:
+        """
+        Remove a train's route positions from the route block index
+        
+        Args:
+            train_id: ID of train whose entries should be removed
+        """
+        self.blockReservations.release(train_id)
+        indexed = self.indexed_routes.pop(train_id, None)
+        if not indexed:
+            return
+        
+        train, route = indexed
+        for block_id in {route_block.blockID for route_block in route.blockSequence}:
+            entries = [entry for entry in self.route_block_index.get(block_id, ()) if entry[0] is not train]
+            if entries:
+                self.route_block_index[block_id] = entries
+            else:
+                self.route_block_index.pop(block_id, None)
+    
     def _get_train_id(self, train) -> str:
         """Extract train ID from train object"""
         if hasattr(train, 'trainID'):
@@ -1930,6 +2258,7 @@ class CTCSystem(QObject):
             # Set route on train
             train.route = route
             route.trainID = train_id
+            self.update_route_index(train)
             
             # Set departure time and destination on train for display (TBTG camelCase)
             if hasattr(route, 'scheduledDeparture'):
@@ -1940,6 +2269,9 @@ class CTCSystem(QObject):
                 train.arrival_time = route.scheduledArrival      # Keep for compatibility
             if hasattr(route, 'endBlock'):
                 train.destination = getattr(route.endBlock, 'blockID', 'Unknown')
+            
+            # Register yard departures with the event scheduler
+            self._schedule_departure(train_id, route)
 
             # DEBUG: Log route details
             route_id = getattr(route, 'routeID', 'Unknown')
@@ -2050,6 +2382,11 @@ class CTCSystem(QObject):
         Process any scheduled closures that are due
         System-wide coordination of scheduled maintenance closures
         
+        Not called by system_tick: closures registered through
+        schedule_block_closure() run from the event scheduler. This on-demand
+        full sweep is the only way entries added to scheduledClosures
+        directly are executed.
+        
         Returns:
             List of action messages for what was processed
         """
@@ -2060,28 +2397,7 @@ class CTCSystem(QObject):
         
         for scheduled in self.scheduledClosures[:]:  # Copy list to allow modifications
             if scheduled['status'] == 'scheduled' and scheduled['scheduled_time'] <= current_time:
-                logger.info(f"Executing scheduled closure: Block {scheduled['block_number']} on {scheduled['line']} line")
-                
-                # Get the block object
-                block = self.get_block_by_line_new(scheduled['line'], scheduled['block_number'])
-                if block:
-                    # Use block's own method to close
-                    block.set_block_open(False)
-                    scheduled['status'] = 'active'
-                    
-                    # Add to maintenance closures tracking
-                    self.add_maintenance_closure(scheduled['line'], scheduled['block_number'])
-                    
-                    # Notify communication handler if needed
-                    # Communication handler will be notified through wayside updates
-                    
-                    logger.info(f"Successfully executed scheduled closure of block {scheduled['block_number']} on {scheduled['line']} line")
-                    actions.append(f"Executed scheduled closure of block {scheduled['block_number']} on {scheduled['line']} line")
-                else:
-                    # Mark as failed if block not found
-                    scheduled['status'] = 'failed'
-                    logger.error(f"Failed to execute closure of block {scheduled['block_number']}: Block not found")
-                    actions.append(f"Failed to execute closure of block {scheduled['block_number']}: Block not found")
+                actions.append(self._execute_scheduled_closure(scheduled))
         
         return actions
     
@@ -2090,6 +2406,11 @@ class CTCSystem(QObject):
         Process any scheduled openings that are due
         System-wide coordination of scheduled maintenance openings
         
+        Not called by system_tick: openings registered through
+        schedule_block_closure() run from the event scheduler. This on-demand
+        full sweep is the only way entries added to scheduledOpenings
+        directly are executed.
+        
         Returns:
             List of action messages for what was processed
         """
@@ -2100,36 +2421,96 @@ class CTCSystem(QObject):
         
         for scheduled in self.scheduledOpenings[:]:  # Copy list to allow modifications
             if scheduled['scheduled_time'] <= current_time:
-                logger.info(f"Executing scheduled opening: Block {scheduled['block_number']} on {scheduled['line']} line")
-                
-                # Get the block object
-                block = self.get_block_by_line_new(scheduled['line'], scheduled['block_number'])
-                if block:
-                    # Use block's own method to open
-                    block.set_block_open(True)
-                    
-                    # Remove from scheduled openings list
-                    self.scheduledOpenings.remove(scheduled)
-                    
-                    # Mark related closure as completed
-                    for closure in self.scheduledClosures:
-                        if closure['id'] == scheduled.get('related_closure'):
-                            closure['status'] = 'completed'
-                    
-                    # Remove from maintenance closures tracking
-                    self.remove_maintenance_closure(scheduled['line'], scheduled['block_number'])
-                    
-                    # Notify communication handler if needed
-                    # Communication handler will be notified through wayside updates
-                    
-                    logger.info(f"Successfully executed scheduled opening of block {scheduled['block_number']} on {scheduled['line']} line")
-                    actions.append(f"Executed scheduled opening of block {scheduled['block_number']} on {scheduled['line']} line")
-                else:
-                    logger.error(f"Failed to execute opening of block {scheduled['block_number']}: Block not found")
-                    actions.append(f"Failed to execute opening of block {scheduled['block_number']}: Block not found")
+                actions.append(self._execute_scheduled_opening(scheduled))
         
         return actions
     
+    def _execute_scheduled_closure(self, scheduled: dict) -> str:
+        """
+        Close the block of one due scheduled closure
+        
+        Args:
+            scheduled: Entry from scheduledClosures
+            
+        Returns:
+            Action message for what was processed
+        """
+        self.eventScheduler.cancel(self.closureEvents.pop(scheduled.get('id'), None))
+        logger.info(f"Executing scheduled closure: Block {scheduled['block_number']} on {scheduled['line']} line")
+        
+        # Get the block object
+        block = self.get_block_by_line_new(scheduled['line'], scheduled['block_number'])
+        if block:
+            # Use block's own method to close
+            block.set_block_open(False)
+            scheduled['status'] = 'active'
+            
+            # Add to maintenance closures tracking
+            self.add_maintenance_closure(scheduled['line'], scheduled['block_number'])
+            
+            # Notify communication handler if needed
+            # Communication handler will be notified through wayside updates
+            
+            logger.info(f"Successfully executed scheduled closure of block {scheduled['block_number']} on {scheduled['line']} line")
+            return f"Executed scheduled closure of block {scheduled['block_number']} on {scheduled['line']} line"
+        
+        # Mark as failed if block not found
+        scheduled['status'] = 'failed'
+        logger.error(f"Failed to execute closure of block {scheduled['block_number']}: Block not found")
+        return f"Failed to execute closure of block {scheduled['block_number']}: Block not found"
+    
+    def _execute_scheduled_opening(self, scheduled: dict) -> str:
+        """
+        Reopen the block of one due scheduled opening
+        
+        Args:
+            scheduled: Entry from scheduledOpenings
+            
+        Returns:
+            Action message for what was processed
+        """
+        logger.info(f"Executing scheduled opening: Block {scheduled['block_number']} on {scheduled['line']} line")
+        
+        # Get the block object
+        block = self.get_block_by_line_new(scheduled['line'], scheduled['block_number'])
+        if block:
+            self.eventScheduler.cancel(self.openingEvents.pop(scheduled.get('related_closure'), None))
+            
+            # Use block's own method to open
+            block.set_block_open(True)
+            
+            # Remove from scheduled openings list
+            self.scheduledOpenings.remove(scheduled)
+            
+            # Mark related closure as completed
+            for closure in self.scheduledClosures:
+                if closure['id'] == scheduled.get('related_closure'):
+                    closure['status'] = 'completed'
+            
+            # Remove from maintenance closures tracking
+            self.remove_maintenance_closure(scheduled['line'], scheduled['block_number'])
+            
+            # Notify communication handler if needed
+            # Communication handler will be notified through wayside updates
+            
+            logger.info(f"Successfully executed scheduled opening of block {scheduled['block_number']} on {scheduled['line']} line")
+            return f"Executed scheduled opening of block {scheduled['block_number']} on {scheduled['line']} line"
+        
+        logger.error(f"Failed to execute opening of block {scheduled['block_number']}: Block not found")
+        return f"Failed to execute opening of block {scheduled['block_number']}: Block not found"
+    
+    def _run_scheduled_closure(self, scheduled: dict) -> None:
+        """Scheduler callback: execute a closure if it is still scheduled"""
+        self.closureEvents.pop(scheduled['id'], None)
+        if scheduled['status'] == 'scheduled':
+            self._execute_scheduled_closure(scheduled)
+    
+    def _run_scheduled_opening(self, scheduled: dict) -> None:
+        """Scheduler callback: execute an opening if it is still scheduled"""
+        self.openingEvents.pop(scheduled.get('related_closure'), None)
+        if any(opening is scheduled for opening in self.scheduledOpenings):
+            self._execute_scheduled_opening(scheduled)
+    
     def schedule_block_closure(self, line: str, block_number: int, closure_time: datetime, duration: timedelta = None) -> dict:
         """
         Simple delegation to Block's schedule_closure method
@@ -2151,29 +2532,38 @@ class CTCSystem(QObject):
         result = block.schedule_closure(closure_time)
         
         if result['success']:
-            # Track in CTC system for process_scheduled_closures
+            # Track in CTC system for display, cancellation and process_scheduled_closures
             import uuid
             closure_id = str(uuid.uuid4())
             
-            self.scheduledClosures.append({
+            scheduled_closure = {
                 'id': closure_id,
                 'line': line,
                 'block_number': block_number,
                 'scheduled_time': closure_time,
                 'status': 'scheduled'
-            })
+            }
+            self.scheduledClosures.append(scheduled_closure)
+            self.mark_changed('blocks')
+            self.closureEvents[closure_id] = self.eventScheduler.schedule(
+                closure_time, self._run_scheduled_closure, scheduled_closure,
+                name=f"closure {line} {block_number}")
             
             # Schedule automatic reopening if duration specified
             if duration:
                 opening_time = closure_time + duration
                 block.schedule_opening(opening_time)
                 
-                self.scheduledOpenings.append({
+                scheduled_opening = {
                     'line': line,
                     'block_number': block_number,
                     'scheduled_time': opening_time,
                     'related_closure': closure_id
-                })
+                }
+                self.scheduledOpenings.append(scheduled_opening)
+                self.openingEvents[closure_id] = self.eventScheduler.schedule(
+                    opening_time, self._run_scheduled_opening, scheduled_opening,
+                    name=f"opening {line} {block_number}")
         
         return result
     
@@ -2200,12 +2590,15 @@ class CTCSystem(QObject):
         for scheduled in self.scheduledClosures[:]:
             if scheduled['line'] == line and scheduled['block_number'] == block_number and scheduled['status'] == 'scheduled':
                 self.scheduledClosures.remove(scheduled)
+                self.eventScheduler.cancel(self.closureEvents.pop(scheduled['id'], None))
+                self.mark_changed('blocks')
                 cancelled_count += 1
                 
                 # Remove related opening
                 for opening in self.scheduledOpenings[:]:
                     if opening.get('related_closure') == scheduled['id']:
                         self.scheduledOpenings.remove(opening)
+                self.eventScheduler.cancel(self.openingEvents.pop(scheduled['id'], None))
         
         if cancelled_count > 0:
             return {'success': True, 'message': f'Cancelled {cancelled_count} scheduled closures for block {block_number}'}
@@ -2615,6 +3008,7 @@ class CTCSystem(QObject):
             for train_id, train in self.trains.items():
                 if hasattr(train, 'route') and train.route and getattr(train.route, 'routeID', None) == route_id:
                     train.route = None
+                    self._remove_route_index(train_id)
                     logger.info(f"Removed route {route_id} from train {train_id}")
             
             logger.info(f"Route {route_id} cancelled successfully")
@@ -2835,6 +3229,8 @@ class CTCSystem(QObject):
                 train.route.scheduledDeparture = departure_time
                 train.departureTime = departure_time
                 train.departure_time = departure_time
+                self._schedule_departure(train_id, train.route)
+                self.update_route_index(train)
             
             # Check if train is in yard (for automatic dispatch)
             current_block = getattr(train.currentBlock, 'blockID', getattr(train.currentBlock, 'blockNumber', 0)) if train.currentBlock else 0
@@ -2888,7 +3284,7 @@ class CTCSystem(QObject):
                 self.communicationHandler.stop_train(train)
             
             # Set speed to 0
-            self.trainSuggestedSpeeds[train_id] = 0
+            self._set_suggested_speed(train_id, 0)
             
             # Add to emergency stops if reason indicates emergency
             if "emergency" in reason.lower():
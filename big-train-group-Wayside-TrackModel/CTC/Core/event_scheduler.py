@@ -0,0 +1,178 @@
+"""
+Event Scheduler Module
+=====================
+Simulation-time event scheduler for the CTC system.
+
+This module handles:
+- Registering callbacks to run at a simulated due time
+- Cancelling registered events through their handles
+- Running only the events that are due on each system tick
+
+Events are kept in a min-heap keyed by due time, so a tick costs
+O(k log n) for the k due events instead of a scan of every pending item.
+Cancelled events are marked and skipped when they reach the top of the heap.
+"""
+
+from typing import Any, Callable, List, Optional
+from datetime import datetime
+import heapq
+import itertools
+import logging
+import threading
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class ScheduledEvent:
+    """
+    Handle for one event registered with the EventScheduler.
+
+    Attributes:
+        dueTime (datetime): Simulated time at which the event runs
+        callback (Callable): Function called when the event is due
+        args (tuple): Positional arguments passed to the callback
+        name (str): Short description used in log messages
+        cancelled (bool): True once the event has been cancelled
+        fired (bool): True once the callback has been run
+    """
+
+    __slots__ = ('dueTime', 'callback', 'args', 'name', 'cancelled', 'fired', '_sequence')
+
+    def __init__(self, due_time: datetime, callback: Callable, args: tuple, name: str, sequence: int):
+        self.dueTime = due_time
+        self.callback = callback
+        self.args = args
+        self.name = name
+        self.cancelled = False
+        self.fired = False
+        self._sequence = sequence
+
+    def __lt__(self, other: 'ScheduledEvent') -> bool:
+        # Events due at the same time run in registration order
+        return (self.dueTime, self._sequence) < (other.dueTime, other._sequence)
+
+    @property
+    def pending(self) -> bool:
+        """True while the event is neither cancelled nor fired"""
+        return not self.cancelled and not self.fired
+
+    def cancel(self) -> bool:
+        """
+        Cancel the event so it never runs
+
+        Returns:
+            True if the event was pending and is now cancelled
+        """
+        if not self.pending:
+            return False
+        self.cancelled = True
+        return True
+
+
+class EventScheduler:
+    """
+    Min-heap of ScheduledEvent handles ordered by simulated due time.
+
+    Attributes:
+        _heap (List[ScheduledEvent]): Pending (and lazily removed cancelled) events
+        _sequence (itertools.count): Tie-breaker preserving registration order
+        _lock (threading.RLock): Guards the heap; callbacks run outside the lock
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+
+    def schedule(self, due_time: datetime, callback: Callable, *args: Any, name: str = '') -> ScheduledEvent:
+        """
+        Register a callback to run at a simulated time
+
+        Args:
+            due_time: Simulated time at which to run the callback
+            callback: Function to call
+            *args: Positional arguments for the callback
+            name: Short description used in log messages
+
+        Returns:
+            Handle that can be used to cancel the event
+        """
+        event = ScheduledEvent(due_time, callback, args, name, next(self._sequence))
+        with self._lock:
+            heapq.heappush(self._heap, event)
+        logger.debug(f"Scheduled event '{name}' for {due_time}")
+        return event
+
+    def cancel(self, event: Optional[ScheduledEvent]) -> bool:
+        """
+        Cancel a registered event
+
+        Args:
+            event: Handle returned by schedule() (None is ignored)
+
+        Returns:
+            True if the event was pending and is now cancelled
+        """
+        if event is None:
+            return False
+        with self._lock:
+            return event.cancel()
+
+    def pop_due(self, current_time: datetime) -> List[ScheduledEvent]:
+        """
+        Remove and return every pending event due at or before current_time
+
+        Args:
+            current_time: Current simulated time
+
+        Returns:
+            Due events in due-time order, already marked as fired
+        """
+        due_events = []
+        with self._lock:
+            while self._heap and self._heap[0].dueTime <= current_time:
+                event = heapq.heappop(self._heap)
+                if event.cancelled:
+                    continue
+                event.fired = True
+                due_events.append(event)
+        return due_events
+
+    def run_due(self, current_time: datetime) -> int:
+        """
+        Run the callbacks of every event due at or before current_time.
+        Callbacks may schedule or cancel other events.
+
+        Args:
+            current_time: Current simulated time
+
+        Returns:
+            Number of callbacks run
+        """
+        due_events = self.pop_due(current_time)
+        for event in due_events:
+            try:
+                event.callback(*event.args)
+            except Exception as e:
+                logger.error(f"Error running scheduled event '{event.name}': {e}")
+        return len(due_events)
+
+    def next_due_time(self) -> Optional[datetime]:
+        """Get the due time of the earliest pending event, or None if there is none"""
+        with self._lock:
+            while self._heap and self._heap[0].cancelled:
+                heapq.heappop(self._heap)
+            return self._heap[0].dueTime if self._heap else None
+
+    def clear(self) -> None:
+        """Cancel and drop every pending event"""
+        with self._lock:
+            for event in self._heap:
+                event.cancel()
+            self._heap.clear()
+
+    def __len__(self) -> int:
+        """Number of pending (not cancelled) events"""
+        with self._lock:
+            return sum(1 for event in self._heap if not event.cancelled)
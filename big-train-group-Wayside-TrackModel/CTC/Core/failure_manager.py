@@ -16,6 +16,8 @@ from datetime import datetime
 import logging
 import uuid
 
+from .reroute_engine import RerouteEngine
+
 # Import simulation time (lazy import to avoid circular dependencies)
 # from Master_Interface.master_control import get_time
 
@@ -57,6 +59,7 @@ class FailureManager:
     Emergency Response:
         recovery_actions (Dict[str, dict]): Recovery status tracking by failure ID
         stopped_trains (Set[str]): Train IDs stopped due to failures
+        rerouteEngine (RerouteEngine): Cached shortest-path trees used to reroute trains
         
     Maintenance Coordination (Tracking Only):
         maintenanceClosures (Dict[str, List[int]]): Active closures by line (for tracking)
@@ -167,6 +170,7 @@ class FailureManager:
         # Recovery tracking
         self.recovery_actions = {}  # failure_id -> recovery_status
         self.stopped_trains = set()  # Set of train IDs that were stopped due to failures
+        self.rerouteEngine = None    # Created on first reroute (needs the route manager)
         
         # Migrated from maintenance_manager.py
         self.maintenanceClosures = {
@@ -270,6 +274,7 @@ class FailureManager:
             
             # Automatically stop affected trains
             self._stop_affected_trains_for_block(block)
+            self._mark_changed('blocks', 'warnings')
             
             logger.error(f"Block {block_id} added to failed blocks list")
     
@@ -309,6 +314,7 @@ class FailureManager:
             
             # Automatically stop the failed train
             self._emergency_stop_train(train)
+            self._mark_changed('trains', 'warnings')
             
             logger.error(f"Train {train_id} added to failed trains list")
     
@@ -324,17 +330,25 @@ class FailureManager:
         affected_trains = self.find_affected_trains()
         reroute_results = {}
         
+        # Mask the failed/closed blocks once; every train then shares the same path trees
+        engine = self._prepare_reroute_engine()
+        
         for train in affected_trains:
             train_id = self._get_train_id(train)
             
             # Only reroute if train was stopped due to failures (not if train itself failed)
             if train not in self.failedTrains and train_id in self.stopped_trains:
                 try:
-                    new_route = self._generate_alternative_route(train)
+                    new_route = engine.reroute_train(train) if engine else None
                     if new_route:
                         # Apply new route to train
                         if hasattr(train, 'route'):
                             train.route = new_route
+                            if hasattr(self.ctc_system, 'update_route_index'):
+                                self.ctc_system.update_route_index(train)
+                            # A pending yard departure still refers to the old route
+                            if hasattr(self.ctc_system, '_schedule_departure'):
+                                self.ctc_system._schedule_departure(train_id, new_route)
                         
                         # Remove from stopped trains
                         self.stopped_trains.discard(train_id)
@@ -379,6 +393,7 @@ class FailureManager:
             Dict mapping train_id to new route or error message
         """
         emergency_routes = {}
+        engine = self._prepare_reroute_engine()
         
         for train in affected_trains:
             train_id = self._get_train_id(train)
@@ -386,7 +401,7 @@ class FailureManager:
             try:
                 # Only generate routes for trains that aren't themselves failed
                 if train not in self.failedTrains:
-                    alternative_route = self._generate_alternative_route(train)
+                    alternative_route = engine.reroute_train(train) if engine else None
                     if alternative_route:
                         emergency_routes[train_id] = alternative_route
                     else:
@@ -423,6 +438,7 @@ class FailureManager:
             # Update display
             if self.display_manager:
                 self.display_manager.address_emergency(failure_id, emergency['resolution'])
+            self._mark_changed('blocks', 'trains', 'warnings')
             
             logger.info(f"Failure {failure_id} cleared")
     
@@ -538,6 +554,7 @@ class FailureManager:
                         # Notify display manager
                         if self.display_manager:
                             self.display_manager.update_train_error(train)
+                        self._mark_changed('warnings')
                         
                         logger.error(f"Emergency detected: Train {train_id} stopped unexpectedly at block {current_block} (stationary for {stationary_count} updates)")
         
@@ -599,30 +616,51 @@ class FailureManager:
     
     def _generate_alternative_route(self, train):
         """Generate alternative route avoiding failed blocks"""
-        if not hasattr(train, 'route') or not train.route:
+        engine = self._prepare_reroute_engine()
+        return engine.reroute_train(train) if engine else None
+    
+    def _prepare_reroute_engine(self) -> Optional[RerouteEngine]:
+        """
+        Get the reroute engine with the current failed/closed blocks applied as its mask
+        
+        Returns:
+            RerouteEngine, or None if no route manager is available
+        """
+        route_manager = getattr(self.ctc_system, 'routeManager', None) if self.ctc_system else None
+        if route_manager is None:
             return None
         
-        current_route = train.route
+        if self.rerouteEngine is None or self.rerouteEngine.routeManager is not route_manager:
+            self.rerouteEngine = RerouteEngine(route_manager)
+        self.rerouteEngine.set_blocked_blocks(self._get_blocked_blocks())
+        return self.rerouteEngine
+    
+    def _get_blocked_blocks(self) -> Dict[str, Set[int]]:
+        """
+        Get the blocks trains must be routed around
+        
+        Returns:
+            Dict mapping line name to IDs of failed, maintenance-closed and non-operational blocks
+        """
+        blocked = {line: set(block_numbers) for line, block_numbers in self.maintenanceClosures.items()}
         
-        # Get route manager to generate alternative
-        if self.ctc_system and hasattr(self.ctc_system, 'routeManager'):
-            route_manager = self.ctc_system.routeManager
-            
-            # Get start and end blocks
-            start_block = current_route.startBlock if hasattr(current_route, 'startBlock') else None
-            end_block = current_route.endBlock if hasattr(current_route, 'endBlock') else None
-            
-            if start_block and end_block and hasattr(route_manager, 'find_alternative_routes'):
-                # Find routes avoiding failed blocks
-                alternative_routes = route_manager.find_alternative_routes(
-                    start_block, end_block, self.failedBlocks
-                )
-                
-                if alternative_routes:
-                    return alternative_routes[0]  # Return first alternative
+        for block in self.failedBlocks:
+            line = getattr(block, 'line', None)
+            if line:
+                blocked.setdefault(line, set()).add(self._get_block_id(block))
+        
+        blocks = getattr(self.ctc_system, 'blocks', None)
+        if isinstance(blocks, dict):
+            for (line, block_number), block in blocks.items():
+                if hasattr(block, 'block_operational') and not block.block_operational():
+                    blocked.setdefault(line, set()).add(block_number)
         
-        return None
+        return blocked
     
+    def _mark_changed(self, *domains: str) -> None:
+        """Bump the CTC System's version counters for changed state domains"""
+        if self.ctc_system and hasattr(self.ctc_system, 'mark_changed'):
+            self.ctc_system.mark_changed(*domains)
     
     def _get_train_id(self, train) -> str:
         """Extract train ID from train object"""
@@ -691,6 +729,7 @@ class FailureManager:
             # Update display if available
             if self.display_manager:
                 self.display_manager.update_block_status(block)
+            self._mark_changed('blocks', 'warnings')
             
             logger.info(f"Block {block_id} removed from failed blocks and restored to operational")
             return True
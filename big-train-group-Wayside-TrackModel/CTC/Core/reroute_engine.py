@@ -0,0 +1,414 @@
+"""
+Reroute Engine Module
+====================
+Batch rerouting of trains around failed and closed blocks.
+
+This module handles:
+- Precomputing each line's (block, arrived-from) state graph once
+- Applying the failed/closed blocks of a line as a mask over that graph
+- Caching one shortest-path tree per destination and reusing it for every
+  train heading there
+- Invalidating only the trees a change of the mask actually affects
+
+The state graph follows the RouteManager's switch and direction rules but
+ignores block status, so it only depends on the track layout. Blocked blocks
+are skipped while a tree is built. When a failure adds blocks to the mask,
+only the states whose tree path ran through them are recomputed; the rest of
+each tree is kept. When blocks are reopened, a tree is kept unless a reopened
+block gains a move into it, otherwise it is rebuilt on next use. Rerouting
+many trains after a failure therefore costs at most one tree update per
+destination plus O(path length) per train.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
+import heapq
+import itertools
+import logging
+
+from .route import Route
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class RerouteEngine:
+    """
+    Shortest-path trees over masked line graphs, shared by all rerouted trains.
+
+    Attributes:
+        routeManager (RouteManager): Source of block connections and switch rules
+        lineGraphs (Dict[str, dict]): line -> block lookup, connections and
+            per-destination state successors
+        blockedBlocks (Dict[str, frozenset]): line -> block IDs currently masked
+        pathTrees (Dict[Tuple[str, int], dict]): (line, destination) -> next hops,
+            distances and blocks of a shortest-path tree under the current mask
+        treesBuilt (int): Number of trees computed from scratch
+        treesRepaired (int): Number of trees updated in place for new failures
+        treesReused (int): Number of tree lookups answered from the cache
+    """
+
+    def __init__(self, route_manager):
+        """
+        Args:
+            route_manager: RouteManager whose track connections are used
+        """
+        self.routeManager = route_manager
+        self.lineGraphs = {}
+        self.blockedBlocks = {}
+        self.pathTrees = {}
+        self.treesBuilt = 0
+        self.treesRepaired = 0
+        self.treesReused = 0
+
+    # === Line graphs ===
+
+    def _get_line_graph(self, line: str) -> Dict:
+        """
+        Get the state graph for a line, rebuilding it if the line's blocks changed
+
+        Args:
+            line: Line name
+
+        Returns:
+            Graph dictionary (shaped like a RouteManager route table with no closures)
+        """
+        block_lookup = {block.blockID: block for block in self.routeManager._get_all_blocks_on_line(line)}
+        graph = self.lineGraphs.get(line)
+        if graph is None or graph['block_ids'] != block_lookup.keys():
+            graph = {
+                'block_lookup': block_lookup,
+                'block_ids': set(block_lookup.keys()),
+                'closed_blocks': frozenset(),  # Blocks are masked per tree instead
+                'connected': {
+                    block_id: self.routeManager._get_connected_blocks(block)
+                    for block_id, block in block_lookup.items()
+                },
+                'destinations': {}  # destination -> (successors, predecessors, states by block)
+            }
+            self.lineGraphs[line] = graph
+            self.invalidate(line)
+            logger.debug(f"Reroute graph built for {line} line ({len(block_lookup)} blocks)")
+        return graph
+
+    def _get_state_graph(self, graph: Dict, line: str, destination_id: int) -> Tuple[Dict, Dict, Dict]:
+        """
+        Get the unmasked state graph towards one destination, building it on first use
+
+        Args:
+            graph: Line graph from _get_line_graph
+            line: Line name
+            destination_id: Destination block ID (the switch rules depend on it)
+
+        Returns:
+            Tuple of (state -> next states, state -> previous states, block -> its states)
+        """
+        cached = graph['destinations'].get(destination_id)
+        if cached is not None:
+            return cached
+
+        block_lookup = graph['block_lookup']
+        successors = {}
+        pending = deque((block_id, None) for block_id in block_lookup)
+        while pending:
+            state = pending.popleft()
+            if state in successors:
+                continue
+            successors[state] = self.routeManager._get_route_step_options(
+                graph, line, state, destination_id, block_lookup
+            )
+            pending.extend(s for s in successors[state] if s not in successors)
+
+        predecessors = {}
+        states_by_block = {}
+        for state, next_states in successors.items():
+            states_by_block.setdefault(state[0], []).append(state)
+            for next_state in next_states:
+                predecessors.setdefault(next_state, []).append(state)
+
+        graph['destinations'][destination_id] = (successors, predecessors, states_by_block)
+        return graph['destinations'][destination_id]
+
+    # === Masks and trees ===
+
+    def set_blocked_blocks(self, blocked_by_line: Dict[str, Iterable[int]]) -> int:
+        """
+        Replace the mask of every line and update the cached trees to match.
+        Lines missing from blocked_by_line are treated as having no blocked blocks.
+
+        Args:
+            blocked_by_line: line -> IDs of failed or closed blocks
+
+        Returns:
+            Number of cached trees repaired or dropped
+        """
+        # Pick up layout changes of lines already in use before comparing masks
+        for line in list(self.lineGraphs):
+            self._get_line_graph(line)
+
+        changed = 0
+        for line in set(self.blockedBlocks) | set(blocked_by_line):
+            blocked = frozenset(blocked_by_line.get(line, ()))
+            previous = self.blockedBlocks.get(line, frozenset())
+            if blocked == previous:
+                continue
+            added = blocked - previous
+            removed = previous - blocked
+            self.blockedBlocks[line] = blocked
+
+            for key in [key for key in self.pathTrees if key[0] == line]:
+                tree = self.pathTrees[key]
+                if removed and self._reopening_changes_tree(tree, line, key[1], removed):
+                    del self.pathTrees[key]
+                    changed += 1
+                elif added and self._repair_tree(tree, line, key[1], added):
+                    changed += 1
+            logger.debug(f"Reroute mask for {line} line: +{sorted(added)} -{sorted(removed)}")
+        return changed
+
+    def _reopening_changes_tree(self, tree: Dict, line: str, destination_id: int, removed: Set[int]) -> bool:
+        """
+        Check whether reopening blocks can shorten any path of a cached tree
+
+        Args:
+            tree: Cached tree
+            line: Line name
+            destination_id: Destination of the tree
+            removed: Blocks no longer masked
+
+        Returns:
+            True if the tree must be rebuilt
+        """
+        if destination_id in removed:
+            return True
+
+        # A reopened block only matters if it now has a move into the tree
+        successors, _, states_by_block = self.lineGraphs[line]['destinations'][destination_id]
+        distances = tree['distances']
+        for block_id in removed:
+            for state in states_by_block.get(block_id, ()):
+                if any(next_state in distances for next_state in successors[state]):
+                    return True
+        return False
+
+    def _repair_tree(self, tree: Dict, line: str, destination_id: int, added: Set[int]) -> bool:
+        """
+        Update a cached tree for newly masked blocks.
+
+        Only states whose path in the tree runs through a masked block lose
+        their distance; every other path is unchanged and still shortest. The
+        lost states are re-attached to the rest of the tree in order of their
+        new distance.
+
+        Args:
+            tree: Cached tree
+            line: Line name
+            destination_id: Destination of the tree
+            added: Blocks newly masked
+
+        Returns:
+            True if any state of the tree was affected
+        """
+        distances = tree['distances']
+        children = tree['children']
+        pending = [state for block_id in added for state in tree['statesByBlock'].get(block_id, ())]
+        if not pending:
+            return False
+
+        # Collect every state whose path passes through a masked block
+        affected = set()
+        while pending:
+            state = pending.pop()
+            if state in affected:
+                continue
+            affected.add(state)
+            pending.extend(children.get(state, ()))
+
+        for state in affected:
+            del distances[state]
+            next_id = tree['hops'].pop(state, None)
+            if next_id is not None:
+                parent = (next_id, state[0])
+                if parent not in affected:
+                    children.get(parent, set()).discard(state)
+            children.pop(state, None)
+            tree['statesByBlock'][state[0]].discard(state)
+
+        successors, predecessors, _ = self._get_state_graph(self.lineGraphs[line], line, destination_id)
+        blocked = self.blockedBlocks[line]
+
+        # Shortest distances back to the kept part of the tree (unit moves, mixed start distances)
+        queue = []
+        order = itertools.count()  # Tie-breaker; states hold None and cannot be compared
+        for state in affected:
+            if state[0] in blocked:
+                continue
+            kept = [distances[s] for s in successors[state] if s in distances]
+            if kept:
+                heapq.heappush(queue, (min(kept) + 1, next(order), state))
+        while queue:
+            distance, _, state = heapq.heappop(queue)
+            if state in distances:
+                continue
+            distances[state] = distance
+            for previous_state in predecessors.get(state, ()):
+                if previous_state in affected and previous_state not in distances and previous_state[0] not in blocked:
+                    heapq.heappush(queue, (distance + 1, next(order), previous_state))
+
+        self._set_hops(tree, successors, [state for state in affected if state in distances])
+        self.treesRepaired += 1
+        return True
+
+    def _set_hops(self, tree: Dict, successors: Dict, states: Iterable[Tuple[int, Optional[int]]]) -> None:
+        """
+        Choose the next hop of the given tree states and record them in the tree's indexes
+
+        Args:
+            tree: Tree being built or repaired
+            successors: State -> next states towards the tree's destination
+            states: States whose distance is set
+        """
+        distances = tree['distances']
+        for state in states:
+            tree['statesByBlock'].setdefault(state[0], set()).add(state)
+            distance = distances[state]
+            if distance == 0:
+                continue
+            # Among equally short moves keep the first in switch-rule order, as the RouteManager does
+            for next_state in successors[state]:
+                if distances.get(next_state) == distance - 1:
+                    tree['hops'][state] = next_state[0]
+                    tree['children'].setdefault(next_state, set()).add(state)
+                    break
+
+    def invalidate(self, line: str = None) -> None:
+        """
+        Drop cached trees
+
+        Args:
+            line: Only drop trees of this line (None drops all)
+        """
+        if line is None:
+            self.pathTrees.clear()
+        else:
+            for key in [key for key in self.pathTrees if key[0] == line]:
+                del self.pathTrees[key]
+
+    def get_path_tree(self, line: str, destination_id: int) -> Dict:
+        """
+        Get the shortest-path tree towards a destination under the line's mask
+
+        Args:
+            line: Line name
+            destination_id: Destination block ID
+
+        Returns:
+            Tree dictionary with 'hops' (state -> next block), 'distances'
+            (state -> moves to destination), 'children' (state -> states whose
+            next hop leads to it) and 'statesByBlock' (block -> its tree states)
+        """
+        graph = self.lineGraphs.get(line) or self._get_line_graph(line)
+        key = (line, destination_id)
+        tree = self.pathTrees.get(key)
+        if tree is not None:
+            self.treesReused += 1
+            return tree
+
+        successors, predecessors, _ = self._get_state_graph(graph, line, destination_id)
+        blocked = self.blockedBlocks.get(line, frozenset())
+
+        # Reverse breadth-first search from the destination, skipping masked states
+        distances = {}
+        if destination_id not in blocked:
+            distances = {state: 0 for state in successors if state[0] == destination_id}
+        queue = deque(distances)
+        while queue:
+            state = queue.popleft()
+            for previous_state in predecessors.get(state, ()):
+                if previous_state not in distances and previous_state[0] not in blocked:
+                    distances[previous_state] = distances[state] + 1
+                    queue.append(previous_state)
+
+        tree = {'hops': {}, 'distances': distances, 'children': {}, 'statesByBlock': {}}
+        self._set_hops(tree, successors, list(distances))
+        self.pathTrees[key] = tree
+        self.treesBuilt += 1
+        return tree
+
+    # === Rerouting ===
+
+    def find_path(self, line: str, current_id: int, previous_id: Optional[int], destination_id: int) -> List[int]:
+        """
+        Find the shortest unblocked path from a train's position to a destination
+
+        Args:
+            line: Line name
+            current_id: Block the train is on
+            previous_id: Block the train arrived from (None if unknown)
+            destination_id: Destination block ID
+
+        Returns:
+            Block IDs from current_id to destination_id, or empty list if no path
+        """
+        if current_id == destination_id:
+            return [current_id]
+
+        tree = self.get_path_tree(line, destination_id)
+        successors, _, _ = self.lineGraphs[line]['destinations'][destination_id]
+        hops = tree['hops']
+        distances = tree['distances']
+
+        state = (current_id, previous_id)
+        if state not in successors:
+            state = (current_id, None)
+        path = [current_id]
+
+        if state not in distances:
+            # The train may be standing on a blocked block; it can still drive off it
+            options = [s for s in successors.get(state, ()) if s in distances]
+            if not options:
+                return []
+            state = min(options, key=lambda s: distances[s])
+            path.append(state[0])
+
+        while state[0] != destination_id:
+            next_id = hops[state]
+            path.append(next_id)
+            state = (next_id, state[0])
+        return path
+
+    def reroute_train(self, train) -> Optional[Route]:
+        """
+        Build a route from a train's current position to its route's destination
+        that avoids the masked blocks
+
+        Args:
+            train: Train with a route
+
+        Returns:
+            New emergency Route, or None if the train has no route or no path exists
+        """
+        current_route = getattr(train, 'route', None)
+        block_sequence = getattr(current_route, 'blockSequence', None)
+        if not block_sequence or not current_route.endBlock:
+            return None
+
+        index = min(getattr(current_route, 'currentBlockIndex', 0), len(block_sequence) - 1)
+        current_block = block_sequence[index]
+        previous_id = block_sequence[index - 1].blockID if index > 0 else None
+        line = getattr(current_block, 'line', None) or getattr(train, 'line', 'Green')
+
+        path_ids = self.find_path(line, current_block.blockID, previous_id, current_route.endBlock.blockID)
+        if not path_ids:
+            return None
+
+        block_lookup = self.lineGraphs[line]['block_lookup']
+        block_sequence = [block_lookup.get(block_id, current_block) for block_id in path_ids]
+
+        new_route = Route()
+        new_route.create_route(block_sequence, current_route.scheduledArrival)
+        new_route.routeType = 'EMERGENCY'
+        new_route.trainID = current_route.trainID
+        new_route.isActive = current_route.isActive
+        new_route.scheduledDeparture = getattr(current_route, 'scheduledDeparture', None)
+        return new_route
@@ -11,8 +11,9 @@ This module handles:
 - Location tracking and updates
 """
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
+from bisect import bisect_left
 import logging
 
 # Import simulation time (lazy import to avoid circular dependencies)
@@ -89,6 +90,11 @@ class Route:
         Timing & Estimation:
             - get_estimated_arrival(): Calculate estimated arrival time
             - calculate_route_distance(from_block, to_block): Calculate route hops between blocks
+            - get_remaining_distance() / get_remaining_time(): Prefix-sum lookups from current position
+            
+        Position Index:
+            - find_block_index(block_id, start_index): First route index of a block at or after start_index
+            - contains_block(block_id): Check whether a block is on the route
             
         Advanced Pathfinding:
             - Breadth-First Search (BFS) algorithm for optimal pathfinding
@@ -147,6 +153,13 @@ class Route:
         self.maxSpeed = 0              # Maximum speed for route
         self.grade_profile = []        # Grade information for each block
         
+        # Position index (rebuilt automatically when blockSequence or speedSequence is replaced)
+        self.blockPositions = {}       # Dict[int, List[int]] - block ID -> route indices (repeats for loops)
+        self.cumulativeDistance = [0.0] # cumulativeDistance[i] = meters before route index i
+        self.cumulativeTime = [0.0]    # cumulativeTime[i] = seconds (incl. station stops) before route index i
+        self._indexed_sequence = None
+        self._indexed_speeds = None
+        
         logger.debug(f"New route initialized")
     
     # Methods from UML
@@ -212,34 +225,34 @@ class Route:
         Returns:
             True if location update was successful, False if block not found in route or backward movement attempted
         """
-        # Find block in sequence
+        # Find block in sequence (next occurrence at or after the current position for looped routes)
         new_block_id = newBlock.blockID if hasattr(newBlock, 'blockID') else newBlock
         
-        for i, block in enumerate(self.blockSequence):
-            if block.blockID == new_block_id:
-                old_index = self.currentBlockIndex
-                
-                # Prevent backward movement - trains cannot move backwards
-                if i < old_index:
-                    logger.error(f"Route {self.routeID}: backward movement not allowed from block index {old_index} to {i}")
-                    return False
-                
-                self.currentBlockIndex = i
-                self.lastUpdate = _get_simulation_time()
-                
-                # Update actual departure time if this is the first move
-                if old_index == 0 and i > 0 and not self.actualDeparture:
-                    self.actualDeparture = _get_simulation_time()
-                
-                # Update actual arrival time if reached destination
-                if i == len(self.blockSequence) - 1 and not self.actualArrival:
-                    self.actualArrival = _get_simulation_time()
-                
-                logger.debug(f"Route {self.routeID} position updated: block index {old_index} -> {i}")
-                return True
-        
-        logger.warning(f"Route {self.routeID}: block {new_block_id} not found in sequence")
-        return False
+        old_index = self.currentBlockIndex
+        i = self.find_block_index(new_block_id, old_index)
+        if i is None and self.contains_block(new_block_id):
+            # Prevent backward movement - trains cannot move backwards
+            i = self.get_block_positions(new_block_id)[0]
+            logger.error(f"Route {self.routeID}: backward movement not allowed from block index {old_index} to {i}")
+            return False
+        
+        if i is None:
+            logger.warning(f"Route {self.routeID}: block {new_block_id} not found in sequence")
+            return False
+        
+        self.currentBlockIndex = i
+        self.lastUpdate = _get_simulation_time()
+        
+        # Update actual departure time if this is the first move
+        if old_index == 0 and i > 0 and not self.actualDeparture:
+            self.actualDeparture = _get_simulation_time()
+        
+        # Update actual arrival time if reached destination
+        if i == len(self.blockSequence) - 1 and not self.actualArrival:
+            self.actualArrival = _get_simulation_time()
+        
+        logger.debug(f"Route {self.routeID} position updated: block index {old_index} -> {i}")
+        return True
     
     def get_block_sequence(self) -> List:
         """
@@ -353,42 +366,8 @@ class Route:
         if not self.isActive or self.currentBlockIndex >= len(self.blockSequence):
             return self.actualArrival
 
-        # Calculate remaining time based on remaining blocks and current speeds
-        remaining_time = 0.0
-        
-        for i in range(self.currentBlockIndex, len(self.blockSequence)):
-            block = self.blockSequence[i]
-            speed_command = self.speedSequence[i] if i < len(self.speedSequence) else 1
-
-            # Convert speed command to actual speed
-            actual_speed = self._speed_command_to_kmh(speed_command, block.speedLimit)
-            
-            # Calculate block traversal time
-            if actual_speed > 0:
-                block_time = (block.length / 1000.0) / actual_speed * 3600  # Convert to seconds
-                remaining_time += block_time
-                
-                # Check if this block has a station (requires stop)
-                if hasattr(block, 'station') and block.station:
-                    # Add 60 seconds dwell time for station stop
-                    remaining_time += 60.0
-                    
-                    # Add deceleration time (speed from km/h to m/s, then time = v/a)
-                    # Deceleration rate: 1.2 m/s²
-                    speed_ms = actual_speed / 3.6  # Convert km/h to m/s
-                    decel_time = speed_ms / 1.2  # Time to decelerate to stop
-                    remaining_time += decel_time
-                    
-                    # Add acceleration time for leaving station
-                    # Acceleration rate: 0.5 m/s²
-                    # Get speed for next block to determine target acceleration speed
-                    next_i = i + 1
-                    if next_i < len(self.blockSequence):
-                        next_speed_command = self.speedSequence[next_i] if next_i < len(self.speedSequence) else 1
-                        next_actual_speed = self._speed_command_to_kmh(next_speed_command, self.blockSequence[next_i].speedLimit)
-                        next_speed_ms = next_actual_speed / 3.6  # Convert km/h to m/s
-                        accel_time = next_speed_ms / 0.5  # Time to accelerate from stop
-                        remaining_time += accel_time
+        # Remaining time from the cumulative time prefix (block traversal + station stops)
+        remaining_time = self.get_remaining_time()
         
         return _get_simulation_time() + timedelta(seconds=remaining_time)
     
@@ -434,6 +413,119 @@ class Route:
     
     
     
+    def _ensure_position_index(self) -> None:
+        """Rebuild the position index and prefix sums if blockSequence or speedSequence was replaced"""
+        sequence_changed = (self._indexed_sequence is not self.blockSequence or
+                            len(self.cumulativeDistance) - 1 != len(self.blockSequence))
+        if sequence_changed:
+            self.blockPositions = {}
+            self.cumulativeDistance = [0.0]
+            for i, block in enumerate(self.blockSequence):
+                block_id = getattr(block, 'blockID', getattr(block, 'block_number', block))
+                self.blockPositions.setdefault(block_id, []).append(i)
+                self.cumulativeDistance.append(self.cumulativeDistance[-1] + getattr(block, 'length', 0))
+            self._indexed_sequence = self.blockSequence
+        
+        if sequence_changed or self._indexed_speeds is not self.speedSequence:
+            self.cumulativeTime = [0.0]
+            for i in range(len(self.blockSequence)):
+                self.cumulativeTime.append(self.cumulativeTime[-1] + self._get_block_time(i))
+            self._indexed_speeds = self.speedSequence
+    
+    def _get_block_time(self, i: int) -> float:
+        """
+        Get time spent on route block i at its commanded speed
+        Includes 60-second dwell plus deceleration/acceleration at station blocks
+        """
+        block = self.blockSequence[i]
+        speed_command = self.speedSequence[i] if i < len(self.speedSequence) else 1
+        
+        # Convert speed command to actual speed
+        actual_speed = self._speed_command_to_kmh(speed_command, block.speedLimit)
+        if actual_speed <= 0:
+            return 0.0
+        
+        # Calculate block traversal time
+        block_time = (block.length / 1000.0) / actual_speed * 3600  # Convert to seconds
+        
+        # Check if this block has a station (requires stop)
+        if hasattr(block, 'station') and block.station:
+            # Add 60 seconds dwell time for station stop
+            block_time += 60.0
+            
+            # Add deceleration time (speed from km/h to m/s, then time = v/a)
+            # Deceleration rate: 1.2 m/s²
+            speed_ms = actual_speed / 3.6  # Convert km/h to m/s
+            block_time += speed_ms / 1.2  # Time to decelerate to stop
+            
+            # Add acceleration time for leaving station
+            # Acceleration rate: 0.5 m/s²
+            # Get speed for next block to determine target acceleration speed
+            next_i = i + 1
+            if next_i < len(self.blockSequence):
+                next_speed_command = self.speedSequence[next_i] if next_i < len(self.speedSequence) else 1
+                next_actual_speed = self._speed_command_to_kmh(next_speed_command, self.blockSequence[next_i].speedLimit)
+                next_speed_ms = next_actual_speed / 3.6  # Convert km/h to m/s
+                block_time += next_speed_ms / 0.5  # Time to accelerate from stop
+        
+        return block_time
+    
+    def get_block_positions(self, block_id: int) -> List[int]:
+        """
+        Get every route index of a block (more than one for looped routes)
+        
+        Args:
+            block_id: Block ID to look up
+            
+        Returns:
+            Sorted list of route indices, empty if block is not on the route
+        """
+        self._ensure_position_index()
+        return self.blockPositions.get(block_id, [])
+    
+    def contains_block(self, block_id: int) -> bool:
+        """Check if block is part of the route"""
+        return bool(self.get_block_positions(block_id))
+    
+    def find_block_index(self, block_id: int, start_index: int = 0) -> Optional[int]:
+        """
+        Find the first route index of a block at or after start_index
+        
+        Args:
+            block_id: Block ID to look up
+            start_index: Route index to search from
+            
+        Returns:
+            Route index, or None if block does not occur at or after start_index
+        """
+        positions = self.get_block_positions(block_id)
+        k = bisect_left(positions, start_index)
+        return positions[k] if k < len(positions) else None
+    
+    def get_remaining_distance(self) -> float:
+        """
+        Get route distance in meters from the start of the current block to the end of the route
+        """
+        self._ensure_position_index()
+        current_index = min(self.currentBlockIndex, len(self.blockSequence))
+        return self.cumulativeDistance[-1] - self.cumulativeDistance[current_index]
+    
+    def get_cumulative_times(self) -> List[float]:
+        """
+        Get seconds (including station stops) from the route start to the start of each route index;
+        the last entry is the total route time
+        """
+        self._ensure_position_index()
+        return self.cumulativeTime
+    
+    def get_remaining_time(self) -> float:
+        """
+        Get time in seconds from the current block to the end of the route, including station stops
+        """
+        self._ensure_position_index()
+        current_index = min(self.currentBlockIndex, len(self.blockSequence))
+        return self.cumulativeTime[-1] - self.cumulativeTime[current_index]
+    
     def _speed_command_to_kmh(self, speed_command: int, speed_limit: float) -> float:
         """Convert speed command to actual speed in km/h"""
         speed_map = {
@@ -522,21 +614,17 @@ class Route:
             logger.warning("Cannot calculate route distance: no block sequence available")
             return 0
         
-        # Find indices of blocks in the route sequence
-        from_index = None
-        to_index = None
+        # Find indices of blocks in the route sequence - for looped routes, the occurrence
+        # nearest the train's position and the first target occurrence after it
+        from_index = self.find_block_index(from_block_id, self.currentBlockIndex)
+        if from_index is None and self.contains_block(from_block_id):
+            from_index = self.get_block_positions(from_block_id)[-1]
         
-        for i, block in enumerate(self.blockSequence):
-            block_id = getattr(block, 'blockID', getattr(block, 'block_number', block))
-            
-            if block_id == from_block_id:
-                from_index = i
-            if block_id == to_block_id:
-                to_index = i
-                
-            # Early exit if both found
-            if from_index is not None and to_index is not None:
-                break
+        to_index = None
+        if from_index is not None:
+            to_index = self.find_block_index(to_block_id, from_index)
+            if to_index is None and self.contains_block(to_block_id):
+                to_index = self.get_block_positions(to_block_id)[-1]
         
         # Validate both blocks were found
         if from_index is None:
@@ -60,7 +60,7 @@ class RouteManager:
     """
     Route management system implementing pathfinding and route lifecycle management.
     
-    This class handles route generation using a simplified BFS algorithm with
+    This class handles route generation using per-line route tables built from
     consistent switch routing rules based on approach direction.
     """
     
@@ -89,6 +89,7 @@ class RouteManager:
         # Track layout reference
         self.track_reader = track_reader
         self.track_graph = {}          # Block connectivity graph
+        self.route_tables = {}         # line -> next-hop route table (see _get_route_table)
         
         # Performance metrics
         self.route_generation_times = []
@@ -160,10 +161,10 @@ class RouteManager:
     
     def _find_path(self, start_block: Block, end_block: Block, initial_direction: str = None) -> List[Block]:
         """
-        Find path from start to end using BFS with consistent switch rules.
+        Find the shortest path from start to end using the precomputed route table.
         
-        This is a simplified pathfinding algorithm that:
-        1. Uses BFS to explore the track network
+        Paths follow the same rules as a breadth-first search of the track:
+        1. Moves are taken between (block, arrived-from) states
         2. Makes consistent decisions at switches based on approach direction
         3. Respects direction of travel constraints
         4. Does not use destination for routing decisions (except yard)
@@ -184,17 +185,15 @@ class RouteManager:
         if start_id == end_id:
             return [start_block]
         
-        # Get all blocks for this line
-        all_blocks = self._get_all_blocks_on_line(line)
-        if not all_blocks:
+        # The route table holds the line's block lookup
+        table = self._get_route_table(line)
+        block_lookup = table['blocks']
+        if not block_lookup:
             logger.error(f"No blocks available for line '{line}'")
             return []
         
         logger.info(f"Finding path from {start_id} to {end_id} on {line} line")
         
-        # Create block lookup
-        block_lookup = {block.blockID: block for block in all_blocks}
-        
         # Debug: Check if start and end blocks exist
         if start_id not in block_lookup:
             logger.error(f"Start block {start_id} not found in block lookup")
@@ -209,208 +208,251 @@ class RouteManager:
             return self._calculate_yard_route(start_block, end_block, block_lookup)
         
         
-        # BFS pathfinding with path tracking
-        # For complex routes, we need to allow revisiting blocks
-        queue = deque([(start_id, [start_block], None, initial_direction)])  # (current_id, path, previous_id, direction_hint)
-        visited = set()  # Track visited states as (block_id, previous_id) tuples
-        visited.add((start_id, None))
+        # Reconstruct the path from the precomputed route table
+        hops, distances = self._get_destination_hops(table, line, end_id, block_lookup)
         
-        # Debug logging for Green Line routing issues
-        if line == 'Green' and end_id == 48:
-            logger.debug(f"DEBUG: Starting BFS from block {start_id} to block 48")
+        state = (start_id, None)
+        path = [start_block]
         
-        # For complex routes with loops, we need to allow revisiting certain blocks
-        # This is necessary for Green Line where trains need to traverse loops
-        allow_revisit_blocks = set()
-        if line == 'Green':
-            # Allow revisiting blocks that are part of loops/switches
-            # These are blocks where the track splits or merges
-            # Include both bidirectional sections: 78-100 and 29-150
-            # Add more blocks needed for complex section I routing (blocks 30-48)
-            # Also include ALL blocks from 1-57 since the complex route visits many twice
-            allow_revisit_blocks = {77, 78, 85, 86, 100, 101, 28, 29, 150, 1, 13, 35, 31, 30, 32, 33, 34, 
-                                   36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48,
-                                   2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 14, 15, 16, 17, 18, 19, 20,
-                                   21, 22, 23, 24, 25, 26, 27}
-        
-        # Debug counter for iterations
-        iterations = 0
-        max_iterations = 10000  # Prevent infinite loops
-        blocks_explored = set()
-        
-        while queue and iterations < max_iterations:
-            iterations += 1
-            current_id, path, previous_id, direction_hint = queue.popleft()
-            blocks_explored.add(current_id)
+        # Apply direction filtering on the first move if we have a direction hint
+        if initial_direction:
+            first_moves = self._get_route_step_options(table, line, state, end_id, block_lookup)
+            if initial_direction == 'forward':
+                first_moves = [s for s in first_moves if isinstance(s[0], int) and s[0] > start_id]
+            elif initial_direction == 'backward':
+                first_moves = [s for s in first_moves if isinstance(s[0], int) and s[0] < start_id]
+            logger.debug(f"Applied initial direction filter at block {start_id}: {initial_direction}, moves: {first_moves}")
             
-            # Debug specific blocks for Section I routing
-            if line == 'Green' and end_id == 48:
-                if current_id in [1, 2, 13, 48]:
-                    logger.debug(f"DEBUG: Processing block {current_id} from {previous_id}, path length: {len(path)}")
-                if current_id == 48:
-                    logger.debug(f"REACHED BLOCK 48! Full path: {[b.blockID for b in path]}")
-                    return path
+            reachable = [s for s in first_moves if s in distances]
+            if not reachable:
+                logger.error(f"No path found from block {start_id} to {end_id} heading {initial_direction}")
+                return []
+            # Earliest option wins ties, matching breadth-first expansion order
+            state = min(reachable, key=lambda s: distances[s])
+            path.append(block_lookup[state[0]])
+        elif state not in distances:
+            logger.error(f"No path found from block {start_id} to {end_id}")
+            return []
+        
+        while state[0] != end_id:
+            next_id = hops[state]
+            path.append(block_lookup[next_id])
+            state = (next_id, state[0])
+        
+        logger.debug(f"Found path to block {end_id}! Path length: {len(path)}")
+        return path
+    
+    def _get_route_table(self, line: str) -> Dict:
+        """
+        Get the route table for a line, bringing it up to date with block status.
+        
+        The table is a next-hop matrix over (block, arrived-from) states: for
+        each destination it stores the next block to take from every state, so
+        paths are reconstructed in O(path length) instead of searching. Block
+        status is only re-read when Block.statusVersion has moved on since the
+        table last looked, and then only the destinations affected by the
+        blocks that changed are dropped (see _invalidate_route_entries).
+        
+        Args:
+            line: Line name
             
-            current_block = block_lookup.get(current_id)
+        Returns:
+            Route table dictionary for the line
+        """
+        blocks = getattr(self.ctc_system, 'blocks', None) if getattr(self, 'ctc_system', None) else None
+        layout_key = (id(blocks), len(blocks) if isinstance(blocks, dict) else 0)
+        table = self.route_tables.get(line)
+        if table is None or table['layout_key'] != layout_key:
+            block_lookup = {block.blockID: block for block in self._get_all_blocks_on_line(line)}
+            table = {
+                'layout_key': layout_key,
+                'blocks': block_lookup,
+                'status_version': Block.statusVersion,
+                'closed_blocks': self._get_closed_blocks(block_lookup),
+                # Connections only depend on the layout, so look them up once
+                'connected': {
+                    block_id: self._get_connected_blocks(block)
+                    for block_id, block in block_lookup.items()
+                },
+                'destinations': {},     # destination -> (next hops, distances)
+                'entry_closures': {}    # destination -> blocks closed when it was built
+            }
+            self.route_tables[line] = table
+            logger.debug(f"Route table reset for {line} line ({len(table['closed_blocks'])} blocks not operational)")
+        elif table['status_version'] != Block.statusVersion:
+            table['status_version'] = Block.statusVersion
+            closed_blocks = self._get_closed_blocks(table['blocks'])
+            if closed_blocks != table['closed_blocks']:
+                self._invalidate_route_entries(table, closed_blocks)
+        return table
+    
+    def _get_closed_blocks(self, block_lookup: Dict[int, Block]) -> frozenset:
+        """Get the IDs of the blocks in a lookup that are not operational"""
+        return frozenset(
+            block_id for block_id, block in block_lookup.items()
+            if hasattr(block, 'block_operational') and not block.block_operational()
+        )
+    
+    def _invalidate_route_entries(self, table: Dict, closed_blocks: frozenset) -> None:
+        """
+        Drop the destinations whose paths change with a new set of closed blocks.
+        
+        A newly closed block only breaks destinations that route through it;
+        a reopened block only helps destinations built while it was closed.
+        Every other destination keeps its next hops.
+        
+        Args:
+            table: Route table for the line
+            closed_blocks: Blocks that are not operational now
+        """
+        newly_closed = closed_blocks - table['closed_blocks']
+        reopened = table['closed_blocks'] - closed_blocks
+        table['closed_blocks'] = closed_blocks
+        
+        stale = []
+        for destination_id, (hops, distances) in table['destinations'].items():
+            if reopened & table['entry_closures'][destination_id]:
+                stale.append(destination_id)
+            elif newly_closed and not newly_closed.isdisjoint(hops.values()):
+                stale.append(destination_id)
+        for destination_id in stale:
+            del table['destinations'][destination_id]
+            del table['entry_closures'][destination_id]
+        logger.debug(f"Route table updated: {len(newly_closed)} blocks closed, {len(reopened)} reopened, "
+                     f"{len(stale)} destinations to rebuild")
+    
+    def build_route_table(self, line: str) -> None:
+        """
+        Precompute next hops from every state to every destination on a line.
+        
+        Called for each line when the CTC System starts so dispatching only
+        reads the table; destinations dropped by closures are filled in
+        again on their next route request.
+        
+        Args:
+            line: Line name
+        """
+        table = self._get_route_table(line)
+        block_lookup = table['blocks']
+        for block_id in block_lookup:
+            if block_id != 0:
+                self._get_destination_hops(table, line, block_id, block_lookup)
+        logger.info(f"Route table built for {line} line: {len(table['destinations'])} destinations")
+    
+    def build_route_tables(self) -> None:
+        """Build the route table for every line the CTC System has blocks for"""
+        blocks = getattr(self.ctc_system, 'blocks', None) if getattr(self, 'ctc_system', None) else None
+        if not isinstance(blocks, dict):
+            return
+        for line in sorted({line for (line, block_number) in blocks}):
+            self.build_route_table(line)
+    
+    def _get_route_step_options(self, table: Dict, line: str, state: Tuple[int, Optional[int]],
+                                destination_id: int, block_lookup: Dict[int, Block]) -> List[Tuple[int, int]]:
+        """
+        Get the states reachable in one move, applying switch and direction rules.
+        
+        Args:
+            table: Route table for the line
+            line: Line name
+            state: (current block, block we arrived from) tuple
+            destination_id: Final destination (used by the switch rules)
+            block_lookup: Dictionary of block ID to block objects for the line
             
-            if not current_block:
+        Returns:
+            List of next (block, arrived-from) states in switch-rule order
+        """
+        current_id, previous_id = state
+        current_block = block_lookup.get(current_id)
+        connected_blocks = table['connected'].get(current_id)
+        if not current_block or not connected_blocks:
+            return []
+        
+        next_blocks = self._apply_switch_logic(
+            current_block, connected_blocks, previous_id, destination_id
+        )
+        
+        options = []
+        for next_id in next_blocks:
+            # Skip yard unless it's the destination
+            if next_id == 0 and destination_id != 0:
                 continue
             
-            # Get connected blocks
-            connected_blocks = self._get_connected_blocks(current_block)
-            
-            # Debug for Green Line issue
-            if line == 'Green' and end_id == 48:
-                if current_id == 29:
-                    visit_count = sum(1 for b in path if b.blockID == 29)
-                    logger.debug(f"DEBUG: Block 29 (visit #{visit_count}) connected: {connected_blocks}, previous: {previous_id}, path length: {len(path)}")
-                elif current_id == 1:
-                    logger.debug(f"DEBUG: Block 1 connected blocks: {connected_blocks}, previous: {previous_id}")
-                elif current_id == 13:
-                    logger.debug(f"DEBUG: Block 13 connected blocks: {connected_blocks}, previous: {previous_id}")
-                elif current_id == 28:
-                    visit_count = sum(1 for b in path if b.blockID == 28)
-                    logger.debug(f"DEBUG: Block 28 (visit #{visit_count}) connected: {connected_blocks}, previous: {previous_id}")
-                elif current_id == 30:
-                    logger.debug(f"DEBUG: Block 30 connected blocks: {connected_blocks}, previous: {previous_id}")
-                elif current_id == 2:
-                    logger.debug(f"DEBUG: Block 2 connected blocks: {connected_blocks}, previous: {previous_id}, going to dest {end_id}")
-                elif current_id in [31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48]:
-                    logger.debug(f"DEBUG: Block {current_id} connected: {connected_blocks}, previous: {previous_id}")
-            
-            if not connected_blocks:
-                logger.debug(f"Block {current_id} has no connected blocks")
+            next_block = block_lookup.get(next_id)
+            if not next_block or next_id in table['closed_blocks']:
                 continue
             
+            # Check direction constraints
+            # Special cases: Allow bidirectional track transitions on Green Line regardless of direction
+            if line == 'Green' and ((current_id == 100 and next_id == 85) or
+                                   (current_id == 150 and next_id == 29)):
+                pass
+            elif not self._is_direction_allowed(current_block, next_block):
+                continue
             
+            options.append((next_id, current_id))
+        return options
+    
+    def _get_destination_hops(self, table: Dict, line: str, destination_id: int,
+                              block_lookup: Dict[int, Block]) -> Tuple[Dict, Dict]:
+        """
+        Get the next-hop and distance maps towards one destination, building them on first use.
+        
+        Explores every (block, arrived-from) state under the switch rules for
+        this destination, then runs a reverse breadth-first search from the
+        destination. Among equally short moves the first option in switch-rule
+        order is kept, so paths match a forward breadth-first search.
+        
+        Args:
+            table: Route table for the line
+            line: Line name
+            destination_id: Destination block ID
+            block_lookup: Dictionary of block ID to block objects for the line
             
-            # Apply direction filtering if we have a direction hint and we're at the starting block
-            if direction_hint and previous_id is None:
-                # Filter connected blocks based on initial direction
-                if direction_hint == 'forward':
-                    connected_blocks = [b for b in connected_blocks if b > current_id]
-                elif direction_hint == 'backward':
-                    connected_blocks = [b for b in connected_blocks if b < current_id]
-                logger.debug(f"Applied initial direction filter at block {current_id}: {direction_hint}, connections: {connected_blocks}")
-            
-            # Apply switch logic if at a switch
-            next_blocks = self._apply_switch_logic(
-                current_block, connected_blocks, previous_id, end_id
-            )
-            
-            # Debug for Green Line issue
-            if line == 'Green' and end_id == 48:
-                if current_id == 29:
-                    logger.debug(f"DEBUG: Block 29 next_blocks after switch logic: {next_blocks}")
-                    logger.debug(f"       Block 29 path so far: {[b.blockID for b in path]}")
-                elif current_id == 1:
-                    logger.debug(f"DEBUG: Block 1 next_blocks after switch logic: {next_blocks}")
-                elif current_id == 13:
-                    logger.debug(f"DEBUG: Block 13 next_blocks after switch logic: {next_blocks}")
-                elif current_id == 28:
-                    logger.debug(f"DEBUG: Block 28 next_blocks after switch logic: {next_blocks}")
-                    logger.debug(f"       Block 28 path so far: {[b.blockID for b in path]}")
-            
-            
-            
-            # Debug logging for switch decisions
-            if len(connected_blocks) > 2 or (len(connected_blocks) == 2 and previous_id not in connected_blocks):
-                logger.debug(f"Switch at block {current_id}: from {previous_id}, connections={connected_blocks}, filtered to {next_blocks}")
-            
-            # Special debug for Red Line block 9
-            if current_id == 9 and line == 'Red':
-                logger.debug(f"RED LINE BLOCK 9: from {previous_id}, available={connected_blocks}, filtered to {next_blocks}")
-            
-            for next_id in next_blocks:
-                # Debug block 30 exploration specifically
-                if line == 'Green' and end_id == 48 and next_id == 30:
-                    logger.debug(f"DEBUG: Attempting to add block 30 to queue from block {current_id}")
-                    logger.debug(f"       Current path: {[b.blockID for b in path][-10:]}")  # Last 10 blocks
-                
-                # Check if this state (block + from direction) has been visited
-                state = (next_id, current_id)
-                
-                # Special cases: Always allow certain transitions on Green Line for bidirectional tracks
-                # This is needed for the bidirectional track return paths
-                allow_special_transition = False
-                if line == 'Green' and ((current_id == 100 and next_id == 85) or 
-                                       (current_id == 150 and next_id == 29) or
-                                       (current_id == 28 and next_id == 29)):
-                    # Don't check visited state, always allow these transitions
-                    allow_special_transition = True
-                
-                if not allow_special_transition:
-                    # Allow revisiting certain blocks for Green Line loops
-                    if state in visited and next_id not in allow_revisit_blocks:
-                        continue
-                    
-                    # For blocks that can be revisited, check if we've been there too many times
-                    if next_id in allow_revisit_blocks:
-                        # Count how many times this block appears in the path
-                        visit_count = sum(1 for b in path if b.blockID == next_id)
-                        # Special case: blocks 31 and 35 may need to be visited more than twice for section I
-                        if next_id in {31, 35}:
-                            if visit_count >= 3:  # Allow up to 3 visits for these blocks
-                                continue
-                        # Special case: block 29 needs to be visited at least twice for section I
-                        elif next_id == 29:
-                            if visit_count >= 3:  # Allow up to 3 visits for block 29
-                                continue
-                        # Special case: blocks 30-34 may need multiple visits for section I routing
-                        elif next_id in {30, 32, 33, 34}:
-                            if visit_count >= 3:  # Allow up to 3 visits
-                                continue
-                        elif visit_count >= 2:  # Allow at most 2 visits to other blocks
-                            continue
-                
-                # Skip yard unless it's the destination
-                if next_id == 0 and end_id != 0:
-                    continue
-                
-                next_block = block_lookup.get(next_id)
-                if not next_block:
-                    continue
-                
-                # Check if block is operational
-                if hasattr(next_block, 'block_operational') and not next_block.block_operational():
-                    if line == 'Green' and end_id == 48:
-                        logger.debug(f"Block {next_id} is not operational, skipping")
-                    continue
-                
-                # Check direction constraints
-                # Special cases: Allow bidirectional track transitions on Green Line regardless of direction
-                if line == 'Green' and ((current_id == 100 and next_id == 85) or
-                                       (current_id == 150 and next_id == 29)):
-                    # Skip direction check for these specific transitions
-                    pass
-                elif not self._is_direction_allowed(current_block, next_block):
-                    continue
-                
-                new_path = path + [next_block]
-                
-                # Found destination
-                if next_id == end_id:
-                    logger.debug(f"Found path to block {end_id}! Path length: {len(new_path)}")
-                    return new_path
-                
-                # Add to queue (direction_hint is None after first move)
-                queue.append((next_id, new_path, current_id, None))
-                
-                # Only add to visited if not a revisitable block
-                if next_id not in allow_revisit_blocks:
-                    visited.add(state)
-                
+        Returns:
+            Tuple of (state -> next block ID, state -> moves to destination)
+        """
+        cached = table['destinations'].get(destination_id)
+        if cached is not None:
+            return cached
+        
+        # Explore the state graph from every possible starting block
+        successors = {}
+        pending = deque((block_id, None) for block_id in block_lookup)
+        while pending:
+            state = pending.popleft()
+            if state in successors:
+                continue
+            successors[state] = self._get_route_step_options(table, line, state, destination_id, block_lookup)
+            pending.extend(s for s in successors[state] if s not in successors)
+        
+        predecessors = {}
+        for state, next_states in successors.items():
+            for next_state in next_states:
+                predecessors.setdefault(next_state, []).append(state)
+        
+        # Reverse breadth-first search from every state that has reached the destination
+        distances = {state: 0 for state in successors if state[0] == destination_id}
+        queue = deque(distances)
+        while queue:
+            state = queue.popleft()
+            for previous_state in predecessors.get(state, ()):
+                if previous_state not in distances:
+                    distances[previous_state] = distances[state] + 1
+                    queue.append(previous_state)
+        
+        hops = {}
+        for state, distance in distances.items():
+            if distance == 0:
+                continue
+            for next_state in successors[state]:
+                if distances.get(next_state) == distance - 1:
+                    hops[state] = next_state[0]
+                    break
         
-        # No path found
-        if iterations >= max_iterations:
-            logger.error(f"Pathfinding exceeded max iterations ({max_iterations}) from block {start_id} to {end_id}")
-        else:
-            logger.error(f"No path found from block {start_id} to {end_id} after {iterations} iterations")
-            logger.error(f"Blocks explored: {sorted(blocks_explored)}")
-            # Check if target block is in a different section
-            if end_id not in blocks_explored:
-                logger.error(f"Target block {end_id} was never reached. May be disconnected from start.")
-        return []
+        table['destinations'][destination_id] = (hops, distances)
+        table['entry_closures'][destination_id] = table['closed_blocks']
+        return hops, distances
     
     def _apply_switch_logic(self, current_block: Block, connected_blocks: List[int], 
                            previous_id: Optional[int], destination_id: int) -> List[int]:
@@ -1179,6 +1221,8 @@ class RouteManager:
                     if train:
                         # Assign the route to the train
                         train.update_route(route)
+                        if hasattr(self.ctc_system, 'update_route_index'):
+                            self.ctc_system.update_route_index(train)
                         logger.info(f"Route {route.routeID} assigned to train {route.trainID}")
                     else:
                         logger.error(f"Train {route.trainID} not found - cannot confirm route")
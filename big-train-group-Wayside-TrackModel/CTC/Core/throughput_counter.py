@@ -0,0 +1,133 @@
+"""
+Throughput Counter Module
+========================
+Sliding-window ticket counter used for CTC throughput reporting.
+
+This module handles:
+- Recording ticket sales against simulated time
+- Constant-time totals over the last hour (or any configured window)
+- Exporting the per-bucket history inside the window
+
+Sales are summed into fixed-width time buckets kept in a ring (60 one-minute
+buckets by default). A running total is adjusted as buckets enter and leave
+the window, so recording a sale and reading the windowed total are both O(1)
+and memory does not grow with the number of sales.
+"""
+
+from typing import List, Tuple
+from datetime import datetime, timedelta
+
+# Reference point for numbering time buckets
+_BUCKET_EPOCH = datetime(1970, 1, 1)
+
+
+class ThroughputCounter:
+    """
+    Ring of time buckets holding ticket counts for one line.
+
+    The window total covers the current (partial) bucket plus the previous
+    bucketCount - 1 whole buckets, i.e. between window - bucketWidth and
+    window of simulated time.
+
+    Attributes:
+        bucketWidth (timedelta): Simulated time covered by one bucket
+        bucketCount (int): Number of buckets in the window
+        buckets (List[int]): Ticket count per ring slot
+        total (int): Tickets in all buckets currently in the window
+        headIndex (int): Absolute number of the newest bucket (None until first use)
+    """
+
+    def __init__(self, window: timedelta = timedelta(hours=1), bucket_width: timedelta = timedelta(minutes=1)):
+        """
+        Args:
+            window: Length of the sliding window
+            bucket_width: Simulated time covered by one bucket (use a smaller
+                width for finer-grained history)
+
+        Raises:
+            ValueError: If bucket_width is not positive or larger than window
+        """
+        if bucket_width <= timedelta(0) or bucket_width > window:
+            raise ValueError(f"bucket_width must be positive and no larger than the window, got {bucket_width}")
+        self.bucketWidth = bucket_width
+        self.bucketCount = int(window / bucket_width)
+        self.buckets = [0] * self.bucketCount
+        self.total = 0
+        self.headIndex = None
+        self._bucketSeconds = bucket_width.total_seconds()
+
+    def _bucket_index(self, timestamp: datetime) -> int:
+        """Get the absolute bucket number containing a timestamp"""
+        return int((timestamp - _BUCKET_EPOCH).total_seconds() // self._bucketSeconds)
+
+    def _advance(self, bucket_index: int) -> None:
+        """Move the window forward so bucket_index is the newest bucket"""
+        if self.headIndex is None:
+            self.headIndex = bucket_index
+            return
+        steps = bucket_index - self.headIndex
+        if steps <= 0:
+            return
+        if steps >= self.bucketCount:
+            # Whole window expired
+            self.buckets = [0] * self.bucketCount
+            self.total = 0
+        else:
+            for index in range(self.headIndex + 1, bucket_index + 1):
+                slot = index % self.bucketCount
+                self.total -= self.buckets[slot]
+                self.buckets[slot] = 0
+        self.headIndex = bucket_index
+
+    def add(self, tickets: int, timestamp: datetime) -> None:
+        """
+        Record ticket sales at a simulated time
+
+        Args:
+            tickets: Number of tickets sold
+            timestamp: Simulated time of the sale; sales older than the window are ignored
+        """
+        bucket_index = self._bucket_index(timestamp)
+        self._advance(bucket_index)
+        if bucket_index <= self.headIndex - self.bucketCount:
+            return
+        self.buckets[bucket_index % self.bucketCount] += tickets
+        self.total += tickets
+
+    def get_total(self, current_time: datetime) -> int:
+        """
+        Get tickets sold within the window ending at current_time
+
+        Args:
+            current_time: Current simulated time
+
+        Returns:
+            Ticket total for the window
+        """
+        self._advance(self._bucket_index(current_time))
+        return self.total
+
+    def get_history(self, current_time: datetime) -> List[Tuple[datetime, int]]:
+        """
+        Export the per-bucket counts inside the window, oldest first
+
+        Args:
+            current_time: Current simulated time
+
+        Returns:
+            List of (bucket start time, tickets) tuples
+        """
+        self._advance(self._bucket_index(current_time))
+        if self.headIndex is None:
+            return []
+        history = []
+        for index in range(self.headIndex - self.bucketCount + 1, self.headIndex + 1):
+            bucket_start = _BUCKET_EPOCH + timedelta(seconds=index * self._bucketSeconds)
+            history.append((bucket_start, self.buckets[index % self.bucketCount]))
+        return history
+
+    def clear(self) -> None:
+        """Drop all recorded sales"""
+        self.buckets = [0] * self.bucketCount
+        self.total = 0
+        self.headIndex = None
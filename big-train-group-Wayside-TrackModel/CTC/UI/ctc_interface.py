@@ -24,13 +24,14 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QGridLayout, QTabWidget, QLabel,
                              QPushButton, QLineEdit, QComboBox, QTextEdit, 
                              QListWidget, QFrame, QMessageBox, QTableWidget, 
-                             QTableWidgetItem, QSplitter, QHeaderView, QAbstractItemView,
+                             QTableWidgetItem, QTableView, QSplitter, QHeaderView, QAbstractItemView,
                              QFileDialog, QSizePolicy)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRegExp
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRegExp, QSortFilterProxyModel
 from PyQt5.QtGui import QFont, QFontMetrics, QRegExpValidator, QIntValidator, QColor
 
 # Import visualization components
 from .track_visualization import TrackVisualization
+from .table_models import SnapshotTableModel, TableCell
 
 # Import UML-compliant core components
 from ..Core.ctc_system import CTCSystem
@@ -40,7 +41,7 @@ from ..Core.failure_manager import FailureManager
 from ..Utils.update_worker import UpdateWorker
 
 # Import track reader
-from Track_Reader.track_reader import TrackLayoutReader
+from Track_Reader.track_reader import get_shared_track_reader
 
 # Import visualization libraries for consolidated display functionality
 import matplotlib.pyplot as plt
@@ -48,6 +49,15 @@ import matplotlib.patches as patches
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
+# CTC System state domains each periodically refreshed table (and the track map) is built from
+TABLE_DOMAINS = {
+	'trains': ('trains', 'routes', 'clock'),
+	'blocks': ('blocks', 'trains'),
+	'warnings': ('warnings',),
+	'scheduled_closures': ('blocks', 'clock'),
+	'track': ('trains', 'blocks', 'routes'),
+}
+
 
 class CTCVisualDisplay:
     """
@@ -867,7 +877,7 @@ class CTCInterface(QMainWindow):
 		self.current_time = "05:00"  # Default time
 
 		# Core components - UML-compliant architecture
-		self.trackReader = TrackLayoutReader(track_file, selected_lines=selected_lines)
+		self.trackReader = get_shared_track_reader(track_file, selected_lines=selected_lines)
 		self.ctc_system = CTCSystem(self.trackReader)
 		self.communication_handler = self.ctc_system.communicationHandler
 		self.display_manager = self.ctc_system.displayManager
@@ -912,6 +922,7 @@ class CTCInterface(QMainWindow):
 		self.allBlocksData = []
 		self.blockToRowMap = {}
 		self.previousTrainPositions = {}
+		self.tableDomainVersions = {}  # Table name -> CTC domain versions it was last built from
 
 		# Thread management
 		self.running = True
@@ -1300,7 +1311,7 @@ class CTCInterface(QMainWindow):
 		block_layout.addWidget(self.open_block_btn)
 		
 		# Connect block table selection to update button text
-		self.block_info_table.itemSelectionChanged.connect(self.update_open_close_button)
+		self.block_info_table.selectionModel().selectionChanged.connect(lambda *_: self.update_open_close_button())
 		
 		right_layout.addWidget(block_frame)
 		
@@ -1318,10 +1329,10 @@ class CTCInterface(QMainWindow):
 
 	def create_train_info_table(self):
 		"""Create and configure the train information table"""
-		table = QTableWidget()
-		table.setColumnCount(9)
-		table.setHorizontalHeaderLabels(['Train ID', 'Line', 'Location (Section)', 'Location (Block)', 
-		                               'Destination (Section)', 'Destination (Block)', 'Departure Time', 'ETA', 'Speed (mph)'])
+		self.train_info_model = SnapshotTableModel(['Train ID', 'Line', 'Location (Section)', 'Location (Block)', 
+		                               'Destination (Section)', 'Destination (Block)', 'Departure Time', 'ETA', 'Speed (mph)'], parent=self)
+		table = QTableView()
+		table.setModel(self.train_info_model)
 		table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
 		table.horizontalHeader().setStretchLastSection(False)
 		table.resizeColumnsToContents()
@@ -1349,9 +1360,11 @@ class CTCInterface(QMainWindow):
 
 	def create_warnings_table(self):
 		"""Create and configure the warnings table"""
-		table = QTableWidget()
-		table.setColumnCount(6)
-		table.setHorizontalHeaderLabels(['Warning Type', 'Train', 'Line', 'Section', 'Block', 'Resolved'])
+		# Warnings have no ID - rows are matched on everything except the Resolved column
+		self.warnings_model = SnapshotTableModel(['Warning Type', 'Train', 'Line', 'Section', 'Block', 'Resolved'],
+		                                         row_key=lambda row: row[:5], parent=self)
+		table = QTableView()
+		table.setModel(self.warnings_model)
 		table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
 		table.horizontalHeader().setStretchLastSection(False)
 		table.resizeColumnsToContents()
@@ -1368,10 +1381,14 @@ class CTCInterface(QMainWindow):
 
 	def create_block_info_table(self):
 		"""Create and configure the block information table"""
-		table = QTableWidget()
-		table.setColumnCount(9)
-		table.setHorizontalHeaderLabels(['Line', 'Open?', 'Occupying Train', 'Section', 'Block', 
-		                               'Speed Limit (mph)', 'Stop', 'Switch', 'Crossing'])
+		# Rows are keyed by (line, block) and shown through a sort proxy
+		self.block_info_model = SnapshotTableModel(['Line', 'Open?', 'Occupying Train', 'Section', 'Block', 
+		                               'Speed Limit (mph)', 'Stop', 'Switch', 'Crossing'],
+		                                           row_key=lambda row: (row[0], row[4]), parent=self)
+		block_proxy = QSortFilterProxyModel(self)
+		block_proxy.setSourceModel(self.block_info_model)
+		table = QTableView()
+		table.setModel(block_proxy)
 		table.setAlternatingRowColors(True)
 		table.setSortingEnabled(True)
 		table.verticalHeader().setDefaultSectionSize(16)
@@ -1933,10 +1950,10 @@ class CTCInterface(QMainWindow):
 
 	def create_current_trains_table(self):
 		"""Create the current trains table for the right panel"""
-		table = QTableWidget()
-		table.setColumnCount(9)
-		table.setHorizontalHeaderLabels(['Train ID', 'Line', 'Location (Section)', 'Location (Block)', 
-		                               'Destination (Section)', 'Destination (Block)', 'Departure Time', 'ETA', 'Speed (mph)'])
+		self.current_trains_model = SnapshotTableModel(['Train ID', 'Line', 'Location (Section)', 'Location (Block)', 
+		                               'Destination (Section)', 'Destination (Block)', 'Departure Time', 'ETA', 'Speed (mph)'], parent=self)
+		table = QTableView()
+		table.setModel(self.current_trains_model)
 		table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
 		table.horizontalHeader().setStretchLastSection(False)
 		table.resizeColumnsToContents()
@@ -2182,10 +2199,13 @@ class CTCInterface(QMainWindow):
 		scheduled_title.setFont(QFont("Arial", 16, QFont.Bold))  # Header size per style guide
 		scheduled_layout.addWidget(scheduled_title)
 		
-		# Create scheduled closures table
-		self.scheduled_closures_table = QTableWidget()
-		self.scheduled_closures_table.setColumnCount(6)
-		self.scheduled_closures_table.setHorizontalHeaderLabels(['Line', 'Section', 'Block', 'Type', 'Scheduled Time', 'Status'])
+		# Create scheduled closures table - rows are keyed by the closure ID stored on the Line cell
+		self.scheduled_closures_model = SnapshotTableModel(['Line', 'Section', 'Block', 'Type', 'Scheduled Time', 'Status'],
+		                                                   row_key=lambda row: row[0].user_data, parent=self)
+		scheduled_proxy = QSortFilterProxyModel(self)
+		scheduled_proxy.setSourceModel(self.scheduled_closures_model)
+		self.scheduled_closures_table = QTableView()
+		self.scheduled_closures_table.setModel(scheduled_proxy)
 		self.scheduled_closures_table.setAlternatingRowColors(True)
 		self.scheduled_closures_table.setSortingEnabled(True)
 		self.scheduled_closures_table.verticalHeader().setDefaultSectionSize(20)
@@ -2708,24 +2728,51 @@ class CTCInterface(QMainWindow):
 	# Update methods (using separated business logic)
 
 	def update_table_displays(self):
-		"""Medium frequency update - table content only"""
-		self.update_train_info_table()
-		self.update_block_info_table()
-		self.update_warnings_table()
+		"""Medium frequency update - table content only (only emitted when trains, blocks, warnings or routes changed)
+		
+		Each table's rows are only rebuilt when a CTC System domain it is built
+		from changed since its last refresh (see TABLE_DOMAINS).
+		"""
+		if self._table_domains_changed('trains'):
+			self.update_train_info_table()
+		if self._table_domains_changed('blocks'):
+			self.update_block_info_table()
+		if self._table_domains_changed('warnings'):
+			self.update_warnings_table()
 		# Update scheduled closures to reflect automatic status changes
-		self.update_scheduled_closures_display()
+		if self._table_domains_changed('scheduled_closures'):
+			self.update_scheduled_closures_display()
 		self.detect_and_handle_conflicts()
 		# Keep tables compact after updates
 # Removed compact tables functionality that affects map size
 		# Note: Compact table sizing removed per user request
 
 	def update_visual_displays(self):
-		"""Low frequency update - visual charts and plots"""
-		if self.trackNeedsRedraw:
-			self.create_track_visualization()
-			# Also update the route track widget if it exists
-			if hasattr(self, 'route_track_widget'):
-				self.update_route_track_visualization()
+		"""Low frequency update - visual charts and plots (only emitted when trains, blocks or routes changed)"""
+		if self._table_domains_changed('track'):
+			self.trackNeedsRedraw = True
+		self.create_track_visualization()
+		# Also update the route track widget if it exists
+		if hasattr(self, 'route_track_widget'):
+			self.update_route_track_visualization()
+
+	def _table_domains_changed(self, table_name):
+		"""Check whether the CTC System domains a table is built from changed since it was last checked"""
+		versions = self.ctc_system.get_domain_versions()
+		seen = tuple(versions.get(domain, 0) for domain in TABLE_DOMAINS[table_name])
+		if self.tableDomainVersions.get(table_name) == seen:
+			return False
+		self.tableDomainVersions[table_name] = seen
+		return True
+
+	def _train_table_rows(self, train_data):
+		"""Build train table rows from display manager train info"""
+		return [
+			(data['train_id'], data['line'], data['section_location'], data['block_location'],
+			 data.get('destination_section', ''), data['destination_block'],
+			 data.get('departure_time', ''), data.get('eta', ''), data['speed'])
+			for data in train_data
+		]
 
 	def update_train_info_table(self):
 		"""Update the train information table using display manager data - show only routed trains"""
@@ -2735,46 +2782,22 @@ class CTCInterface(QMainWindow):
 		)
 		# Filter to show only routed trains
 		train_data = [data for data in all_train_data if data['routing_status'] == "Routed"]
-		self.train_info_table.setRowCount(len(train_data))
-
-		for row, data in enumerate(train_data):
-			self.train_info_table.setItem(row, 0, QTableWidgetItem(data['train_id']))
-			self.train_info_table.setItem(row, 1, QTableWidgetItem(data['line']))
-			self.train_info_table.setItem(row, 2, QTableWidgetItem(data['section_location']))
-			self.train_info_table.setItem(row, 3, QTableWidgetItem(data['block_location']))
-			self.train_info_table.setItem(row, 4, QTableWidgetItem(data.get('destination_section', '')))
-			self.train_info_table.setItem(row, 5, QTableWidgetItem(data['destination_block']))
-			self.train_info_table.setItem(row, 6, QTableWidgetItem(data.get('departure_time', '')))
-			self.train_info_table.setItem(row, 7, QTableWidgetItem(data.get('eta', '')))
-			self.train_info_table.setItem(row, 8, QTableWidgetItem(data['speed']))
+		self.train_info_model.set_snapshot(self._train_table_rows(train_data))
 
 		# Also update the current trains table in Route Train tab if it exists
 		if hasattr(self, 'current_trains_table'):
-			self.update_current_trains_table(train_data)
+			self.update_current_trains_table(all_train_data)
 
-	def update_current_trains_table(self, filtered_train_data):
+	def update_current_trains_table(self, all_train_data=None):
 		"""Update the current trains table in the Route Train tab - show all existing trains for rerouting"""
 		# For rerouting, we want to show ALL trains on track, not just routed ones
-		if hasattr(self, 'ctc_system') and self.ctc_system:
+		if all_train_data is None:
 			all_train_data = self.display_manager.get_train_info_for_display(
 				trains=self.ctc_system.trains,
 				train_suggested_speeds=self.ctc_system.trainSuggestedSpeeds
 			)
-		else:
-			all_train_data = []
-			
-		self.current_trains_table.setRowCount(len(all_train_data))
-
-		for row, data in enumerate(all_train_data):
-			self.current_trains_table.setItem(row, 0, QTableWidgetItem(data['train_id']))
-			self.current_trains_table.setItem(row, 1, QTableWidgetItem(data['line']))
-			self.current_trains_table.setItem(row, 2, QTableWidgetItem(data['section_location']))
-			self.current_trains_table.setItem(row, 3, QTableWidgetItem(data['block_location']))
-			self.current_trains_table.setItem(row, 4, QTableWidgetItem(data.get('destination_section', '')))
-			self.current_trains_table.setItem(row, 5, QTableWidgetItem(data['destination_block']))
-			self.current_trains_table.setItem(row, 6, QTableWidgetItem(data.get('departure_time', '')))
-			self.current_trains_table.setItem(row, 7, QTableWidgetItem(data.get('eta', '')))
-			self.current_trains_table.setItem(row, 8, QTableWidgetItem(data['speed']))
+
+		self.current_trains_model.set_snapshot(self._train_table_rows(all_train_data))
 
 	def update_warnings_table(self):
 		"""Update the warnings table using display manager"""
@@ -2783,17 +2806,13 @@ class CTCInterface(QMainWindow):
 			track_status=self.ctc_system.trackStatus,
 			railway_crossings=self.ctc_system.railwayCrossings
 		)
-		
-		self.warnings_table.setRowCount(len(warnings))
 
-		for row, warning in enumerate(warnings):
-			self.warnings_table.setItem(row, 0, QTableWidgetItem(warning["type"]))
-			self.warnings_table.setItem(row, 1, QTableWidgetItem(warning["train"]))
-			self.warnings_table.setItem(row, 2, QTableWidgetItem(warning["line"]))
-			self.warnings_table.setItem(row, 3, QTableWidgetItem(warning["section"]))
-			self.warnings_table.setItem(row, 4, QTableWidgetItem(warning["block"]))
-			resolved_text = "●" if warning["resolved"] else "○"
-			self.warnings_table.setItem(row, 5, QTableWidgetItem(resolved_text))
+		rows = [
+			(str(warning["type"]), str(warning["train"]), str(warning["line"]),
+			 str(warning["section"]), str(warning["block"]), "●" if warning["resolved"] else "○")
+			for warning in warnings
+		]
+		self.warnings_model.set_snapshot(rows)
 	
 	def detect_and_handle_conflicts(self):
 		"""Detect emergencies and handle them - simplified"""
@@ -2822,40 +2841,25 @@ class CTCInterface(QMainWindow):
 		for train_id, train in self.ctc_system.trains.items():
 			current_positions[(train.line, self.get_block_number(train.currentBlock))] = train_id
 
-		# Only update rows that have changed
-		for row in range(self.block_info_table.rowCount()):
-			line_item = self.block_info_table.item(row, 0)
-			block_item = self.block_info_table.item(row, 4)  # Block column moved to position 4
-
-			if line_item and block_item:
-				line = line_item.text()
-				block_num = int(block_item.text())
-				key = (line, block_num)
-
-				# Update Open? column (column 1)
-				open_item = self.block_info_table.item(row, 1)
-				# Use display manager as single source of truth for block closure status
-				is_closed = self.display_manager.is_block_closed(line, block_num, failure_manager=self.failure_manager)
-				open_text = "○" if is_closed else "●"  # ● = filled circle (open), ○ = empty circle (closed)
-				if open_item:
-					if open_item.text() != open_text:
-						open_item.setText(open_text)
-						# Block status updated
-				else:
-					self.block_info_table.setItem(row, 1, QTableWidgetItem(open_text))
-
-				# Update train position (column 2)
-				train_item = self.block_info_table.item(row, 2)
-				if key in current_positions:
-					new_text = current_positions[key]
-					if train_item:
-						if train_item.text() != new_text:
-							train_item.setText(new_text)
-					else:
-						self.block_info_table.setItem(row, 2, QTableWidgetItem(new_text))
-				else:
-					if train_item and train_item.text():
-						train_item.setText("")
+		rows = []
+		for block_data in self.allBlocksData:
+			key = (block_data["line"], block_data["block_number"])
+			# Use display manager as single source of truth for block closure status
+			is_closed = self.display_manager.is_block_closed(key[0], key[1], failure_manager=self.failure_manager)
+			rows.append((
+				block_data["line"],
+				"○" if is_closed else "●",  # ● = filled circle (open), ○ = empty circle (closed)
+				current_positions.get(key, ""),
+				block_data["section"],
+				block_data["block"],
+				block_data["speed"],
+				block_data["stop"],
+				block_data["switch"],
+				block_data["crossing"]
+			))
+
+		# Only the rows whose closure status or occupying train changed are repainted
+		self.block_info_model.set_snapshot(rows)
 
 	# Route Train Tab Event Handlers
 	def set_manual_mode(self):
@@ -3111,11 +3115,30 @@ class CTCInterface(QMainWindow):
 
 	def highlight_train_in_current_table(self, train_id):
 		"""Highlight a train in the current trains table"""
-		for row in range(self.current_trains_table.rowCount()):
-			item = self.current_trains_table.item(row, 0)  # Train ID column
-			if item and item.text() == train_id:
-				self.current_trains_table.selectRow(row)
-				break
+		self._select_table_row(self.current_trains_table, self.current_trains_model.find_row(train_id))
+
+	def _table_source_row(self, table, index):
+		"""Map a view index to its row in the table's snapshot model"""
+		view_model = table.model()
+		if isinstance(view_model, QSortFilterProxyModel):
+			index = view_model.mapToSource(index)
+		return index.row()
+
+	def _selected_table_row(self, table):
+		"""Get the snapshot model row of the first selected row in a table, or -1"""
+		selected_rows = table.selectionModel().selectedRows()
+		if not selected_rows:
+			return -1
+		return self._table_source_row(table, selected_rows[0])
+
+	def _select_table_row(self, table, row):
+		"""Select a snapshot model row in a table view (ignored for row -1)"""
+		if row < 0:
+			return
+		view_model = table.model()
+		if isinstance(view_model, QSortFilterProxyModel):
+			row = view_model.mapFromSource(view_model.sourceModel().index(row, 0)).row()
+		table.selectRow(row)
 
 	def get_block_number(self, block_obj):
 		"""Extract block number from Block object or return as-is if already a number"""
@@ -3574,13 +3597,11 @@ class CTCInterface(QMainWindow):
 
 	def reroute_selected_train(self):
 		"""Handle rerouting a selected train from the current trains table"""
-		selected_items = self.current_trains_table.selectedItems()
-		print(f"Debug: Selected items count: {len(selected_items) if selected_items else 0}")
-		if selected_items:
-			row = selected_items[0].row()
-			train_id_item = self.current_trains_table.item(row, 0)
-			if train_id_item:
-				train_id = train_id_item.text()
+		row = self._selected_table_row(self.current_trains_table)
+		print(f"Debug: Selected row: {row}")
+		if row >= 0:
+			train_id = self.current_trains_model.row_text(row, 0)
+			if train_id:
 				print(f"Debug: Rerouting train {train_id}")
 				# Switch to Route Trains tab
 				self.tab_widget.setCurrentIndex(1)
@@ -3594,13 +3615,11 @@ class CTCInterface(QMainWindow):
 
 	def reroute_selected_train_from_main(self):
 		"""Handle rerouting a selected train from the main page train table"""
-		selected_items = self.train_info_table.selectedItems()
-		print(f"Debug: Selected items from main table count: {len(selected_items) if selected_items else 0}")
-		if selected_items:
-			row = selected_items[0].row()
-			train_id_item = self.train_info_table.item(row, 0)
-			if train_id_item:
-				train_id = train_id_item.text()
+		row = self._selected_table_row(self.train_info_table)
+		print(f"Debug: Selected row from main table: {row}")
+		if row >= 0:
+			train_id = self.train_info_model.row_text(row, 0)
+			if train_id:
 				print(f"Debug: Rerouting train {train_id} from main page")
 				# Switch to Route Trains tab
 				self.tab_widget.setCurrentIndex(1)
@@ -4235,9 +4254,6 @@ class CTCInterface(QMainWindow):
 		self.allBlocksData = []
 		self.blockToRowMap = {}
 
-		self.block_info_table.setSortingEnabled(False)
-		self.block_info_table.setUpdatesEnabled(False)
-
 		row_index = 0
 		for line in self.selected_lines:
 			blocks = self.trackReader.lines.get(line, [])
@@ -4256,22 +4272,8 @@ class CTCInterface(QMainWindow):
 				self.blockToRowMap[(line, block.block_number)] = row_index
 				row_index += 1
 
-		self.block_info_table.setRowCount(len(self.allBlocksData))
-
-		for row, block_data in enumerate(self.allBlocksData):
-			self.block_info_table.setItem(row, 0, QTableWidgetItem(block_data["line"]))
-			self.block_info_table.setItem(row, 1, QTableWidgetItem("●"))  # Filled circle = open
-			self.block_info_table.setItem(row, 2, QTableWidgetItem(""))    # Occupying Train
-			self.block_info_table.setItem(row, 3, QTableWidgetItem(block_data["section"]))
-			self.block_info_table.setItem(row, 4, QTableWidgetItem(block_data["block"]))
-			self.block_info_table.setItem(row, 5, QTableWidgetItem(block_data["speed"]))
-			self.block_info_table.setItem(row, 6, QTableWidgetItem(block_data["stop"]))
-			self.block_info_table.setItem(row, 7, QTableWidgetItem(block_data["switch"]))
-			self.block_info_table.setItem(row, 8, QTableWidgetItem(block_data["crossing"]))
-
-		self.block_info_table.setUpdatesEnabled(True)
-		self.block_info_table.setSortingEnabled(True)
-		self.block_info_table.sortItems(0, Qt.AscendingOrder)
+		self.update_block_info_table()
+		self.block_info_table.sortByColumn(0, Qt.AscendingOrder)
 
 	def create_track_visualization(self):
 		"""Create track visualization using the track visualization component"""
@@ -4304,19 +4306,19 @@ class CTCInterface(QMainWindow):
 
 	def _initial_compact_sizing(self, table):
 		"""Set initial compact column sizes for a table"""
+		column_count = table.model().columnCount()
 		# Check if this is the block info table by column count and headers
-		if (table.columnCount() == 9 and 
-			table.horizontalHeaderItem(0) and 
-			table.horizontalHeaderItem(0).text() == 'Line'):
+		if (column_count == 9 and 
+			table.model().headerData(0, Qt.Horizontal) == 'Line'):
 			# Set proper widths for block table columns to accommodate 20pt font
 			compact_widths = [140, 90, 180, 110, 90, 170, 90, 110, 110]  # Updated for 20pt font
 			for col, width in enumerate(compact_widths):
-				if col < table.columnCount():
+				if col < column_count:
 					table.setColumnWidth(col, width)
 		else:
 			# For other tables, use auto-sizing but make compact
 			table.resizeColumnsToContents()
-			for col in range(table.columnCount()):
+			for col in range(column_count):
 				current_width = table.columnWidth(col)
 				new_width = max(50, int(current_width * 0.85))
 				table.setColumnWidth(col, new_width)
@@ -4328,32 +4330,27 @@ class CTCInterface(QMainWindow):
 
 	def update_open_close_button(self):
 		"""Update the open/close button text based on selected block"""
-		selected_items = self.block_info_table.selectedItems()
-		if selected_items:
-			# Get the selected row
-			row = selected_items[0].row()
-			open_item = self.block_info_table.item(row, 1)  # Open? column
-			if open_item:
-				is_open = open_item.text() == "●"  # Filled circle means open
-				if is_open:
-					self.open_block_btn.setText("Close Block")
-				else:
-					self.open_block_btn.setText("Open Block")
+		# Get the selected row
+		row = self._selected_table_row(self.block_info_table)
+		if row >= 0:
+			is_open = self.block_info_model.row_text(row, 1) == "●"  # Open? column - filled circle means open
+			if is_open:
+				self.open_block_btn.setText("Close Block")
+			else:
+				self.open_block_btn.setText("Open Block")
 		else:
 			self.open_block_btn.setText("Close Block")  # Default
 
 	def handle_open_close_block(self):
 		"""Handle open/close block button click - navigate to maintenance tab"""
-		selected_items = self.block_info_table.selectedItems()
-		if selected_items:
-			# Get the selected row info
-			row = selected_items[0].row()
-			line_item = self.block_info_table.item(row, 0)
-			block_item = self.block_info_table.item(row, 4)
+		# Get the selected row info
+		row = self._selected_table_row(self.block_info_table)
+		if row >= 0:
+			line = self.block_info_model.row_text(row, 0)
+			block_text = self.block_info_model.row_text(row, 4)
 			
-			if line_item and block_item:
-				line = line_item.text()
-				block_num = int(block_item.text())
+			if line and block_text:
+				block_num = int(block_text)
 				
 				# Store the auto-population data and set flag
 				self._auto_populate_data = {'line': line, 'block': block_num}
@@ -4557,51 +4554,24 @@ class CTCInterface(QMainWindow):
 	def update_train_table_selection(self, train_id: str):
 		"""Update train table to show selected train"""
 		if hasattr(self, 'train_info_table'):
-			for row in range(self.train_info_table.rowCount()):
-				item = self.train_info_table.item(row, 0)  # Train ID column
-				if item and item.text() == train_id:
-					self.train_info_table.selectRow(row)
-					break
+			self._select_table_row(self.train_info_table, self.train_info_model.find_row(train_id))
 
 	def update_current_trains_selection(self, train_id: str):
 		"""Update current trains table to show selected train"""
 		if hasattr(self, 'current_trains_table'):
-			for row in range(self.current_trains_table.rowCount()):
-				item = self.current_trains_table.item(row, 0)  # Train ID column
-				if item and item.text() == train_id:
-					self.current_trains_table.selectRow(row)
-					break
+			self._select_table_row(self.current_trains_table, self.current_trains_model.find_row(train_id))
 
 	def update_block_table_selection(self, line: str, block: int):
 		"""Update block info table to show selected block"""
 		if hasattr(self, 'block_info_table'):
-			for row in range(self.block_info_table.rowCount()):
-				line_item = self.block_info_table.item(row, 0)  # Line column
-				block_item = self.block_info_table.item(row, 4)  # Block column
-				if (line_item and line_item.text() == line and 
-					block_item and block_item.text() == str(block)):
-					self.block_info_table.selectRow(row)
-					break
+			# Block column holds zero-padded block numbers
+			row = self.block_info_model.find_row((line, str(block).zfill(4)))
+			self._select_table_row(self.block_info_table, row)
 
 	def update_warnings_display(self):
 		"""Update warnings display from display manager"""
 		if hasattr(self, 'warnings_table'):
-			warnings = self.display_manager.get_warnings(
-				failure_manager=self.failure_manager,
-				track_status=self.ctc_system.trackStatus,
-				railway_crossings=self.ctc_system.railwayCrossings
-			)
-			self.warnings_table.setRowCount(len(warnings))
-			
-			for row, warning in enumerate(warnings):
-				# Display warning information
-				self.warnings_table.setItem(row, 0, QTableWidgetItem(warning.get('type', '')))
-				self.warnings_table.setItem(row, 1, QTableWidgetItem(warning.get('message', '')))
-				# Add timestamp if available
-				if 'timestamp' in warning:
-					import datetime
-					ts = datetime.datetime.fromtimestamp(warning['timestamp'])
-					self.warnings_table.setItem(row, 2, QTableWidgetItem(ts.strftime('%H:%M:%S')))
+			self.update_warnings_table()
 
 	def get_block_section(self, block_id, line=None):
 		"""Get section information for a block"""
@@ -4705,77 +4675,54 @@ class CTCInterface(QMainWindow):
 			
 			table_entries.sort(key=get_sort_key)
 			
-			self.scheduled_closures_table.setRowCount(len(table_entries))
-			
-			for row, entry in enumerate(table_entries):
-				# Line
-				line_item = QTableWidgetItem(entry['line'])
-				# Store the closure ID as item data for easy retrieval
-				line_item.setData(Qt.UserRole, entry['closure_id'])
-				self.scheduled_closures_table.setItem(row, 0, line_item)
-				
-				# Section
-				self.scheduled_closures_table.setItem(row, 1, QTableWidgetItem(entry['section']))
-				
-				# Block
-				self.scheduled_closures_table.setItem(row, 2, QTableWidgetItem(str(entry['block_number'])))
-				
-				# Type (Closure or Opening)
-				type_item = QTableWidgetItem(entry['type'])
-				
-				if entry['type'] == 'Closure':
-					type_item.setForeground(QColor('red'))
-				else:  # Opening
-					type_item.setForeground(QColor('green'))
-				
-				self.scheduled_closures_table.setItem(row, 3, type_item)
-				
+			rows = []
+			for entry in table_entries:
 				# Scheduled Time
 				scheduled_time = entry['scheduled_time']
 				if hasattr(scheduled_time, 'strftime'):
 					time_str = scheduled_time.strftime('%H:%M')
 				else:
 					time_str = str(scheduled_time)
-				self.scheduled_closures_table.setItem(row, 4, QTableWidgetItem(time_str))
 				
 				# Status
 				if entry['status'] == 'automatic':
-					status_text = 'Auto Open'
-					status_item = QTableWidgetItem(status_text)
-					status_item.setForeground(QColor('blue'))
+					status_cell = TableCell('Auto Open', foreground='blue', bold=True)
 				else:
-					status_text = entry['status'].title()
-					status_item = QTableWidgetItem(status_text)
-					if entry['status'] == 'active':
-						status_item.setForeground(QColor('red'))
-					elif entry['status'] == 'scheduled':
-						status_item.setForeground(QColor('darkorange'))
+					status_colors = {'active': 'red', 'scheduled': 'darkorange'}
+					status_cell = TableCell(entry['status'].title(), foreground=status_colors.get(entry['status']), bold=True)
 				
-				font = QFont()
-				font.setBold(True)
-				status_item.setFont(font)
-				self.scheduled_closures_table.setItem(row, 5, status_item)
+				rows.append((
+					# Store the closure ID as Line cell data for easy retrieval
+					TableCell(entry['line'], user_data=entry['closure_id']),
+					str(entry['section']),
+					str(entry['block_number']),
+					# Type (Closure or Opening)
+					TableCell(entry['type'], foreground='red' if entry['type'] == 'Closure' else 'green'),
+					time_str,
+					status_cell
+				))
+			
+			self.scheduled_closures_model.set_snapshot(rows)
 
 	def cancel_selected_scheduled_closure(self):
 		"""Cancel the selected scheduled closure"""
 		if hasattr(self, 'scheduled_closures_table'):
-			current_row = self.scheduled_closures_table.currentRow()
+			current_index = self.scheduled_closures_table.currentIndex()
+			current_row = self._table_source_row(self.scheduled_closures_table, current_index) if current_index.isValid() else -1
 			if current_row >= 0:
-				# Get the closure ID from the stored item data
-				line_item = self.scheduled_closures_table.item(current_row, 0)
-				block_item = self.scheduled_closures_table.item(current_row, 2)
-				type_item = self.scheduled_closures_table.item(current_row, 3)
+				model = self.scheduled_closures_model
+				line = model.row_text(current_row, 0)
+				block_text = model.row_text(current_row, 2)
+				action_type = model.row_text(current_row, 3)
 				
-				if line_item and block_item and type_item:
-					# Get the closure ID from the item data
-					closure_id = line_item.data(Qt.UserRole)
-					line = line_item.text()
+				if line and block_text and action_type:
+					# Get the closure ID from the Line cell data
+					closure_id = model.index(current_row, 0).data(Qt.UserRole)
 					try:
-						block_number = int(block_item.text())
+						block_number = int(block_text)
 					except ValueError:
-						StyledMessageBox.warning(self, "Error", f"Invalid block number: {block_item.text()}")
+						StyledMessageBox.warning(self, "Error", f"Invalid block number: {block_text}")
 						return
-					action_type = type_item.text()
 					print(f"Debug: Cancelling {action_type} for {line} Line Block {block_number}, closure_id={closure_id}")
 					
 					if action_type == "Opening":
@@ -4808,8 +4755,7 @@ class CTCInterface(QMainWindow):
 								if reply == QMessageBox.Yes:
 									self.communication_handler.scheduledOpenings.remove(opening_to_cancel)
 									StyledMessageBox.information(self, "Success", f"Scheduled opening for Block {block_number} cancelled")
-									# Clear the table and refresh it
-									self.scheduled_closures_table.setRowCount(0)
+									# Refresh the table
 									self.update_scheduled_closures_display()
 									print(f"Debug: Cancelled opening for {line} Line Block {block_number}")
 							else:
@@ -4843,8 +4789,7 @@ class CTCInterface(QMainWindow):
 								if reply == QMessageBox.Yes:
 									self.communication_handler.scheduledClosures.remove(closure_to_cancel)
 									StyledMessageBox.information(self, "Success", f"Scheduled closure for Block {block_number} cancelled")
-									# Clear the table and refresh it
-									self.scheduled_closures_table.setRowCount(0)
+									# Refresh the table
 									self.update_scheduled_closures_display()
 									print(f"Debug: Cancelled closure for {line} Line Block {block_number}")
 							else:
@@ -4864,8 +4809,7 @@ class CTCInterface(QMainWindow):
 								result = self.failure_manager.cancel_scheduled_closure(closure_id)
 								if result['success']:
 									StyledMessageBox.information(self, "Success", result['message'])
-									# Clear the table and refresh it
-									self.scheduled_closures_table.setRowCount(0)
+									# Refresh the table
 									self.update_scheduled_closures_display()
 									print(f"Debug: Cancelled closure for {line} Line Block {block_number}")
 								else:
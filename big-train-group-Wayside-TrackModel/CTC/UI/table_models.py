@@ -0,0 +1,222 @@
+"""
+CTC UI - Table Models
+=====================
+Qt item models behind the CTC interface tables.
+
+This module handles:
+- Holding table rows as immutable snapshots of cell values
+- Diffing a new snapshot against the shown one by row key
+- Emitting row inserts/removes and dataChanged only for rows that changed
+
+Rows are matched by key (e.g. train ID or (line, block)), so a refresh where
+one train moved only repaints that train's row, and selections stay on the
+same train or block while rows are added, removed or reordered.
+"""
+
+from collections import namedtuple
+from typing import Callable, List, Optional, Sequence
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QFont
+
+
+class TableCell(namedtuple('TableCell', ['text', 'foreground', 'bold', 'user_data'])):
+    """
+    One styled table cell. Plain strings can be used for unstyled cells.
+
+    Attributes:
+        text (str): Displayed text
+        foreground (Optional[str]): Text color name, or None for the default
+        bold (bool): Whether the text is bold
+        user_data: Value returned for Qt.UserRole
+    """
+    __slots__ = ()
+
+    def __new__(cls, text, foreground=None, bold=False, user_data=None):
+        return super().__new__(cls, text, foreground, bold, user_data)
+
+
+class SnapshotTableModel(QAbstractTableModel):
+    """
+    Read-only table model fed with whole-table row snapshots.
+
+    Each row is a tuple of cells (str or TableCell). set_snapshot compares the
+    new rows with the shown rows by key and only signals the differences.
+
+    Attributes:
+        headers (List[str]): Column header labels
+        rowKey (Callable[[tuple], object]): Gets the identity of a row
+        rows (List[tuple]): Rows currently shown
+        snapshotVersion (Optional[int]): Version of the shown snapshot
+    """
+
+    def __init__(self, headers: Sequence[str], row_key: Optional[Callable[[tuple], object]] = None, parent=None):
+        """
+        Args:
+            headers: Column header labels
+            row_key: Gets the identity of a row (defaults to the first cell's text)
+            parent: Optional Qt parent object
+        """
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.rowKey = row_key or (lambda row: self.cell_text(row[0]))
+        self.rows = []
+        self.snapshotVersion = None
+        self._keys = []
+        self._boldFont = QFont()
+        self._boldFont.setBold(True)
+
+    # === Snapshot updates ===
+
+    def set_snapshot(self, rows: Sequence[tuple], version: Optional[int] = None) -> int:
+        """
+        Show a new snapshot of the table
+
+        Args:
+            rows: New rows in display order
+            version: Snapshot version; an unchanged version is ignored without diffing
+
+        Returns:
+            Number of rows inserted, removed or changed
+        """
+        if version is not None and version == self.snapshotVersion:
+            return 0
+        self.snapshotVersion = version
+
+        new_rows = [tuple(row) for row in rows]
+        new_keys = self._unique_keys(new_rows)
+        changes = self._remove_missing_rows(set(new_keys))
+        changes += self._append_new_rows(new_rows, new_keys)
+        self._reorder_rows(new_keys)
+
+        # Rows now line up with the snapshot - signal the ones whose cells changed
+        changed_rows = [i for i, row in enumerate(new_rows) if self.rows[i] != row]
+        for i in changed_rows:
+            self.rows[i] = new_rows[i]
+        for first, last in self._contiguous_runs(changed_rows):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.headers) - 1))
+        return changes + len(changed_rows)
+
+    def clear(self) -> None:
+        """Remove all rows"""
+        self.beginResetModel()
+        self.rows = []
+        self._keys = []
+        self.snapshotVersion = None
+        self.endResetModel()
+
+    def _unique_keys(self, rows: List[tuple]) -> List[tuple]:
+        """Get (key, occurrence) pairs so rows with equal keys stay distinguishable"""
+        seen = {}
+        keys = []
+        for row in rows:
+            key = self.rowKey(row)
+            occurrence = seen.get(key, 0)
+            seen[key] = occurrence + 1
+            keys.append((key, occurrence))
+        return keys
+
+    def _remove_missing_rows(self, new_key_set: set) -> int:
+        """Remove shown rows whose key is not in the new snapshot"""
+        missing = [i for i, key in enumerate(self._keys) if key not in new_key_set]
+        for first, last in reversed(self._contiguous_runs(missing)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.rows[first:last + 1]
+            del self._keys[first:last + 1]
+            self.endRemoveRows()
+        return len(missing)
+
+    def _append_new_rows(self, new_rows: List[tuple], new_keys: List[tuple]) -> int:
+        """Append snapshot rows whose key is not shown yet"""
+        shown = set(self._keys)
+        added = [i for i, key in enumerate(new_keys) if key not in shown]
+        if added:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self.rows.extend(new_rows[i] for i in added)
+            self._keys.extend(new_keys[i] for i in added)
+            self.endInsertRows()
+        return len(added)
+
+    def _reorder_rows(self, new_keys: List[tuple]) -> None:
+        """Move the shown rows into snapshot order, keeping persistent indexes on their rows"""
+        if self._keys == new_keys:
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_keys = self._keys
+        old_position = {key: i for i, key in enumerate(old_keys)}
+        new_position = {key: i for i, key in enumerate(new_keys)}
+        self.rows = [self.rows[old_position[key]] for key in new_keys]
+        self._keys = list(new_keys)
+
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_position[old_keys[index.row()]], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    @staticmethod
+    def _contiguous_runs(indexes: List[int]) -> List[tuple]:
+        """Group sorted row numbers into (first, last) runs"""
+        runs = []
+        for i in indexes:
+            if runs and runs[-1][1] == i - 1:
+                runs[-1] = (runs[-1][0], i)
+            else:
+                runs.append((i, i))
+        return runs
+
+    # === Row access ===
+
+    @staticmethod
+    def cell_text(cell) -> str:
+        """Get the display text of a cell"""
+        return cell.text if isinstance(cell, TableCell) else str(cell)
+
+    def row_text(self, row: int, column: int) -> str:
+        """Get the display text at a row and column, or '' if out of range"""
+        if 0 <= row < len(self.rows) and 0 <= column < len(self.headers):
+            return self.cell_text(self.rows[row][column])
+        return ''
+
+    def find_row(self, key) -> int:
+        """Get the first row with a key, or -1 if it is not shown"""
+        for i, (row_key, _) in enumerate(self._keys):
+            if row_key == key:
+                return i
+        return -1
+
+    # === QAbstractTableModel interface ===
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        cell = self.rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return self.cell_text(cell)
+        if not isinstance(cell, TableCell):
+            return None
+        if role == Qt.ForegroundRole and cell.foreground:
+            return QColor(cell.foreground)
+        if role == Qt.FontRole and cell.bold:
+            return self._boldFont
+        if role == Qt.UserRole:
+            return cell.user_data
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
@@ -5,6 +5,9 @@ Handles all track visualization components for the CTC interface.
 Separated from main UI for better modularity.
 """
 
+import hashlib
+import os
+import pickle
 import time
 import numpy as np
 import matplotlib
@@ -17,16 +20,26 @@ from datetime import datetime
 from collections import defaultdict, deque
 import math
 
+from Track_Reader.track_reader import LAYOUT_CACHE_DIR_NAME
+
+# Bump UI_LAYOUT_VERSION whenever a layout algorithm changes so persisted
+# block positions computed by the old algorithm are ignored.
+UI_LAYOUT_VERSION = 1
+
 
 class TrackTopologyAnalyzer:
     """
     Analyzes track topology to identify linear sections, branches, loops, and yard connections.
+    Analysis results are computed once per analyzer and reused by later calls.
     """
     
     def __init__(self, blocks):
         self.blocks = blocks
         self.block_dict = {block.block_number: block for block in blocks}
         self.graph = self._build_connection_graph()
+        self._classification = None
+        self._cycles = None
+        self._segments = None
         
     def _build_connection_graph(self):
         """Build undirected graph from connected_blocks data"""
@@ -43,6 +56,9 @@ class TrackTopologyAnalyzer:
     
     def classify_nodes(self):
         """Classify nodes by their connectivity degree"""
+        if self._classification is not None:
+            return self._classification
+
         classification = {
             'linear': [],      # degree = 2 (middle of track segments)
             'junctions': [],   # degree > 2 (switches and convergence points)  
@@ -66,10 +82,14 @@ class TrackTopologyAnalyzer:
             elif degree > 2:
                 classification['junctions'].append(block_num)
         
+        self._classification = classification
         return classification
     
     def detect_cycles(self):
         """Detect cycles (loops) in the track graph using DFS"""
+        if self._cycles is not None:
+            return self._cycles
+
         visited = set()
         cycles = []
         
@@ -95,10 +115,14 @@ class TrackTopologyAnalyzer:
             if block_num not in visited:
                 dfs_cycle_detection(block_num, None, [])
         
+        self._cycles = cycles
         return cycles
     
     def extract_track_segments(self):
         """Extract track segments (paths between junctions/terminals)"""
+        if self._segments is not None:
+            return self._segments
+
         classification = self.classify_nodes()
         key_nodes = set(classification['junctions'] + classification['terminals'] + classification['yard_blocks'])
         
@@ -134,6 +158,7 @@ class TrackTopologyAnalyzer:
                 if len(segment) > 1:
                     segments.append(segment)
         
+        self._segments = segments
         return segments
 
 
@@ -349,6 +374,144 @@ class TrackLayoutEngine:
                 self.yard_position['x'] = avg_x
 
 
+class TrackLayoutCache:
+    """
+    Block positions computed by the layout algorithms, keyed by layout content hash.
+
+    The key hashes the layout method, its parameters and the topology of the
+    blocks it is given, so an entry is reused until the track data changes.
+    Entries are persisted next to the track reader's compiled layout cache,
+    letting later sessions skip the topology analysis entirely.
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.entries = {}
+        self.loaded = False
+
+    @staticmethod
+    def layout_key(kind, blocks, params):
+        """
+        Get the content hash identifying a layout
+
+        Args:
+            kind: Layout method name
+            blocks: Blocks in the order the method receives them
+            params: Hashable layout parameters (line name, offsets, spacing)
+
+        Returns:
+            SHA-256 hex digest of the layout inputs
+        """
+        topology = tuple(
+            (block.block_number,
+             tuple(getattr(block, 'connected_blocks', None) or ()),
+             bool(getattr(block, 'has_yard_connection', False)))
+            for block in blocks
+        )
+        content = repr((UI_LAYOUT_VERSION, kind, params, topology))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def get_or_compute(self, key, compute):
+        """
+        Get a cached layout, computing and persisting it on a miss
+
+        Args:
+            key: Layout content hash from layout_key
+            compute: Callable returning the layout on a cache miss
+
+        Returns:
+            The cached or freshly computed layout
+        """
+        if not self.loaded:
+            self._load()
+        if key not in self.entries:
+            self.entries[key] = compute()
+            self._save()
+        return self.entries[key]
+
+    def _load(self):
+        """Load persisted layouts; a missing or unreadable file just starts empty"""
+        self.loaded = True
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, 'rb') as cache_file:
+                payload = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return
+        if isinstance(payload, dict) and payload.get('version') == UI_LAYOUT_VERSION:
+            self.entries.update(payload.get('layouts', {}))
+
+    def _save(self):
+        """Persist all layouts; failures are not fatal - layouts are recomputed next session"""
+        if not self.cache_path:
+            return
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temp_path, 'wb') as cache_file:
+                pickle.dump({'version': UI_LAYOUT_VERSION, 'layouts': self.entries},
+                            cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic replace so concurrent readers never see a partial file
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+class LayoutSpatialIndex:
+    """
+    Uniform grid over element bounding boxes for click hit-testing.
+
+    Each element is stored in every grid cell its box overlaps, so a point
+    query only checks the few elements sharing the point's cell instead of
+    every element on the map.
+    """
+
+    def __init__(self, cell_size=50):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.elements = {}
+
+    def _cell_range(self, low, high):
+        """Get the grid cell numbers covered by [low, high]"""
+        return range(int(math.floor(low / self.cell_size)), int(math.floor(high / self.cell_size)) + 1)
+
+    def insert(self, element_id, element):
+        """
+        Add an element with 'x', 'y', 'width' and 'height' bounds
+
+        Args:
+            element_id: Identifier returned by queries
+            element: Element data including its bounds
+        """
+        order = len(self.elements)
+        self.elements[element_id] = (order, element)
+        for cx in self._cell_range(element['x'], element['x'] + element['width']):
+            for cy in self._cell_range(element['y'], element['y'] + element['height']):
+                self.cells[(cx, cy)].append(element_id)
+
+    def query(self, x, y):
+        """
+        Get the elements whose bounds contain a point
+
+        Args:
+            x: Point x in data coordinates
+            y: Point y in data coordinates
+
+        Returns:
+            List of (element_id, element) in insertion order
+        """
+        cell = (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+        hits = []
+        for element_id in self.cells.get(cell, ()):
+            order, element = self.elements[element_id]
+            if (element['x'] <= x <= element['x'] + element['width'] and
+                    element['y'] <= y <= element['y'] + element['height']):
+                hits.append((order, element_id, element))
+        return [(element_id, element) for _, element_id, element in sorted(hits, key=lambda hit: hit[0])]
+
+
 class TrackVisualization:
     """
     Manages track visualization components for the CTC interface.
@@ -360,9 +523,16 @@ class TrackVisualization:
         self.figure = None
         self.canvas = None
         self.widget = None
-        self.layout_cache = {}  # Cache for auto-generated layouts
+        self.layout_cache = {}  # Cache for auto-generated layouts, keyed by (line, layout content hash)
+        self.position_cache = TrackLayoutCache(self._get_layout_cache_path())  # Persisted block positions
         self.interactive_elements = {}  # Store clickable elements for future interaction
+        self.hit_index = None  # Spatial index over clickable elements of the current scene
         self.click_callback = None  # Callback function for click events
+        self.scene = None  # Static scene currently drawn (key, axes, draw method, dynamic state)
+        self.background = None  # Cached bitmap of the static scene for blitting
+        self.closure_markers = {}  # (line, block) -> hidden overlay artists shown while closed
+        self.train_styles = {}  # line -> (block positions, marker style) for train markers
+        self.train_markers = {}  # line -> pool of (box, label) train marker artists
         
     def create_widget(self):
         """Create the track visualization widget"""
@@ -370,12 +540,41 @@ class TrackVisualization:
         self.figure = Figure(figsize=(16, 10), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         self.widget = self.canvas
+
+        # Re-cache the static background whenever the canvas redraws (e.g. on resize)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
-        # Disable mouse click events to make charts non-editable
-        # self.canvas.mpl_connect('button_press_event', self._on_click)
+        # Clicks only report the element under the cursor to click_callback
+        # (looked up in the hit index); the chart itself stays non-editable
+        self.canvas.mpl_connect('button_press_event', self._on_click)
         
         return self.widget
         
+    def _get_layout_cache_path(self):
+        """Get the persisted block position file next to the track reader's layout cache"""
+        file_path = getattr(self.track_reader, 'file_path', None)
+        if not isinstance(file_path, str):
+            return None
+        workbook_dir, workbook_name = os.path.split(os.path.abspath(file_path))
+        stem = os.path.splitext(workbook_name)[0].replace(" ", "_").replace("&", "and")
+        return os.path.join(workbook_dir, LAYOUT_CACHE_DIR_NAME, f"{stem}.ui_positions.pkl")
+
+    def _cached_layout(self, kind, blocks, params, compute):
+        """
+        Get a layout from the position cache, computing it on a miss
+
+        Args:
+            kind: Layout method name
+            blocks: Blocks passed to the layout method
+            params: Hashable layout parameters
+            compute: Callable computing the layout
+
+        Returns:
+            The cached layout
+        """
+        key = TrackLayoutCache.layout_key(kind, blocks, params)
+        return self.position_cache.get_or_compute(key, compute)
+
     def set_click_callback(self, callback):
         """Set callback function for track element clicks"""
         self.click_callback = callback
@@ -390,10 +589,38 @@ class TrackVisualization:
             return
             
         # Check if click is within any interactive elements
+        if self.hit_index is None:
+            self._build_hit_index()
+        hits = self.hit_index.query(x, y)
+        if hits:
+            element_data = hits[0][1]
+            self.click_callback(element_data['type'], element_data)
+
+    def _register_block_hit_boxes(self, line_name, block_positions, half_size):
+        """
+        Add clickable boxes around drawn blocks
+
+        Args:
+            line_name: Line the blocks belong to
+            block_positions: Block number -> {'x', 'y'} centre
+            half_size: Half the width/height of the clickable box
+        """
+        for block_number, pos in block_positions.items():
+            self.interactive_elements[f"{line_name}_block_{block_number}"] = {
+                'type': 'block',
+                'line': line_name,
+                'block_number': block_number,
+                'x': pos['x'] - half_size,
+                'y': pos['y'] - half_size,
+                'width': 2 * half_size,
+                'height': 2 * half_size
+            }
+
+    def _build_hit_index(self):
+        """Index the current scene's interactive elements for click hit-testing"""
+        self.hit_index = LayoutSpatialIndex()
         for element_id, element_data in self.interactive_elements.items():
-            if self._point_in_element(x, y, element_data):
-                self.click_callback(element_data['type'], element_data)
-                break
+            self.hit_index.insert(element_id, element_data)
                 
     def _point_in_element(self, x, y, element):
         """Check if a point is within an interactive element's bounds"""
@@ -401,61 +628,281 @@ class TrackVisualization:
                 element['y'] <= y <= element['y'] + element['height'])
         
     def update_display(self, selected_line, trains, maintenance_closures, use_auto_layout=True):
-        """Update the track visualization display"""
+        """
+        Update the track visualization display
+
+        Static track geometry is drawn once per line selection and cached as a
+        background bitmap. Later updates only move the train markers and toggle
+        the closure overlays, blitting them over the cached background, and
+        skip repainting entirely when neither has changed.
+        """
         if not self.figure:
             return
-            
-        # Clear previous plot
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        # Set light background color to match track theme
-        ax.set_facecolor('#FFFFFF')
-        
+
+        scene_key = (selected_line, use_auto_layout, tuple(self.track_reader.lines.keys()))
+        if self.scene is None or self.scene['key'] != scene_key:
+            self._build_static_scene(scene_key, selected_line, trains, maintenance_closures, use_auto_layout)
+        elif not self.scene['retained']:
+            # Map style without retained markers - redraw everything as before
+            self._draw_full_scene(trains, maintenance_closures)
+        else:
+            self._update_dynamic_artists(trains, maintenance_closures)
+
+    def invalidate_display(self):
+        """Force the next update_display call to rebuild the static scene"""
+        self.scene = None
+        self.background = None
+
+    def _select_draw_method(self, selected_line, use_auto_layout):
+        """
+        Choose the map drawing method for a line selection
+
+        Args:
+            selected_line: Line selection shown in the CTC interface
+            use_auto_layout: Whether to use the auto-generated layout
+
+        Returns:
+            Callable taking (ax, trains, maintenance_closures)
+        """
         # Choose visualization method based on available lines
         available_lines = list(self.track_reader.lines.keys())
-        
+
+        def auto_map(line_name):
+            return lambda ax, trains, closures: self.draw_auto_generated_map(ax, line_name, trains, closures)
+
         if use_auto_layout:
             # Use new auto-generated boxy layout
             if selected_line == "Red & Green":
                 # Show both Red and Green lines in a simplified, clean format
-                self.draw_simplified_red_green_map(ax, trains, maintenance_closures)
-                ax.set_aspect('equal')
-                ax.axis('off')
-            else:
-                # Single line view
-                self.draw_auto_generated_map(ax, selected_line, trains, maintenance_closures)
-                ax.set_aspect('equal')
-                ax.axis('off')
-        else:
-            # Use simple clean layout - automatically choose based on available lines
-            if len(available_lines) == 1:
-                # Single line loaded - show that line
-                line_name = available_lines[0]
-                if line_name == "Blue":
-                    self.draw_blue_line(ax, trains, maintenance_closures)
-                else:
-                    self.draw_auto_generated_map(ax, line_name, trains, maintenance_closures)
-            elif len(available_lines) == 2 and "Red" in available_lines and "Green" in available_lines:
-                # Red and Green together
-                self.draw_simplified_red_green_map(ax, trains, maintenance_closures)
-            elif selected_line == "Blue" and "Blue" in available_lines:
-                self.draw_blue_line(ax, trains, maintenance_closures)
-            elif selected_line == "Red & Green":
-                self.draw_simplified_red_green_map(ax, trains, maintenance_closures)
-            else:
-                # Default to auto-generated layout for other cases
-                if selected_line in available_lines:
-                    self.draw_auto_generated_map(ax, selected_line, trains, maintenance_closures)
-                else:
-                    # Fallback - show first available line
-                    self.draw_auto_generated_map(ax, available_lines[0], trains, maintenance_closures)
-                
-            # Set axis properties
-            ax.set_aspect('equal')
-            ax.axis('off')
-        
+                return self.draw_simplified_red_green_map
+            # Single line view
+            return auto_map(selected_line)
+
+        # Use simple clean layout - automatically choose based on available lines
+        if len(available_lines) == 1:
+            # Single line loaded - show that line
+            if available_lines[0] == "Blue":
+                return self.draw_blue_line
+            return auto_map(available_lines[0])
+        if len(available_lines) == 2 and "Red" in available_lines and "Green" in available_lines:
+            # Red and Green together
+            return self.draw_simplified_red_green_map
+        if selected_line == "Blue" and "Blue" in available_lines:
+            return self.draw_blue_line
+        if selected_line == "Red & Green":
+            return self.draw_simplified_red_green_map
+        # Default to auto-generated layout for other cases
+        if selected_line in available_lines:
+            return auto_map(selected_line)
+        # Fallback - show first available line
+        return auto_map(available_lines[0])
+
+    def _new_axes(self):
+        """Clear the figure and create the map axes"""
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+
+        # Set light background color to match track theme
+        ax.set_facecolor('#FFFFFF')
+        return ax
+
+    def _build_static_scene(self, scene_key, selected_line, trains, maintenance_closures, use_auto_layout):
+        """
+        Draw the static track geometry for a line selection and cache it
+
+        The map is drawn with no trains and no closures; the drawing methods
+        register a hidden closure overlay per block and a train marker style
+        per line while they draw. If nothing was registered the map style does
+        not support retained updates and is redrawn in full on every update.
+        """
+        self.closure_markers = {}
+        self.train_styles = {}
+        self.train_markers = {}
+        self.background = None
+        self.scene = {
+            'key': scene_key,
+            'draw': self._select_draw_method(selected_line, use_auto_layout),
+            'ax': None,
+            'retained': False,
+            'state': None
+        }
+
+        ax = self._new_axes()
+        self.scene['ax'] = ax
+        self.interactive_elements = {}
+        self.scene['draw'](ax, {}, {})
+        self._build_hit_index()
+
+        if not self.closure_markers and not self.train_styles:
+            self._draw_full_scene(trains, maintenance_closures)
+            return
+
+        ax.set_aspect('equal')
+        ax.axis('off')
+        self.scene['retained'] = True
+        self._update_dynamic_artists(trains, maintenance_closures)
+
+    def _draw_full_scene(self, trains, maintenance_closures):
+        """Redraw the whole map, including trains and closures"""
+        ax = self._new_axes()
+        self.scene['ax'] = ax
+        self.interactive_elements = {}
+        self.scene['draw'](ax, trains, maintenance_closures)
+        self._build_hit_index()
+        ax.set_aspect('equal')
+        ax.axis('off')
         self.canvas.draw()
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn static scene and put the dynamic artists back on top"""
+        if self.scene is None or not self.scene['retained']:
+            return
+        self.background = self.canvas.copy_from_bbox(self.scene['ax'].bbox)
+        self._draw_dynamic_artists()
+
+    def _register_closure_marker(self, line_name, block_number, *artists):
+        """
+        Register hidden overlay artists shown while a block is closed
+
+        Args:
+            line_name: Line the block belongs to
+            block_number: Block number on the line
+            *artists: Overlay artists already added to the axes (None entries are ignored)
+        """
+        overlay = [artist for artist in artists if artist is not None]
+        for artist in overlay:
+            artist.set_animated(True)
+            artist.set_visible(False)
+        self.closure_markers[(line_name, block_number)] = overlay
+
+    def _register_train_style(self, line_name, block_positions, style):
+        """
+        Register how train markers are placed on a line
+
+        Args:
+            line_name: Line the trains run on
+            block_positions: Block number -> {'x', 'y'} anchor for a train in that block
+            style: Marker style with offset, size, label_offset, color, fontsize,
+                zorder and an optional boxstyle
+        """
+        self.train_styles[line_name] = (block_positions, style)
+
+    def _train_block_number(self, train):
+        """Get the block number a train occupies (currentBlock may be a block object)"""
+        current_block = getattr(train, 'currentBlock', None)
+        return getattr(current_block, 'blockID', current_block)
+
+    def _dynamic_state(self, trains, maintenance_closures):
+        """
+        Get the closures and train positions shown by the retained scene
+
+        Returns:
+            Tuple of (closed (line, block) set, sorted (line, block, label) train entries)
+        """
+        closed = frozenset(
+            (line_name, block_number)
+            for line_name, block_numbers in (maintenance_closures or {}).items()
+            for block_number in block_numbers
+            if (line_name, block_number) in self.closure_markers
+        )
+
+        train_entries = []
+        for train in (trains or {}).values():
+            line_name = getattr(train, 'line', None)
+            if line_name not in self.train_styles:
+                continue
+            block_number = self._train_block_number(train)
+            if block_number in self.train_styles[line_name][0]:
+                label = str(getattr(train, 'id', getattr(train, 'trainID', 'T')))
+                train_entries.append((line_name, block_number, label))
+
+        return closed, tuple(sorted(train_entries))
+
+    def _create_train_marker(self, ax, style):
+        """Create one hidden, animated train marker (box and label)"""
+        width, height = style['size']
+        if style.get('boxstyle'):
+            box = patches.FancyBboxPatch((0, 0), width, height, boxstyle=style['boxstyle'],
+                                         facecolor=style['color'], edgecolor='white',
+                                         linewidth=2, zorder=style['zorder'])
+        else:
+            box = patches.Rectangle((0, 0), width, height, facecolor=style['color'],
+                                    edgecolor='white', linewidth=2, zorder=style['zorder'])
+        ax.add_patch(box)
+        label = ax.text(0, 0, '', ha='center', va='center', color='white',
+                        fontsize=style['fontsize'], fontweight='bold', zorder=style['zorder'] + 1)
+        for artist in (box, label):
+            artist.set_animated(True)
+            artist.set_visible(False)
+        return box, label
+
+    def _apply_dynamic_state(self, state):
+        """Show closure overlays and place train markers for a dynamic state"""
+        closed, train_entries = state
+        for key, overlay in self.closure_markers.items():
+            for artist in overlay:
+                artist.set_visible(key in closed)
+
+        entries_by_line = defaultdict(list)
+        for line_name, block_number, label in train_entries:
+            entries_by_line[line_name].append((block_number, label))
+
+        for line_name, (block_positions, style) in self.train_styles.items():
+            pool = self.train_markers.setdefault(line_name, [])
+            entries = entries_by_line.get(line_name, [])
+            while len(pool) < len(entries):
+                pool.append(self._create_train_marker(self.scene['ax'], style))
+
+            for i, (box, label) in enumerate(pool):
+                if i >= len(entries):
+                    box.set_visible(False)
+                    label.set_visible(False)
+                    continue
+                block_number, text = entries[i]
+                pos = block_positions[block_number]
+                box.set_x(pos['x'] + style['offset'][0])
+                box.set_y(pos['y'] + style['offset'][1])
+                label.set_position((pos['x'] + style['label_offset'][0], pos['y'] + style['label_offset'][1]))
+                label.set_text(text)
+                box.set_visible(True)
+                label.set_visible(True)
+
+    def _visible_dynamic_artists(self):
+        """Get the visible overlay and train artists in drawing order"""
+        artists = [artist for overlay in self.closure_markers.values() for artist in overlay
+                   if artist.get_visible()]
+        artists.extend(artist for pool in self.train_markers.values() for marker in pool
+                       for artist in marker if artist.get_visible())
+        return sorted(artists, key=lambda artist: artist.get_zorder())
+
+    def _draw_dynamic_artists(self):
+        """Draw the visible dynamic artists onto the canvas buffer"""
+        ax = self.scene['ax']
+        for artist in self._visible_dynamic_artists():
+            ax.draw_artist(artist)
+
+    def _update_dynamic_artists(self, trains, maintenance_closures):
+        """
+        Bring train markers and closure overlays up to date
+
+        Returns:
+            True if the canvas was repainted, False if nothing changed
+        """
+        state = self._dynamic_state(trains, maintenance_closures)
+        if state == self.scene['state']:
+            return False
+
+        self.scene['state'] = state
+        self._apply_dynamic_state(state)
+
+        if self.background is None:
+            # No cached background yet (first draw) - the draw event caches it
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            self._draw_dynamic_artists()
+            self.canvas.blit(self.scene['ax'].bbox)
+        return True
         
     def draw_red_green_lines(self, ax, trains, maintenance_closures):
         """Draw Red and Green lines using actual connected_blocks topology"""
@@ -696,6 +1143,12 @@ class TrackVisualization:
             # Draw the block
             ax.plot([x, x + block_width - 2], [y, y],
                    color=block_color, linewidth=12, solid_capstyle='butt', alpha=0.9)
+
+            # Hidden maintenance overlay, shown by the retained renderer while the block is closed
+            if block_color != '#FF5555':
+                overlay, = ax.plot([x, x + block_width - 2], [y, y],
+                                   color='#FF5555', linewidth=12, solid_capstyle='butt', alpha=0.9)
+                self._register_closure_marker("Blue", block.block_number, overlay)
             
             # Add block number for every block (small text)
             ax.text(x + block_width/2, y - 15, str(block.block_number),
@@ -753,6 +1206,13 @@ class TrackVisualization:
                                 edgecolor=blue_color, linewidth=2))
         
         # Add trains with accurate positioning
+        train_anchors = {number: {'x': pos['x'] + block_width/2, 'y': pos['y']}
+                         for number, pos in block_positions.items()}
+        self._register_train_style("Blue", train_anchors, {
+            'offset': (-10, -6), 'size': (20, 12), 'label_offset': (0, 0),
+            'color': '#8A2BE2', 'fontsize': 14, 'zorder': 4, 'boxstyle': "round,pad=2"
+        })
+        self._register_block_hit_boxes("Blue", train_anchors, block_width/2)
         for train_id, train in trains.items():
             if train.line == 'Blue' and train.currentBlock in block_positions:
                 pos = block_positions[train.currentBlock]
@@ -1858,12 +2318,13 @@ class TrackVisualization:
         
         Returns: Dictionary with layout information
         """
-        if line_name in self.layout_cache:
-            return self.layout_cache[line_name]
-            
         blocks = self.track_reader.lines.get(line_name, [])
         if not blocks:
             return {}
+
+        cache_key = (line_name, TrackLayoutCache.layout_key('auto_layout', blocks, (line_name,)))
+        if cache_key in self.layout_cache:
+            return self.layout_cache[cache_key]
             
         # Use connected_blocks data to create proper track topology layout
         sorted_blocks = self._sort_blocks_by_topology(blocks) if hasattr(self, '_sort_blocks_by_topology') else sorted(blocks, key=lambda b: b.block_number)
@@ -1968,7 +2429,7 @@ class TrackVisualization:
         layout['bounds']['min_y'] = base_y - 80
         
         # Cache the layout
-        self.layout_cache[line_name] = layout
+        self.layout_cache[cache_key] = layout
         return layout
     
     def _sort_blocks_by_topology(self, blocks):
@@ -1977,6 +2438,15 @@ class TrackVisualization:
         """
         if not blocks:
             return []
+
+        # The traversal order is cached as block numbers and mapped back to the given blocks
+        block_dict = {block.block_number: block for block in blocks}
+        order = self._cached_layout('topology_order', blocks, (),
+                                    lambda: [b.block_number for b in self._compute_topology_order(blocks)])
+        return [block_dict[number] for number in order]
+
+    def _compute_topology_order(self, blocks):
+        """Depth-first block order following connected_blocks"""
         
         # Check if blocks have connected_blocks data
         has_connected_data = any(hasattr(block, 'connected_blocks') and block.connected_blocks for block in blocks)
@@ -2132,6 +2602,15 @@ class TrackVisualization:
             # Add block number - INCREASED FONT SIZE
             ax.text(x, y, str(block.block_number), ha='center', va='center',
                    fontsize=12, fontweight='bold', color='white' if block_color != '#FFD700' else 'black', zorder=3)
+
+            # Hidden maintenance overlay, shown by the retained renderer while the block is closed
+            if block_color != '#FF5555':
+                overlay = patches.Circle((x, y), 15, facecolor='#FF5555',
+                                         edgecolor='black', linewidth=2, zorder=2)
+                ax.add_patch(overlay)
+                overlay_label = ax.text(x, y, str(block.block_number), ha='center', va='center',
+                                        fontsize=12, fontweight='bold', color='white', zorder=3)
+                self._register_closure_marker(line_name, block.block_number, overlay, overlay_label)
             
             # Add station label if present - IMPROVED POSITIONING AND SIZE
             if block.has_station and block.station:
@@ -2164,6 +2643,11 @@ class TrackVisualization:
                            color=line_color, linewidth=4, alpha=0.7, zorder=1)
         
         # Draw trains
+        self._register_train_style(line_name, block_positions, {
+            'offset': (-15, 25), 'size': (30, 12), 'label_offset': (0, 31),
+            'color': '#8A2BE2', 'fontsize': 11, 'zorder': 3
+        })
+        self._register_block_hit_boxes(line_name, block_positions, 15)
         for train_id, train in trains.items():
             if train.line == line_name and hasattr(train, 'currentBlock'):
                 pos = block_positions.get(train.currentBlock)
@@ -2184,6 +2668,11 @@ class TrackVisualization:
     
     def _calculate_topology_positions(self, blocks):
         """Calculate block positions using force-directed layout based on connected_blocks"""
+        return self._cached_layout('topology_positions', blocks, (),
+                                   lambda: self._compute_topology_positions(blocks))
+
+    def _compute_topology_positions(self, blocks):
+        """Run the force-directed layout for a set of blocks"""
         import math
         import random
         
@@ -2551,6 +3040,11 @@ class TrackVisualization:
 
     def _calculate_smart_positions(self, sorted_blocks, start_x, track_y, block_width):
         """Calculate block positions using connected_blocks data for smart layout"""
+        return self._cached_layout('smart_positions', sorted_blocks, (start_x, track_y, block_width),
+                                   lambda: self._compute_smart_positions(sorted_blocks, start_x, track_y, block_width))
+
+    def _compute_smart_positions(self, sorted_blocks, start_x, track_y, block_width):
+        """Place blocks left to right, keeping connected blocks next to each other"""
         positions = {}
         current_x = start_x
         
@@ -2720,18 +3214,18 @@ class TrackVisualization:
         if not blocks:
             return {}
         
-        # Use the new topology-based layout engine
-        layout_engine = TrackLayoutEngine()
-        return layout_engine.create_line_layout(blocks, "Red", track_y, yard_x=500)
+        # Use the new topology-based layout engine (computed once per track layout)
+        return self._cached_layout('line_layout', blocks, ("Red", track_y, 500),
+                                   lambda: TrackLayoutEngine().create_line_layout(blocks, "Red", track_y, yard_x=500))
 
     def _create_green_line_topology(self, blocks, track_y):
         """Create Green line topology using realistic track layout based on connections"""
         if not blocks:
             return {}
         
-        # Use the new topology-based layout engine
-        layout_engine = TrackLayoutEngine()
-        return layout_engine.create_line_layout(blocks, "Green", track_y, yard_x=500)
+        # Use the new topology-based layout engine (computed once per track layout)
+        return self._cached_layout('line_layout', blocks, ("Green", track_y, 500),
+                                   lambda: TrackLayoutEngine().create_line_layout(blocks, "Green", track_y, yard_x=500))
 
     def _draw_yard_connections(self, ax, blocks, block_positions, line_color):
         """Draw yard connections from blocks that connect to yard"""
@@ -3088,12 +3582,24 @@ class TrackVisualization:
             ax.add_patch(block_circle)
             
             # Add block number for key blocks only - moderate font size
-            if (block.block_number % 10 == 0 or block.has_station or block.has_switch or 
-                block.block_number in [1, len(blocks)]):  # Start, end, and key blocks
+            is_key_block = (block.block_number % 10 == 0 or block.has_station or block.has_switch or
+                            block.block_number in [1, len(blocks)])  # Start, end, and key blocks
+            if is_key_block:
                 ax.text(x, y, str(block.block_number), ha='center', va='center',
                        fontsize=9, fontweight='bold', 
                        color='white' if block_color != '#FFD700' else 'black', zorder=3)
 
+            # Hidden maintenance overlay, shown by the retained renderer while the block is closed
+            if block_color != '#FF5555':
+                overlay = patches.Circle((x, y), 8, facecolor='#FF5555',
+                                         edgecolor='black', linewidth=1.5, zorder=2)
+                ax.add_patch(overlay)
+                overlay_label = None
+                if is_key_block:
+                    overlay_label = ax.text(x, y, str(block.block_number), ha='center', va='center',
+                                            fontsize=9, fontweight='bold', color='white', zorder=3)
+                self._register_closure_marker(line_name, block.block_number, overlay, overlay_label)
+
     def _draw_balanced_infrastructure(self, ax, blocks, block_positions, track_y, line_color):
         """Draw infrastructure with appropriate sizing and positioning"""
         for block in blocks:
@@ -3127,6 +3633,12 @@ class TrackVisualization:
 
     def _draw_balanced_trains(self, ax, trains, block_positions, line_name):
         """Draw trains with appropriate visibility"""
+        self._register_train_style(line_name, block_positions, {
+            'offset': (-12, 20), 'size': (24, 10), 'label_offset': (0, 25),
+            'color': '#8B5CF6', 'fontsize': 9, 'zorder': 6
+        })
+        self._register_block_hit_boxes(line_name, block_positions, 8)
+
         for train_id, train in trains.items():
             if train.line == line_name and hasattr(train, 'currentBlock'):
                 pos = block_positions.get(train.currentBlock)
@@ -3,11 +3,23 @@ CTC Utils - Update Worker
 =========================
 Threading utility for handling system updates at different frequencies.
 Updated to work with migrated CTC System architecture.
+
+Signals are driven by the CTC System's per-domain version counters: each
+signal is emitted at most once per interval, and only when one of the state
+domains it refreshes changed since it was last emitted. Bursts of changes
+inside an interval coalesce into one refresh, and an idle system emits nothing.
 """
 
 from PyQt5.QtCore import QThread, pyqtSignal
 from datetime import datetime
 
+# Signal name -> (interval in 100ms ticks, state domains it refreshes)
+UPDATE_SIGNALS = {
+    'updateData': (1, ('trains', 'blocks', 'warnings', 'routes', 'throughput')),  # 100ms
+    'updateTables': (5, ('trains', 'blocks', 'warnings', 'routes', 'clock')),     # 500ms
+    'updateVisuals': (20, ('trains', 'blocks', 'routes')),                        # 2 seconds
+}
+
 
 class UpdateWorker(QThread):
     """Worker thread for system updates with separate signals for different update frequencies"""
@@ -20,6 +32,7 @@ class UpdateWorker(QThread):
         self.ctcOffice = ctc_office
         self.running = True
         self.updateCounter = 0
+        self.emittedVersions = {}  # Signal name -> domain versions when it was last emitted
 
     def run(self):
         """Main update loop with different frequencies for different components"""
@@ -40,16 +53,8 @@ class UpdateWorker(QThread):
                     current_time = datetime.now()
                 ctc_system.system_tick(current_time)
 
-                # High frequency data updates (every 100ms)
-                self.updateData.emit()
-
-                # Medium frequency table updates (every 500ms)
-                if self.updateCounter % 5 == 0:
-                    self.updateTables.emit()
-
-                # Low frequency visual updates (every 2 seconds)
-                if self.updateCounter % 20 == 0:
-                    self.updateVisuals.emit()
+                # Emit each signal on its interval, only if its domains changed
+                self.emit_changed_signals(ctc_system)
 
                 self.updateCounter += 1
                 self.msleep(100)  # 10Hz base rate
@@ -60,7 +65,34 @@ class UpdateWorker(QThread):
                 traceback.print_exc()
                 self.msleep(1000)
 
+    def emit_changed_signals(self, ctc_system):
+        """
+        Emit the signals that are due this tick and whose domains changed
+
+        Args:
+            ctc_system: CTC System providing get_domain_versions()
+
+        Returns:
+            List of emitted signal names
+        """
+        # Systems without version counters get the fixed-rate refresh
+        versions = ctc_system.get_domain_versions() if hasattr(ctc_system, 'get_domain_versions') else None
+        emitted = []
+
+        for signal_name, (interval, domains) in UPDATE_SIGNALS.items():
+            if self.updateCounter % interval != 0:
+                continue
+            if versions is not None:
+                seen = tuple(versions.get(domain, 0) for domain in domains)
+                if self.emittedVersions.get(signal_name) == seen:
+                    continue
+                self.emittedVersions[signal_name] = seen
+            getattr(self, signal_name).emit()
+            emitted.append(signal_name)
+
+        return emitted
+
     def stop(self):
         """Stop the update worker thread"""
         self.running = False
-        self.wait()
\ No newline at end of file
+        self.wait()
@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add the parent directory to sys.path to import CTC modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from CTC.Core.block_reservations import BlockReservationTable, route_block_intervals
+
+
+class TestBlockReservationTable(unittest.TestCase):
+    """Test cases for the space-time BlockReservationTable"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.table = BlockReservationTable()
+        self.base_time = datetime(2024, 1, 1, 12, 0, 0)
+        self.key = ('Green', 5)
+    
+    def _at(self, seconds):
+        """Time offset from base_time in seconds"""
+        return self.base_time + timedelta(seconds=seconds)
+    
+    def _make_route(self, block_ids, block_seconds, current_index=0):
+        """Mock route whose blocks each take block_seconds to traverse"""
+        route = Mock()
+        route.blockSequence = [Mock(blockID=block_id, line='Green') for block_id in block_ids]
+        route.currentBlockIndex = current_index
+        route.get_cumulative_times.return_value = [i * block_seconds for i in range(len(block_ids) + 1)]
+        return route
+    
+    def test_free_and_conflicting_intervals(self):
+        """Test overlap queries against stored intervals"""
+        self.table.reserve(self.key, 'G001', self._at(100), self._at(200))
+        self.table.reserve(self.key, 'G002', self._at(500), self._at(600))
+        
+        self.assertTrue(self.table.is_free(self.key, self._at(250), self._at(450)))
+        self.assertEqual(self.table.find_conflicts(self.key, self._at(150), self._at(550)), ['G001', 'G002'])
+        self.assertEqual(self.table.find_conflicts(self.key, self._at(590), self._at(700)), ['G002'])
+        self.assertTrue(self.table.is_free(('Green', 6), self._at(0), self._at(1000)))
+    
+    def test_long_reservation_found_from_earlier_start(self):
+        """Test that a long reservation starting well before the query window still conflicts"""
+        self.table.reserve(self.key, 'G001', self._at(0), self._at(3600))
+        for i in range(10):
+            self.table.reserve(self.key, f'G1{i}', self._at(4000 + i * 10), self._at(4005 + i * 10))
+        
+        self.assertEqual(self.table.find_conflicts(self.key, self._at(3000), self._at(3100)), ['G001'])
+    
+    def test_open_ended_query(self):
+        """Test that a query without an end covers every later reservation"""
+        self.table.reserve(self.key, 'G001', self._at(100), self._at(200))
+        self.table.reserve(self.key, 'G002', self._at(5000), self._at(5100))
+        
+        self.assertEqual(self.table.find_conflicts(self.key, self._at(300)), ['G002'])
+        self.assertEqual(self.table.find_conflicts(self.key, self._at(300), ignore_train='G002'), [])
+    
+    def test_reserve_route_replaces_and_release_removes(self):
+        """Test route intervals are derived from traversal times and replaced on re-reserve"""
+        route = self._make_route([0, 4, 5, 6], 60)
+        self.table.reserve_route('G001', route, self.base_time)
+        
+        # Block 5 is the third block: occupied from 120 s to 180 s
+        self.assertEqual(self.table.find_conflicts(self.key, self._at(150), self._at(160)), ['G001'])
+        self.assertTrue(self.table.is_free(self.key, self._at(190), self._at(300)))
+        
+        # Train has moved on to block 5 - reservations restart from its current block
+        route.currentBlockIndex = 2
+        self.table.reserve_route('G001', route, self._at(1000))
+        self.assertTrue(self.table.is_free(self.key, self._at(120), self._at(180)))
+        self.assertEqual(self.table.get_train_blocks('G001'), {('Green', 5), ('Green', 6)})
+        
+        self.table.release('G001')
+        self.assertTrue(self.table.is_free(self.key, self._at(0)))
+    
+    def test_route_conflicts_and_margin(self):
+        """Test route-against-table conflicts, with margins padding each interval"""
+        table = BlockReservationTable(margin=timedelta(seconds=30))
+        table.reserve_route('G001', self._make_route([0, 4, 5], 60), self.base_time)
+        
+        later_route = self._make_route([0, 4, 5], 60)
+        # Starts 90 s later: 60 s blocks padded by 30 s on each side still overlap on every block
+        conflicts = table.find_route_conflicts('G002', later_route, self._at(90))
+        self.assertEqual(conflicts, {('Green', 0): ['G001'], ('Green', 4): ['G001'], ('Green', 5): ['G001']})
+        self.assertEqual(table.find_route_conflicts('G002', later_route, self._at(600)), {})
+        
+        intervals = route_block_intervals(later_route, self.base_time, timedelta(seconds=30))
+        self.assertEqual(intervals[0], (('Green', 0), self._at(-30), self._at(90)))
+
+
+if __name__ == '__main__':
+    unittest.main()
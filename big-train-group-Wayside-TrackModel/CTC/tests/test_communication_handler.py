@@ -536,6 +536,186 @@ class TestCommunicationHandler(unittest.TestCase):
         retrieved = self.comm_handler.commandQueue.get(timeout=1)
         self.assertEqual(retrieved["type"], "EMERGENCY_STOP")
 
+    
+    @patch('CTC.Core.communication_handler._get_simulation_time')
+    def test_occupied_blocks_delta_filters_coverage_and_repeats(self, mock_time):
+        """Test that only managed, actually changed entries reach the line state"""
+        mock_time.return_value = datetime(2024, 1, 1, 12, 0, 0)
+        self.mock_controller.controller_id = "Green_1"
+        self.comm_handler.provide_wayside_controller(
+            self.mock_controller, [True, True, True, False, False], False
+        )
+        
+        self.comm_handler.update_occupied_blocks_delta({1: True, 2: False, 4: True}, self.mock_controller)
+        self.assertEqual(self.comm_handler.previous_line_states['Green']['occupied'], [False, True, False, False, False])
+        
+        # Repeating a change already applied is dropped
+        changes = self.comm_handler._apply_line_state_changes('occupied', 'Green', {1: True}, self.mock_controller)
+        self.assertEqual(changes, {})
+        
+        # Unregistered controllers cannot change line state
+        changes = self.comm_handler._apply_line_state_changes('occupied', 'Green', {0: True}, Mock())
+        self.assertEqual(changes, {})
+    
+    def test_occupied_blocks_delta_forwarded_to_ctc(self):
+        """Test that changed entries are forwarded to the CTC system with their line"""
+        self.comm_handler.ctc_system = Mock()
+        
+        with patch.object(self.comm_handler, 'send_updated_train_commands') as send_commands, \
+             patch.object(self.comm_handler, '_update_switches_for_routes'):
+            self.comm_handler._update_occupied_blocks_delta_internal({5: True}, {'line': 'Green'})
+            self.comm_handler._update_occupied_blocks_delta_internal({}, {'line': 'Green'})
+            # Updates without changes neither resend train commands nor reach the CTC system
+            send_commands.assert_called_once()
+        
+        self.comm_handler.ctc_system.process_occupied_block_changes.assert_called_once_with({5: True}, 'Green')
+    
+    @patch('CTC.Core.communication_handler._get_simulation_time')
+    def test_occupied_blocks_delta_without_changes_is_not_queued(self, mock_time):
+        """Test that a delta with nothing new is dropped before reaching the message queue"""
+        mock_time.return_value = datetime(2024, 1, 1, 12, 0, 0)
+        self.mock_controller.controller_id = "Green_1"
+        self.comm_handler.provide_wayside_controller(self.mock_controller, [True, True, True], False)
+        
+        with patch.object(self.comm_handler.message_queue, 'put') as put:
+            self.comm_handler.update_occupied_blocks_delta({}, self.mock_controller)
+            self.comm_handler.update_occupied_blocks_delta({1: False}, self.mock_controller)
+            put.assert_not_called()
+    
+    @patch('CTC.Core.communication_handler._get_simulation_time')
+    def test_line_state_seeded_from_each_controllers_own_snapshot(self, mock_time):
+        """Test that one controller's full snapshot does not pre-apply another controller's live state"""
+        mock_time.return_value = datetime(2024, 1, 1, 12, 0, 0)
+        first = Mock(controller_id="Green_1", block_occupancy=[False] * 6)
+        second = Mock(controller_id="Green_2", block_occupancy=[False] * 6)
+        self.comm_handler.provide_wayside_controller(first, [True, True, True, False, False, False], False)
+        self.comm_handler.provide_wayside_controller(second, [False, False, False, True, True, True], False)
+        
+        # Both controllers publish their first full snapshot
+        self.assertTrue(self.comm_handler._store_controller_snapshot('occupied', 'Green', [False] * 6, first))
+        self.assertTrue(self.comm_handler._store_controller_snapshot('occupied', 'Green', [False] * 6, second))
+        
+        # Block 4 becomes occupied in the second controller's live array before it publishes
+        second.block_occupancy[4] = True
+        self.comm_handler.update_occupied_blocks([True, False, False, False, False, False], first)
+        self.assertEqual(self.comm_handler.previous_line_states['Green']['occupied'],
+                         [True, False, False, False, False, False])
+        
+        # The second controller's first delta still carries the change
+        changes = self.comm_handler._apply_line_state_changes('occupied', 'Green', {4: True}, second)
+        self.assertEqual(changes, {4: True})
+        
+        # Re-sending an unchanged snapshot reports no changes
+        self.assertFalse(self.comm_handler._store_controller_snapshot(
+            'occupied', 'Green', [False, False, False, False, True, False], second))
+
+    
+    @patch('CTC.Core.communication_handler._get_simulation_time')
+    def test_departure_commands_scheduled_in_sim_time(self, mock_time):
+        """Test that departure commands are spaced 2 sim-seconds apart by the scheduler, without threads"""
+        start_time = datetime(2024, 1, 1, 12, 0, 0)
+        mock_time.return_value = start_time
+        self.mock_controller.redLine = False
+        self.comm_handler.wayside_controllers = [self.mock_controller]
+        
+        route = Mock()
+        route.blockSequence = [Mock(blockID=block_id) for block_id in (0, 63, 64, 65, 66, 67)]
+        thread_count = threading.active_count()
+        
+        with patch.object(self.comm_handler, '_get_train_line_from_route', return_value='Green'), \
+             patch.object(self.comm_handler, 'calculate_authority_and_speed', return_value=(1, 3)), \
+             patch.object(self.comm_handler, '_get_next_station_for_route', return_value=0), \
+             patch.object(self.comm_handler, '_get_line_length', return_value=151):
+            self.comm_handler.send_departure_commands(self.test_train_id, route)
+            
+            # First command goes out immediately, no thread is started for the rest
+            self.assertEqual(threading.active_count(), thread_count)
+            self.assertEqual(self.mock_controller.command_train.call_count, 1)
+            
+            # Remaining commands run only as simulated time reaches them
+            self.comm_handler.eventScheduler.run_due(start_time + timedelta(seconds=3))
+            self.assertEqual(self.mock_controller.command_train.call_count, 2)
+            self.comm_handler.eventScheduler.run_due(start_time + timedelta(seconds=6))
+        
+        commanded_blocks = [c.args[2][0] for c in self.mock_controller.command_train.call_args_list]
+        self.assertEqual(commanded_blocks, [63, 64, 65, 66])
+        self.assertNotIn(self.test_train_id, self.comm_handler.departureCommandEvents)
+    
+    @patch('CTC.Core.communication_handler._get_simulation_time')
+    def test_remove_train_cancels_pending_departure_commands(self, mock_time):
+        """Test that removing a train cancels departure commands not yet sent"""
+        start_time = datetime(2024, 1, 1, 12, 0, 0)
+        mock_time.return_value = start_time
+        self.mock_controller.redLine = False
+        self.comm_handler.wayside_controllers = [self.mock_controller]
+        
+        route = Mock()
+        route.blockSequence = [Mock(blockID=block_id) for block_id in (0, 63, 64, 65, 66)]
+        
+        with patch.object(self.comm_handler, '_get_train_line_from_route', return_value='Green'), \
+             patch.object(self.comm_handler, 'calculate_authority_and_speed', return_value=(1, 3)), \
+             patch.object(self.comm_handler, '_get_next_station_for_route', return_value=0), \
+             patch.object(self.comm_handler, '_get_line_length', return_value=151):
+            self.comm_handler.send_departure_commands(self.test_train_id, route)
+            self.comm_handler.remove_train_from_system(self.test_train_id)
+            self.comm_handler.eventScheduler.run_due(start_time + timedelta(seconds=10))
+        
+        self.assertEqual(self.mock_controller.command_train.call_count, 1)
+        self.assertEqual(len(self.comm_handler.eventScheduler), 0)
+
+    
+    def _make_line_train(self, block_id):
+        """Create an active train standing in a Green line block"""
+        train = Mock()
+        train.currentBlock = Mock(blockID=block_id)
+        train.route.isActive = True
+        train.route.calculate_route_distance.return_value = 4
+        return train
+    
+    def test_updated_train_commands_sparse_and_deduplicated(self):
+        """Test that controllers only receive command entries that changed since their last set"""
+        self.mock_controller.redLine = False
+        self.comm_handler.wayside_controllers = [self.mock_controller]
+        self.comm_handler.ctc_system = Mock()
+        train_a = self._make_line_train(10)
+        train_b = self._make_line_train(40)
+        self.comm_handler.ctc_system.trains = {'A': train_a, 'B': train_b}
+        
+        with patch.object(self.comm_handler, '_get_line_for_block', return_value='Green'), \
+             patch.object(self.comm_handler, '_get_target_block_for_train',
+                          side_effect=lambda train_id, route, ahead: self.comm_handler.ctc_system.trains[train_id].currentBlock.blockID + 4), \
+             patch.object(self.comm_handler, 'calculate_authority_and_speed', return_value=(1, 3)), \
+             patch.object(self.comm_handler, '_get_next_station_for_route', return_value=0):
+            self.comm_handler.send_updated_train_commands('Green')
+            self.comm_handler.send_updated_train_commands('Green')
+            
+            # Only train A moves: its old entry is cleared, train B is not resent
+            train_a.currentBlock = Mock(blockID=11)
+            self.comm_handler.send_updated_train_commands('Green')
+        
+        sent = [c.args[0] for c in self.mock_controller.command_train_delta.call_args_list]
+        self.assertEqual(sent, [
+            [(10, 3, 1, 14, 0, 4), (40, 3, 1, 44, 0, 4)],
+            [(10, 0, 0, 0, 0, 0), (11, 3, 1, 15, 0, 4)]
+        ])
+        self.mock_controller.command_train.assert_not_called()
+    
+    def test_command_set_falls_back_to_full_arrays(self):
+        """Test that controllers without command_train_delta get full line arrays when their set changes"""
+        controller = Mock(spec=['command_train', 'redLine'])
+        controller.redLine = False
+        self.comm_handler.wayside_controllers = [controller]
+        
+        with patch.object(self.comm_handler, '_get_line_length', return_value=151):
+            self.comm_handler.send_train_command_set('Green', {10: (3, 1, 14, 2, 4)})
+            self.comm_handler.send_train_command_set('Green', {10: (3, 1, 14, 2, 4)})
+        
+        controller.command_train.assert_called_once()
+        speeds, authorities, block_nums, update_flags, stations, blocks_away = controller.command_train.call_args.args
+        self.assertEqual(len(block_nums), 151)
+        self.assertEqual((speeds[10], authorities[10], block_nums[10], stations[10], blocks_away[10]), (3, 1, 14, 2, 4))
+        self.assertEqual(sum(1 for block in block_nums if block), 1)
+
 
 if __name__ == '__main__':
     # Create test suite
@@ -206,6 +206,82 @@ class TestCTCSystem(unittest.TestCase):
         mock_block1.update_occupation.assert_called_once_with(True)
         mock_block2.update_occupation.assert_called_once_with(False)
     
+    def test_line_block_table_index_lookup(self, mock_time):
+        """Test that wayside array indexes map to blocks through the line block table"""
+        green_table = self.ctc_system.line_blocks["Green"]
+        
+        self.assertIs(green_table[96], self.ctc_system.blocks[("Green", 96)])
+        self.assertIs(self.ctc_system._get_block_by_index(96, "Green"), green_table[96])
+        self.assertIs(self.ctc_system._get_block_by_index(0, "Green"), self.ctc_system.blocks[("Green", 0)])
+        self.assertIsNone(self.ctc_system._get_block_by_index(len(green_table), "Green"))
+        self.assertIsNone(self.ctc_system._get_block_by_index(5, "Red"))
+    
+    def test_process_occupied_blocks_by_line(self, mock_time):
+        """Test that an occupancy array updates the blocks of the given line"""
+        mock_time.return_value = self.base_time
+        occupied_blocks = [False] * len(self.ctc_system.line_blocks["Green"])
+        occupied_blocks[5] = True
+        
+        self.ctc_system.process_occupied_blocks(occupied_blocks, "Green")
+        
+        self.assertTrue(self.ctc_system.get_block_by_line("Green", 5).occupied)
+        self.assertFalse(self.ctc_system.get_block_by_line("Green", 6).occupied)
+    
+    def test_process_occupied_block_changes(self, mock_time):
+        """Test that only the changed occupation entries are applied"""
+        mock_time.return_value = self.base_time
+        
+        self.ctc_system.process_occupied_block_changes({5: True}, "Green")
+        self.assertTrue(self.ctc_system.get_block_by_line("Green", 5).occupied)
+        
+        with patch.object(self.ctc_system, '_apply_block_occupancy') as apply_occupancy:
+            self.ctc_system.process_occupied_block_changes({}, "Green")
+            apply_occupancy.assert_not_called()
+            
+            self.ctc_system.process_occupied_block_changes({5: False, 7: True}, "Green")
+            self.assertEqual(apply_occupancy.call_count, 2)
+    
+    def test_stationary_trains_counted_on_tick_for_delta_lines(self, mock_time):
+        """Test that trains standing still on delta-reporting lines are counted by system_tick"""
+        mock_time.return_value = self.base_time
+        train = Train(trainID="G001", currentBlock=self.ctc_system.get_block_by_line("Green", 5))
+        self.ctc_system.trains["G001"] = train
+        train.currentBlock.update_occupation(True)
+        train.currentBlock.add_train(train)
+        
+        # Full-array lines count stationary trains as updates arrive, so the tick leaves them alone
+        with patch('CTC.Core.display_manager._get_simulation_time', return_value=self.base_time):
+            self.ctc_system.system_tick(self.base_time)
+            self.assertEqual(train.get_stationary_count(), 0)
+            
+            self.ctc_system.process_occupied_block_changes({9: False}, "Green")
+            self.ctc_system.system_tick(self.base_time)
+            self.ctc_system.system_tick(self.base_time)
+        self.assertEqual(train.get_stationary_count(), 2)
+    
+    def test_route_block_index_train_attribution(self, mock_time):
+        """Test that newly occupied blocks are attributed through the route block index"""
+        mock_time.return_value = self.base_time
+        train = self._create_test_train("G001", block_number=63)
+        self.ctc_system.trains["G001"] = train
+        
+        route = Mock()
+        route.blockSequence = [self.ctc_system.get_block_by_line("Green", n) for n in range(63, 70)]
+        route.currentBlockIndex = 0
+        train.route = route
+        self.ctc_system.update_route_index(train)
+        
+        self.assertEqual(self.ctc_system.route_block_index[65], [(train, 2)])
+        self.assertIs(self.ctc_system._find_train_for_occupied_block(route.blockSequence[2]), train)
+        # More than 2 blocks ahead of the train's route position is not attributed
+        self.assertIsNone(self.ctc_system._find_train_for_occupied_block(route.blockSequence[4]))
+        
+        # Cancelling the route clears its entries
+        train.route = None
+        self.ctc_system.update_route_index(train)
+        self.assertNotIn(65, self.ctc_system.route_block_index)
+        self.assertNotIn("G001", self.ctc_system.indexed_routes)
+    
     def test_provide_wayside_controller(self, mock_time):
         """Test wayside controller registration"""
         mock_controller = Mock()
@@ -391,6 +467,180 @@ class TestCTCSystem(unittest.TestCase):
         # Check that closure was removed
         self.assertEqual(len(self.ctc_system.scheduledClosures), 0)
     
+    def test_system_tick_runs_due_scheduled_events(self, mock_time):
+        """Test that system_tick runs registered closures and openings only once due"""
+        from datetime import timedelta
+        mock_time.return_value = self.base_time
+        
+        closure_time = self.base_time + timedelta(minutes=5)
+        self.ctc_system.schedule_block_closure('Green', 5, closure_time, timedelta(minutes=30))
+        self.assertEqual(len(self.ctc_system.eventScheduler), 2)
+        
+        with patch('CTC.Core.display_manager._get_simulation_time', return_value=self.base_time):
+            # Nothing is due yet
+            self.ctc_system.system_tick(closure_time - timedelta(seconds=1))
+            self.assertEqual(self.ctc_system.scheduledClosures[0]['status'], 'scheduled')
+            
+            # Closure is due, opening is not
+            self.ctc_system.system_tick(closure_time)
+            self.assertEqual(self.ctc_system.scheduledClosures[0]['status'], 'active')
+            self.assertIn(5, self.ctc_system.maintenance_closures.get('Green', []))
+            self.assertEqual(len(self.ctc_system.eventScheduler), 1)
+            
+            # Opening is due
+            self.ctc_system.system_tick(closure_time + timedelta(minutes=30))
+        self.assertEqual(self.ctc_system.scheduledClosures[0]['status'], 'completed')
+        self.assertNotIn(5, self.ctc_system.maintenance_closures.get('Green', []))
+        self.assertEqual(len(self.ctc_system.eventScheduler), 0)
+    
+    def test_cancel_scheduled_closure_cancels_events(self, mock_time):
+        """Test that cancelling a closure also cancels its scheduler events"""
+        from datetime import timedelta
+        mock_time.return_value = self.base_time
+        
+        closure_time = self.base_time + timedelta(minutes=5)
+        self.ctc_system.schedule_block_closure('Green', 5, closure_time, timedelta(minutes=30))
+        self.ctc_system.cancel_scheduled_closure('Green', 5)
+        
+        self.assertEqual(len(self.ctc_system.eventScheduler), 0)
+        with patch('CTC.Core.display_manager._get_simulation_time', return_value=self.base_time):
+            self.ctc_system.system_tick(closure_time + timedelta(hours=1))
+        self.assertNotIn(5, self.ctc_system.maintenance_closures.get('Green', []))
+    
+    def test_hourly_throughput_by_line(self, mock_time):
+        """Test ticket sales are counted per line over the last hour"""
+        from datetime import timedelta
+        mock_time.return_value = self.base_time
+        
+        self.ctc_system.update_throughput(10, 'Green')
+        self.ctc_system.update_throughput(4, 'Red')
+        mock_time.return_value = self.base_time + timedelta(minutes=30)
+        self.ctc_system.update_throughput(5, 'Green')
+        
+        self.assertEqual(self.ctc_system.calculate_hourly_throughput(), {'Blue': 0, 'Red': 4, 'Green': 15})
+        
+        # Sales from the first minute leave the window after an hour
+        mock_time.return_value = self.base_time + timedelta(minutes=61)
+        self.assertEqual(self.ctc_system.get_throughput_by_line('Green'), 5)
+        self.assertEqual(self.ctc_system.calculate_hourly_throughput('Red'), {'Red': 0})
+    
+    def test_domain_versions_move_only_on_changes(self, mock_time):
+        """Test that domain versions only move on real changes and gate UpdateWorker signals"""
+        from CTC.Utils.update_worker import UpdateWorker
+        mock_time.return_value = self.base_time
+        worker = UpdateWorker(Mock(ctc_system=self.ctc_system))
+        signals = []
+        for name in ('updateData', 'updateTables', 'updateVisuals'):
+            getattr(worker, name).connect(lambda name=name: signals.append(name))
+        
+        # First tick refreshes everything, an idle tick refreshes nothing
+        self.assertEqual(worker.emit_changed_signals(self.ctc_system), ['updateData', 'updateTables', 'updateVisuals'])
+        self.assertEqual(worker.emit_changed_signals(self.ctc_system), [])
+        
+        versions = self.ctc_system.get_domain_versions()
+        self.ctc_system.process_occupied_block_changes({5: True}, "Green")
+        self.ctc_system.process_occupied_block_changes({5: True}, "Green")
+        self.ctc_system.process_occupied_block_changes({5: True}, "Green")
+        after = self.ctc_system.get_domain_versions()
+        self.assertEqual(after['blocks'], versions['blocks'] + 1)
+        self.assertEqual(after['warnings'], versions['warnings'])
+        
+        # Throughput only moves when a line's hourly rate changes
+        with patch('CTC.Core.display_manager._get_simulation_time', return_value=self.base_time):
+            self.ctc_system.system_tick(self.base_time)
+            throughput_version = self.ctc_system.get_domain_versions()['throughput']
+            self.ctc_system.system_tick(self.base_time)
+        self.assertEqual(self.ctc_system.get_domain_versions()['throughput'], throughput_version)
+        
+        # Changes between intervals coalesce into the next due signal
+        worker.updateCounter = 1
+        self.assertEqual(worker.emit_changed_signals(self.ctc_system), ['updateData'])
+        worker.updateCounter = 5
+        self.assertEqual(worker.emit_changed_signals(self.ctc_system), ['updateTables'])
+        self.assertEqual(signals.count('updateTables'), 2)
+    
+    def test_clock_and_suggested_speed_versions(self, mock_time):
+        """Test that the clock domain moves once per simulated minute and speed changes mark trains"""
+        from datetime import timedelta
+        mock_time.return_value = self.base_time
+        
+        with patch('CTC.Core.display_manager._get_simulation_time', return_value=self.base_time):
+            self.ctc_system.system_tick(self.base_time)
+            clock_version = self.ctc_system.get_domain_versions()['clock']
+            self.ctc_system.system_tick(self.base_time + timedelta(seconds=30))
+            self.assertEqual(self.ctc_system.get_domain_versions()['clock'], clock_version)
+            self.ctc_system.system_tick(self.base_time + timedelta(minutes=1))
+            self.assertEqual(self.ctc_system.get_domain_versions()['clock'], clock_version + 1)
+        
+        train = self._create_test_train('G001', 13)
+        self.ctc_system.trains['G001'] = train
+        self.ctc_system.trainSuggestedSpeeds['G001'] = 40
+        trains_version = self.ctc_system.get_domain_versions()['trains']
+        self.ctc_system.stop_train_for_ui('G001')
+        self.assertEqual(self.ctc_system.trainSuggestedSpeeds['G001'], 0)
+        self.assertEqual(self.ctc_system.get_domain_versions()['trains'], trains_version + 1)
+        
+        # Stopping an already stopped train changes nothing
+        self.ctc_system.stop_train_for_ui('G001')
+        self.assertEqual(self.ctc_system.get_domain_versions()['trains'], trains_version + 1)
+    
+    def test_validate_closure_uses_route_block_times(self, mock_time):
+        """Test that a closure only conflicts with trains scheduled on the block around that time"""
+        from datetime import timedelta
+        mock_time.return_value = self.base_time
+        
+        with patch('CTC.Core.route._get_simulation_time', return_value=self.base_time):
+            blocks = [self.ctc_system.get_block_by_line_new('Green', n) for n in (13, 14, 15)]
+            route = Route()
+            route.create_route(blocks, self.base_time + timedelta(hours=1))
+        route.scheduledDeparture = self.base_time + timedelta(minutes=10)
+        
+        train = self._create_test_train('G001', 13)
+        train.route = route
+        self.ctc_system.trains['G001'] = train
+        self.ctc_system.update_route_index(train)
+        
+        block_14 = blocks[1]
+        entry_time = route.scheduledDeparture + timedelta(seconds=route.get_cumulative_times()[1])
+        
+        # Closing well before the train arrives for a short window is allowed
+        self.assertTrue(self.ctc_system.validate_closure(block_14, self.base_time, timedelta(minutes=5)))
+        # Closing while the train passes (or indefinitely before it) is denied
+        self.assertFalse(self.ctc_system.validate_closure(block_14, entry_time))
+        self.assertFalse(self.ctc_system.validate_closure(block_14, self.base_time))
+        self.assertEqual(self.ctc_system.find_route_conflicts(route, 'G002')[('Green', 14)], ['G001'])
+        
+        # Releasing the route frees the block
+        self.ctc_system._remove_route_index('G001')
+        self.assertTrue(self.ctc_system.validate_closure(block_14, entry_time))
+    
+    def test_validate_closure_rejects_block_ahead_of_delayed_train(self, mock_time):
+        """Test that a closure is checked against a delayed train's real position, not its stale reservations"""
+        from datetime import timedelta
+        mock_time.return_value = self.base_time
+        self.ctc_system.system_time = self.base_time
+        
+        with patch('CTC.Core.route._get_simulation_time', return_value=self.base_time):
+            blocks = [self.ctc_system.get_block_by_line_new('Green', n) for n in (13, 14, 15)]
+            route = Route()
+            route.create_route(blocks, self.base_time + timedelta(hours=1))
+        route.scheduledDeparture = self.base_time
+        
+        train = self._create_test_train('G001', 13)
+        train.route = route
+        self.ctc_system.trains['G001'] = train
+        self.ctc_system.update_route_index(train)
+        
+        # The train is still waiting at block 13 long after its reservation of block 14 ended
+        later = self.base_time + timedelta(minutes=30)
+        self.ctc_system.system_time = later
+        self.assertEqual(self.ctc_system.blockReservations.find_conflicts(('Green', 14), later, later + timedelta(minutes=5)), [])
+        self.assertFalse(self.ctc_system.validate_closure(blocks[1], later, timedelta(minutes=5)))
+        
+        # Once the train has passed the block it no longer blocks the closure
+        route.currentBlockIndex = 2
+        self.assertTrue(self.ctc_system.validate_closure(blocks[1], later, timedelta(minutes=5)))
+    
     def test_close_block_immediately(self, mock_time):
         """Test immediate block closure"""
         mock_time.return_value = self.base_time
@@ -0,0 +1,85 @@
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add the parent directory to sys.path to import CTC modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from CTC.Core.event_scheduler import EventScheduler
+
+
+class TestEventScheduler(unittest.TestCase):
+    """Test cases for the sim-time EventScheduler"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.scheduler = EventScheduler()
+        self.base_time = datetime(2024, 1, 1, 12, 0, 0)
+        self.fired = []
+    
+    def _record(self, label):
+        """Callback that records which event ran"""
+        self.fired.append(label)
+    
+    def test_runs_only_due_events_in_time_order(self):
+        """Test that only due events run, earliest first"""
+        self.scheduler.schedule(self.base_time + timedelta(seconds=10), self._record, 'late')
+        self.scheduler.schedule(self.base_time + timedelta(seconds=2), self._record, 'early')
+        self.scheduler.schedule(self.base_time + timedelta(seconds=5), self._record, 'middle')
+        
+        ran = self.scheduler.run_due(self.base_time + timedelta(seconds=5))
+        
+        self.assertEqual(ran, 2)
+        self.assertEqual(self.fired, ['early', 'middle'])
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.next_due_time(), self.base_time + timedelta(seconds=10))
+    
+    def test_same_due_time_keeps_registration_order(self):
+        """Test that events due at the same time run in the order they were scheduled"""
+        for label in ('a', 'b', 'c'):
+            self.scheduler.schedule(self.base_time, self._record, label)
+        
+        self.scheduler.run_due(self.base_time)
+        
+        self.assertEqual(self.fired, ['a', 'b', 'c'])
+    
+    def test_cancelled_event_never_runs(self):
+        """Test cancelling an event through its handle"""
+        event = self.scheduler.schedule(self.base_time, self._record, 'cancelled')
+        self.scheduler.schedule(self.base_time, self._record, 'kept')
+        
+        self.assertTrue(self.scheduler.cancel(event))
+        self.assertFalse(self.scheduler.cancel(event))
+        self.scheduler.run_due(self.base_time)
+        
+        self.assertEqual(self.fired, ['kept'])
+        self.assertFalse(event.pending)
+    
+    def test_callback_can_schedule_follow_up(self):
+        """Test that a callback can register another event, including one already due"""
+        def chain():
+            self.fired.append('first')
+            self.scheduler.schedule(self.base_time, self._record, 'second')
+        
+        self.scheduler.schedule(self.base_time, chain)
+        self.scheduler.run_due(self.base_time)
+        self.assertEqual(self.fired, ['first'])
+        
+        self.scheduler.run_due(self.base_time)
+        self.assertEqual(self.fired, ['first', 'second'])
+    
+    def test_callback_error_does_not_stop_other_events(self):
+        """Test that an exception in one callback is logged and later events still run"""
+        def fail():
+            raise RuntimeError("boom")
+        
+        self.scheduler.schedule(self.base_time, fail)
+        self.scheduler.schedule(self.base_time, self._record, 'after')
+        
+        self.assertEqual(self.scheduler.run_due(self.base_time), 2)
+        self.assertEqual(self.fired, ['after'])
+
+
+if __name__ == '__main__':
+    unittest.main()
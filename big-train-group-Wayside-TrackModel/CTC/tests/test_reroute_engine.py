@@ -0,0 +1,175 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add the parent directory to sys.path to import CTC modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from CTC.Core.reroute_engine import RerouteEngine
+from CTC.Core.route import Route
+from CTC.Core.ctc_system import CTCSystem
+from Track_Reader.track_reader import TrackLayoutReader
+
+
+class TestRerouteEngine(unittest.TestCase):
+    """Test cases for batch rerouting over masked line graphs"""
+
+    def setUp(self):
+        """Set up a CTC system on the real track layout"""
+        self.time_patches = [
+            patch('CTC.Core.ctc_system._get_simulation_time'),
+            patch('CTC.Core.route_manager._get_simulation_time'),
+            patch('CTC.Core.route._get_simulation_time'),
+            patch('CTC.Core.block._get_simulation_time'),
+            patch('CTC.Core.failure_manager._get_simulation_time'),
+            patch('CTC.Core.communication_handler._get_simulation_time'),
+            patch('CTC.Core.display_manager._get_simulation_time'),
+        ]
+        self.mock_time = datetime(2024, 1, 1, 12, 0, 0)
+        for patch_obj in self.time_patches:
+            patch_obj.start().return_value = self.mock_time
+
+        track_file_path = os.path.join(os.path.dirname(__file__), '..', '..',
+                                       'Track_Reader', 'Track Layout & Vehicle Data vF2.xlsx')
+        self.ctc_system = CTCSystem(track_reader=TrackLayoutReader(track_file_path))
+        self.route_manager = self.ctc_system.routeManager
+        self.engine = RerouteEngine(self.route_manager)
+
+    def tearDown(self):
+        for patch_obj in self.time_patches:
+            patch_obj.stop()
+
+    def _make_train(self, train_id, line, start, end):
+        """Create a train following the route manager's path between two blocks"""
+        path = self.route_manager._find_path(
+            self.ctc_system.get_block_by_line_new(line, start),
+            self.ctc_system.get_block_by_line_new(line, end)
+        )
+        route = Route()
+        route.create_route(path, self.mock_time + timedelta(minutes=30))
+        route.trainID = train_id
+        train = Mock()
+        train.trainID = train_id
+        train.route = route
+        return train
+
+    def test_masked_path_matches_route_manager(self):
+        """Test that masking a failed block gives the same detour as the route manager"""
+        failed_block = self.ctc_system.get_block_by_line_new('Red', 11)
+        start = self.ctc_system.get_block_by_line_new('Red', 10)
+        end = self.ctc_system.get_block_by_line_new('Red', 60)
+
+        self.assertEqual(self.engine.find_path('Red', 10, None, 60), list(range(10, 61)))
+
+        failed_block.set_block_failed(True)
+        try:
+            expected = [block.blockID for block in self.route_manager._find_path(start, end)]
+        finally:
+            failed_block.set_block_failed(False)
+        self.engine.set_blocked_blocks({'Red': {11}})
+
+        path = self.engine.find_path('Red', 10, None, 60)
+        self.assertEqual(path, expected)
+        self.assertNotIn(11, path)
+
+    def test_new_failure_repairs_cached_tree(self):
+        """Test that a new failure updates cached trees in place instead of rebuilding them"""
+        self.engine.get_path_tree('Red', 60)
+        self.engine.get_path_tree('Red', 30)
+        self.assertEqual(self.engine.treesBuilt, 2)
+
+        self.engine.set_blocked_blocks({'Red': {11}})
+        self.assertEqual(self.engine.treesBuilt, 2)
+        self.assertEqual(self.engine.treesRepaired, 2)
+
+        # Repaired trees match trees built from scratch under the same mask
+        fresh = RerouteEngine(self.route_manager)
+        fresh.set_blocked_blocks({'Red': {11}})
+        for destination in (60, 30):
+            repaired = self.engine.get_path_tree('Red', destination)
+            rebuilt = fresh.get_path_tree('Red', destination)
+            self.assertEqual(repaired['distances'], rebuilt['distances'])
+            self.assertEqual(repaired['hops'], rebuilt['hops'])
+
+    def test_reopened_block_restores_direct_path(self):
+        """Test that clearing a failure drops the trees it shortens"""
+        self.engine.set_blocked_blocks({'Red': {11}})
+        self.assertNotIn(11, self.engine.find_path('Red', 10, None, 60))
+
+        self.assertEqual(self.engine.set_blocked_blocks({'Red': set()}), 1)
+        self.assertEqual(self.engine.find_path('Red', 10, None, 60), list(range(10, 61)))
+        self.assertEqual(self.engine.treesBuilt, 2)
+
+    def test_reroute_train_from_current_position(self):
+        """Test that a rerouted train continues from its current block to the same destination"""
+        train = self._make_train('T1', 'Red', 5, 60)
+        train.route.currentBlockIndex = 1  # At block 4, arrived from block 5
+        train.route.scheduledDeparture = self.mock_time + timedelta(minutes=5)
+
+        self.engine.set_blocked_blocks({'Red': {11}})
+        new_route = self.engine.reroute_train(train)
+
+        block_ids = [block.blockID for block in new_route.blockSequence]
+        self.assertEqual(block_ids[0], 4)
+        self.assertEqual(block_ids[-1], 60)
+        self.assertNotIn(5, block_ids)
+        self.assertNotIn(11, block_ids)
+        self.assertEqual(new_route.routeType, 'EMERGENCY')
+        self.assertEqual(new_route.trainID, 'T1')
+        self.assertEqual(new_route.scheduledDeparture, train.route.scheduledDeparture)
+
+    def test_failure_manager_reroutes_trains_in_one_pass(self):
+        """Test that FailureManager reroutes every affected train with one shared tree"""
+        failure_manager = self.ctc_system.failureManager
+        failure_manager.communication_handler = Mock()
+        failure_manager.display_manager = Mock()
+        trains = [self._make_train(f'T{i}', 'Red', 10, 60) for i in range(5)]
+
+        with patch.object(self.ctc_system, 'get_train_list', return_value=trains):
+            failed_block = self.ctc_system.get_block_by_line_new('Red', 11)
+            failure_manager.add_failed_block(failed_block)
+            try:
+                results = failure_manager.reroute_trains()
+            finally:
+                failure_manager.remove_failed_block(failed_block)
+
+        self.assertEqual(results, {f'T{i}': 'SUCCESS' for i in range(5)})
+        self.assertEqual(failure_manager.rerouteEngine.treesBuilt, 1)
+        for train in trains:
+            self.assertNotIn(11, [block.blockID for block in train.route.blockSequence])
+
+    def test_reroute_reschedules_yard_departure(self):
+        """Test that rerouting a waiting yard train moves its departure event to the new route"""
+        failure_manager = self.ctc_system.failureManager
+        failure_manager.communication_handler = Mock()
+        failure_manager.display_manager = Mock()
+        departure = self.mock_time + timedelta(minutes=10)
+        train = self._make_train('T1', 'Red', 0, 60)
+        train.route.scheduledDeparture = departure
+        old_route = train.route
+        self.ctc_system.trains['T1'] = train
+        self.ctc_system._schedule_departure('T1', old_route)
+        old_event = self.ctc_system.departureEvents['T1']
+
+        detour = self._make_train('T1', 'Red', 0, 60).route
+        detour.scheduledDeparture = departure
+        with patch.object(self.ctc_system, 'get_train_list', return_value=[train]), \
+                patch.object(RerouteEngine, 'reroute_train', return_value=detour):
+            failed_block = self.ctc_system.get_block_by_line_new('Red', 5)
+            failure_manager.add_failed_block(failed_block)
+            try:
+                results = failure_manager.reroute_trains()
+            finally:
+                failure_manager.remove_failed_block(failed_block)
+
+        self.assertEqual(results, {'T1': 'SUCCESS'})
+        self.assertIs(train.route, detour)
+        self.assertTrue(old_event.cancelled)
+        new_event = self.ctc_system.departureEvents['T1']
+        self.assertIsNot(new_event, old_event)
+        self.assertIs(new_event.args[1], detour)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -403,6 +403,41 @@ class TestRoute(unittest.TestCase):
         distance = empty_route.calculate_route_distance(1, 5)
         self.assertEqual(distance, 0)
     
+    def test_position_index_looped_route(self, mock_route_manager_time, mock_route_time, mock_ctc_time):
+        """Test position index and prefix sums on a route that repeats blocks"""
+        mock_route_time.return_value = datetime(2024, 1, 1, 12, 0, 0)
+        route = Route()
+        block_sequence = [
+            self.start_block,
+            self.intermediate_block,
+            self.end_block,
+            self.intermediate_block,
+            self.end_block
+        ]
+        route.create_route(block_sequence, self.test_arrival_time)
+        
+        self.assertEqual(route.get_block_positions(13), [1, 3])
+        self.assertEqual(route.find_block_index(14, 3), 4)
+        self.assertIsNone(route.find_block_index(1, 1))
+        self.assertFalse(route.contains_block(50))
+        
+        # Distance and location updates use the occurrence ahead of the train
+        route.currentBlockIndex = 3
+        self.assertEqual(route.calculate_route_distance(13, 14), 1)
+        self.assertTrue(route.update_location(self.end_block))
+        self.assertEqual(route.currentBlockIndex, 4)
+        self.assertFalse(route.update_location(self.start_block))
+        
+        route.currentBlockIndex = 2
+        self.assertAlmostEqual(route.get_remaining_distance(),
+                               sum(block.length for block in block_sequence[2:]))
+        expected_time = sum(route._get_block_time(i) for i in range(2, len(block_sequence)))
+        self.assertAlmostEqual(route.get_remaining_time(), expected_time)
+        
+        # Replacing the sequence rebuilds the index
+        route.blockSequence = [self.end_block]
+        self.assertEqual(route.get_block_positions(14), [0])
+    
     def test_get_remaining_blocks(self, mock_route_manager_time, mock_route_time, mock_ctc_time):
         """Test getting remaining blocks in route"""
         route = Route()
@@ -846,6 +846,112 @@ class TestRouteManager(unittest.TestCase):
         self.assertEqual(route.startBlock, self.test_block1)
         self.assertEqual(route.endBlock, self.test_block2)
 
+    def test_find_path_full_green_loop(self):
+        """Test that the route table finds routes through both Green line loops"""
+        start = self.ctc_system.get_block_by_line_new('Green', 57)
+        end = self.ctc_system.get_block_by_line_new('Green', 1)
+
+        path = self.route_manager._find_path(start, end, 'forward')
+        path_ids = [block.blockID for block in path]
+
+        self.assertEqual(path_ids[0], 57)
+        self.assertEqual(path_ids[-1], 1)
+        # Route must pass through the 100->85 and 150->29 one-way transitions
+        self.assertIn(85, path_ids[path_ids.index(100):])
+        self.assertEqual(path_ids[path_ids.index(150) + 1], 29)
+
+    def test_find_path_route_table_follows_closures(self):
+        """Test that closing a block invalidates the cached route table"""
+        start = self.ctc_system.get_block_by_line_new('Green', 63)
+        end = self.ctc_system.get_block_by_line_new('Green', 70)
+        closed_block = self.ctc_system.get_block_by_line_new('Green', 66)
+
+        path = self.route_manager._find_path(start, end)
+        self.assertEqual([block.blockID for block in path], list(range(63, 71)))
+
+        closed_block.set_block_failed(True)
+        try:
+            self.assertEqual(self.route_manager._find_path(start, end), [])
+        finally:
+            closed_block.set_block_failed(False)
+
+        path = self.route_manager._find_path(start, end)
+        self.assertEqual([block.blockID for block in path], list(range(63, 71)))
+
+    def test_build_route_table_precomputes_destinations(self):
+        """Test that build_route_table fills in every destination up front"""
+        self.route_manager.build_route_table('Red')
+        table = self.route_manager.route_tables['Red']
+        red_blocks = [block_id for (line, block_id) in self.ctc_system.blocks if line == 'Red' and block_id != 0]
+
+        self.assertEqual(set(table['destinations']), set(red_blocks))
+
+        with patch.object(self.route_manager, '_get_route_step_options') as step_options:
+            start = self.ctc_system.get_block_by_line_new('Red', 10)
+            end = self.ctc_system.get_block_by_line_new('Red', 20)
+            path = self.route_manager._find_path(start, end)
+            step_options.assert_not_called()
+        self.assertEqual([block.blockID for block in path][-1], 20)
+
+    def test_ctc_system_builds_route_tables_at_startup(self):
+        """Test that the CTC System precomputes every destination for each loaded line"""
+        route_tables = self.ctc_system.routeManager.route_tables
+        for line in ('Green', 'Red'):
+            line_blocks = [block_id for (block_line, block_id) in self.ctc_system.blocks
+                           if block_line == line and block_id != 0]
+            self.assertIn(line, route_tables)
+            self.assertEqual(set(route_tables[line]['destinations']), set(line_blocks))
+
+    def test_route_table_skips_status_check_when_unchanged(self):
+        """Test that block status is only re-read after a block changes status"""
+        self.route_manager.build_route_table('Red')
+        start = self.ctc_system.get_block_by_line_new('Red', 10)
+        end = self.ctc_system.get_block_by_line_new('Red', 20)
+
+        with patch.object(self.route_manager, '_get_closed_blocks',
+                          wraps=self.route_manager._get_closed_blocks) as get_closed:
+            self.route_manager._find_path(start, end)
+            self.route_manager._find_path(start, end)
+            get_closed.assert_not_called()
+
+            block = self.ctc_system.get_block_by_line_new('Red', 30)
+            block.set_block_failed(True)
+            try:
+                self.route_manager._find_path(start, end)
+                self.route_manager._find_path(start, end)
+                self.assertEqual(get_closed.call_count, 1)
+            finally:
+                block.set_block_failed(False)
+
+    def test_closure_invalidates_only_affected_destinations(self):
+        """Test that closing and reopening a block only drops the destinations it affects"""
+        self.route_manager.build_route_table('Green')
+        table = self.route_manager.route_tables['Green']
+        before = dict(table['destinations'])
+        through_66 = {dest for dest, (hops, distances) in before.items() if 66 in hops.values()}
+        self.assertTrue(through_66)
+        self.assertTrue(set(before) - through_66)
+
+        closed_block = self.ctc_system.get_block_by_line_new('Green', 66)
+        closed_block.set_block_failed(True)
+        try:
+            self.route_manager._get_route_table('Green')
+            self.assertEqual(set(table['destinations']), set(before) - through_66)
+            for dest in table['destinations']:
+                self.assertIs(table['destinations'][dest], before[dest])
+
+            # Rebuild one affected destination while the block is closed
+            rebuilt = next(iter(through_66))
+            self.route_manager._get_destination_hops(table, 'Green', rebuilt, table['blocks'])
+            self.assertNotIn(66, table['destinations'][rebuilt][0].values())
+        finally:
+            closed_block.set_block_failed(False)
+
+        # Reopening drops only the destination built while 66 was closed
+        self.route_manager._get_route_table('Green')
+        self.assertEqual(set(table['destinations']), set(before) - through_66)
+        self.assertNotIn(rebuilt, table['destinations'])
+
 
 if __name__ == '__main__':
     # Create test suite
@@ -0,0 +1,160 @@
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+from functools import partial
+
+# Add the parent directory to sys.path to import CTC modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QPersistentModelIndex
+from CTC.UI.table_models import SnapshotTableModel, TableCell
+from CTC.UI.ctc_interface import CTCInterface
+
+
+class TestSnapshotTableModel(unittest.TestCase):
+    """Test cases for diffing table snapshots into minimal model signals"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = SnapshotTableModel(['Train', 'Block'])
+        self.model.set_snapshot([('T1', '5'), ('T2', '9'), ('T3', '12')])
+        self.signals = []
+        self.model.dataChanged.connect(lambda first, last: self.signals.append(('changed', first.row(), last.row())))
+        self.model.rowsInserted.connect(lambda parent, first, last: self.signals.append(('inserted', first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: self.signals.append(('removed', first, last)))
+        self.model.layoutChanged.connect(lambda: self.signals.append(('layout',)))
+
+    def _texts(self):
+        return [tuple(self.model.row_text(row, column) for column in range(2)) for row in range(self.model.rowCount())]
+
+    def test_initial_snapshot(self):
+        """Test that the first snapshot shows every row"""
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.columnCount(), 2)
+        self.assertEqual(self._texts(), [('T1', '5'), ('T2', '9'), ('T3', '12')])
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal), 'Block')
+
+    def test_only_changed_rows_signalled(self):
+        """Test that a snapshot with one moved train only signals that row"""
+        changes = self.model.set_snapshot([('T1', '5'), ('T2', '10'), ('T3', '12')])
+        self.assertEqual(changes, 1)
+        self.assertEqual(self.signals, [('changed', 1, 1)])
+
+    def test_identical_snapshot_signals_nothing(self):
+        """Test that an unchanged snapshot causes no repaint"""
+        self.assertEqual(self.model.set_snapshot([('T1', '5'), ('T2', '9'), ('T3', '12')]), 0)
+        self.assertEqual(self.signals, [])
+
+    def test_unchanged_version_is_skipped(self):
+        """Test that a snapshot with the shown version is ignored without diffing"""
+        self.model.set_snapshot([('T1', '6')], version=4)
+        self.signals.clear()
+        self.assertEqual(self.model.set_snapshot([('T9', '1')], version=4), 0)
+        self.assertEqual(self.signals, [])
+        self.assertEqual(self._texts(), [('T1', '6')])
+
+    def test_rows_added_and_removed(self):
+        """Test that rows are inserted and removed by key"""
+        self.model.set_snapshot([('T1', '5'), ('T3', '12'), ('T4', '1')])
+        self.assertEqual(self._texts(), [('T1', '5'), ('T3', '12'), ('T4', '1')])
+        self.assertIn(('removed', 1, 1), self.signals)
+        self.assertIn(('inserted', 2, 2), self.signals)
+        self.assertNotIn('changed', [signal[0] for signal in self.signals])
+
+    def test_reorder_keeps_selection_on_row(self):
+        """Test that reordering moves persistent indexes with their rows"""
+        selected = QPersistentModelIndex(self.model.index(0, 0))  # T1
+        self.model.set_snapshot([('T3', '12'), ('T2', '9'), ('T1', '5')])
+        self.assertEqual(self._texts(), [('T3', '12'), ('T2', '9'), ('T1', '5')])
+        self.assertEqual(selected.row(), 2)
+        self.assertIn(('layout',), self.signals)
+
+    def test_duplicate_keys_stay_distinct(self):
+        """Test that rows sharing a key are matched by occurrence"""
+        model = SnapshotTableModel(['Line', 'Block'])
+        model.set_snapshot([('Green', '1'), ('Green', '2')])
+        model.set_snapshot([('Green', '1'), ('Green', '3')])
+        self.assertEqual([model.row_text(row, 1) for row in range(2)], ['1', '3'])
+        self.assertEqual(model.find_row('Green'), 0)
+        self.assertEqual(model.find_row('Red'), -1)
+
+    def test_styled_cells(self):
+        """Test that TableCell styling is exposed through the item roles"""
+        model = SnapshotTableModel(['Line', 'Status'], row_key=lambda row: row[0].user_data)
+        model.set_snapshot([(TableCell('Green', user_data='closure-1'), TableCell('Active', foreground='red', bold=True))])
+        self.assertEqual(model.data(model.index(0, 0)), 'Green')
+        self.assertEqual(model.data(model.index(0, 0), Qt.UserRole), 'closure-1')
+        self.assertEqual(model.data(model.index(0, 1), Qt.ForegroundRole).name(), '#ff0000')
+        self.assertTrue(model.data(model.index(0, 1), Qt.FontRole).bold())
+        self.assertIsNone(model.data(model.index(0, 0), Qt.ForegroundRole))
+        self.assertEqual(model.row_text(5, 0), '')
+
+
+class TestInterfaceTableRefresh(unittest.TestCase):
+    """Test cases for skipping table rebuilds when their state domains did not change"""
+
+    def setUp(self):
+        self.versions = {'trains': 0, 'blocks': 0, 'warnings': 0, 'routes': 0, 'throughput': 0, 'clock': 0}
+        self.interface = Mock()
+        self.interface.tableDomainVersions = {}
+        self.interface.ctc_system.get_domain_versions.side_effect = lambda: dict(self.versions)
+        self.interface._table_domains_changed = partial(CTCInterface._table_domains_changed, self.interface)
+        CTCInterface.update_table_displays(self.interface)
+        self.interface.reset_mock()
+
+    def _refreshed_tables(self):
+        CTCInterface.update_table_displays(self.interface)
+        tables = {
+            'trains': self.interface.update_train_info_table,
+            'blocks': self.interface.update_block_info_table,
+            'warnings': self.interface.update_warnings_table,
+            'scheduled_closures': self.interface.update_scheduled_closures_display,
+        }
+        return {name for name, method in tables.items() if method.called}
+
+    def test_unchanged_domains_build_no_rows(self):
+        """Test that no table is rebuilt when no domain moved"""
+        self.assertEqual(self._refreshed_tables(), set())
+
+    def test_only_dependent_tables_rebuilt(self):
+        """Test that a domain change rebuilds only the tables built from it"""
+        self.versions['warnings'] += 1
+        self.assertEqual(self._refreshed_tables(), {'warnings'})
+
+        self.interface.reset_mock()
+        self.versions['trains'] += 1
+        self.assertEqual(self._refreshed_tables(), {'trains', 'blocks'})
+
+        self.interface.reset_mock()
+        self.versions['throughput'] += 1
+        self.assertEqual(self._refreshed_tables(), set())
+
+    def test_clock_refreshes_time_dependent_tables(self):
+        """Test that a new simulated minute rebuilds the ETA and closure status tables"""
+        self.versions['clock'] = 1
+        self.assertEqual(self._refreshed_tables(), {'trains', 'scheduled_closures'})
+
+    def test_track_redrawn_only_on_map_domains(self):
+        """Test that the visual refresh only flags the track map for redraw when its domains changed"""
+        self.interface.trackNeedsRedraw = False
+        CTCInterface.update_visual_displays(self.interface)
+        self.assertTrue(self.interface.trackNeedsRedraw)
+
+        for domain in ('warnings', 'throughput', 'clock'):
+            self.interface.trackNeedsRedraw = False
+            self.versions[domain] = self.versions.get(domain, 0) + 1
+            CTCInterface.update_visual_displays(self.interface)
+            self.assertFalse(self.interface.trackNeedsRedraw)
+
+        self.versions['routes'] += 1
+        CTCInterface.update_visual_displays(self.interface)
+        self.assertTrue(self.interface.trackNeedsRedraw)
+
+
+if __name__ == '__main__':
+    unittest.main()
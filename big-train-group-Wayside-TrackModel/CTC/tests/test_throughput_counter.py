@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add the parent directory to sys.path to import CTC modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from CTC.Core.throughput_counter import ThroughputCounter
+
+
+class TestThroughputCounter(unittest.TestCase):
+    """Test cases for the sliding-window ThroughputCounter"""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.counter = ThroughputCounter()
+        self.base_time = datetime(2024, 1, 1, 12, 0, 0)
+    
+    def test_total_within_window(self):
+        """Test that sales inside the last hour are summed"""
+        self.counter.add(5, self.base_time)
+        self.counter.add(3, self.base_time + timedelta(minutes=10, seconds=30))
+        self.counter.add(2, self.base_time + timedelta(minutes=59))
+        
+        self.assertEqual(self.counter.get_total(self.base_time + timedelta(minutes=59, seconds=59)), 10)
+    
+    def test_old_buckets_expire(self):
+        """Test that buckets leave the window as time advances"""
+        self.counter.add(5, self.base_time)
+        self.counter.add(3, self.base_time + timedelta(minutes=30))
+        
+        self.assertEqual(self.counter.get_total(self.base_time + timedelta(minutes=60)), 3)
+        self.assertEqual(self.counter.get_total(self.base_time + timedelta(minutes=90)), 0)
+    
+    def test_long_gap_clears_window(self):
+        """Test that a gap longer than the window drops everything"""
+        self.counter.add(5, self.base_time)
+        self.counter.add(1, self.base_time + timedelta(hours=5))
+        
+        self.assertEqual(self.counter.get_total(self.base_time + timedelta(hours=5)), 1)
+    
+    def test_late_sales_outside_window_ignored(self):
+        """Test that a sale older than the window does not count"""
+        self.counter.add(1, self.base_time + timedelta(hours=2))
+        self.counter.add(7, self.base_time)
+        
+        self.assertEqual(self.counter.get_total(self.base_time + timedelta(hours=2)), 1)
+    
+    def test_history_export(self):
+        """Test per-bucket history export with finer-grained buckets"""
+        counter = ThroughputCounter(timedelta(minutes=1), timedelta(seconds=10))
+        counter.add(2, self.base_time)
+        counter.add(4, self.base_time + timedelta(seconds=25))
+        
+        history = counter.get_history(self.base_time + timedelta(seconds=25))
+        
+        self.assertEqual(len(history), 6)
+        self.assertEqual(history[-1], (self.base_time + timedelta(seconds=20), 4))
+        self.assertEqual(history[-3], (self.base_time, 2))
+        self.assertEqual(sum(tickets for _, tickets in history), counter.total)
+    
+    def test_invalid_bucket_width(self):
+        """Test that a bucket wider than the window is rejected"""
+        with self.assertRaises(ValueError):
+            ThroughputCounter(timedelta(minutes=1), timedelta(minutes=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
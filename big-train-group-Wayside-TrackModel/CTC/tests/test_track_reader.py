@@ -0,0 +1,263 @@
+"""
+Test Track Layout Reader
+========================
+Tests for TrackLayoutReader features shared by all modules
+"""
+
+import unittest
+from unittest.mock import patch
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the parent directory to sys.path to import project modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from Track_Reader import track_reader
+from Track_Reader.track_reader import (TrackLayoutReader, LAYOUT_CACHE_DIR_NAME,
+                                       get_shared_track_reader, clear_shared_track_readers)
+
+TRACK_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', '..',
+                               'Track_Reader', 'Track Layout & Vehicle Data vF2.xlsx')
+# Default workbook of the CTC and Track Model UIs - it has no Connected Blocks data
+ROOT_TRACK_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', '..',
+                                    'Track Layout & Vehicle Data vF2.xlsx')
+
+
+class TestLayoutCache(unittest.TestCase):
+    """Test cases for the compiled layout cache"""
+
+    def setUp(self):
+        """Copy the workbook into a scratch directory so the cache starts empty"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.track_file = os.path.join(self.temp_dir, 'layout.xlsx')
+        shutil.copyfile(TRACK_FILE_PATH, self.track_file)
+
+    def tearDown(self):
+        """Remove the scratch directory"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cache_written_and_reused(self):
+        """Test that a second reader loads the same layout from the cache"""
+        parsed = TrackLayoutReader(self.track_file, selected_lines=["Green"])
+        cache_path = parsed._get_cache_path()
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertEqual(os.path.dirname(cache_path),
+                         os.path.join(self.temp_dir, LAYOUT_CACHE_DIR_NAME))
+
+        with patch.object(TrackLayoutReader, '_load_track_data') as mock_parse:
+            cached = TrackLayoutReader(self.track_file, selected_lines=["Green"])
+            mock_parse.assert_not_called()
+
+        self.assertEqual(cached.lines["Green"], parsed.lines["Green"])
+        self.assertEqual(cached.sections, parsed.sections)
+        self.assertEqual(cached.get_all_stations("Green"), parsed.get_all_stations("Green"))
+
+    def test_cache_rebuilt_when_parser_version_changes(self):
+        """Test that a cache written by another parser version is ignored"""
+        TrackLayoutReader(self.track_file, selected_lines=["Green"])
+
+        with patch.object(track_reader, 'LAYOUT_PARSER_VERSION', -1):
+            reader = TrackLayoutReader.__new__(TrackLayoutReader)
+            reader.file_path = self.track_file
+            reader.selected_lines = ["Green"]
+            self.assertFalse(reader._load_from_cache())
+
+    def test_cache_rebuilt_when_workbook_changes(self):
+        """Test that editing the workbook invalidates the cache"""
+        reader = TrackLayoutReader(self.track_file, selected_lines=["Green"])
+        with open(self.track_file, 'ab') as workbook:
+            workbook.write(b'\0')
+        self.assertFalse(reader._load_from_cache())
+
+    def test_failed_cache_save_removes_temp_file(self):
+        """Test that a pickling error neither raises nor leaves a temp file behind"""
+        with patch.object(track_reader.pickle, 'dump', side_effect=track_reader.pickle.PicklingError("unpicklable")):
+            reader = TrackLayoutReader(self.track_file, selected_lines=["Green"])
+
+        cache_dir = os.path.dirname(reader._get_cache_path())
+        self.assertFalse(os.path.exists(reader._get_cache_path()))
+        self.assertEqual([name for name in os.listdir(cache_dir) if name.endswith('.tmp')], [])
+        self.assertTrue(reader.lines["Green"])
+
+    def test_cache_disabled(self):
+        """Test that use_cache=False neither reads nor writes the cache"""
+        reader = TrackLayoutReader(self.track_file, selected_lines=["Green"], use_cache=False)
+        self.assertFalse(os.path.exists(reader._get_cache_path()))
+
+
+class TestSharedLayoutRegistry(unittest.TestCase):
+    """Test cases for the process-wide shared layout registry"""
+
+    def setUp(self):
+        """Start every test with an empty registry"""
+        clear_shared_track_readers()
+
+    def tearDown(self):
+        """Leave an empty registry for other tests"""
+        clear_shared_track_readers()
+
+    def test_same_file_and_lines_share_reader(self):
+        """Test that equal (file, lines) requests return one reader"""
+        first = get_shared_track_reader(TRACK_FILE_PATH, selected_lines=["Green"])
+        second = get_shared_track_reader(os.path.abspath(TRACK_FILE_PATH), selected_lines=["Green"])
+        self.assertIs(first, second)
+
+    def test_different_lines_get_different_readers(self):
+        """Test that each line selection has its own reader"""
+        green = get_shared_track_reader(TRACK_FILE_PATH, selected_lines=["Green"])
+        red_green = get_shared_track_reader(TRACK_FILE_PATH, selected_lines=["Red", "Green"])
+        self.assertIsNot(green, red_green)
+
+    def test_line_view_is_lazy_and_read_only(self):
+        """Test that line views are built once and cannot be modified"""
+        reader = get_shared_track_reader(TRACK_FILE_PATH, selected_lines=["Green"])
+        self.assertNotIn("Green", reader._line_views)
+
+        view = reader.get_line_view("Green")
+        self.assertIs(view, reader.get_line_view("Green"))
+        self.assertEqual(len(view.blocks), len(reader.lines["Green"]))
+        self.assertIs(view.blocks_by_number[1], reader.get_block_info("Green", 1))
+        self.assertEqual(dict(view.controller_json), reader.generate_controller_json("Green"))
+
+        with self.assertRaises(TypeError):
+            view.blocks_by_number[1] = None
+        with self.assertRaises(ValueError):
+            reader.get_line_view("Blue")
+
+
+class TestLookupIndexes(unittest.TestCase):
+    """Test cases for the load-time block, station and switch indexes"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the layout once for all index tests"""
+        cls.reader = TrackLayoutReader(TRACK_FILE_PATH, selected_lines=["Red", "Green"])
+
+    def test_block_lookups_match_line_data(self):
+        """Test that every block is found by line and by number"""
+        for line in ["Red", "Green"]:
+            for block in self.reader.lines[line]:
+                self.assertIs(self.reader.get_block_info(line, block.block_number), block)
+                self.assertIs(self.reader.get_block_by_number(block.block_number, line), block)
+        # Line-less lookup returns the block from the first selected line
+        self.assertEqual(self.reader.get_block_by_number(1).line, "Red")
+        self.assertIsNone(self.reader.get_block_info("Green", 9999))
+
+    def test_station_and_switch_lookups(self):
+        """Test that stations and switches are found through their indexes"""
+        for station in self.reader.get_all_stations():
+            info = self.reader.get_station_by_id(station["station_id"])
+            self.assertEqual(info["block_number"], station["block_number"])
+            self.assertEqual(info["line"], station["line"])
+        for switch in self.reader.get_all_switches("Green"):
+            info = self.reader.get_switch_by_block(switch["block_number"], "Green")
+            self.assertEqual(info["description"], switch["description"])
+        self.assertIsNone(self.reader.get_station_by_id(0))
+
+    def test_adjacency_respects_direction(self):
+        """Test that valid next blocks are adjacent blocks allowed by direction"""
+        for block in self.reader.lines["Green"]:
+            adjacent = self.reader.get_adjacent_blocks(block.block_number, "Green")
+            expected = [b for b in adjacent if block.can_move_to_block(b)]
+            self.assertEqual(self.reader.get_valid_next_blocks("Green", block.block_number), expected)
+
+    def test_distance_and_time_prefix_sums(self):
+        """Test that prefix-sum distances match summing the blocks directly"""
+        blocks = self.reader.lines["Green"]
+        first, last = blocks[3].block_number, blocks[20].block_number
+        expected_length = sum(b.length_m for b in blocks[3:21])
+        expected_time = sum(b.min_traversal_time_seconds for b in blocks[3:21])
+        self.assertAlmostEqual(self.reader.get_distance_between_blocks("Green", first, last), expected_length)
+        self.assertAlmostEqual(self.reader.get_distance_between_blocks("Green", last, first), expected_length)
+        self.assertAlmostEqual(self.reader.get_time_between_blocks("Green", first, last), expected_time)
+        self.assertEqual(self.reader.get_distance_between_blocks("Green", first, 9999), 0.0)
+
+
+class TestRouteOptions(unittest.TestCase):
+    """Test cases for graph-based route options"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the layout once for all routing tests"""
+        cls.reader = TrackLayoutReader(TRACK_FILE_PATH, selected_lines=["Red", "Green"])
+
+    def assert_route_follows_graph(self, line, route):
+        """Check that every step of a route is an edge of the routing graph"""
+        graph = self.reader.get_route_graph(line)
+        for current_block, next_block in zip(route, route[1:]):
+            self.assertIn(next_block, graph[current_block])
+
+    def test_graph_respects_direction_and_yard_switches(self):
+        """Test that one-way blocks and yard switches shape the Green graph"""
+        graph = self.reader.get_route_graph("Green")
+        self.assertEqual(graph[0], [63])  # Yard exit
+        self.assertIn(0, graph[57])  # Yard entry
+        self.assertEqual(graph[100], [85])  # Loop back through the switch at 85
+        self.assertEqual(graph[150], [29])
+        self.assertNotIn(62, graph[63])  # Forward-only block
+
+    def test_routes_ranked_and_valid(self):
+        """Test that alternatives are valid, distinct and ordered by time"""
+        routes = self.reader.get_route_options("Red", 10, 50, max_routes=3)
+        self.assertEqual(len(routes), 3)
+        self.assertEqual(len({tuple(route) for route in routes}), 3)
+        times = [self.reader.calculate_journey_time("Red", route) for route in routes]
+        self.assertEqual(times, sorted(times))
+        for route in routes:
+            self.assertEqual((route[0], route[-1]), (10, 50))
+            self.assert_route_follows_graph("Red", route)
+
+    def test_route_from_yard(self):
+        """Test routing out of the yard on the Green Line"""
+        routes = self.reader.get_route_options("Green", 0, 65)
+        self.assertEqual(routes[0], [0, 63, 64, 65])
+
+    def test_route_options_cached_and_copied(self):
+        """Test that repeated searches reuse the cache without sharing lists"""
+        first = self.reader.get_route_options("Green", 63, 96, max_routes=2)
+        first[0].append(-1)
+        second = self.reader.get_route_options("Green", 63, 96, max_routes=2)
+        self.assertNotEqual(second[0][-1], -1)
+        self.assertIn(("Green", 63, 96, 2, "time"), self.reader._route_options_cache)
+
+    def test_route_options_edge_cases(self):
+        """Test same-block, unreachable and invalid-weight requests"""
+        self.assertEqual(self.reader.get_route_options("Green", 5, 5), [[5]])
+        self.assertEqual(self.reader.get_route_options("Green", 9999, 5), [])
+        with self.assertRaises(ValueError):
+            self.reader.get_route_options("Green", 63, 96, weight="cost")
+
+
+class TestRouteOptionsWithoutConnections(unittest.TestCase):
+    """Test cases for routing on a workbook without connected-blocks data"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Load a scratch copy of the root workbook so its cache stays out of the repository"""
+        cls.temp_dir = tempfile.mkdtemp()
+        track_file = os.path.join(cls.temp_dir, 'layout.xlsx')
+        shutil.copyfile(ROOT_TRACK_FILE_PATH, track_file)
+        cls.reader = TrackLayoutReader(track_file, selected_lines=["Red", "Green"])
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the scratch directory"""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_adjacent_blocks_fill_missing_connections(self):
+        """Test that blocks without connections route through their direction-valid neighbours"""
+        self.assertFalse(any(block.connected_blocks for block in self.reader.lines["Green"]))
+        graph = self.reader.get_route_graph("Green")
+        for block_number in (20, 25, 30):
+            self.assertEqual(graph[block_number], self.reader.get_valid_next_blocks("Green", block_number))
+
+    def test_sequential_routes_found(self):
+        """Test that sequential routes are found on both lines"""
+        self.assertEqual(self.reader.get_route_options("Green", 20, 30)[0], list(range(20, 31)))
+        self.assertEqual(self.reader.get_route_options("Red", 10, 20)[0], list(range(10, 21)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import pickle
+import random
+import tempfile
+
+# Add the parent directory to sys.path to import CTC modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from PyQt5.QtWidgets import QApplication
+from CTC.UI.track_visualization import (TrackVisualization, TrackLayoutCache, LayoutSpatialIndex,
+                                        UI_LAYOUT_VERSION)
+from Track_Reader.track_reader import TrackLayoutReader
+
+
+def make_block(number, connections=(), yard=False):
+    """Create a minimal track block for layout keys"""
+    block = Mock()
+    block.block_number = number
+    block.connected_blocks = list(connections)
+    block.has_yard_connection = yard
+    return block
+
+
+def make_train(train_id, line, block_number):
+    """Create a minimal train for the map"""
+    train = Mock()
+    train.id = train_id
+    train.line = line
+    train.currentBlock = block_number
+    return train
+
+
+class TestTrackLayoutCache(unittest.TestCase):
+    """Test cases for the content-hashed layout cache"""
+
+    def setUp(self):
+        self.blocks = [make_block(1, (2,)), make_block(2, (1, 3)), make_block(3, (2,), yard=True)]
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, 'layouts', 'test.ui_positions.pkl')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_key_is_stable_for_same_inputs(self):
+        """Test that identical layout inputs give the same key"""
+        copies = [make_block(1, (2,)), make_block(2, (1, 3)), make_block(3, (2,), yard=True)]
+        self.assertEqual(TrackLayoutCache.layout_key('smart', self.blocks, ('Green',)),
+                         TrackLayoutCache.layout_key('smart', copies, ('Green',)))
+
+    def test_key_changes_with_layout_inputs(self):
+        """Test that topology, yard links, parameters and method all invalidate the key"""
+        key = TrackLayoutCache.layout_key('smart', self.blocks, ('Green',))
+        rewired = [make_block(1, (2,)), make_block(2, (1,)), make_block(3, (2,), yard=True)]
+        no_yard = [make_block(1, (2,)), make_block(2, (1, 3)), make_block(3, (2,))]
+        other_keys = [
+            TrackLayoutCache.layout_key('smart', rewired, ('Green',)),
+            TrackLayoutCache.layout_key('smart', no_yard, ('Green',)),
+            TrackLayoutCache.layout_key('smart', self.blocks, ('Red',)),
+            TrackLayoutCache.layout_key('topology', self.blocks, ('Green',)),
+            TrackLayoutCache.layout_key('smart', self.blocks[::-1], ('Green',)),
+        ]
+        for other_key in other_keys:
+            self.assertNotEqual(key, other_key)
+        with patch('CTC.UI.track_visualization.UI_LAYOUT_VERSION', UI_LAYOUT_VERSION + 1):
+            self.assertNotEqual(key, TrackLayoutCache.layout_key('smart', self.blocks, ('Green',)))
+
+    def test_computes_once_and_persists(self):
+        """Test that a layout is computed on the first miss only and reloaded by later sessions"""
+        compute = Mock(return_value={1: {'x': 0, 'y': 0}})
+        cache = TrackLayoutCache(self.cache_path)
+        self.assertEqual(cache.get_or_compute('key', compute), {1: {'x': 0, 'y': 0}})
+        cache.get_or_compute('key', compute)
+        self.assertEqual(compute.call_count, 1)
+
+        reloaded = TrackLayoutCache(self.cache_path)
+        self.assertEqual(reloaded.get_or_compute('key', compute), {1: {'x': 0, 'y': 0}})
+        self.assertEqual(compute.call_count, 1)
+        self.assertEqual(os.listdir(os.path.dirname(self.cache_path)), ['test.ui_positions.pkl'])
+
+    def test_ignores_stale_or_unreadable_files(self):
+        """Test that old-version and corrupt cache files are recomputed"""
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, 'wb') as cache_file:
+            pickle.dump({'version': UI_LAYOUT_VERSION - 1, 'layouts': {'key': 'old'}}, cache_file)
+        self.assertEqual(TrackLayoutCache(self.cache_path).get_or_compute('key', lambda: 'new'), 'new')
+
+        with open(self.cache_path, 'wb') as cache_file:
+            cache_file.write(b'not a pickle')
+        self.assertEqual(TrackLayoutCache(self.cache_path).get_or_compute('key', lambda: 'fresh'), 'fresh')
+
+
+class TestLayoutSpatialIndex(unittest.TestCase):
+    """Test cases for click hit-testing over the map elements"""
+
+    def test_query_matches_linear_scan(self):
+        """Test that the grid returns exactly the boxes containing a point, in insertion order"""
+        rng = random.Random(7)
+        elements = {}
+        index = LayoutSpatialIndex(cell_size=50)
+        for i in range(200):
+            element = {'x': rng.uniform(-300, 300), 'y': rng.uniform(-300, 300),
+                       'width': rng.uniform(1, 120), 'height': rng.uniform(1, 120)}
+            elements[f'e{i}'] = element
+            index.insert(f'e{i}', element)
+
+        for _ in range(500):
+            x, y = rng.uniform(-320, 420), rng.uniform(-320, 420)
+            expected = [element_id for element_id, e in elements.items()
+                        if e['x'] <= x <= e['x'] + e['width'] and e['y'] <= y <= e['y'] + e['height']]
+            self.assertEqual([element_id for element_id, _ in index.query(x, y)], expected)
+
+    def test_box_edges_are_inclusive(self):
+        """Test that points on a box edge hit it, including across cell boundaries"""
+        index = LayoutSpatialIndex(cell_size=50)
+        index.insert('block', {'x': 40, 'y': 40, 'width': 20, 'height': 20})
+        for point in ((40, 40), (60, 60), (50, 45)):
+            self.assertEqual([element_id for element_id, _ in index.query(*point)], ['block'])
+        self.assertEqual(index.query(61, 50), [])
+
+
+class TestTrackVisualizationScene(unittest.TestCase):
+    """Test cases for the retained map scene and click handling"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+        track_file_path = os.path.join(os.path.dirname(__file__), '..', '..',
+                                       'Track_Reader', 'Track Layout & Vehicle Data vF2.xlsx')
+        cls.track_reader = TrackLayoutReader(track_file_path)
+
+    def setUp(self):
+        self.viz = TrackVisualization(self.track_reader)
+        self.viz.position_cache = TrackLayoutCache(None)  # Keep test layouts out of the shared cache
+        self.viz.create_widget()
+        self.viz.update_display('Green', {}, {})
+
+    def test_static_scene_is_retained(self):
+        """Test that train and closure updates reuse the static scene"""
+        self.assertTrue(self.viz.scene['retained'])
+        with patch.object(self.viz, '_build_static_scene') as rebuild:
+            self.viz.update_display('Green', {'G1': make_train('G1', 'Green', 5)}, {'Green': [10]})
+            rebuild.assert_not_called()
+
+        closed, trains = self.viz.scene['state']
+        self.assertEqual(closed, frozenset({('Green', 10)}))
+        self.assertEqual(trains, (('Green', 5, 'G1'),))
+        self.assertTrue(all(artist.get_visible() for artist in self.viz.closure_markers[('Green', 10)]))
+        self.assertTrue(self.viz.train_markers['Green'][0][0].get_visible())
+
+    def test_unchanged_state_skips_repaint(self):
+        """Test that an update with the same trains and closures does not touch the canvas"""
+        trains = {'G1': make_train('G1', 'Green', 5)}
+        self.viz.update_display('Green', trains, {})
+        with patch.object(self.viz.canvas, 'draw') as draw, patch.object(self.viz.canvas, 'blit') as blit:
+            self.viz.update_display('Green', trains, {})
+            draw.assert_not_called()
+            blit.assert_not_called()
+
+    def test_line_change_rebuilds_scene(self):
+        """Test that selecting another line rebuilds the static scene"""
+        self.viz.update_display('Red', {}, {})
+        self.assertEqual(self.viz.scene['key'][0], 'Red')
+        self.assertNotIn(('Green', 10), self.viz.closure_markers)
+
+    def test_click_reports_block_under_cursor(self):
+        """Test that a map click reports the block found by the hit index"""
+        callback = Mock()
+        self.viz.set_click_callback(callback)
+        box = self.viz.interactive_elements['Green_block_5']
+        event = Mock(inaxes=self.viz.scene['ax'], xdata=box['x'] + box['width'] / 2,
+                     ydata=box['y'] + box['height'] / 2)
+
+        self.viz._on_click(event)
+        element_type, element = callback.call_args[0]
+        self.assertEqual(element_type, 'block')
+        self.assertEqual((element['line'], element['block_number']), ('Green', 5))
+
+        callback.reset_mock()
+        self.viz._on_click(Mock(inaxes=None, xdata=None, ydata=None))
+        callback.assert_not_called()
+
+    def test_button_press_reaches_callback(self):
+        """Test that a canvas button press is routed through the hit index to the callback"""
+        callback = Mock()
+        self.viz.set_click_callback(callback)
+        box = self.viz.interactive_elements['Green_block_12']
+        event = Mock(inaxes=self.viz.scene['ax'], xdata=box['x'] + 1, ydata=box['y'] + 1)
+
+        self.viz.canvas.callbacks.process('button_press_event', event)
+        self.assertEqual(callback.call_args[0][1]['block_number'], 12)
+
+if __name__ == '__main__':
+    unittest.main()
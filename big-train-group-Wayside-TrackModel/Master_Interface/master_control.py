@@ -23,6 +23,8 @@ sys.path.insert(0, os.path.join(project_root, 'CTC', 'Core'))
 sys.path.insert(0, os.path.join(project_root, 'Track_Reader'))
 sys.path.insert(0, os.path.join(project_root, 'Wayside_Controller'))
 
+from Track_Model.wayside_store import WaysideFieldStore
+
 # ============================================================================
 # WAYSIDE CONTROLLER CONFIGURATION - Easy to Modify
 # ============================================================================
@@ -300,8 +302,8 @@ class WaysideManager:
                 print("over here wayside")
                 controller.set_track_model_communication_object(CommunicationObject(controller_config["id"], line))
                 
-                # Start the update cycle timer
-                controller.start_update_cycle()
+                # Start the update cycle timer - scan only when inputs change, with a 1 s watchdog
+                controller.start_update_cycle(event_driven=True, watchdog_ms=1000)
                 
                 # Create Track Model CommunicationObject for this wayside
                 from Track_Model.trackmodel_working import CommunicationObject
@@ -358,9 +360,14 @@ class WaysideManager:
 class CommunicationObject:
     """
     Simple Communication interface for Track Model to interact with individual Wayside Controllers.
-    Basic setter/getter only - no validation or computation.
+    Basic setter/getter only - no computation.
     
     Array Structure: Index 0 = G0 (Yard), Index 1 = G1, ..., Index 150 = G150 (151 total elements)
+    
+    Values are kept in a WaysideFieldStore (one typed integer column per field).
+    Setters accept lists of ints/bools or bit strings; getters return lists of ints.
+    getFieldView() gives a zero-copy read-only array for bulk readers, and
+    getVersion() changes whenever a stored value does.
     """
     
     def __init__(self, wayside_id: str, wayside_line: str = "Green"):
@@ -378,89 +385,99 @@ class CommunicationObject:
             block_length = 151
         elif wayside_line == "Red":
             block_length = 77
-        # Initialize all data arrays with default values (151 elements: G0-G150)
-        self._wayside_blocks_covered = ["0"] * block_length     # 1-bit: determines which blocks this wayside manages
-        self._next_block_numbers = ["0000000"] * block_length    # 7-bit: next block numbers
-        self._next_station_numbers = ["00000"] * block_length    # 5-bit: next station numbers
-        self._update_block_in_queue = ["0"] * block_length       # 1-bit: update block in queue
-        self._wayside_authority = ["0"] * block_length           # 1-bit: authority for each block
-        self._wayside_commanded_speed = ["00"] * block_length    # 2-bit: commanded speed
-        self._switch_states = ["0"] * block_length               # 1-bit: switch states
-        self._traffic_light_states = ["0"] * block_length        # 1-bit: traffic light states
-        self._crossing_states = ["0"] * block_length             # 1-bit: crossing states
+        # All data fields default to 0 (151 elements: G0-G150 on the Green line)
+        # blocks_covered 1-bit, next_block_number 7-bit, next_station_number 5-bit,
+        # update_block_in_queue 1-bit, authority 1-bit, commanded_speed 2-bit,
+        # switch_state / traffic_light_state / crossing_state 1-bit
+        self._fields = WaysideFieldStore(block_length)
         print(f"CommunicationObject initialized for Wayside {wayside_id} on {wayside_line} line")
     
+    def _set_field(self, field, values):
+        """Store a list of ints/bools or bit strings in a field column"""
+        if len(values) and isinstance(values[0], str):
+            self._fields.set_bits_list(field, values)
+        else:
+            self._fields.set_values(field, values)
+    
+    def getFieldView(self, field):
+        """Get a read-only zero-copy array of a field (e.g. 'switch_state') for all blocks"""
+        return self._fields.view(field)
+    
+    def getVersion(self):
+        """Get a counter that changes whenever any stored field value changes"""
+        return self._fields.version
+    
     # === WAYSIDE BLOCKS COVERED ===
     
     def setWaysideBlocksCovered(self, blocks_covered_list):
-        self._wayside_blocks_covered = blocks_covered_list
+        self._set_field('blocks_covered', blocks_covered_list)
     
     def getWaysideBlocksCovered(self):
-        return self._wayside_blocks_covered
+        return self._fields.get_values('blocks_covered')
     
     # === AUTHORITY ===
     
     def setAuthorities(self, authorities_list):
-        self._wayside_authority = authorities_list
+        self._set_field('authority', authorities_list)
     
     def getWaysideAuthority(self):
-        return self._wayside_authority
+        return self._fields.get_values('authority')
     
     # === COMMANDED SPEED ===
     
     def setCommandedSpeeds(self, speeds_list):
-        self._wayside_commanded_speed = speeds_list
+        self._set_field('commanded_speed', speeds_list)
     
     def getWaysideCommandedSpeed(self):
-        return self._wayside_commanded_speed
+        return self._fields.get_values('commanded_speed')
     
     # === NEXT BLOCK NUMBERS ===
     
     def setNextBlockNumbers(self, next_blocks_list):
-        self._next_block_numbers = next_blocks_list
+        self._set_field('next_block_number', next_blocks_list)
     
     def getNextBlockNumbers(self):
-        return self._next_block_numbers
+        return self._fields.get_values('next_block_number')
     
     # === NEXT STATION NUMBERS ===
     
     def setNextStationNumbers(self, next_stations_list):
-        self._next_station_numbers = next_stations_list
+        self._set_field('next_station_number', next_stations_list)
     
     def getNextStationNumbers(self):
-        return self._next_station_numbers
+        return self._fields.get_values('next_station_number')
     
     # === UPDATE BLOCK IN QUEUE ===
     
     def setUpdateBlockInQueue(self, update_queue_list):
-        self._update_block_in_queue = update_queue_list
+        self._set_field('update_block_in_queue', update_queue_list)
     
     def getUpdateBlockInQueue(self):
-        return self._update_block_in_queue
+        return self._fields.get_values('update_block_in_queue')
     
     # === SWITCH STATES ===
     
     def setSwitchStates(self, switch_states_list):
-        self._switch_states = switch_states_list
+        self._set_field('switch_state', switch_states_list)
     
     def getSwitchStates(self):
-        return self._switch_states
+        return self._fields.get_values('switch_state')
     
     # === TRAFFIC LIGHT STATES ===
     
     def setTrafficLightStates(self, traffic_light_list):
-        self._traffic_light_states = traffic_light_list
+        self._set_field('traffic_light_state', traffic_light_list)
     
     def getTrafficLightStates(self):
-        return self._traffic_light_states
+        return self._fields.get_values('traffic_light_state')
     
     # === CROSSING STATES ===
     
     def setCrossingStates(self, crossing_states_list):
-        self._crossing_states = crossing_states_list
+        self._set_field('crossing_state', crossing_states_list)
     
     def getCrossingStates(self):
-        return self._crossing_states
+        return self._fields.get_values('crossing_state')
     
     # === BLOCK OCCUPANCY ===
     
@@ -913,11 +930,12 @@ class MasterInterface(QMainWindow):
         if self.ctc_interface and hasattr(self.ctc_interface, 'ctc_system'):
             try:
                 # Import track reader for wayside setup
-                from Track_Reader.track_reader import TrackLayoutReader
+                from Track_Reader.track_reader import get_shared_track_reader
                 
+                # Same file and lines as the CTC, so this reuses the CTC's parsed layout
                 track_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
                                         "Track_Reader", "Track Layout & Vehicle Data vF2.xlsx")
-                track_reader = TrackLayoutReader(track_file)
+                track_reader = get_shared_track_reader(track_file, selected_lines=self.selected_lines)
                 print("Track reader loaded.")
                 
                 # Setup wayside controllers
@@ -1,4 +1,21 @@
 import csv
+import numpy as np
+from wayside_store import WaysideFieldStore
+
+GREEN_LINE_BLOCKS = 151
+
+# Value returned for blocks outside G0-G150 (matches the old per-field string defaults)
+WAYSIDE_FIELD_DEFAULTS = {
+    'next_block_number': 0,
+    'next_station_number': 19,
+    'update_block_in_queue': 0,
+    'authority': 0,
+    'commanded_speed': 0,
+    'switch_state': 0,
+    'traffic_light_state': 0,
+    'crossing_state': 0,
+    'blocks_covered': 0
+}
 
 class TrackModelInputs:
     """
@@ -17,16 +34,10 @@ class TrackModelInputs:
         self._power_failure = {}            # {block_id: bool}
 
         # Wayside Controller Inputs (Green Line G0-G150)
-        # Each block has wayside data as bit strings
-        self._next_block_numbers = {}       # {block_id: str} - 7-bit strings
-        self._next_station_numbers = {}     # {block_id: str} - 5-bit strings
-        self._update_block_in_queue = {}    # {block_id: str} - 1-bit strings
-        self._wayside_authority = {}        # {block_id: str} - 1-bit strings
-        self._wayside_commanded_speed = {}  # {block_id: str} - 2-bit strings
-        self._switch_states = {}            # {block_id: str} - 1-bit strings
-        self._traffic_light_states = {}     # {block_id: str} - 1-bit strings
-        self._crossing_states = {}          # {block_id: str} - 1-bit strings
-        self._wayside_blocks_covered = {}   # {block_id: str} - 1-bit strings
+        # Stored as typed per-block columns; the bit-string getters/setters below
+        # format and parse on access
+        self._wayside_fields = WaysideFieldStore(GREEN_LINE_BLOCKS)
+        self._other_block_fields = {}       # {(field, block_id): int} - blocks outside G0-G150
         
         # Initialize dummy data for Green Line blocks G0-G150
         self._initialize_wayside_dummy_data()    
@@ -69,136 +80,152 @@ class TrackModelInputs:
     def set_power_failure(self, block_id, value: bool):
         self._power_failure[block_id] = bool(value)
 
+    def get_failed_blocks(self):
+        """Return the sets of block IDs with power, broken rail and track circuit failures."""
+        return (
+            {block_id for block_id, failed in self._power_failure.items() if failed},
+            {block_id for block_id, failed in self._broken_rail_failure.items() if failed},
+            {block_id for block_id, failed in self._track_circuit_failure.items() if failed}
+        )
+
 
     # --- Wayside Controller Inputs (per block bit strings) ---
     
     def _initialize_wayside_dummy_data(self):
         """Initialize dummy data for Green Line blocks G0-G150"""
-        # Create sample datasets with different patterns for testing
-        for block_num in range(151):  # G0 to G150
-            block_id = f"G{block_num}"
-            
-            # Sample patterns based on block number for variety
-            if block_num == 0:  # Yard block
-                self._next_block_numbers[block_id] = "0000001"    # 7-bit: next block 1
-                self._next_station_numbers[block_id] = "10011"    # 5-bit: station 19
-                self._update_block_in_queue[block_id] = "0"       # 1-bit: no update
-                self._wayside_authority[block_id] = "1"           # 1-bit: authorized
-                self._wayside_commanded_speed[block_id] = "00"    # 2-bit: stop
-                self._switch_states[block_id] = "0"               # 1-bit: lower block
-                self._traffic_light_states[block_id] = "0"        # 1-bit: green
-                self._crossing_states[block_id] = "0"             # 1-bit: inactive
-                self._wayside_blocks_covered[block_id] = "1"      # 1-bit: covered
-            elif block_num % 20 == 0:  # Station blocks (every 20th block)
-                next_block = min(block_num + 1, 150)
-                station_num = (block_num // 20) % 32  # Cycle through station numbers
-                self._next_block_numbers[block_id] = f"{next_block:07b}"
-                self._next_station_numbers[block_id] = f"{station_num:05b}"
-                self._update_block_in_queue[block_id] = "0"
-                self._wayside_authority[block_id] = "1"
-                self._wayside_commanded_speed[block_id] = "01"    # Slow speed at stations
-                self._switch_states[block_id] = "0"
-                self._traffic_light_states[block_id] = "0"        # Green at stations
-                self._crossing_states[block_id] = "0"
-                self._wayside_blocks_covered[block_id] = "1"
-            elif block_num % 15 == 0:  # Switch blocks (every 15th block)
-                next_block = min(block_num + 1, 150)
-                self._next_block_numbers[block_id] = f"{next_block:07b}"
-                self._next_station_numbers[block_id] = "11111"    # No immediate station
-                self._update_block_in_queue[block_id] = "0"
-                self._wayside_authority[block_id] = "1"
-                self._wayside_commanded_speed[block_id] = "10"    # Medium speed
-                self._switch_states[block_id] = "1"               # Higher block direction
-                self._traffic_light_states[block_id] = "0"
-                self._crossing_states[block_id] = "0"
-                self._wayside_blocks_covered[block_id] = "1"
-            elif block_num % 25 == 0:  # Crossing blocks (every 25th block)
-                next_block = min(block_num + 1, 150)
-                self._next_block_numbers[block_id] = f"{next_block:07b}"
-                self._next_station_numbers[block_id] = "11111"
-                self._update_block_in_queue[block_id] = "0"
-                self._wayside_authority[block_id] = "1"
-                self._wayside_commanded_speed[block_id] = "01"    # Slow at crossings
-                self._switch_states[block_id] = "0"
-                self._traffic_light_states[block_id] = "1"        # Red at crossings
-                self._crossing_states[block_id] = "1"             # Active crossing
-                self._wayside_blocks_covered[block_id] = "1"
-            else:  # Regular blocks
-                next_block = min(block_num + 1, 150)
-                self._next_block_numbers[block_id] = f"{next_block:07b}"
-                self._next_station_numbers[block_id] = "11111"    # No immediate station
-                self._update_block_in_queue[block_id] = "0"
-                self._wayside_authority[block_id] = "1"
-                self._wayside_commanded_speed[block_id] = "11"    # Full speed
-                self._switch_states[block_id] = "0"
-                self._traffic_light_states[block_id] = "0"        # Green
-                self._crossing_states[block_id] = "0"
-                self._wayside_blocks_covered[block_id] = "1"
+        # Sample patterns based on block number for variety
+        blocks = np.arange(GREEN_LINE_BLOCKS)
+        station_blocks = (blocks % 20 == 0) & (blocks != 0)                   # Every 20th block
+        switch_blocks = (blocks % 15 == 0) & ~station_blocks & (blocks != 0)  # Every 15th block
+        crossing_blocks = (blocks % 25 == 0) & ~station_blocks & ~switch_blocks & (blocks != 0)  # Every 25th block
+        
+        next_blocks = np.minimum(blocks + 1, GREEN_LINE_BLOCKS - 1)
+        next_blocks[0] = 1                                                  # Yard: next block 1
+        
+        next_stations = np.full(GREEN_LINE_BLOCKS, 31)                      # No immediate station
+        next_stations[0] = 19                                               # Yard: station 19
+        next_stations[station_blocks] = (blocks[station_blocks] // 20) % 32 # Cycle through station numbers
+        
+        speeds = np.full(GREEN_LINE_BLOCKS, 3)                              # Full speed
+        speeds[0] = 0                                                       # Stop in yard
+        speeds[station_blocks | crossing_blocks] = 1                        # Slow at stations and crossings
+        speeds[switch_blocks] = 2                                           # Medium at switches
+        
+        fields = self._wayside_fields
+        fields.set_values('next_block_number', next_blocks)
+        fields.set_values('next_station_number', next_stations)
+        fields.set_values('update_block_in_queue', np.zeros(GREEN_LINE_BLOCKS))   # No updates
+        fields.set_values('authority', np.ones(GREEN_LINE_BLOCKS))                # All authorized
+        fields.set_values('commanded_speed', speeds)
+        fields.set_values('switch_state', switch_blocks)                          # Higher block at switches
+        fields.set_values('traffic_light_state', crossing_blocks)                 # Red at crossings
+        fields.set_values('crossing_state', crossing_blocks)                      # Active crossings
+        fields.set_values('blocks_covered', np.ones(GREEN_LINE_BLOCKS))           # All covered
+
+    def _get_block_index(self, block_id):
+        """Get the column index for a block ID like "G12" (None if not a Green Line block)"""
+        if isinstance(block_id, int):
+            index = block_id
+        elif isinstance(block_id, str) and block_id[:1] == "G" and block_id[1:].isdigit():
+            index = int(block_id[1:])
+        else:
+            return None
+        return index if 0 <= index < GREEN_LINE_BLOCKS else None
+
+    def _get_bits(self, field, block_id):
+        index = self._get_block_index(block_id)
+        if index is None:
+            value = self._other_block_fields.get((field, block_id), WAYSIDE_FIELD_DEFAULTS[field])
+            return self._wayside_fields.format_bits(field, value)
+        return self._wayside_fields.get_bits(field, index)
+
+    def _set_bits(self, field, block_id, value, length):
+        # Invalid values are ignored, as before
+        if not isinstance(value, str) or len(value) != length or not all(c in '01' for c in value):
+            return
+        index = self._get_block_index(block_id)
+        if index is None:
+            self._other_block_fields[(field, block_id)] = int(value, 2)
+        else:
+            self._wayside_fields.set_bits(field, index, value)
+
+    def has_wayside_data(self, block_id):
+        """Check whether wayside data has been stored for a block ID"""
+        if self._get_block_index(block_id) is not None:
+            return True
+        return ('authority', block_id) in self._other_block_fields
+
+    # Typed access for wayside data (no bit-string parsing)
+    def get_wayside_value(self, field, block_id):
+        """Get one block's wayside field as an int (e.g. 'commanded_speed' -> 0-3)"""
+        index = self._get_block_index(block_id)
+        if index is None:
+            return self._other_block_fields.get((field, block_id), WAYSIDE_FIELD_DEFAULTS[field])
+        return self._wayside_fields.get_value(field, index)
+
+    def get_wayside_values(self, field):
+        """Get a read-only zero-copy array of a wayside field for all blocks G0-G150"""
+        return self._wayside_fields.view(field)
+
+    def set_wayside_values(self, field, values, mask=None):
+        """Set a wayside field for all blocks G0-G150 from ints/bools (optionally masked)"""
+        self._wayside_fields.set_values(field, values, mask)
 
     # Getter methods for wayside data
     def get_next_block_number(self, block_id):
-        return self._next_block_numbers.get(block_id, "0000000")
+        return self._get_bits('next_block_number', block_id)
     
     def get_next_station_number(self, block_id):
-        return self._next_station_numbers.get(block_id, "10011")
+        return self._get_bits('next_station_number', block_id)
     
     def get_update_block_in_queue(self, block_id):
-        return self._update_block_in_queue.get(block_id, "0")
+        return self._get_bits('update_block_in_queue', block_id)
     
     def get_wayside_authority(self, block_id):
-        return self._wayside_authority.get(block_id, "0")
+        return self._get_bits('authority', block_id)
     
     def get_wayside_commanded_speed(self, block_id):
-        return self._wayside_commanded_speed.get(block_id, "00")
+        return self._get_bits('commanded_speed', block_id)
     
     def get_switch_state(self, block_id):
-        return self._switch_states.get(block_id, "0")
+        return self._get_bits('switch_state', block_id)
     
     def get_traffic_light_state(self, block_id):
-        return self._traffic_light_states.get(block_id, "0")
+        return self._get_bits('traffic_light_state', block_id)
     
     def get_crossing_state(self, block_id):
-        return self._crossing_states.get(block_id, "0")
+        return self._get_bits('crossing_state', block_id)
     
     def get_wayside_blocks_covered(self, block_id):
-        return self._wayside_blocks_covered.get(block_id, "0")
+        return self._get_bits('blocks_covered', block_id)
 
     # Setter methods for wayside data
     def set_next_block_number(self, block_id, value: str):
-        if len(value) == 7 and all(c in '01' for c in value):
-            self._next_block_numbers[block_id] = value
+        self._set_bits('next_block_number', block_id, value, 7)
     
     def set_next_station_number(self, block_id, value: str):
-        if len(value) == 5 and all(c in '01' for c in value):
-            self._next_station_numbers[block_id] = value
+        self._set_bits('next_station_number', block_id, value, 5)
     
     def set_update_block_in_queue(self, block_id, value: str):
-        if len(value) == 1 and value in '01':
-            self._update_block_in_queue[block_id] = value
+        self._set_bits('update_block_in_queue', block_id, value, 1)
     
     def set_wayside_authority(self, block_id, value: str):
-        if len(value) == 1 and value in '01':
-            self._wayside_authority[block_id] = value
+        self._set_bits('authority', block_id, value, 1)
     
     def set_wayside_commanded_speed(self, block_id, value: str):
-        if len(value) == 2 and all(c in '01' for c in value):
-            self._wayside_commanded_speed[block_id] = value
+        self._set_bits('commanded_speed', block_id, value, 2)
     
     def set_switch_state(self, block_id, value: str):
-        if len(value) == 1 and value in '01':
-            self._switch_states[block_id] = value
+        self._set_bits('switch_state', block_id, value, 1)
     
     def set_traffic_light_state(self, block_id, value: str):
-        if len(value) == 1 and value in '01':
-            self._traffic_light_states[block_id] = value
+        self._set_bits('traffic_light_state', block_id, value, 1)
     
     def set_crossing_state(self, block_id, value: str):
-        if len(value) == 1 and value in '01':
-            self._crossing_states[block_id] = value
+        self._set_bits('crossing_state', block_id, value, 1)
     
     def set_wayside_blocks_covered(self, block_id, value: str):
-        if len(value) == 1 and value in '01':
-            self._wayside_blocks_covered[block_id] = value
+        self._set_bits('blocks_covered', block_id, value, 1)
 
     def set_train_manager(self, train_manager):
         """Set reference to train manager for yard buffer processing"""
@@ -2,17 +2,20 @@ import sys
 import os
 import threading
 import time  # Keep for performance timing only
+import numpy as np
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QFrame, QFileDialog, QPushButton, QComboBox, QTextEdit, QSizePolicy,
     QLineEdit, QMessageBox, QScrollArea, QTabWidget
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QRect, QRectF
+from PyQt5.QtGui import QPainter, QPen, QColor, QFont
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from Track_Reader.track_reader import TrackLayoutReader, TrackBlock
+from Track_Reader.track_reader import TrackLayoutReader, TrackBlock, get_shared_track_reader
 from Inputs import TrackModelInputs
+from wayside_store import WaysideFieldStore
 from Outputs import get_16bit_track_model_output  # Import from Outputs.py
 
 # Master Interface Time Integration
@@ -656,7 +659,7 @@ class DebugWindow(QWidget):
             return ", ".join(active) if active else "None"
 
         # Use selected block if provided, otherwise show sample blocks
-        if selected_block_id and selected_block_id in self.inputs._wayside_authority:
+        if selected_block_id and self.inputs.has_wayside_data(selected_block_id):
             # Show detailed data for the selected block
             block_id = selected_block_id
             auth = self.inputs.get_wayside_authority(block_id)
@@ -689,7 +692,7 @@ class DebugWindow(QWidget):
             sample_blocks = ["G0", "G20", "G40", "G60"]
             wayside_summary = ""
             for block_id in sample_blocks:
-                if block_id in self.inputs._wayside_authority:
+                if self.inputs.has_wayside_data(block_id):
                     auth = self.inputs.get_wayside_authority(block_id)
                     speed = self.inputs.get_wayside_commanded_speed(block_id)
                     next_blk = self.inputs.get_next_block_number(block_id)
@@ -1040,123 +1043,191 @@ class TrainInfoPanel(QWidget):
         except Exception as e:
             self.label.setText(f"Error updating train {self.selected_train_id}: {str(e)}")
 
-# --- Clickable Block ---
-class ClickableBox(QFrame):
-    def __init__(self, block: TrackBlock, info_panel: QWidget, main_window, inputs: TrackModelInputs):
-        super().__init__()
-        self.block = block
-        self.info_panel = info_panel
-        self.main_window = main_window
-        self.inputs = inputs
-        self.block_id_str = f"{self.block.line[0].upper()}{self.block.block_number}"
-        self.setFixedSize(30, 30)
-        # Only display the block number (no R/G) for visibility
-        self.label = QLabel(str(self.block.block_number))
-        self.label.setAlignment(Qt.AlignCenter)
-        # Smaller, bold, black text with subtle white shadow for contrast
-        self.label.setStyleSheet(
-            "font-size: 9pt; font-family: Arial; font-weight: bold; color: #000000;"
-        )
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.label)
-        self.setLayout(layout)
-        self.setFrameShape(QFrame.StyledPanel)
-        self.set_failure_color()
+# --- Track Block Grid ---
+BLOCK_SIZE = 30       # Block square size in pixels
+BLOCK_SPACING = 40    # Distance between block origins
+GRID_COLUMNS = 10
+GRID_MARGIN = 10
 
-    def mousePressEvent(self, event):
-        self.info_panel.update_info(self.block, self.inputs)
-        self.main_window.set_selected_block(self)
-        # Update debug window immediately for the selected block
-        self.main_window.debug_window.update_for_block(self.block_id_str)
-        
-        # Debug: Confirm GUI is getting correct block data
-        DebugWindow.print_to_terminal(f"Block {self.block_id_str} selected - Loading wayside data...")
-        auth = self.inputs.get_wayside_authority(self.block_id_str)
-        speed = self.inputs.get_wayside_commanded_speed(self.block_id_str)
-        DebugWindow.print_to_terminal(f"Block {self.block_id_str}: Authority={auth}, Speed={speed}")
+class TrackGridBlock:
+    """Handle for one block in the TrackGridWidget (used as the selected block)"""
+
+    def __init__(self, grid, index: int):
+        self.grid = grid
+        self.index = index
+        self.block = grid.blocks[index]
+        self.block_id_str = grid.block_ids[index]
 
     def set_failure(self, failure_type, failed):
         bid = self.block_id_str
         if failure_type == 'power':
-            self.inputs.set_power_failure(bid, failed)
+            self.grid.inputs.set_power_failure(bid, failed)
         elif failure_type == 'broken_rail':
-            self.inputs.set_broken_rail_failure(bid, failed)
+            self.grid.inputs.set_broken_rail_failure(bid, failed)
         elif failure_type == 'track_circuit':
-            self.inputs.set_track_circuit_failure(bid, failed)
-        self.set_failure_color()
+            self.grid.inputs.set_track_circuit_failure(bid, failed)
+        self.grid.refresh_colors([self.index])
 
-    def set_failure_color(self):
-        bid = self.block_id_str
-        
-        # Special handling for yard block (G0)
-        if self.block.block_number == 0:
-            self._set_yard_color()
-            return
-        
-        # Check for train occupancy first
-        train_occupied = False
-        if hasattr(self.main_window, 'train_manager') and self.main_window.train_manager:
-            if bid in self.main_window.train_manager.block_info_objects:
-                block_info = self.main_window.train_manager.block_info_objects[bid]
-                if block_info.current_train_id:
-                    train_occupied = True
-        
-        # Set color based on status
-        if train_occupied:
-            color = "#808080"  # Grey for train occupancy
-        elif self.inputs.get_power_failure(bid):
-            color = "#FB8C00"  # Orange for power failure
-        elif self.inputs.get_broken_rail_failure(bid):
-            color = "#FFA726"  # Light orange for broken rail
-        elif self.inputs.get_track_circuit_failure(bid):
-            color = "#FF9800"  # Amber for track circuit failure
-        else:
-            # Default line colors
-            color = "#4CAF50" if self.block.line.lower() == "green" else "#f44336" if self.block.line.lower() == "red" else "salmon"
-            
-        self.setStyleSheet(
-            f"background-color: {color}; border: 0.5px solid #222; "
-            "border-radius: 4px; "
-        )
-        
-    def _set_yard_color(self):
-        """Set special yard block coloring"""
-        bid = self.block_id_str
-        
-        # Check for trains staged in yard
+class TrackGridWidget(QWidget):
+    """
+    Single custom-painted widget for the block grid.
+    Keeps a color per block and the cached rectangle of every block, repaints
+    only the rectangles of blocks whose color changed and hit-tests clicks
+    with grid arithmetic instead of one QFrame per block.
+    """
+
+    def __init__(self, info_panel: QWidget, main_window, inputs: TrackModelInputs):
+        super().__init__()
+        self.info_panel = info_panel
+        self.main_window = main_window
+        self.inputs = inputs
+        self.blocks = []        # TrackBlock per grid cell
+        self.block_ids = []     # "G12" style ID per grid cell
+        self.block_rects = []   # Cached QRect per grid cell
+        self.block_colors = []  # Current fill color per grid cell
+        self.index_by_id = {}   # {block_id: grid cell index}
+        self.block_font = QFont("Arial", 9, QFont.Bold)
+        # Every paint fills its whole dirty rectangle, so Qt can skip erasing it
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def set_blocks(self, blocks):
+        """Lay out a new set of blocks and repaint the whole grid"""
+        self.blocks = list(blocks)
+        self.block_ids = [f"{blk.line[0].upper()}{blk.block_number}" for blk in self.blocks]
+        self.index_by_id = {bid: i for i, bid in enumerate(self.block_ids)}
+        self.block_rects = [
+            QRect(GRID_MARGIN + (i % GRID_COLUMNS) * BLOCK_SPACING,
+                  GRID_MARGIN + (i // GRID_COLUMNS) * BLOCK_SPACING,
+                  BLOCK_SIZE, BLOCK_SIZE)
+            for i in range(len(self.blocks))
+        ]
+        self.block_colors = [None] * len(self.blocks)
+        self.refresh_colors()
+        self.update()
+
+    def block_at(self, pos):
+        """Return the grid cell index under a point, or -1"""
+        col = (pos.x() - GRID_MARGIN) // BLOCK_SPACING
+        row = (pos.y() - GRID_MARGIN) // BLOCK_SPACING
+        if pos.x() < GRID_MARGIN or pos.y() < GRID_MARGIN or col >= GRID_COLUMNS:
+            return -1
+        index = row * GRID_COLUMNS + col
+        if index < len(self.blocks) and self.block_rects[index].contains(pos):
+            return index
+        return -1
+
+    def refresh_block_ids(self, block_ids):
+        """Recolor blocks by ID (IDs not shown in the grid are ignored)"""
+        indexes = [self.index_by_id[bid] for bid in block_ids if bid in self.index_by_id]
+        if indexes:
+            self.refresh_colors(indexes)
+
+    def refresh_colors(self, indexes=None):
+        """
+        Recompute block colors and repaint only the blocks whose color changed.
+        Failure and occupancy state is gathered once per call, not per block.
+        """
+        if indexes is None:
+            indexes = range(len(self.blocks))
+        power, broken_rail, track_circuit = self.inputs.get_failed_blocks()
+        occupied = set()
+        train_manager = getattr(self.main_window, 'train_manager', None)
+        if train_manager:
+            occupied = {bid for bid, info in train_manager.block_info_objects.items() if info.current_train_id}
+
+        for i in indexes:
+            bid = self.block_ids[i]
+            if self.blocks[i].block_number == 0:
+                color = self._yard_color(bid, power, broken_rail, track_circuit)
+            elif bid in occupied:
+                color = "#808080"  # Grey for train occupancy
+            elif bid in power:
+                color = "#FB8C00"  # Orange for power failure
+            elif bid in broken_rail:
+                color = "#FFA726"  # Light orange for broken rail
+            elif bid in track_circuit:
+                color = "#FF9800"  # Amber for track circuit failure
+            else:
+                # Default line colors
+                line = self.blocks[i].line.lower()
+                color = "#4CAF50" if line == "green" else "#f44336" if line == "red" else "salmon"
+
+            if color != self.block_colors[i]:
+                self.block_colors[i] = color
+                self.update(self.block_rects[i])
+
+    def _yard_color(self, bid, power, broken_rail, track_circuit):
+        """Yard color logic: buffer activity > train staging > failures > default"""
         trains_in_yard = 0
         yard_buffer_active = False
-        
-        if hasattr(self.main_window, 'train_manager') and self.main_window.train_manager:
-            trains_in_yard = len(getattr(self.main_window.train_manager, 'trains_in_yard', []))
-            
+
+        train_manager = getattr(self.main_window, 'train_manager', None)
+        if train_manager:
+            trains_in_yard = len(getattr(train_manager, 'trains_in_yard', []))
+
             # Check yard buffer status
-            yard_buffer = self.main_window.train_manager.yard_buffer
+            yard_buffer = train_manager.yard_buffer
             if yard_buffer and (yard_buffer.current_buffer or yard_buffer.is_complete):
                 yard_buffer_active = True
-        
-        # Yard color logic: buffer activity > train staging > failures > default
+
         if yard_buffer_active:
-            color = "#FFD700"  # Gold for active yard buffer
+            return "#FFD700"  # Gold for active yard buffer
         elif trains_in_yard > 0:
-            color = "#87CEEB"  # Sky blue for staged trains
-        elif self.inputs.get_power_failure(bid):
-            color = "#FB8C00"  # Orange for power failure
-        elif self.inputs.get_broken_rail_failure(bid):
-            color = "#FFA726"  # Light orange for broken rail
-        elif self.inputs.get_track_circuit_failure(bid):
-            color = "#FF9800"  # Amber for track circuit failure
-        else:
-            color = "#E0E0E0"  # Light grey for empty yard
-            
-        # Special yard styling with bold border
-        self.setStyleSheet(
-            f"background-color: {color}; border: 2px solid #333; "
-            "border-radius: 6px; font-weight: bold;"
-        )
-        # Only show the block number (no R/G) for clarity  
-        self.label.setText(str(self.block.block_number))
+            return "#87CEEB"  # Sky blue for staged trains
+        elif bid in power:
+            return "#FB8C00"  # Orange for power failure
+        elif bid in broken_rail:
+            return "#FFA726"  # Light orange for broken rail
+        elif bid in track_circuit:
+            return "#FF9800"  # Amber for track circuit failure
+        return "#E0E0E0"  # Light grey for empty yard
+
+    def paintEvent(self, event):
+        dirty = event.rect()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(dirty, Qt.white)
+        painter.setFont(self.block_font)
+
+        # Only blocks in the grid rows touched by the dirty rectangle need drawing
+        first_row = max(0, (dirty.top() - GRID_MARGIN) // BLOCK_SPACING)
+        last_row = max(0, (dirty.bottom() - GRID_MARGIN) // BLOCK_SPACING)
+        first = first_row * GRID_COLUMNS
+        last = min(len(self.blocks), (last_row + 1) * GRID_COLUMNS)
+
+        for i in range(first, last):
+            rect = self.block_rects[i]
+            if not rect.intersects(dirty):
+                continue
+            if self.blocks[i].block_number == 0:
+                # Special yard styling with bold border
+                painter.setPen(QPen(QColor("#333333"), 2))
+                radius = 6
+            else:
+                painter.setPen(QPen(QColor("#222222"), 1))
+                radius = 4
+            painter.setBrush(QColor(self.block_colors[i]))
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius)
+            # Only display the block number (no R/G) for visibility
+            painter.setPen(Qt.black)
+            painter.drawText(rect, Qt.AlignCenter, str(self.blocks[i].block_number))
+        painter.end()
+
+    def mousePressEvent(self, event):
+        index = self.block_at(event.pos())
+        if index < 0:
+            return
+        selected = TrackGridBlock(self, index)
+        self.info_panel.update_info(selected.block, self.inputs)
+        self.main_window.set_selected_block(selected)
+        # Update debug window immediately for the selected block
+        self.main_window.debug_window.update_for_block(selected.block_id_str)
+
+        # Debug: Confirm GUI is getting correct block data
+        DebugWindow.print_to_terminal(f"Block {selected.block_id_str} selected - Loading wayside data...")
+        auth = self.inputs.get_wayside_authority(selected.block_id_str)
+        speed = self.inputs.get_wayside_commanded_speed(selected.block_id_str)
+        DebugWindow.print_to_terminal(f"Block {selected.block_id_str}: Authority={auth}, Speed={speed}")
 
 # --- Train Integration Classes ---
 class YardTrackBlock:
@@ -1193,9 +1264,8 @@ class BlockInfo:
         
         # Update from wayside data
         block_id = f"{track_block.line[0].upper()}{track_block.block_number}"
-        self.authorized_to_go = wayside_inputs.get_wayside_authority(block_id) == "1"
-        speed_bits = wayside_inputs.get_wayside_commanded_speed(block_id)
-        self.commanded_speed = int(speed_bits, 2) if speed_bits and len(speed_bits) == 2 else 0
+        self.authorized_to_go = wayside_inputs.get_wayside_value('authority', block_id) == 1
+        self.commanded_speed = wayside_inputs.get_wayside_value('commanded_speed', block_id)
         
         # Store reference for updates
         self.track_block = track_block
@@ -1205,9 +1275,8 @@ class BlockInfo:
     def update_from_wayside(self):
         """Update BlockInfo from current wayside data"""
         block_id = f"{self.track_block.line[0].upper()}{self.track_block.block_number}"
-        self.authorized_to_go = self.wayside_inputs.get_wayside_authority(block_id) == "1"
-        speed_bits = self.wayside_inputs.get_wayside_commanded_speed(block_id)
-        self.commanded_speed = int(speed_bits, 2) if speed_bits and len(speed_bits) == 2 else 0
+        self.authorized_to_go = self.wayside_inputs.get_wayside_value('authority', block_id) == 1
+        self.commanded_speed = self.wayside_inputs.get_wayside_value('commanded_speed', block_id)
         
     def set_train_occupancy(self, train_id: str = None):
         """Set which train is currently on this block"""
@@ -1456,15 +1525,7 @@ class TrainManager:
         for i in range(4):
             # Get next block number from wayside data
             block_id = f"G{current_block}"
-            next_block_bits = self.inputs.get_next_block_number(block_id)
-            
-            try:
-                # Convert 7-bit string to integer
-                next_block_num = int(next_block_bits, 2) if next_block_bits else current_block + 1
-            except ValueError:
-                # Fallback to sequential if wayside data is invalid
-                next_block_num = current_block + 1
-                DebugTerminal.log(f"Invalid wayside next block data for {block_id}, using {next_block_num}")
+            next_block_num = self.inputs.get_wayside_value('next_block_number', block_id)
             
             # Get TrackBlock from track layout using correct .lines access pattern
             track_block = None
@@ -1642,16 +1703,14 @@ class TrainManager:
                 fourth_block_ahead = self._get_fourth_block_ahead(current_block_num)
                 
                 # Get wayside data for train's current position
-                authority = self.inputs.get_wayside_authority(current_block_id) == "1"
-                speed_bits = self.inputs.get_wayside_commanded_speed(current_block_id)
-                speed_cmd = int(speed_bits, 2) if speed_bits and len(speed_bits) == 2 else 0
+                authority = self.inputs.get_wayside_value('authority', current_block_id) == 1
+                speed_cmd = self.inputs.get_wayside_value('commanded_speed', current_block_id)
                 
                 # Debug: Log packet details
-                DebugTerminal.log(f"Train {train_id} at {current_block_id}: 4th_ahead={fourth_block_ahead}, speed_bits={speed_bits}, speed_cmd={speed_cmd}, auth={authority}")
+                DebugTerminal.log(f"Train {train_id} at {current_block_id}: 4th_ahead={fourth_block_ahead}, speed_cmd={speed_cmd}, auth={authority}")
                 
                 # Get station info
-                station_bits = self.inputs.get_next_station_number(current_block_id)
-                station_num = int(station_bits, 2) if station_bits and len(station_bits) == 5 else 0
+                station_num = self.inputs.get_wayside_value('next_station_number', current_block_id)
                 
                 # Create and send packet with 4th block ahead
                 DebugTerminal.log(f"Creating packet: block_ahead={fourth_block_ahead}, speed_cmd={speed_cmd}, auth={authority}, station={station_num}")
@@ -1772,9 +1831,8 @@ class MainWindow(QMainWindow):
         self.info_panel = InfoPanel()
         self.train_info_panel = TrainInfoPanel()
         self.train_info_panel.main_window = self  # Set reference for data access
-        self.grid_container = QWidget()
-        self.grid_container.setMinimumSize(800, 700)
-        self.grid_container.setStyleSheet("background-color: white;")
+        self.track_grid = TrackGridWidget(self.info_panel, main_window=self, inputs=self.inputs)
+        self.track_grid.setMinimumSize(800, 700)
         self.selected_block = None
         
         # Train management system
@@ -1810,7 +1868,7 @@ class MainWindow(QMainWindow):
 
         # Create layout (yard is now integrated into main track grid as Block 0)
         row = QHBoxLayout()
-        row.addWidget(self.grid_container)
+        row.addWidget(self.track_grid)
         
         # Add info panel with 3/5 ratio
         row.addWidget(self.info_panel, 3)  # 3 parts
@@ -1876,7 +1934,7 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            self.reader = TrackLayoutReader(path, selected_lines=["Green", "Red"])
+            self.reader = get_shared_track_reader(path, selected_lines=["Green", "Red"])
             self.track_layout = self.reader
             
             # Initialize train management system
@@ -1896,10 +1954,6 @@ class MainWindow(QMainWindow):
             return
         line = self.line_selector.currentText()
         blocks = self.reader.lines.get(line, [])
-        for child in self.grid_container.findChildren(QWidget):
-            child.deleteLater()
-        spacing = 40
-        cols = 10
         
         # Create yard block (G0) first if Green line is selected
         display_blocks = []
@@ -1910,17 +1964,11 @@ class MainWindow(QMainWindow):
         # Add regular track blocks
         display_blocks.extend(blocks)
         
-        for i, blk in enumerate(display_blocks):
-            box = ClickableBox(blk, self.info_panel, main_window=self, inputs=self.inputs)
-            box.setParent(self.grid_container)
-            row = i // cols
-            col = i % cols
-            box.move(10 + col * spacing, 10 + row * spacing)
-            box.show()
+        self.track_grid.set_blocks(display_blocks)
         self.selected_block = None
 
-    def set_selected_block(self, box):
-        self.selected_block = box
+    def set_selected_block(self, grid_block):
+        self.selected_block = grid_block
 
     def toggle_failure(self, failure_type):
         if self.selected_block:
@@ -1974,9 +2022,8 @@ class MainWindow(QMainWindow):
             # Update train dropdown with active trains (exclude yard staged trains)
             self.update_train_dropdown()
             
-            # Update GUI colors for all blocks
-            for child in self.grid_container.findChildren(ClickableBox):
-                child.set_failure_color()
+            # Update GUI colors for all blocks (only changed blocks are repainted)
+            self.track_grid.refresh_colors()
                 
     def update_train_dropdown(self):
         """Update the train selection dropdown with active trains"""
@@ -2026,12 +2073,22 @@ class MainWindow(QMainWindow):
                 # Update GUI
                 self.update_train_count()
 
+# Every valid bit string of each length, for fast list validation
+_VALID_BIT_STRINGS = {
+    length: frozenset(format(value, f'0{length}b') for value in range(2 ** length))
+    for length in (1, 2, 5, 7)
+}
+
 class CommunicationObject:
     """
     Communication interface for Track Model to interact with individual Wayside Controllers.
     Each wayside has its own CommunicationObject instance that manages data for blocks it covers.
     
     Array Structure: Index 0 = G0 (Yard), Index 1 = G1, ..., Index 150 = G150 (151 total elements)
+    
+    Data is held in a WaysideFieldStore (one typed column per field). The list-of-bit-string
+    getters and setters are kept for compatibility; getFieldView/getFieldValues/setFieldValues
+    give bulk integer access without any string parsing.
     """
     
     def __init__(self, wayside_id: str, wayside_line: str = "Green"):
@@ -2045,19 +2102,15 @@ class CommunicationObject:
         self.wayside_id = wayside_id
         self.wayside_line = wayside_line
         
-        # Initialize all data arrays with default values (151 elements: G0-G150)
-        self._wayside_blocks_covered = ["0"] * 151      # 1-bit: determines which blocks this wayside manages
-        self._next_block_numbers = ["0000000"] * 151    # 7-bit: next block numbers
-        self._next_station_numbers = ["00000"] * 151    # 5-bit: next station numbers  
-        self._update_block_in_queue = ["0"] * 151       # 1-bit: update block in queue
-        self._wayside_authority = ["0"] * 151           # 1-bit: authority for each block
-        self._wayside_commanded_speed = ["00"] * 151    # 2-bit: commanded speed
-        self._switch_states = ["0"] * 151               # 1-bit: switch states
-        self._traffic_light_states = ["0"] * 151        # 1-bit: traffic light states
-        self._crossing_states = ["0"] * 151             # 1-bit: crossing states
+        # All data fields with default values 0 (151 elements: G0-G150)
+        # blocks_covered 1-bit, next_block_number 7-bit, next_station_number 5-bit,
+        # update_block_in_queue 1-bit, authority 1-bit, commanded_speed 2-bit,
+        # switch_state / traffic_light_state / crossing_state 1-bit
+        self._fields = WaysideFieldStore(151)
         
         # Track which blocks this wayside is responsible for
         self._covered_blocks = set()
+        self._covered_mask = np.zeros(151, dtype=bool)
         
     def _validate_array_length(self, data_array, expected_length=151, param_name="parameter"):
         """Validate that input array has correct length"""
@@ -2075,10 +2128,40 @@ class CommunicationObject:
     
     def _update_covered_blocks(self):
         """Update the set of blocks this wayside covers based on wayside_blocks_covered"""
-        self._covered_blocks.clear()
-        for i, covered in enumerate(self._wayside_blocks_covered):
-            if covered == "1":
-                self._covered_blocks.add(i)
+        self._covered_mask = self._fields.view('blocks_covered') == 1
+        self._covered_blocks = set(np.flatnonzero(self._covered_mask).tolist())
+    
+    def _set_covered_field(self, field, values_list, bit_length, param_name, element_name, description):
+        """Validate a list of bit strings and store it for the blocks this wayside covers"""
+        self._validate_array_length(values_list, 151, param_name)
+        
+        valid_bits = _VALID_BIT_STRINGS[bit_length]
+        try:
+            all_valid = all(value in valid_bits for value in values_list)
+        except TypeError:
+            all_valid = False
+        if not all_valid:
+            # Report the first invalid element
+            for i, value in enumerate(values_list):
+                self._validate_bit_string(value, bit_length, f"{element_name}[{i}]")
+        
+        # Only update blocks this wayside covers
+        self._fields.set_bits_list(field, values_list, mask=self._covered_mask)
+        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated {description} for {len(self._covered_blocks)} covered blocks")
+    
+    # === TYPED BULK ACCESS ===
+    
+    def getFieldView(self, field):
+        """Return a read-only zero-copy array of a field (e.g. 'commanded_speed') for all 151 blocks"""
+        return self._fields.view(field)
+    
+    def getFieldValues(self, field):
+        """Return a field for all 151 blocks as a list of ints"""
+        return self._fields.get_values(field)
+    
+    def setFieldValues(self, field, values):
+        """Set a field from 151 ints/bools. Only updates blocks this wayside covers."""
+        self._fields.set_values(field, values, mask=self._covered_mask)
     
     # === WAYSIDE BLOCKS COVERED (Critical - determines which data to use) ===
     
@@ -2096,13 +2179,13 @@ class CommunicationObject:
             if value not in ["0", "1"]:
                 raise ValueError(f"WaysideBlocksCovered[{i}] must be '0' or '1', got '{value}'")
         
-        self._wayside_blocks_covered = blocks_covered_list.copy()
+        self._fields.set_bits_list('blocks_covered', blocks_covered_list)
         self._update_covered_blocks()
         DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated block coverage, managing {len(self._covered_blocks)} blocks")
     
     def getWaysideBlocksCovered(self):
         """Return list of 151 strings indicating which blocks this wayside covers"""
-        return self._wayside_blocks_covered.copy()
+        return self._fields.get_bits_list('blocks_covered')
     
     # === AUTHORITY ===
     
@@ -2113,22 +2196,11 @@ class CommunicationObject:
         Args:
             authorities_list: List of 151 strings, each "0" or "1"
         """
-        self._validate_array_length(authorities_list, 151, "Authorities")
-        
-        updated_count = 0
-        for i, value in enumerate(authorities_list):
-            self._validate_bit_string(value, 1, f"Authority[{i}]")
-            
-            # Only update if this wayside covers this block
-            if i in self._covered_blocks:
-                self._wayside_authority[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated authority for {updated_count} covered blocks")
+        self._set_covered_field('authority', authorities_list, 1, "Authorities", "Authority", "authority")
     
     def getWaysideAuthority(self):
         """Return complete list of 151 authority values"""
-        return self._wayside_authority.copy()
+        return self._fields.get_bits_list('authority')
     
     # === COMMANDED SPEED ===
     
@@ -2139,21 +2211,11 @@ class CommunicationObject:
         Args:
             speeds_list: List of 151 strings, each 2-bit ("00", "01", "10", "11")
         """
-        self._validate_array_length(speeds_list, 151, "CommandedSpeeds")
-        
-        updated_count = 0
-        for i, value in enumerate(speeds_list):
-            self._validate_bit_string(value, 2, f"CommandedSpeed[{i}]")
-            
-            if i in self._covered_blocks:
-                self._wayside_commanded_speed[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated commanded speed for {updated_count} covered blocks")
+        self._set_covered_field('commanded_speed', speeds_list, 2, "CommandedSpeeds", "CommandedSpeed", "commanded speed")
     
     def getWaysideCommandedSpeed(self):
         """Return complete list of 151 commanded speed values"""
-        return self._wayside_commanded_speed.copy()
+        return self._fields.get_bits_list('commanded_speed')
     
     # === NEXT BLOCK NUMBERS ===
     
@@ -2164,21 +2226,11 @@ class CommunicationObject:
         Args:
             next_blocks_list: List of 151 strings, each 7-bit
         """
-        self._validate_array_length(next_blocks_list, 151, "NextBlockNumbers")
-        
-        updated_count = 0
-        for i, value in enumerate(next_blocks_list):
-            self._validate_bit_string(value, 7, f"NextBlockNumber[{i}]")
-            
-            if i in self._covered_blocks:
-                self._next_block_numbers[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated next block numbers for {updated_count} covered blocks")
+        self._set_covered_field('next_block_number', next_blocks_list, 7, "NextBlockNumbers", "NextBlockNumber", "next block numbers")
     
     def getNextBlockNumbers(self):
         """Return complete list of 151 next block number values"""
-        return self._next_block_numbers.copy()
+        return self._fields.get_bits_list('next_block_number')
     
     # === NEXT STATION NUMBERS ===
     
@@ -2189,21 +2241,11 @@ class CommunicationObject:
         Args:
             next_stations_list: List of 151 strings, each 5-bit
         """
-        self._validate_array_length(next_stations_list, 151, "NextStationNumbers")
-        
-        updated_count = 0
-        for i, value in enumerate(next_stations_list):
-            self._validate_bit_string(value, 5, f"NextStationNumber[{i}]")
-            
-            if i in self._covered_blocks:
-                self._next_station_numbers[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated next station numbers for {updated_count} covered blocks")
+        self._set_covered_field('next_station_number', next_stations_list, 5, "NextStationNumbers", "NextStationNumber", "next station numbers")
     
     def getNextStationNumbers(self):
         """Return complete list of 151 next station number values"""
-        return self._next_station_numbers.copy()
+        return self._fields.get_bits_list('next_station_number')
     
     # === UPDATE BLOCK IN QUEUE ===
     
@@ -2214,21 +2256,11 @@ class CommunicationObject:
         Args:
             update_queue_list: List of 151 strings, each "0" or "1"
         """
-        self._validate_array_length(update_queue_list, 151, "UpdateBlockInQueue")
-        
-        updated_count = 0
-        for i, value in enumerate(update_queue_list):
-            self._validate_bit_string(value, 1, f"UpdateBlockInQueue[{i}]")
-            
-            if i in self._covered_blocks:
-                self._update_block_in_queue[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated update block in queue for {updated_count} covered blocks")
+        self._set_covered_field('update_block_in_queue', update_queue_list, 1, "UpdateBlockInQueue", "UpdateBlockInQueue", "update block in queue")
     
     def getUpdateBlockInQueue(self):
         """Return complete list of 151 update block in queue values"""
-        return self._update_block_in_queue.copy()
+        return self._fields.get_bits_list('update_block_in_queue')
     
     # === SWITCH STATES ===
     
@@ -2239,21 +2271,11 @@ class CommunicationObject:
         Args:
             switch_states_list: List of 151 strings, each "0" or "1"
         """
-        self._validate_array_length(switch_states_list, 151, "SwitchStates")
-        
-        updated_count = 0
-        for i, value in enumerate(switch_states_list):
-            self._validate_bit_string(value, 1, f"SwitchState[{i}]")
-            
-            if i in self._covered_blocks:
-                self._switch_states[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated switch states for {updated_count} covered blocks")
+        self._set_covered_field('switch_state', switch_states_list, 1, "SwitchStates", "SwitchState", "switch states")
     
     def getSwitchStates(self):
         """Return complete list of 151 switch state values"""
-        return self._switch_states.copy()
+        return self._fields.get_bits_list('switch_state')
     
     # === TRAFFIC LIGHT STATES ===
     
@@ -2264,21 +2286,11 @@ class CommunicationObject:
         Args:
             traffic_light_list: List of 151 strings, each "0" or "1"
         """
-        self._validate_array_length(traffic_light_list, 151, "TrafficLightStates")
-        
-        updated_count = 0
-        for i, value in enumerate(traffic_light_list):
-            self._validate_bit_string(value, 1, f"TrafficLightState[{i}]")
-            
-            if i in self._covered_blocks:
-                self._traffic_light_states[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated traffic light states for {updated_count} covered blocks")
+        self._set_covered_field('traffic_light_state', traffic_light_list, 1, "TrafficLightStates", "TrafficLightState", "traffic light states")
     
     def getTrafficLightStates(self):
         """Return complete list of 151 traffic light state values"""
-        return self._traffic_light_states.copy()
+        return self._fields.get_bits_list('traffic_light_state')
     
     # === CROSSING STATES ===
     
@@ -2289,21 +2301,11 @@ class CommunicationObject:
         Args:
             crossing_states_list: List of 151 strings, each "0" or "1"
         """
-        self._validate_array_length(crossing_states_list, 151, "CrossingStates")
-        
-        updated_count = 0
-        for i, value in enumerate(crossing_states_list):
-            self._validate_bit_string(value, 1, f"CrossingState[{i}]")
-            
-            if i in self._covered_blocks:
-                self._crossing_states[i] = value
-                updated_count += 1
-        
-        DebugWindow.print_to_terminal(f"Wayside {self.wayside_id}: Updated crossing states for {updated_count} covered blocks")
+        self._set_covered_field('crossing_state', crossing_states_list, 1, "CrossingStates", "CrossingState", "crossing states")
     
     def getCrossingStates(self):
         """Return complete list of 151 crossing state values"""
-        return self._crossing_states.copy()
+        return self._fields.get_bits_list('crossing_state')
     
     # === UTILITY METHODS ===
     
@@ -2333,14 +2335,14 @@ class CommunicationObject:
             'block_index': block_index,
             'block_id': f"G{block_index}",
             'covered': self.isBlockCovered(block_index),
-            'next_block_number': self._next_block_numbers[block_index],
-            'next_station_number': self._next_station_numbers[block_index],
-            'update_block_in_queue': self._update_block_in_queue[block_index],
-            'authority': self._wayside_authority[block_index],
-            'commanded_speed': self._wayside_commanded_speed[block_index],
-            'switch_state': self._switch_states[block_index],
-            'traffic_light_state': self._traffic_light_states[block_index],
-            'crossing_state': self._crossing_states[block_index]
+            'next_block_number': self._fields.get_bits('next_block_number', block_index),
+            'next_station_number': self._fields.get_bits('next_station_number', block_index),
+            'update_block_in_queue': self._fields.get_bits('update_block_in_queue', block_index),
+            'authority': self._fields.get_bits('authority', block_index),
+            'commanded_speed': self._fields.get_bits('commanded_speed', block_index),
+            'switch_state': self._fields.get_bits('switch_state', block_index),
+            'traffic_light_state': self._fields.get_bits('traffic_light_state', block_index),
+            'crossing_state': self._fields.get_bits('crossing_state', block_index)
         }
 
 
@@ -2377,7 +2379,7 @@ class TrackModelInterface(QMainWindow):
     def load_track_layout(self, track_file):
         """Load track layout file automatically"""
         try:
-            self.main_window.track_layout = TrackLayoutReader(track_file)
+            self.main_window.track_layout = get_shared_track_reader(track_file)
             
             # Filter to selected lines only
             if self.selected_lines:
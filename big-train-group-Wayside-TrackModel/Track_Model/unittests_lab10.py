@@ -8,7 +8,7 @@ from PyQt5.QtCore import Qt
 print("Starting unit tests for Track Model functionality")
 
 # Import modules to test
-from Track_Model.trackmodel_working import MainWindow, DebugWindow, ClickableBox, InfoPanel
+from Track_Model.trackmodel_working import MainWindow, DebugWindow, TrackGridBlock, InfoPanel
 from Inputs import TrackModelInputs
 from Track_Reader.track_reader import TrackBlock
 
@@ -53,16 +53,11 @@ class TestTrackModel(unittest.TestCase):
         """
         Test that track failures can be toggled correctly
         """
-        # Create a clickable box with our mock block
-        box = ClickableBox(
-            self.mock_block,
-            self.main_window.info_panel,
-            self.main_window,
-            self.inputs
-        )
+        # Show our mock block in the track grid
+        self.main_window.track_grid.set_blocks([self.mock_block])
         
         # Set this as the selected block
-        self.main_window.set_selected_block(box)
+        self.main_window.set_selected_block(TrackGridBlock(self.main_window.track_grid, 0))
         
         # Initial state should be no failures
         block_id = f"{self.mock_block.line[0].upper()}{self.mock_block.block_number}"
@@ -0,0 +1,109 @@
+import unittest
+
+import numpy as np
+
+from Track_Model.wayside_store import WaysideFieldStore, FIELD_MAX_VALUE, WAYSIDE_FIELD_WIDTHS
+
+
+class TestWaysideFieldStore(unittest.TestCase):
+    """
+    Test suite for the wayside field column store
+    """
+
+    def setUp(self):
+        """Create a small store for each test"""
+        self.store = WaysideFieldStore(5)
+
+    def test_columns_start_at_zero(self):
+        """Test that every field starts as zeros with version 0"""
+        for field in WAYSIDE_FIELD_WIDTHS:
+            self.assertEqual(self.store.get_values(field), [0] * 5)
+        self.assertEqual(self.store.version, 0)
+
+    def test_set_and_get_values(self):
+        """Test that a column round-trips ints and bools as Python ints"""
+        self.store.set_values('commanded_speed', [0, 1, 2, 3, 0])
+        self.store.set_values('authority', [True, False, True, False, True])
+        self.assertEqual(self.store.get_values('commanded_speed'), [0, 1, 2, 3, 0])
+        self.assertEqual(self.store.get_values('authority'), [1, 0, 1, 0, 1])
+        self.assertIsInstance(self.store.get_values('authority')[0], int)
+
+    def test_set_values_with_mask(self):
+        """Test that only masked blocks are written"""
+        self.store.set_values('next_block_number', [10, 11, 12, 13, 14])
+        self.store.set_values('next_block_number', [90, 91, 92, 93, 94],
+                              mask=[False, True, False, True, False])
+        self.assertEqual(self.store.get_values('next_block_number'), [10, 91, 12, 93, 14])
+
+    def test_single_value_access(self):
+        """Test get_value/set_value on one block"""
+        self.store.set_value('next_station_number', 2, 17)
+        self.assertEqual(self.store.get_value('next_station_number', 2), 17)
+        self.assertEqual(self.store.get_values('next_station_number'), [0, 0, 17, 0, 0])
+
+    def test_view_is_zero_copy(self):
+        """Test that a view follows later writes without being re-fetched"""
+        view = self.store.view('switch_state')
+        self.store.set_values('switch_state', [1, 0, 1, 0, 1])
+        self.store.set_value('switch_state', 1, 1)
+        self.assertEqual(view.tolist(), [1, 1, 1, 0, 1])
+        self.assertTrue(np.shares_memory(view, self.store.columns['switch_state']))
+
+    def test_view_is_read_only(self):
+        """Test that a view cannot be written and the column stays writable"""
+        view = self.store.view('crossing_state')
+        with self.assertRaises(ValueError):
+            view[0] = 1
+        self.assertTrue(self.store.columns['crossing_state'].flags.writeable)
+        self.store.set_value('crossing_state', 0, 1)
+        self.assertEqual(view[0], 1)
+
+    def test_bit_string_access(self):
+        """Test bit string accessors use the field's declared width"""
+        self.store.set_bits_list('next_block_number', ['0000001', '1111111', '0000000', '0000011', '1000000'])
+        self.assertEqual(self.store.get_values('next_block_number'), [1, 127, 0, 3, 64])
+        self.assertEqual(self.store.get_bits_list('next_block_number')[1], '1111111')
+        self.store.set_bits('commanded_speed', 4, '10')
+        self.assertEqual(self.store.get_bits('commanded_speed', 4), '10')
+        self.assertEqual(self.store.format_bits('next_station_number', 3), '00011')
+
+    def test_version_changes_only_on_new_values(self):
+        """Test that the version moves when values change and not on identical writes"""
+        self.store.set_values('traffic_light_state', [1, 0, 0, 0, 1])
+        self.assertEqual(self.store.version, 1)
+        self.store.set_values('traffic_light_state', [1, 0, 0, 0, 1])
+        self.store.set_value('traffic_light_state', 0, 1)
+        self.store.set_values('traffic_light_state', [0, 0, 0, 0, 1], mask=[False, True, True, True, True])
+        self.assertEqual(self.store.version, 1)
+        self.store.set_value('traffic_light_state', 1, 1)
+        self.assertEqual(self.store.version, 2)
+
+    def test_wrong_length_raises(self):
+        """Test that a column of the wrong size is rejected"""
+        with self.assertRaisesRegex(ValueError, "must have 5 elements"):
+            self.store.set_values('authority', [1, 0, 1])
+
+    def test_scalar_raises_value_error(self):
+        """Test that a scalar is rejected with a ValueError rather than a TypeError"""
+        with self.assertRaisesRegex(ValueError, "must have 5 elements"):
+            self.store.set_values('authority', 1)
+
+    def test_out_of_range_values_raise(self):
+        """Test that values outside the column range are rejected without writing"""
+        with self.assertRaises(ValueError):
+            self.store.set_values('next_block_number', [0, 0, FIELD_MAX_VALUE + 1, 0, 0])
+        with self.assertRaises(ValueError):
+            self.store.set_values('next_block_number', [0, -1, 0, 0, 0])
+        with self.assertRaises(ValueError):
+            self.store.set_value('next_block_number', 0, FIELD_MAX_VALUE + 1)
+        self.assertEqual(self.store.get_values('next_block_number'), [0] * 5)
+        self.assertEqual(self.store.version, 0)
+
+    def test_unknown_field_raises(self):
+        """Test that an undeclared field name raises KeyError"""
+        with self.assertRaises(KeyError):
+            self.store.get_values('not_a_field')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Wayside Field Store
+===================
+Typed per-block storage for the data exchanged between wayside controllers
+and the Track Model.
+
+Every field is held as one NumPy integer column indexed by block number,
+instead of one bit string per block. Readers can take a zero-copy read-only
+view of a whole column or read single values as integers; the bit-string
+accessors are kept so existing "0000000"-style callers still work.
+"""
+
+import numpy as np
+
+# Declared bit width of each wayside field (used to format bit strings)
+WAYSIDE_FIELD_WIDTHS = {
+    'blocks_covered': 1,
+    'next_block_number': 7,
+    'next_station_number': 5,
+    'update_block_in_queue': 1,
+    'authority': 1,
+    'commanded_speed': 2,
+    'switch_state': 1,
+    'traffic_light_state': 1,
+    'crossing_state': 1
+}
+
+# Largest value a column can hold (block numbers above 127 still fit)
+FIELD_MAX_VALUE = np.iinfo(np.uint8).max
+
+# Precomputed bit strings for every storable value, per field width
+_BIT_STRINGS = {
+    field: [format(value, f'0{width}b') for value in range(FIELD_MAX_VALUE + 1)]
+    for field, width in WAYSIDE_FIELD_WIDTHS.items()
+}
+
+
+class WaysideFieldStore:
+    """
+    Column store of wayside fields for one line.
+
+    Attributes:
+        blockCount: Number of blocks (entries per column)
+        columns: Field name -> uint8 NumPy array of length blockCount
+        version: Incremented whenever a write changes any stored value, so
+            readers can detect changes without copying the columns
+    """
+
+    def __init__(self, block_count: int):
+        """
+        Args:
+            block_count: Number of blocks on the line (index 0 = yard)
+        """
+        self.blockCount = block_count
+        self.columns = {
+            field: np.zeros(block_count, dtype=np.uint8)
+            for field in WAYSIDE_FIELD_WIDTHS
+        }
+        self.version = 0
+
+    # === Bulk access ===
+
+    def view(self, field: str) -> np.ndarray:
+        """Get a read-only, zero-copy view of a field column"""
+        column_view = self.columns[field].view()
+        column_view.flags.writeable = False
+        return column_view
+
+    def get_values(self, field: str) -> list:
+        """Get a field column as a list of Python ints"""
+        return self.columns[field].tolist()
+
+    def set_values(self, field: str, values, mask=None) -> None:
+        """
+        Set a whole field column from ints/bools.
+
+        Args:
+            field: Field name from WAYSIDE_FIELD_WIDTHS
+            values: One value per block
+            mask: Optional per-block booleans; only blocks where it is True are written
+
+        Raises:
+            ValueError: If the length is wrong or a value does not fit the column
+        """
+        new_values = np.asarray(values, dtype=np.int64)
+        if new_values.shape != (self.blockCount,):
+            raise ValueError(f"{field} must have {self.blockCount} elements, got shape {new_values.shape}")
+        if new_values.size and (new_values.min() < 0 or new_values.max() > FIELD_MAX_VALUE):
+            raise ValueError(f"{field} values must be between 0 and {FIELD_MAX_VALUE}")
+        column = self.columns[field]
+        if mask is None:
+            if not np.array_equal(column, new_values):
+                column[:] = new_values
+                self.version += 1
+        else:
+            write_mask = np.asarray(mask, dtype=bool)
+            if not np.array_equal(column[write_mask], new_values[write_mask]):
+                column[write_mask] = new_values[write_mask]
+                self.version += 1
+
+    def get_bits_list(self, field: str) -> list:
+        """Get a field column as a list of bit strings"""
+        bit_strings = _BIT_STRINGS[field]
+        return [bit_strings[value] for value in self.columns[field].tolist()]
+
+    def set_bits_list(self, field: str, bit_strings, mask=None) -> None:
+        """Set a whole field column from bit strings (see set_values for mask)"""
+        self.set_values(field, [int(bits, 2) for bits in bit_strings], mask)
+
+    # === Single block access ===
+
+    def get_value(self, field: str, index: int) -> int:
+        """Get one block's value as an int"""
+        return int(self.columns[field][index])
+
+    def set_value(self, field: str, index: int, value: int) -> None:
+        """Set one block's value from an int/bool"""
+        value = int(value)
+        if value < 0 or value > FIELD_MAX_VALUE:
+            raise ValueError(f"{field} value must be between 0 and {FIELD_MAX_VALUE}, got {value}")
+        if self.columns[field][index] != value:
+            self.columns[field][index] = value
+            self.version += 1
+
+    def get_bits(self, field: str, index: int) -> str:
+        """Get one block's value as a bit string of the field's width"""
+        return _BIT_STRINGS[field][self.columns[field][index]]
+
+    def format_bits(self, field: str, value: int) -> str:
+        """Format a value as a bit string of the field's width"""
+        return _BIT_STRINGS[field][value]
+
+    def set_bits(self, field: str, index: int, bits: str) -> None:
+        """Set one block's value from a bit string"""
+        self.set_value(field, index, int(bits, 2))
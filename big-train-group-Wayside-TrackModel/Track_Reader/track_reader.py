@@ -10,9 +10,15 @@ intuitive access to track information.
 """
 
 import pandas as pd
+import hashlib
+import heapq
 import json
+import os
+import pickle
 import re
-from typing import Dict, List, Optional, Tuple, Union
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
@@ -25,6 +31,12 @@ DEBUG_SHOW_ALL_OBJECTS = False  # New flag for comprehensive object dump
 # Set DEBUG_PARSING = False to disable parsing debug messages
 # Set DEBUG_SHOW_ALL_OBJECTS = False to disable the comprehensive object dump
 
+# Compiled layout cache - parsed layouts are pickled next to the workbook and
+# reused while the workbook content hash and parser version still match.
+# Bump LAYOUT_PARSER_VERSION whenever the Excel parsing logic changes.
+LAYOUT_PARSER_VERSION = 1
+LAYOUT_CACHE_DIR_NAME = ".track_layout_cache"
+
 
 class InfrastructureType(Enum):
     """Types of infrastructure that can exist on a track block"""
@@ -240,22 +252,39 @@ class TrackBlock:
         return self.has_yard_connection
 
 
+@dataclass(frozen=True)
+class LineLayoutView:
+    """
+    Read-only view of a single line of a track layout.
+    Built lazily by TrackLayoutReader.get_line_view() and shared by every
+    module that asks for the same line, so it must never be modified.
+    """
+    line: str
+    blocks: Tuple[TrackBlock, ...]  # Blocks in Excel order
+    blocks_by_number: Mapping[int, TrackBlock]  # Block number -> TrackBlock
+    sections: Mapping[str, Tuple[int, ...]]  # Section letter -> block numbers
+    controller_json: Mapping  # Same structure as generate_controller_json()
+
+
 class TrackLayoutReader:
     """
     Main class for reading and managing track layout data.
     Provides easy access to track information for dispatchers.
     """
 
-    def __init__(self, excel_file_path: str, selected_lines: List[str] = None):
+    def __init__(self, excel_file_path: str, selected_lines: List[str] = None, use_cache: bool = True):
         """
         Initialize the track layout reader with an Excel file.
 
         Args:
             excel_file_path: Path to the track layout Excel file
-            selected_lines: List of lines to load (e.g., ['Blue', 'Red']). 
+            selected_lines: List of lines to load (e.g., ['Blue', 'Red']).
                           If None, loads all lines.
+            use_cache: Load from / save to the compiled layout cache instead of
+                       re-parsing the workbook when it has not changed.
         """
         self.file_path = excel_file_path
+        self.use_cache = use_cache
         
         # Default to all lines if none specified
         if selected_lines is None:
@@ -269,12 +298,35 @@ class TrackLayoutReader:
         
         # Station counter for unique IDs
         self.station_counter = 0
-        
+
+        # Read-only per-line views, built on first request
+        self._line_views: Dict[str, LineLayoutView] = {}
+
+        # Lookup indexes, built once the track data is loaded
+        self._block_index: Dict[Tuple[str, int], TrackBlock] = {}  # (line, block) -> block
+        self._block_number_index: Dict[int, TrackBlock] = {}  # block -> block on first selected line
+        self._station_index: Dict[int, TrackBlock] = {}  # station_id -> block
+        self._switch_index: Dict[Tuple[str, int], TrackBlock] = {}  # (line, switch block) -> block
+        self._block_position: Dict[Tuple[str, int], int] = {}  # (line, block) -> position in self.lines[line]
+        self._adjacent_blocks: Dict[Tuple[str, int], List[int]] = {}  # (line, block) -> numerically adjacent blocks
+        self._valid_next_blocks: Dict[Tuple[str, int], List[int]] = {}  # (line, block) -> direction-valid next blocks
+        self._cumulative_length_m: Dict[str, List[float]] = {}  # line -> prefix sums of block lengths
+        self._cumulative_time_s: Dict[str, List[float]] = {}  # line -> prefix sums of traversal times
+
+        # Directed routing graphs and route search results, built on first request
+        self._route_graphs: Dict[str, Dict[int, List[int]]] = {}  # line -> block -> successor blocks
+        self._route_options_cache: Dict[Tuple[str, int, int, int, str], List[List[int]]] = {}
+
         for line in selected_lines:
             self.lines[line] = []
             self.sections[line] = {}
-        
-        self._load_track_data()
+
+        if not (use_cache and self._load_from_cache()):
+            self._load_track_data()
+            if use_cache:
+                self._save_to_cache()
+
+        self._build_indexes()
 
         # Debug output all objects if enabled
         if DEBUG_SHOW_ALL_OBJECTS:
@@ -731,6 +783,7 @@ class TrackLayoutReader:
                             row = df.iloc[i]
                             self._debug_print(f"  Row {i}: Block={row.get('Block Number')}, Section={row.get('Section')}, Infrastructure='{row.get('Infrastructure')}'")
 
+                    seen_block_numbers = set()
                     block_count = 0
                     station_count = 0
                     switch_count = 0
@@ -820,12 +873,12 @@ class TrackLayoutReader:
                             self._debug_print(f"  Block {block_num}: No valid speed/length for traversal time calculation")
 
                         # Check for duplicate blocks
-                        existing_blocks = [b.block_number for b in self.lines[line_name]]
-                        if block_num in existing_blocks:
+                        if block_num in seen_block_numbers:
                             self._debug_print(f"  WARNING: Duplicate block number {block_num} found! Skipping.")
                             continue
 
                         # Add to line data
+                        seen_block_numbers.add(block_num)
                         self.lines[line_name].append(block)
                         block_count += 1
 
@@ -848,31 +901,7 @@ class TrackLayoutReader:
 
                     self._debug_print(f"{line_name} Line Summary: {block_count} blocks, {station_count} stations, {switch_count} switches, {crossing_count} crossings")
 
-            print(f"Successfully loaded track data:")
-            for line, blocks in self.lines.items():
-                stations = sum(1 for b in blocks if b.has_station)
-                switches = sum(1 for b in blocks if b.has_switch)
-                crossings = sum(1 for b in blocks if b.has_crossing)
-                underground = sum(1 for b in blocks if b.is_underground)
-                print(f"  {line} Line: {len(blocks)} blocks, {stations} stations, {switches} switches, {crossings} crossings, {underground} underground")
-
-            # Debug: Show all stations found
-            if DEBUG_PARSING:
-                self._debug_print("\n=== ALL STATIONS FOUND ===")
-                for line_name in self.selected_lines:
-                    stations = self.get_all_stations(line_name)
-                    self._debug_print(f"{line_name} Line stations ({len(stations)} total):")
-                    for station in stations:
-                        self._debug_print(f"  - Block {station['block_number']}: {station['station_name']} ({station['platform_side']})")
-            
-            # Always show station numbering for debugging
-            print("\n=== STATION NUMBERING ===")
-            for line_name in self.selected_lines:
-                stations = self.get_all_stations(line_name)
-                if stations:
-                    print(f"{line_name} Line stations ({len(stations)} total):")
-                    for station in stations:
-                        print(f"  - Station {station['station_id']}: Block {station['block_number']}: {station['station_name']} ({station['platform_side']})")
+            self._print_load_summary()
 
         except Exception as e:
             print(f"Error loading track data: {e}")
@@ -880,6 +909,170 @@ class TrackLayoutReader:
             traceback.print_exc()
             raise
 
+    def _print_load_summary(self):
+        """Print per-line block counts and station numbering after loading"""
+        print(f"Successfully loaded track data:")
+        for line, blocks in self.lines.items():
+            stations = sum(1 for b in blocks if b.has_station)
+            switches = sum(1 for b in blocks if b.has_switch)
+            crossings = sum(1 for b in blocks if b.has_crossing)
+            underground = sum(1 for b in blocks if b.is_underground)
+            print(f"  {line} Line: {len(blocks)} blocks, {stations} stations, {switches} switches, {crossings} crossings, {underground} underground")
+
+        # Debug: Show all stations found
+        if DEBUG_PARSING:
+            self._debug_print("\n=== ALL STATIONS FOUND ===")
+            for line_name in self.selected_lines:
+                stations = self.get_all_stations(line_name)
+                self._debug_print(f"{line_name} Line stations ({len(stations)} total):")
+                for station in stations:
+                    self._debug_print(f"  - Block {station['block_number']}: {station['station_name']} ({station['platform_side']})")
+
+        # Always show station numbering for debugging
+        print("\n=== STATION NUMBERING ===")
+        for line_name in self.selected_lines:
+            stations = self.get_all_stations(line_name)
+            if stations:
+                print(f"{line_name} Line stations ({len(stations)} total):")
+                for station in stations:
+                    print(f"  - Station {station['station_id']}: Block {station['block_number']}: {station['station_name']} ({station['platform_side']})")
+
+    def _build_indexes(self):
+        """
+        Build hash indexes, adjacency lists and cumulative distance arrays.
+        Called once after loading so block, station and switch lookups are
+        constant time instead of scanning self.lines on every call.
+        """
+        self._block_index.clear()
+        self._block_number_index.clear()
+        self._station_index.clear()
+        self._switch_index.clear()
+        self._block_position.clear()
+        self._adjacent_blocks.clear()
+        self._valid_next_blocks.clear()
+        self._cumulative_length_m.clear()
+        self._cumulative_time_s.clear()
+
+        for line_name in self.selected_lines:
+            blocks = self.lines.get(line_name, [])
+            cumulative_length = [0.0]
+            cumulative_time = [0.0]
+
+            for position, block in enumerate(blocks):
+                key = (line_name, block.block_number)
+                self._block_index[key] = block
+                self._block_position[key] = position
+                # Line-less lookups return the block from the first selected line
+                self._block_number_index.setdefault(block.block_number, block)
+                if block.has_station and block.station:
+                    self._station_index.setdefault(block.station.station_id, block)
+                if block.has_switch and block.switch:
+                    self._switch_index[key] = block
+                cumulative_length.append(cumulative_length[-1] + block.length_m)
+                cumulative_time.append(cumulative_time[-1] + block.min_traversal_time_seconds)
+
+            self._cumulative_length_m[line_name] = cumulative_length
+            self._cumulative_time_s[line_name] = cumulative_time
+
+            # Adjacency only depends on which block numbers exist on the line
+            for block in blocks:
+                adjacent = [
+                    neighbor for neighbor in (block.block_number - 1, block.block_number + 1)
+                    if (line_name, neighbor) in self._block_index
+                ]
+                self._adjacent_blocks[(line_name, block.block_number)] = adjacent
+                self._valid_next_blocks[(line_name, block.block_number)] = [
+                    neighbor for neighbor in adjacent if block.can_move_to_block(neighbor)
+                ]
+
+    # === Compiled Layout Cache ===
+
+    def _get_cache_path(self) -> str:
+        """
+        Get the path of the compiled layout cache file for this workbook.
+        One file is kept per workbook and ordered line selection, since
+        station IDs are numbered in the order the lines are loaded. The
+        importing module name is part of the key because this module is
+        imported both as "track_reader" and "Track_Reader.track_reader".
+        """
+        workbook_dir, workbook_name = os.path.split(os.path.abspath(self.file_path))
+        stem = os.path.splitext(workbook_name)[0].replace(" ", "_").replace("&", "and")
+        lines_key = "-".join(self.selected_lines)
+        return os.path.join(workbook_dir, LAYOUT_CACHE_DIR_NAME, f"{stem}.{lines_key}.{__name__}.pkl")
+
+    def _compute_workbook_hash(self) -> str:
+        """Get the SHA-256 hash of the workbook contents"""
+        digest = hashlib.sha256()
+        with open(self.file_path, "rb") as workbook:
+            for chunk in iter(lambda: workbook.read(65536), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_from_cache(self) -> bool:
+        """
+        Load parsed track data from the compiled layout cache.
+
+        Returns:
+            True if a fresh cache entry was loaded, False if the workbook must be parsed
+        """
+        cache_path = self._get_cache_path()
+        try:
+            workbook_hash = self._compute_workbook_hash()
+            with open(cache_path, "rb") as cache_file:
+                payload = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            self._debug_print(f"Layout cache unavailable ({cache_path}): {e}")
+            return False
+
+        if (not isinstance(payload, dict) or
+                payload.get("parser_version") != LAYOUT_PARSER_VERSION or
+                payload.get("module") != __name__ or
+                payload.get("workbook_hash") != workbook_hash or
+                payload.get("selected_lines") != list(self.selected_lines)):
+            self._debug_print(f"Layout cache is stale, re-parsing workbook: {self.file_path}")
+            return False
+
+        self.lines = payload["lines"]
+        self.sections = payload["sections"]
+        self.station_counter = payload["station_counter"]
+        self._debug_print(f"Loaded track data from layout cache: {cache_path}")
+        self._print_load_summary()
+        return True
+
+    def _save_to_cache(self):
+        """
+        Save parsed track data to the compiled layout cache.
+        Failures are not fatal - the workbook is simply parsed again next time.
+        """
+        cache_path = self._get_cache_path()
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            payload = {
+                "parser_version": LAYOUT_PARSER_VERSION,
+                "module": __name__,
+                "workbook_hash": self._compute_workbook_hash(),
+                "selected_lines": list(self.selected_lines),
+                "lines": self.lines,
+                "sections": self.sections,
+                "station_counter": self.station_counter
+            }
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump(payload, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic replace so concurrent readers never see a partial file
+            os.replace(temp_path, cache_path)
+            self._debug_print(f"Saved layout cache: {cache_path}")
+        except Exception as e:
+            # I/O errors and unpicklable layout data alike - parse again next time
+            self._debug_print(f"Could not save layout cache ({cache_path}): {e}")
+        finally:
+            # Never leave a partial temp file behind (it is already gone after os.replace)
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
     # === Methods for Dispatcher Interface ===
 
     def get_all_stations(self, line: Optional[str] = None) -> List[Dict]:
@@ -945,42 +1138,201 @@ class TrackLayoutReader:
 
         return switches
 
-    def get_route_options(self, line: str, from_block: int, to_block: int) -> List[List[int]]:
+    def get_route_options(self, line: str, from_block: int, to_block: int,
+                          max_routes: int = 3, weight: str = "time") -> List[List[int]]:
         """
-        Get possible routes between two blocks.
+        Get possible routes between two blocks, best route first.
         Useful for dispatcher routing interface.
 
+        Routes are loopless paths through the directed routing graph (see
+        get_route_graph), ranked with Yen's k-shortest-paths algorithm.
+        Results are cached per (line, from, to, max_routes, weight).
+
+        Args:
+            line: Line name ("Blue", "Red", "Green")
+            from_block: Starting block number (0 = yard)
+            to_block: Destination block number (0 = yard)
+            max_routes: Maximum number of routes to return
+            weight: "time" for fastest routes (min_traversal_time_seconds),
+                    "distance" for shortest routes (length_m)
+
         Returns:
             List of possible routes (each route is a list of block numbers)
         """
-        # Simple implementation - can be enhanced with graph algorithms
+        if weight not in ("time", "distance"):
+            raise ValueError(f"Unknown route weight '{weight}', expected 'time' or 'distance'")
+
         if from_block == to_block:
             return [[from_block]]
 
-        # For now, return direct route if blocks are sequential
-        # This should be enhanced with proper pathfinding for switches
+        cache_key = (line, from_block, to_block, max_routes, weight)
+        cached = self._route_options_cache.get(cache_key)
+        if cached is None:
+            cached = self._find_k_shortest_routes(line, from_block, to_block, max_routes, weight)
+            self._route_options_cache[cache_key] = cached
+        return [list(route) for route in cached]
+
+    def get_route_graph(self, line: str) -> Dict[int, List[int]]:
+        """
+        Get the directed routing graph for a line, building it on first use.
+
+        Edges come from each block's "Connected Blocks" data. Moves to a
+        numerically adjacent block must also be allowed by the block's
+        BlockDirection; jumps between non-adjacent blocks are switch or loop
+        connections and are taken as listed. Blocks without connected-blocks
+        data fall back to their direction-valid adjacent blocks (see
+        get_valid_next_blocks), and switch connections add the yard (block 0)
+        and switch links for them.
+
+        Args:
+            line: Line name ("Blue", "Red", "Green")
+
+        Returns:
+            Dictionary of block number -> successor block numbers (do not modify)
+        """
+        graph = self._route_graphs.get(line)
+        if graph is not None:
+            return graph
+
+        graph = {}
+
+        def add_edge(source: int, target: int):
+            successors = graph.setdefault(source, [])
+            if target not in successors:
+                successors.append(target)
+
         blocks = self.lines.get(line, [])
-        block_nums = [b.block_number for b in blocks]
+        for block in blocks:
+            graph.setdefault(block.block_number, [])
+            if not block.connected_blocks:
+                for target in self._valid_next_blocks.get((line, block.block_number), []):
+                    add_edge(block.block_number, target)
+                continue
+            for target in block.get_connected_blocks():
+                if (line, target) not in self._block_index:
+                    continue
+                if abs(target - block.block_number) == 1 and not block.can_move_to_block(target):
+                    continue
+                add_edge(block.block_number, target)
+
+        for block in blocks:
+            if not (block.has_switch and block.switch):
+                continue
+            for conn in block.switch.connections:
+                if "yard" in (conn.from_block, conn.to_block):
+                    yard_block = conn.to_block if conn.from_block == "yard" else conn.from_block
+                    if not isinstance(yard_block, int) or (line, yard_block) not in self._block_index:
+                        continue
+                    if block.switch.switch_type in ("YARD_TO", "YARD_TO_FROM", "STANDARD"):
+                        add_edge(yard_block, 0)
+                    if block.switch.switch_type in ("YARD_FROM", "YARD_TO_FROM", "STANDARD"):
+                        add_edge(0, yard_block)
+                    continue
+
+                # Connected-blocks data is authoritative where it exists
+                for source, target, allowed in (
+                        (conn.from_block, conn.to_block, conn.direction != SwitchDirection.FROM_ONLY),
+                        (conn.to_block, conn.from_block, conn.direction != SwitchDirection.TO_ONLY)):
+                    source_block = self._block_index.get((line, source))
+                    if (allowed and source_block and not source_block.connected_blocks and
+                            (line, target) in self._block_index):
+                        add_edge(source, target)
+
+        self._route_graphs[line] = graph
+        return graph
+
+    def _get_route_weights(self, line: str, weight: str) -> Dict[int, float]:
+        """Get the cost of entering each block for route searches (yard costs nothing)"""
+        if weight == "distance":
+            return {b.block_number: b.length_m for b in self.lines.get(line, [])}
+        return {b.block_number: b.min_traversal_time_seconds for b in self.lines.get(line, [])}
+
+    def _shortest_route(self, graph: Dict[int, List[int]], weights: Dict[int, float],
+                        source: int, target: int, removed_edges: set,
+                        removed_blocks: set) -> Optional[Tuple[float, List[int]]]:
+        """
+        Dijkstra search from source to target, skipping removed edges and blocks.
+
+        Returns:
+            Tuple of (cost, route) or None if the target cannot be reached
+        """
+        costs = {source: 0.0}
+        previous = {}
+        heap = [(0.0, source)]
+
+        while heap:
+            cost, block = heapq.heappop(heap)
+            if block == target:
+                route = [target]
+                while route[-1] != source:
+                    route.append(previous[route[-1]])
+                route.reverse()
+                return cost, route
+            if cost > costs[block]:
+                continue
+            for successor in graph.get(block, ()):
+                if successor in removed_blocks or (block, successor) in removed_edges:
+                    continue
+                new_cost = cost + weights.get(successor, 0.0)
+                if new_cost < costs.get(successor, float('inf')):
+                    costs[successor] = new_cost
+                    previous[successor] = block
+                    heapq.heappush(heap, (new_cost, successor))
 
-        if from_block in block_nums and to_block in block_nums:
-            start_idx = block_nums.index(from_block)
-            end_idx = block_nums.index(to_block)
+        return None
 
-            if start_idx < end_idx:
-                route = block_nums[start_idx:end_idx + 1]
-            else:
-                route = block_nums[end_idx:start_idx + 1][::-1]
+    def _find_k_shortest_routes(self, line: str, from_block: int, to_block: int,
+                                max_routes: int, weight: str) -> List[List[int]]:
+        """
+        Find up to max_routes loopless routes with Yen's k-shortest-paths algorithm.
+
+        Returns:
+            List of routes ordered by total cost
+        """
+        graph = self.get_route_graph(line)
+        if from_block not in graph or max_routes < 1:
+            return []
+
+        weights = self._get_route_weights(line, weight)
+        first = self._shortest_route(graph, weights, from_block, to_block, set(), set())
+        if first is None:
+            return []
+
+        found = [first]
+        candidates = []  # Heap of (cost, route)
+        seen_routes = {tuple(first[1])}
+
+        while len(found) < max_routes:
+            last_route = found[-1][1]
+            for i in range(len(last_route) - 1):
+                spur_block = last_route[i]
+                root = last_route[:i + 1]
+                root_cost = sum(weights.get(b, 0.0) for b in root[1:])
+
+                # Block every edge already used to leave this root
+                removed_edges = {
+                    (route[i], route[i + 1]) for _, route in found
+                    if len(route) > i + 1 and route[:i + 1] == root
+                }
+                spur = self._shortest_route(graph, weights, spur_block, to_block,
+                                            removed_edges, set(root[:-1]))
+                if spur is None:
+                    continue
 
-            return [route]
+                candidate = root[:-1] + spur[1]
+                if tuple(candidate) not in seen_routes:
+                    seen_routes.add(tuple(candidate))
+                    heapq.heappush(candidates, (root_cost + spur[0], candidate))
 
-        return []
+            if not candidates:
+                break
+            found.append(heapq.heappop(candidates))
+
+        return [route for _, route in found]
 
     def get_block_info(self, line: str, block_number: int) -> Optional[TrackBlock]:
         """Get detailed information about a specific block"""
-        for block in self.lines.get(line, []):
-            if block.block_number == block_number:
-                return block
-        return None
+        return self._block_index.get((line, block_number))
 
     def get_maintenance_zones(self, line: str) -> Dict[str, List[int]]:
         """
@@ -995,12 +1347,47 @@ class TrackLayoutReader:
         Returns time in seconds.
         """
         total_time = 0
+        block_index = self._block_index
         for block_num in route:
-            block = self.get_block_info(line, block_num)
+            block = block_index.get((line, block_num))
             if block:
                 total_time += block.min_traversal_time_seconds
         return total_time
 
+    def get_distance_between_blocks(self, line: str, from_block: int, to_block: int) -> float:
+        """
+        Get the total length of the blocks from one block to another, inclusive,
+        following the block order of the line. Constant time via prefix sums.
+
+        Returns:
+            Distance in meters, or 0.0 if either block is not found
+        """
+        start = self._block_position.get((line, from_block))
+        end = self._block_position.get((line, to_block))
+        if start is None or end is None:
+            return 0.0
+        if start > end:
+            start, end = end, start
+        cumulative = self._cumulative_length_m[line]
+        return cumulative[end + 1] - cumulative[start]
+
+    def get_time_between_blocks(self, line: str, from_block: int, to_block: int) -> float:
+        """
+        Get the minimum traversal time from one block to another, inclusive,
+        following the block order of the line. Constant time via prefix sums.
+
+        Returns:
+            Time in seconds, or 0.0 if either block is not found
+        """
+        start = self._block_position.get((line, from_block))
+        end = self._block_position.get((line, to_block))
+        if start is None or end is None:
+            return 0.0
+        if start > end:
+            start, end = end, start
+        cumulative = self._cumulative_time_s[line]
+        return cumulative[end + 1] - cumulative[start]
+
     def export_for_display(self, line: str) -> List[Dict]:
         """
         Export track data in format suitable for graphical display.
@@ -1081,21 +1468,8 @@ class TrackLayoutReader:
         Returns:
             List of valid next block numbers
         """
-        current_block = self.get_block_info(line, current_block_number)
-        if not current_block:
-            return []
-
-        valid_blocks = []
-        all_blocks = [b.block_number for b in self.lines.get(line, [])]
-
-        for block_num in all_blocks:
-            if block_num != current_block_number and current_block.can_move_to_block(block_num):
-                # Additional check: is this block actually adjacent or reachable?
-                # For now, just check if it's numerically adjacent
-                if abs(block_num - current_block_number) == 1:
-                    valid_blocks.append(block_num)
-
-        return sorted(valid_blocks)
+        # Precomputed at load time - numerically adjacent blocks allowed by direction
+        return list(self._valid_next_blocks.get((line, current_block_number), []))
 
     def get_directional_summary(self, line: Optional[str] = None) -> Dict[str, Dict[str, int]]:
         """
@@ -1159,13 +1533,9 @@ class TrackLayoutReader:
         Returns:
             TrackBlock object if found, None otherwise
         """
-        lines_to_check = [line] if line else self.selected_lines
-        
-        for line_name in lines_to_check:
-            for block in self.lines.get(line_name, []):
-                if block.block_number == block_number:
-                    return block
-        return None
+        if line:
+            return self._block_index.get((line, block_number))
+        return self._block_number_index.get(block_number)
 
     def get_line_for_block(self, block_number: int) -> Optional[str]:
         """
@@ -1190,17 +1560,16 @@ class TrackLayoutReader:
         Returns:
             Dictionary with station info or None if not found
         """
-        for line_name in self.selected_lines:
-            for block in self.lines.get(line_name, []):
-                if block.has_station and block.station and block.station.station_id == station_id:
-                    return {
-                        "station_id": block.station.station_id,
-                        "name": block.station.name,
-                        "platform_side": block.station.side,
-                        "line": line_name,
-                        "block_number": block.block_number,
-                        "section": block.section
-                    }
+        block = self._station_index.get(station_id)
+        if block:
+            return {
+                "station_id": block.station.station_id,
+                "name": block.station.name,
+                "platform_side": block.station.side,
+                "line": block.line,
+                "block_number": block.block_number,
+                "section": block.section
+            }
         return None
 
     def get_line_for_station(self, station_id: int) -> Optional[str]:
@@ -1227,7 +1596,10 @@ class TrackLayoutReader:
         Returns:
             Dictionary with switch info or None if no switch found
         """
-        block = self.get_block_by_number(block_number, line)
+        if line:
+            block = self._switch_index.get((line, block_number))
+        else:
+            block = self.get_block_by_number(block_number)
         if block and block.has_switch and block.switch:
             return {
                 "block_number": block.block_number,
@@ -1366,16 +1738,15 @@ class TrackLayoutReader:
         Returns:
             List of adjacent block numbers
         """
-        adjacent = []
-        all_blocks = [b.block_number for b in self.lines.get(line, [])]
-        
-        # Check for numerically adjacent blocks
-        if (block_number - 1) in all_blocks:
-            adjacent.append(block_number - 1)
-        if (block_number + 1) in all_blocks:
-            adjacent.append(block_number + 1)
-            
-        return adjacent
+        adjacent = self._adjacent_blocks.get((line, block_number))
+        if adjacent is not None:
+            return list(adjacent)
+
+        # Block itself not on the line - check for numerically adjacent blocks
+        return [
+            neighbor for neighbor in (block_number - 1, block_number + 1)
+            if (line, neighbor) in self._block_index
+        ]
 
 
     def get_stations_on_line(self, line: str) -> List[Dict]:
@@ -1486,6 +1857,38 @@ class TrackLayoutReader:
         return result
 
 
+    def get_line_view(self, line: str) -> LineLayoutView:
+        """
+        Get the shared read-only view of a line, building it on first use.
+
+        Args:
+            line: Line name ("Blue", "Red", "Green")
+
+        Returns:
+            LineLayoutView for the line
+
+        Raises:
+            ValueError: If the line was not loaded
+        """
+        view = self._line_views.get(line)
+        if view is None:
+            if line not in self.lines:
+                raise ValueError(f"Line {line} not found in track data")
+
+            blocks = tuple(self.lines[line])
+            view = LineLayoutView(
+                line=line,
+                blocks=blocks,
+                blocks_by_number=MappingProxyType({b.block_number: b for b in blocks}),
+                sections=MappingProxyType({
+                    section: tuple(block_numbers)
+                    for section, block_numbers in self.sections.get(line, {}).items()
+                }),
+                controller_json=MappingProxyType(self.generate_controller_json(line))
+            )
+            self._line_views[line] = view
+        return view
+
 # === Example Usage ===
     def generate_controller_json(self, line: str) -> Dict:
         """
@@ -1534,6 +1937,49 @@ class TrackLayoutReader:
         return track_data
 
 
+# === Shared Layout Registry ===
+
+# One reader per (workbook, line selection) for the whole process
+_shared_readers: Dict[Tuple[str, Tuple[str, ...]], TrackLayoutReader] = {}
+_shared_readers_lock = threading.Lock()
+
+
+def get_shared_track_reader(excel_file_path: str, selected_lines: List[str] = None) -> TrackLayoutReader:
+    """
+    Get the process-wide TrackLayoutReader for a workbook and line selection.
+
+    The first call parses (or loads from the layout cache) the workbook; every
+    later call with the same file and lines returns the same reader, so trains,
+    the CTC, wayside controllers and the Track Model share one parsed layout.
+    Shared readers must be treated as read-only.
+
+    Args:
+        excel_file_path: Path to the track layout Excel file
+        selected_lines: List of lines to load. If None, loads all lines.
+
+    Returns:
+        Shared TrackLayoutReader instance
+    """
+    if selected_lines is None:
+        selected_lines = ["Blue", "Red", "Green"]
+    key = (os.path.normcase(os.path.abspath(excel_file_path)), tuple(selected_lines))
+
+    reader = _shared_readers.get(key)
+    if reader is None:
+        with _shared_readers_lock:
+            reader = _shared_readers.get(key)
+            if reader is None:
+                reader = TrackLayoutReader(excel_file_path, selected_lines=list(selected_lines))
+                _shared_readers[key] = reader
+    return reader
+
+
+def clear_shared_track_readers():
+    """Drop all shared readers so the next request reloads the workbook"""
+    with _shared_readers_lock:
+        _shared_readers.clear()
+
+
 if __name__ == "__main__":
     # Initialize the track layout reader
     reader = TrackLayoutReader("Track Layout & Vehicle Data vF2.xlsx")
\ No newline at end of file
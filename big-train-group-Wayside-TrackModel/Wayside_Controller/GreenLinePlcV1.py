@@ -5,222 +5,263 @@ This PLC automatically passes CTC suggestions directly to outputs:
 - commandedSpeed = suggestedSpeed
 - commandedAuthority = suggestedAuthority
 
+Hazard, switch and crossing logic is evaluated as NumPy boolean-array
+operations on module-level buffers that are allocated once and reused on
+every scan, so a call does no per-block Python looping.
+
+The logic is split into the sections declared in PLC_SECTIONS. Each section
+is owned by the wayside controller covering its owner block, so when the
+line is split between controllers every section runs on exactly one of
+them. A controller passes the section names it owns to main() and only
+those sections (and their mapped outputs) are evaluated.
+
 Author: Systems and Project Engineering Student
 """
 
-def main( block_occupancy, speed, authority, switches_actual, 
-         traffic_lights_actual, crossings_actual, block_numbers):
+import numpy as np
+
+GREEN_LINE_BLOCKS = 151
+
+# Block ranges used by the N-section switch logic
+SECTION_M = (74, 77)
+SECTION_N = (77, 86)
+SECTION_OPQ = (86, 101)
+
+# Blocks behind the railroad crossing at block 19 (and the crossing itself)
+CROSSING_APPROACH = (16, 20)
+
+# Switch index per switch block, matching the Track Reader switch blocks
+SWITCH_MAPPING = {
+    12: 0,  # Switch at block 12
+    29: 1,  # Switch at block 29
+    58: 2,  # Switch at block 58 (yard connection)
+    62: 3,  # Switch at block 62 (yard connection)
+    76: 4,  # Switch at block 76 (used in main logic)
+    85: 5   # Switch at block 85 (used in main logic)
+}
+
+# Traffic light index per block entrance for each switch connection
+TRAFFIC_LIGHT_MAPPING = {
+    # Switch at block 12: Block 12 ↔ Block 13; Block 1 ↔ Block 13
+    12: 0,   # Entrance to block 12 from block 11
+    13: 1,   # Entrance to block 13 from block 12
+    1: 2,    # Entrance to block 1 from block 2
+
+    # Switch at block 29: Block 29 ↔ Block 30; Block 29 ↔ Block 150
+    29: 3,   # Entrance to block 29 from block 28
+    30: 4,   # Entrance to block 30 from block 29
+    150: 5,  # Entrance to block 150 from block 29
+
+    # Switch at block 58: Block 57 → Yard (block 0)
+    58: 6,   # Entrance to yard switch at block 58 from block 57
+
+    # Switch at block 62: Yard ← Block 63 (yard to block 62)
+    62: 7,   # Entrance to block 62 from yard
+
+    # Switch at block 76: Block 76 ↔ Block 77; Block 77 ↔ Block 101
+    76: 8,   # Entrance to block 76 from block 75 - used in main logic
+    77: 9,   # Entrance to block 77 from block 76 - used in main logic
+    101: 10, # Entrance to block 101 from block 77
+
+    # Switch at block 85: Block 85 ↔ Block 86; Block 100 ↔ Block 85
+    85: 11,  # Entrance to block 85 from block 84 - used in main logic
+    86: 12,  # Entrance to block 86 from block 85 - used in main logic
+    100: 13  # Entrance to block 100 from block 85
+}
+
+# Crossing index per crossing block
+CROSSING_MAPPING = {
+    19: 0  # RAILWAY CROSSING at block 19 maps to crossings[0]
+}
+
+# PLC sections in evaluation order, with the block ranges (half-open) each
+# one reads and writes. Writes are the switch, light, crossing, speed and
+# authority blocks whose outputs the section produces, so no block is written
+# by two sections; hazard sections only fill the internal speed hazards over
+# their 'hazards' range. A section runs on the controller that covers its
+# owner block (the first block it writes when no owner is given), even when
+# its reads cross into another controller's blocks.
+PLC_SECTIONS = {
+    # Sections I - M, O - Q and S - U: trailing hazards from commanded block numbers
+    'hazard_IM': {'reads': [(36, 77)], 'writes': [], 'hazards': (36, 77), 'owner': 36},
+    'hazard_OQ': {'reads': [(86, 101)], 'writes': [], 'hazards': (86, 101), 'owner': 86},
+    'hazard_SU': {'reads': [(105, 117)], 'writes': [], 'hazards': (105, 117), 'owner': 105},
+    # Switches at blocks 76 and 85 guarding section N, plus the section M hazard
+    'switch_N': {'reads': [(74, 101)], 'writes': [(76, 78), (85, 87), (100, 102)]},
+    # Switches at blocks 12, 29, 58 and 62 are held in their default position
+    'fixed_switches': {'reads': [], 'writes': [(1, 2), (12, 14), (29, 31), (58, 59), (62, 63), (150, 151)]},
+    # Railroad crossing at block 19
+    'crossing': {'reads': [CROSSING_APPROACH], 'writes': [(19, 20)]},
+    # Speed and authority stops driven by the speed hazards
+    'speed_authority': {'reads': [], 'writes': [(0, 2)]}
+}
+
+# Preallocated scan buffers, reused by every call to main()
+_occupancy = np.zeros(GREEN_LINE_BLOCKS, dtype=bool)
+_block_numbers = np.zeros(GREEN_LINE_BLOCKS, dtype=np.int64)
+_speed_hazard = np.zeros(GREEN_LINE_BLOCKS, dtype=bool)
+_section_targets = np.zeros(GREEN_LINE_BLOCKS, dtype=np.int64)
+_section_valid = np.zeros(GREEN_LINE_BLOCKS, dtype=bool)
+_block_index = np.arange(GREEN_LINE_BLOCKS, dtype=np.int64)
+_switches = np.zeros(6, dtype=bool)
+_traffic_lights = np.zeros(14, dtype=bool)  # Updated to handle all switch entrance lights
+_crossings = np.zeros(1, dtype=bool)
+_output_blocks_cache = {}
+
+
+def _any_occupied(section):
+    """Return True if any block in the half-open (start, end) range is occupied."""
+    return bool(_occupancy[section[0]:section[1]].any())
+
+
+def _compute_section_hazards(start, end, block_count):
+    """
+    Flag blocks in [start, end) whose commanded block number is an occupied
+    block of the same section at or ahead of them (trailing hazard).
+    """
+    end = min(end, block_count)
+    if start >= end:
+        return
+    targets = _section_targets[start:end]
+    valid = _section_valid[start:end]
+    np.copyto(targets, _block_numbers[start:end])
+    np.greater_equal(targets, _block_index[start:end], out=valid)
+    valid &= targets >= start
+    valid &= targets < end
+    np.clip(targets, 0, GREEN_LINE_BLOCKS - 1, out=targets)
+    np.logical_and(valid, _occupancy[targets], out=_speed_hazard[start:end])
+
+
+def _apply_speed_hazards(speed, authority, block_count):
+    """
+    Apply speed hazards to commanded speed and authority.
+
+    The original comparison ``speed_hazard[i] == True & block_numbers[z] == i``
+    parses as the chained comparison
+    ``speed_hazard[i] == (block_numbers[z] & 1) == i``, so it can only match
+    for i in (0, 1). That behaviour is kept exactly: block 0 is stopped when
+    it has no hazard and any commanded block number is even, and block 1 is
+    stopped when it has a hazard and any commanded block number is odd.
+    """
+    if block_count == 0:
+        return
+    parity = _block_numbers[:block_count] & 1
+    if not _speed_hazard[0] and not parity.all():
+        speed[0] = 0
+        authority[0] = 0
+    if _speed_hazard[1] and parity.any():
+        speed[1] = 0
+        authority[1] = 0
+
+
+def _evaluate_switch_n():
+    """Set the block 76/85 switches and lights so only one train uses section N."""
+    n_occupied = _any_occupied(SECTION_N)
+    opq_occupied = _any_occupied(SECTION_OPQ)
+
+    if not n_occupied and not opq_occupied:
+        _switches[4] = False
+        _switches[5] = True
+        _traffic_lights[8] = True   # Block 76 entrance (from block 75)
+        _traffic_lights[9] = False  # Block 77 entrance (from block 76)
+        _traffic_lights[11] = True  # Block 85 entrance (from block 84)
+        _traffic_lights[12] = False # Block 86 entrance (from block 85)
+
+        _speed_hazard[SECTION_M[0]:SECTION_M[1]] = False
+
+    elif (n_occupied and not _occupancy[76]) or opq_occupied:
+        _switches[4] = True
+        _traffic_lights[8] = False  # Block 76 entrance (from block 75)
+        _traffic_lights[9] = True   # Block 77 entrance (from block 76)
+        _speed_hazard[SECTION_M[0]:SECTION_M[1]] = True
+
+        if n_occupied and not _occupancy[100]:
+            _switches[5] = False
+            _traffic_lights[11] = False # Block 85 entrance (from block 84)
+            _traffic_lights[12] = True  # Block 86 entrance (from block 85)
+        elif not n_occupied:
+            _switches[5] = True
+            _traffic_lights[11] = True  # Block 85 entrance (from block 84)
+            _traffic_lights[12] = False # Block 86 entrance (from block 85)
+
+
+def _evaluate_crossing():
+    """Check 3 blocks behind the crossing and the block of the crossing (4 total blocks)."""
+    _crossings[0] = _any_occupied(CROSSING_APPROACH)
+
+
+def _get_output_blocks(sections):
+    """Get the set of blocks written by the given sections (cached per section set)."""
+    key = tuple(sections)
+    if key not in _output_blocks_cache:
+        blocks = set()
+        for name in key:
+            for start, end in PLC_SECTIONS[name]['writes']:
+                blocks.update(range(start, end))
+        _output_blocks_cache[key] = blocks
+    return _output_blocks_cache[key]
+
+
+def _map_track_objects(switches_actual, traffic_lights_actual, crossings_actual, block_count, output_blocks=None):
+    """
+    Copy internal switch, light and crossing states to their output indices.
+    When output_blocks is given only objects at those blocks are written.
+    """
+    for block_num, switch_index in SWITCH_MAPPING.items():
+        if output_blocks is not None and block_num not in output_blocks:
+            continue
+        if block_num < block_count and switch_index < len(switches_actual):
+            switches_actual[switch_index] = bool(_switches[switch_index])
+
+    for block_num, light_index in TRAFFIC_LIGHT_MAPPING.items():
+        if output_blocks is not None and block_num not in output_blocks:
+            continue
+        if block_num < block_count and light_index < len(traffic_lights_actual):
+            traffic_lights_actual[light_index] = bool(_traffic_lights[light_index])
+
+    for block_num, crossing_index in CROSSING_MAPPING.items():
+        if output_blocks is not None and block_num not in output_blocks:
+            continue
+        if block_num < block_count and crossing_index < len(crossings_actual):
+            crossings_actual[crossing_index] = bool(_crossings[crossing_index])
+
+
+def main( block_occupancy, speed, authority, switches_actual,
+         traffic_lights_actual, crossings_actual, block_numbers, sections=None):
     """
     Main PLC loop that passes CTC suggestions directly to outputs.
+
+    Args:
+        sections: Optional names from PLC_SECTIONS to evaluate. None runs
+            the whole line; otherwise only the named sections run and only
+            the objects at blocks they write are mapped to the outputs.
     """
-    speed_hazard = [False] * 151  # Initialize speed hazard list for all blocks
-    switches = [False] * 6
-    traffic_lights = [False] * 14  # Updated to handle all switch entrance lights
-    crossings = [False] * 1
-
-    def speed_hazard_to_speed_authority():
-        for i in range(len(speed_hazard)):
-            for z in range(len(block_numbers)):
-                if speed_hazard[i]== True & block_numbers[z] == i:
-                    speed[i] = 0
-                    authority[i] = 0
-    
-    def map_track_objects():
-        # Map switches to their indices based on the correct switch blocks from Track Reader
-        switch_mapping = {
-            12: 0,  # Switch at block 12
-            29: 1,  # Switch at block 29
-            58: 2,  # Switch at block 58 (yard connection)
-            62: 3,  # Switch at block 62 (yard connection)
-            76: 4,  # Switch at block 76 (used in main logic)
-            85: 5   # Switch at block 85 (used in main logic)
-        }
-        
-        # Map traffic lights to block entrances for each switch connection
-        traffic_light_mapping = {
-            # Switch at block 12: Block 12 ↔ Block 13; Block 1 ↔ Block 13
-            12: 0,   # Entrance to block 12 from block 11
-            13: 1,   # Entrance to block 13 from block 12
-            1: 2,    # Entrance to block 1 from block 2
-            
-            # Switch at block 29: Block 29 ↔ Block 30; Block 29 ↔ Block 150
-            29: 3,   # Entrance to block 29 from block 28
-            30: 4,   # Entrance to block 30 from block 29
-            150: 5,  # Entrance to block 150 from block 29
-            
-            # Switch at block 58: Block 57 → Yard (block 0)
-            58: 6,   # Entrance to yard switch at block 58 from block 57
-            
-            # Switch at block 62: Yard ← Block 63 (yard to block 62)
-            62: 7,   # Entrance to block 62 from yard
-            
-            # Switch at block 76: Block 76 ↔ Block 77; Block 77 ↔ Block 101
-            76: 8,   # Entrance to block 76 from block 75 - used in main logic
-            77: 9,   # Entrance to block 77 from block 76 - used in main logic
-            101: 10, # Entrance to block 101 from block 77
-            
-            # Switch at block 85: Block 85 ↔ Block 86; Block 100 ↔ Block 85
-            85: 11,  # Entrance to block 85 from block 84 - used in main logic
-            86: 12,  # Entrance to block 86 from block 85 - used in main logic
-            100: 13  # Entrance to block 100 from block 85
-        }
-        
-        # Map crossings to their indices
-        crossing_mapping = {
-            19: 0  # RAILWAY CROSSING at block 19 maps to crossings[0]
-        }
-        
-        # Apply mappings based on block_numbers array
-        for i in range(len(block_numbers)):
-            block_num = i
-            
-            # Map switches
-            if block_num in switch_mapping:
-                switch_index = switch_mapping[block_num]
-                if switch_index < len(switches_actual):
-                    switches_actual[switch_index] = switches[switch_index]
-            
-            # Map traffic lights  
-            if block_num in traffic_light_mapping:
-                light_index = traffic_light_mapping[block_num]
-                if light_index < len(traffic_lights_actual):
-                    traffic_lights_actual[light_index] = traffic_lights[light_index]
-            
-            # Map crossings
-            if block_num in crossing_mapping:
-                crossing_index = crossing_mapping[block_num]
-                if crossing_index < len(crossings_actual):
-                    crossings_actual[crossing_index] = crossings[crossing_index]
-
-
-    def N_occupied():
-        for i in range(77, 86):
-            if block_occupancy[i]:
-                return True
-        return False
-    
-    def Q_occupied():
-        for i in range(98, 101):
-            if block_occupancy[i]:
-                return True
-        return False
-    
-    def M_occupied():
-        for i in range(74, 77):
-            if block_occupancy[i]:
-                return True
-        return False
-    
-    def OPQ_occupied():
-        for i in range(86, 101):
-            if block_occupancy[i]:
-                return True
-        return False
-    
-    def set_Q_hazard(truth_val):
-        for i in range(98, 101):
-            speed_hazard[i] = truth_val
-    
-    def set_M_hazard(truth_val):
-        for i in range(74, 77):
-            speed_hazard[i] = truth_val
-    
-    def J_is_hazard():
-        for i in range(58, 63):
-            if speed_hazard[i] == False:
-                return False
-        return True
-    
-    def set_J_hazard(truth_val):
-        for i in range(58, 63):
-            speed_hazard[i] = truth_val
-        
-    def reset_hazard():
-        for i in range(0, len(speed_hazard)):
-            speed_hazard[i] = False
-
-    J_hazard = J_is_hazard()
-    
-    reset_hazard()
-
-    # Sections I - M
-    for i in range(36, 77):
-        speed_hazard[i] = False
-        if block_occupancy[i]== True:
-            # trailing 4 blocks so other trains don't get too close
-            for z in range(36,77):
-                if block_numbers[z] == i:
-                    speed_hazard[z] = True
-
-    if J_hazard == True:
-        set_J_hazard(True)
-    
-    # Sections O - Q
-    for i in range(86, 101):
-        speed_hazard[i] = False
-        if block_occupancy[i]== True:
-            # trailing 4 blocks so other trains don't get too close
-            for z in range(86,101):
-                if block_numbers[z] == i:
-                    speed_hazard[z] = True
-        
-
-    # Sections S -  U
-    for i in range(105, 117):
-        speed_hazard[i] = False
-        if block_occupancy[i]== True:
-            # trailing 4 blocks so other trains don't get too close
-            for z in range(105,117):
-                if block_numbers[z] == i:
-                    speed_hazard[z] = True
-            
-        
-    
-    if N_occupied() == False and OPQ_occupied() == False:
-        switches[4] = False
-        switches[5] = True
-        traffic_lights[8] = True   # Block 76 entrance (from block 75)
-        traffic_lights[9] = False  # Block 77 entrance (from block 76)
-        traffic_lights[11] = True  # Block 85 entrance (from block 84)
-        traffic_lights[12] = False # Block 86 entrance (from block 85)
-
-        # set_Q_hazard(False)
-        set_M_hazard(False)
-
-        # if trains are at both ends of section N, give priority over trains at section M
-        # if Q_occupied() and M_occupied():
-        #     set_Q_hazard(True) # stops trains at Q
-
-    elif (N_occupied() == True and not block_occupancy[76]) or OPQ_occupied() == True:
-        switches[4] = True
-        traffic_lights[8] = False  # Block 76 entrance (from block 75)
-        traffic_lights[9] = True   # Block 77 entrance (from block 76)
-        set_M_hazard(True)
-
-        if N_occupied() == True and not block_occupancy[100]:
-            switches[5] = False
-            traffic_lights[11] = False # Block 85 entrance (from block 84)
-            traffic_lights[12] = True  # Block 86 entrance (from block 85)
-
-            # stop other trains from entering section N
-            # set_Q_hazard(True)
-        elif N_occupied() == False:
-            switches[5] = True
-            traffic_lights[11] = True  # Block 85 entrance (from block 84)
-            traffic_lights[12] = False # Block 86 entrance (from block 85)
-
-
-    # check 3 blocks behind crossing and block of crossing (4 total blocks)
-    crossings[0] = False # Default is up
-    for i in range(4):
-        if block_occupancy[19 - i]: # block 19 is the railroad crossing
-            crossings[0] = True # Put the crossing down
-
-    speed_hazard_to_speed_authority()
-    map_track_objects()
-        
-
-            
-
-    
+    block_count = min(len(block_numbers), GREEN_LINE_BLOCKS)
+    active = PLC_SECTIONS if sections is None else set(sections)
+
+    _occupancy[:] = block_occupancy[:GREEN_LINE_BLOCKS]
+    _block_numbers[:block_count] = block_numbers[:block_count]
+    _speed_hazard[:] = False
+    _switches[:] = False
+    _traffic_lights[:] = False
+    _crossings[:] = False
+
+    # Sections I - M, O - Q and S - U: trailing blocks so other trains don't get too close
+    for name in ('hazard_IM', 'hazard_OQ', 'hazard_SU'):
+        if name in active:
+            start, end = PLC_SECTIONS[name]['hazards']
+            _compute_section_hazards(start, end, block_count)
+
+    if 'switch_N' in active:
+        _evaluate_switch_n()
+
+    # Switches at blocks 12, 29, 58 and 62 stay in their reset (False) position
+
+    if 'crossing' in active:
+        _evaluate_crossing()
+
+    if 'speed_authority' in active:
+        _apply_speed_hazards(speed, authority, block_count)
 
+    output_blocks = None if sections is None else _get_output_blocks(sections)
+    _map_track_objects(switches_actual, traffic_lights_actual, crossings_actual, block_count, output_blocks)
@@ -1,13 +1,64 @@
 from PyQt5.QtCore import QObject, QTimer
-from typing import List
+from typing import Dict, List
 import importlib.util
 import os
 import sys
-from threading import Event
+import time
+from threading import Event, Lock
 from CTC import communication_handler
 from Master_Interface import CommunicationObject   
 
 
+class DoubleBuffer:
+    """
+    Front/back pair of preallocated per-block lists for one direction of the
+    wayside data exchange.
+    
+    Writers fill the back buffer while holding lock and record the entries
+    they wrote with mark(); code changing the front in place marks those
+    entries the same way. swap() exchanges the two buffers by reference and
+    copies only the marked entries into the new back buffer, so readers of
+    the front always see a complete snapshot and a cycle costs nothing beyond
+    the entries that changed. Buffers whose writers rewrite every entry they
+    use on each cycle can skip mark().
+    """
+    
+    def __init__(self, fields: Dict[str, list]):
+        self.lock = Lock()
+        self.front = {name: list(values) for name, values in fields.items()}
+        self.back = {name: list(values) for name, values in fields.items()}
+        self.dirty = {name: set() for name in fields}  # Entries written since the last swap (None = all)
+    
+    def mark(self, name: str, indices=None):
+        """Record entries of one field written since the last swap (call while holding lock)
+        
+        Args:
+            name: Field name
+            indices: Iterable of entry indices, or None for the whole field
+        """
+        if indices is None:
+            self.dirty[name] = None
+        elif self.dirty[name] is not None:
+            self.dirty[name].update(indices)
+    
+    def swap(self) -> Dict[str, list]:
+        """Publish the back buffer as the new front and return it"""
+        with self.lock:
+            self.front, self.back = self.back, self.front
+            # Writers continue from the published state
+            for name, entries in self.dirty.items():
+                front = self.front[name]
+                back = self.back[name]
+                if entries is None:
+                    back[:] = front
+                    self.dirty[name] = set()
+                elif entries:
+                    for i in entries:
+                        back[i] = front[i]
+                    entries.clear()
+        return self.front
+
+
 class WaysideController(QObject):
     
     def __init__(self, data, line: str, mode: str, auto: bool, plc_num: int, plc_file: str, blocks_covered: List[bool], total_blocks: int):
@@ -29,35 +80,56 @@ class WaysideController(QObject):
         
         # Timer management
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_cycle)
+        self.update_timer.timeout.connect(self.scan_tick)
         self.check_timer = QTimer()  # Referenced in get_status method
         self.time_manager = None  # Referenced in get_status method
         
+        # Scan scheduling - 'periodic' scans every tick, 'event' scans only when inputs change
+        self.scanMode = 'periodic'
+        self.scanPending = True  # Set when CTC inputs change, cleared when a scan starts
+        self.watchdogInterval = None  # Seconds between forced scans in event mode (None = no watchdog)
+        self.lastScanTime = None
+        self.trackInputVersion = None  # Track model store version seen by the last scan
+        
+        
         
+        # CTC -> wayside: command_train/set_occupied write and mark the back
+        # buffer, each scan swaps it to the front and works on the front
+        self.ctcInputs = DoubleBuffer({
+            'speed': [0] * total_blocks,
+            'authority': [False] * total_blocks,
+            'update_block_in_queue': [0] * total_blocks,
+            'station_numbers': [0] * total_blocks,
+            'block_numbers': [0] * total_blocks,
+            'occupied': [0] * total_blocks  # Occupancy state from CTC
+        })
         
-        # Core wayside data arrays - sized to match total blocks for track model interface
-        self.speed = [0] * total_blocks
-        self.authorities = [False] * total_blocks
-        self.block_occupancy = [False] * total_blocks
-        self.switch_positions = [False] * total_blocks  # Full size - PLC maps internal switches to specific indices
-        self.traffic_lights = [False] * total_blocks    # Full size - PLC maps internal lights to specific indices  
-        self.railroad_crossings = [False] * total_blocks  # Full size - PLC maps internal crossings to specific indices
+        # Wayside -> track model/CTC: a scan reads the track model into the back
+        # buffer, runs the PLC on it and swaps it to the front for publishing.
+        # Every scan rewrites the PLC input ranges and all PLC outputs, so this
+        # buffer is swapped without marks
+        # Full size - PLC maps internal switches/lights/crossings to specific indices
+        self.fieldStates = DoubleBuffer({
+            'occupied': [False] * total_blocks,
+            'switches': [False] * total_blocks,
+            'lights': [False] * total_blocks,
+            'crossings': [False] * total_blocks
+        })
         
-        # CTC input arrays (received from CTC)
-        self.ctc_suggested_speeds = [0] * total_blocks
-        self.ctc_authorities = [False] * total_blocks
-        self.ctc_UpdateBlockInQueue = [0] * total_blocks
-        self.ctc_station_numbers = [0] * total_blocks
-        self.ctc_block_numbers = [0] * total_blocks
-        self.ctc_occupied = [0]* total_blocks  # Occupancy state from CTC
+        # Core wayside data arrays, CTC input arrays and pass-through data to track model
+        # (references into the current buffers)
+        self._bind_ctc_buffers()
+        self._bind_field_buffers()
         
-        # Pass-through data to track model
-        self.station_numbers = [0] * total_blocks
-        self.UpdateBlockInQueue = [0] * total_blocks
-        self.block_numbers = [0] * total_blocks
+        # Last state published to CTC, packed as bitsets (None until the first full publish)
+        self.published_bits = {'occupied': None, 'switches': None, 'crossings': None}
         
         # PLC module management
         self.plcModule = None
+        self.plcSections = None  # PLC sections this controller evaluates (None = whole line)
+        self.plcInputBlocks = []  # Covered blocks plus boundary blocks read by those sections
+        self.plcInputRanges = [(0, total_blocks)]  # plcInputBlocks as half-open runs (whole line by default)
+        self.plcOutputBlocks = None  # Blocks whose speed/authority the PLC may change (None = whole line)
         self.stopEvent = Event()
         
         # Load PLC file
@@ -71,6 +143,34 @@ class WaysideController(QObject):
         print(f"Managing {sum(self.blocksCovered)} blocks out of {total_blocks}")
         print(f"PLC Module Status: {'LOADED' if self.plcModule is not None else 'NOT LOADED'}")
 
+    def _bind_ctc_buffers(self):
+        """Point the CTC input and scan working arrays at the current CTC buffers"""
+        back = self.ctcInputs.back
+        front = self.ctcInputs.front
+        
+        # CTC input arrays (latest received from CTC)
+        self.ctc_suggested_speeds = back['speed']
+        self.ctc_authorities = back['authority']
+        self.ctc_UpdateBlockInQueue = back['update_block_in_queue']
+        self.ctc_station_numbers = back['station_numbers']
+        self.ctc_block_numbers = back['block_numbers']
+        self.ctc_occupied = back['occupied']
+        
+        # Working arrays for the current scan, plus pass-through data to track model
+        self.speed = front['speed']
+        self.authorities = front['authority']
+        self.UpdateBlockInQueue = front['update_block_in_queue']
+        self.station_numbers = front['station_numbers']
+        self.block_numbers = front['block_numbers']
+    
+    def _bind_field_buffers(self):
+        """Point the field state arrays at the last published snapshot"""
+        front = self.fieldStates.front
+        self.block_occupancy = front['occupied']
+        self.switch_positions = front['switches']
+        self.traffic_lights = front['lights']
+        self.railroad_crossings = front['crossings']
+
     # ========== Master Interface Compatibility ==========
     
     def set_communication_object(self, ctc_comm_obj):
@@ -89,12 +189,22 @@ class WaysideController(QObject):
 
     # ========== Timer Management ==========
     
-    def start_update_cycle(self):
-        """Start the update cycle timer at 0.05s intervals"""
+    def start_update_cycle(self, event_driven: bool = False, watchdog_ms: int = 1000):
+        """Start the update cycle timer at 0.05s intervals
+        
+        Args:
+            event_driven: If True, a tick only runs the PLC scan when CTC commands,
+                CTC occupancy or track model inputs changed since the last scan
+            watchdog_ms: In event-driven mode, maximum time between scans so the
+                PLC outputs are re-evaluated periodically (None or 0 disables it)
+        """
         try:
+            self.scanMode = 'event' if event_driven else 'periodic'
+            self.watchdogInterval = watchdog_ms / 1000.0 if event_driven and watchdog_ms else None
+            self.scanPending = True
             self.update_timer.start(50)  # 50ms = 0.05s intervals
             self.isOperational = True
-            print(f"[WAYSIDE] Controller {self.plcNum}: Update cycle started (50ms intervals)")
+            print(f"[WAYSIDE] Controller {self.plcNum}: Update cycle started (50ms intervals, {self.scanMode} scan)")
         except Exception as e:
             print(f"[WAYSIDE] Error starting update cycle: {e}")
             self.isOperational = False
@@ -108,6 +218,37 @@ class WaysideController(QObject):
         except Exception as e:
             print(f"[WAYSIDE] Error stopping update cycle: {e}")
 
+    def request_scan(self):
+        """Mark the inputs as changed so the next tick runs a PLC scan"""
+        self.scanPending = True
+    
+    def scan_tick(self):
+        """Timer tick - run a scan every tick, or only when needed in event-driven mode"""
+        if self.scanMode != 'event' or self._scan_needed():
+            self.update_cycle()
+    
+    def _scan_needed(self) -> bool:
+        """Check whether an event-driven controller has anything new to evaluate"""
+        if self.scanPending or self.lastScanTime is None:
+            return True
+        if self.watchdogInterval and time.monotonic() - self.lastScanTime >= self.watchdogInterval:
+            return True
+        if self.track_CommObj is None:
+            return False
+        version = self._get_track_input_version()
+        # Track objects without a version counter cannot report changes, so scan
+        return version is None or version != self.trackInputVersion
+    
+    def _get_track_input_version(self):
+        """Get the track model store version (None if not connected or unsupported)"""
+        if not hasattr(self.track_CommObj, 'getVersion'):
+            return None
+        try:
+            return self.track_CommObj.getVersion()
+        except Exception as e:
+            print(f"[WAYSIDE] Error reading track model version: {e}")
+            return None
+
     # ========== PLC Management ==========
     def load_plc_module(self):
         """Dynamically load a Python file as a module."""
@@ -117,6 +258,70 @@ class WaysideController(QObject):
         plc_module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(plc_module)
         self.plcModule = plc_module
+        self._resolve_plc_sections()
+
+    def _resolve_plc_sections(self):
+        """Select the PLC sections this controller owns and the blocks they read
+        
+        PLC programs may declare PLC_SECTIONS = {name: {'reads': [(start, end)],
+        'writes': [(start, end)], 'owner': block}}. A section belongs to the
+        controller that covers its owner block (the first block it writes when
+        no owner is declared), so controllers splitting a line each evaluate a
+        disjoint set of sections. Track model inputs are then only read for
+        the covered blocks plus the blocks those sections read. Programs
+        without the declaration run over the whole line as before.
+        """
+        self.plcSections = None
+        self.plcInputBlocks = []
+        self.plcInputRanges = [(0, self.total_blocks)]
+        self.plcOutputBlocks = None
+        declared = getattr(self.plcModule, 'PLC_SECTIONS', None)
+        covered = {block for block, is_covered in enumerate(self.blocksCovered) if is_covered}
+        if not declared or not covered:
+            return
+        
+        sections = []
+        input_blocks = set(covered)
+        output_blocks = set()
+        for name, declaration in declared.items():
+            if self._get_section_owner(declaration) in covered:
+                sections.append(name)
+                input_blocks |= self._expand_block_ranges(declaration.get('reads', []))
+                output_blocks |= self._expand_block_ranges(declaration.get('writes', []))
+        
+        self.plcSections = tuple(sections)
+        self.plcInputBlocks = sorted(block for block in input_blocks if block < self.total_blocks)
+        self.plcInputRanges = self._collapse_block_ranges(self.plcInputBlocks)
+        self.plcOutputBlocks = sorted(block for block in output_blocks if block < self.total_blocks)
+        print(f"[WAYSIDE] Controller {self.plcNum}: Evaluating PLC sections {list(self.plcSections)} "
+              f"({len(self.plcInputBlocks)} input blocks)")
+    
+    @staticmethod
+    def _get_section_owner(declaration) -> int:
+        """Get the block whose controller evaluates a PLC section"""
+        if 'owner' in declaration:
+            return declaration['owner']
+        block_ranges = declaration.get('writes') or declaration.get('reads') or [(0, 1)]
+        return min(start for start, end in block_ranges)
+    
+    @staticmethod
+    def _expand_block_ranges(block_ranges) -> set:
+        """Expand half-open (start, end) block ranges into a set of block numbers"""
+        blocks = set()
+        for start, end in block_ranges:
+            blocks.update(range(start, end))
+        return blocks
+    
+    @staticmethod
+    def _collapse_block_ranges(blocks) -> List[tuple]:
+        """Collapse sorted block numbers into half-open (start, end) runs"""
+        ranges = []
+        for block in blocks:
+            if ranges and ranges[-1][1] == block:
+                ranges[-1] = (ranges[-1][0], block + 1)
+            else:
+                ranges.append((block, block + 1))
+        return ranges
     # ========== CTC Communication Functions ==========
     
     def command_train(self, suggestedSpeed: List[int], authority: List[int], 
@@ -128,51 +333,148 @@ class WaysideController(QObject):
             print(f"[WAYSIDE] Controller {self.plcNum}: Received CTC commands")
             print(f"  Active commands: {len([i for i, s in enumerate(suggestedSpeed) if s > 0])}")
 
-            # Store CTC commands for processing
-            self.ctc_block_numbers = blockNum.copy()
+            with self.ctcInputs.lock:
+                back = self.ctcInputs.back
+                
+                # Store CTC commands for processing
+                back['block_numbers'][:] = blockNum
+                self.ctcInputs.mark('block_numbers')
 
-            # Store CTC suggested speeds and authorities for PLC input
-            for i, block in enumerate(blockNum):
-                if block < self.total_blocks and i < len(suggestedSpeed):
-                    self.ctc_suggested_speeds[block] = suggestedSpeed[i]
-                if block < self.total_blocks and i < len(authority):
-                    self.ctc_authorities[block] = bool(authority[i])
-            
-            # Store pass-through data from CTC
-            for i, block in enumerate(blockNum):
-                if block < self.total_blocks and i < len(nextStation):
-                    self.ctc_station_numbers[block] = nextStation[i]
-                if block < self.total_blocks and i < len(updateBlockInQueue):
-                    self.ctc_UpdateBlockInQueue[block] = int(updateBlockInQueue[i])
+                # Store CTC suggested speeds and authorities for PLC input
+                speeds = back['speed']
+                authorities = back['authority']
+                for i, block in enumerate(blockNum):
+                    if block < self.total_blocks and i < len(suggestedSpeed):
+                        speeds[block] = suggestedSpeed[i]
+                    if block < self.total_blocks and i < len(authority):
+                        authorities[block] = bool(authority[i])
+                written = [block for block in blockNum if block < self.total_blocks]
+                for name in ('speed', 'authority', 'station_numbers', 'update_block_in_queue'):
+                    self.ctcInputs.mark(name, written)
+                
+                # Store pass-through data from CTC
+                station_numbers = back['station_numbers']
+                update_flags = back['update_block_in_queue']
+                for i, block in enumerate(blockNum):
+                    if block < self.total_blocks and i < len(nextStation):
+                        station_numbers[block] = nextStation[i]
+                    if block < self.total_blocks and i < len(updateBlockInQueue):
+                        update_flags[block] = int(updateBlockInQueue[i])
+            self.request_scan()
             
         except Exception as e:
             print(f"[WAYSIDE] Error processing CTC commands: {e}")
-    
+
+    def command_train_delta(self, commands: List[tuple]):
+        """Receive changed CTC command entries only (called by CTC)
+
+        Each entry is (block, speed, authority, target, station, distance),
+        with block being the train's current block and the rest the command
+        for the target block, exactly as one array index of command_train().
+        An all-zero entry clears the command previously stored at block.
+        """
+        try:
+            with self.ctcInputs.lock:
+                back = self.ctcInputs.back
+                block_numbers = back['block_numbers']
+                speeds = back['speed']
+                authorities = back['authority']
+                station_numbers = back['station_numbers']
+                update_flags = back['update_block_in_queue']
+
+                for block, speed, authority, target, station, distance in commands:
+                    if not 0 <= block < self.total_blocks:
+                        continue
+                    block_numbers[block] = target
+                    self.ctcInputs.mark('block_numbers', (block,))
+                    if target < self.total_blocks:
+                        speeds[target] = speed
+                        authorities[target] = bool(authority)
+                        station_numbers[target] = station
+                        update_flags[target] = 0
+                        for name in ('speed', 'authority', 'station_numbers', 'update_block_in_queue'):
+                            self.ctcInputs.mark(name, (target,))
+            self.request_scan()
+
+        except Exception as e:
+            print(f"[WAYSIDE] Error processing CTC command changes: {e}")
+
     def set_occupied(self, block: int, block_state: bool):
         """Receive occupancy from CTC (called by CTC)"""
         try:
-            for i in range(self.total_blocks):
-                if i == block:
-                    self.ctc_occupied[i] = block_state
+            if 0 <= block < self.total_blocks:
+                with self.ctcInputs.lock:
+                    self.ctcInputs.back['occupied'][block] = block_state
+                    self.ctcInputs.mark('occupied', (block,))
+            self.request_scan()
 
         except Exception as e:
             print(f"[WAYSIDE] Error processing occupancy data: {e}")
     
     def send_updates_to_ctc(self):
-        """Send current actual states to CTC"""
+        """Send current actual states to CTC
+        
+        The first publish sends full arrays. After that only entries that
+        changed (XOR against the last published bitset) are sent, when the
+        communication object supports the delta methods.
+        """
         if self.ctc_commObj is None or not self.isOperational:
             return
             
         try:
-            # Send updates to CTC via communication object
-            self.ctc_commObj.update_occupied_blocks(self.block_occupancy, sending_controller=self)
-            self.ctc_commObj.update_switch_positions(self.switch_positions, sending_controller=self)
-            self.ctc_commObj.update_railway_crossings(self.railroad_crossings, sending_controller=self)
+            states = {
+                'occupied': self.block_occupancy,
+                'switches': self.switch_positions,
+                'crossings': self.railroad_crossings
+            }
+            supports_delta = hasattr(self.ctc_commObj, 'update_occupied_blocks_delta')
             
+            if not supports_delta or None in self.published_bits.values():
+                # Send full updates to CTC via communication object
+                self.ctc_commObj.update_occupied_blocks(self.block_occupancy, sending_controller=self)
+                self.ctc_commObj.update_switch_positions(self.switch_positions, sending_controller=self)
+                self.ctc_commObj.update_railway_crossings(self.railroad_crossings, sending_controller=self)
+                if supports_delta:
+                    self.published_bits = {name: self._pack_bits(values) for name, values in states.items()}
+                return
             
+            changes = {}
+            for name, values in states.items():
+                bits = self._pack_bits(values)
+                changes[name] = self._changed_entries(bits, self.published_bits[name])
+                self.published_bits[name] = bits
+            
+            # Nothing is sent for a state that did not change
+            if changes['occupied']:
+                self.ctc_commObj.update_occupied_blocks_delta(changes['occupied'], sending_controller=self)
+            if changes['switches']:
+                self.ctc_commObj.update_switch_positions_delta(changes['switches'], sending_controller=self)
+            if changes['crossings']:
+                self.ctc_commObj.update_railway_crossings_delta(changes['crossings'], sending_controller=self)
             
         except Exception as e:
             print(f"[WAYSIDE] Error sending updates to CTC: {e}")
+    
+    @staticmethod
+    def _pack_bits(values) -> int:
+        """Pack a block-length state array into an integer bitset (bit i = block i)"""
+        bits = 0
+        for i, value in enumerate(values):
+            if value:
+                bits |= 1 << i
+        return bits
+    
+    @staticmethod
+    def _changed_entries(bits: int, previous_bits: int) -> dict:
+        """Get {block: new state} for every bit that differs between two bitsets"""
+        changes = {}
+        changed = bits ^ previous_bits
+        while changed:
+            lowest = changed & -changed
+            block = lowest.bit_length() - 1
+            changes[block] = bool(bits & lowest)
+            changed ^= lowest
+        return changes
 
     # ========== Track Model Interface (Future) ==========
     
@@ -181,30 +483,39 @@ class WaysideController(QObject):
         if self.track_CommObj is None:
             return  # Track model not connected yet
 
-        # Future implementation for track model communication
+        # The communication object copies values into its own store, so the
+        # published buffers are passed without copying
         try:
-            self.track_CommObj.setSwitchStates(self.switch_positions.copy())
-            self.track_CommObj.setTrafficLightStates(self.traffic_lights.copy())
-            self.track_CommObj.setCrossingStates(self.railroad_crossings.copy())
-            self.track_CommObj.setAuthorities(self.authorities.copy())
-            self.track_CommObj.setCommandedSpeeds(self.speed.copy())
-            self.track_CommObj.setNextStationNumbers(self.station_numbers.copy())
-            self.track_CommObj.setUpdateBlockInQueue(self.UpdateBlockInQueue.copy())
+            self.track_CommObj.setSwitchStates(self.switch_positions)
+            self.track_CommObj.setTrafficLightStates(self.traffic_lights)
+            self.track_CommObj.setCrossingStates(self.railroad_crossings)
+            self.track_CommObj.setAuthorities(self.authorities)
+            self.track_CommObj.setCommandedSpeeds(self.speed)
+            self.track_CommObj.setNextStationNumbers(self.station_numbers)
+            self.track_CommObj.setUpdateBlockInQueue(self.UpdateBlockInQueue)
             #need a set occupancy function here
-            self.receive_from_track_model()
         except Exception as e:
             print(f"[WAYSIDE] Error communicating with track model: {e}")
 
     def receive_from_track_model(self):
-        """Receive everything from track model"""
+        """Receive the PLC input blocks from track model into the field state back buffer"""
         if self.track_CommObj is None:
             return
             
         try:
-            self.switch_positions = self.track_CommObj.getSwitchStates()
-            self.traffic_lights = self.track_CommObj.getTrafficLightStates()
-            self.railroad_crossings = self.track_CommObj.getCrossingStates()
-            self.block_occupancy = self.track_CommObj.getBlockOccupancy()
+            back = self.fieldStates.back
+            # Zero-copy views of the track model store; only slices are copied
+            sources = {
+                'switches': self.track_CommObj.getFieldView('switch_state'),
+                'lights': self.track_CommObj.getFieldView('traffic_light_state'),
+                'crossings': self.track_CommObj.getFieldView('crossing_state'),
+                'occupied': self.track_CommObj.getBlockOccupancy()
+            }
+            # Only the blocks this controller's PLC sections read are refreshed
+            for name, values in sources.items():
+                for start, end in self.plcInputRanges:
+                    block_values = values[start:end]
+                    back[name][start:end] = block_values.tolist() if hasattr(block_values, 'tolist') else block_values
         except Exception as e:
             print(f"[WAYSIDE] Error receiving from track model: {e}")
 
@@ -219,6 +530,9 @@ class WaysideController(QObject):
 
         # 3. Run PLC logic if loaded
         if self.plcModule is not None:
+            # Inputs arriving from here on are picked up by the next scan
+            self.scanPending = False
+            self.lastScanTime = time.monotonic()
             try:
                 # 1. Process CTC commands (copy CTC inputs to working arrays)
                 self.process_ctc_commands()
@@ -229,20 +543,39 @@ class WaysideController(QObject):
                 # Call PLC with Green Line signature (standardized for all PLCs)
                 # main(stop_event, block_occupancy, speed, authority, switches_actual, 
                 #      traffic_lights_actual, crossings_actual, block_numbers)
-                self.plcModule.main(
-                    self.block_occupancy, 
+                fields = self.fieldStates.back
+                plc_args = (
+                    fields['occupied'], 
                     self.speed, 
                     self.authorities, 
-                    self.switch_positions, 
-                    self.traffic_lights, 
-                    self.railroad_crossings,
+                    fields['switches'], 
+                    fields['lights'], 
+                    fields['crossings'],
                     self.block_numbers
                 )
+                if self.plcSections is not None:
+                    # Only the sections owning this controller's blocks
+                    self.plcModule.main(*plc_args, sections=self.plcSections)
+                else:
+                    self.plcModule.main(*plc_args)
+                # The PLC may stop blocks in the working arrays; restore them from
+                # the CTC inputs at the next swap
+                with self.ctcInputs.lock:
+                    self.ctcInputs.mark('speed', self.plcOutputBlocks)
+                    self.ctcInputs.mark('authority', self.plcOutputBlocks)
+                # Publish the scan results as one consistent snapshot
+                self.fieldStates.swap()
+                self._bind_field_buffers()
+                
                 # 4. Send commands to track model (if available)
                 self.send_commands_to_track_model()
                 
                 # 5. Send updates back to CTC
                 self.send_updates_to_ctc()
+                
+                if self.scanMode == 'event':
+                    # Taken after our own outputs were sent so they do not trigger a rescan
+                    self.trackInputVersion = self._get_track_input_version()
 
                 
             except Exception as e:
@@ -258,12 +591,9 @@ class WaysideController(QObject):
 
     def process_ctc_commands(self):
         """Process commands received from CTC"""
-        # Copy CTC inputs to working arrays for PLC to use
-        self.speed = self.ctc_suggested_speeds.copy()
-        self.authorities = self.ctc_authorities.copy()
-        self.UpdateBlockInQueue = self.ctc_UpdateBlockInQueue.copy()
-        self.station_numbers = self.ctc_station_numbers.copy()
-        self.block_numbers = self.ctc_block_numbers.copy()
+        # Swap the latest CTC inputs in as the working arrays for the PLC to use
+        self.ctcInputs.swap()
+        self._bind_ctc_buffers()
         #set block occupancy based on CTC input
         #self.track_CommObj.setBlockOccupancy(self.ctc_occupied.copy())
 
@@ -281,7 +611,9 @@ class WaysideController(QObject):
             'time_manager_connected': self.time_manager is not None,
             'plc_loaded': self.plcModule is not None,
             'timer_running': self.check_timer.isActive(),
+            'scan_mode': self.scanMode,
             'blocks_managed': sum(self.blocksCovered),
+            'plc_sections': list(self.plcSections) if self.plcSections is not None else 'all',
             'occupied_blocks': sum(self.block_occupancy),
             'ctc_connected': self.ctc_commObj is not None,
             'track_model_connected': self.track_CommObj is not None,
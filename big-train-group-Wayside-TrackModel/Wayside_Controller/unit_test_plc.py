@@ -0,0 +1,429 @@
+import copy
+import random
+import unittest
+
+from Wayside_Controller import GreenLinePlcV1, RedLinePlcV1
+
+
+# Per-block PLC logic as it was before the programs were vectorized with
+# NumPy. The vectorized programs must produce exactly the same outputs.
+
+def _reference_green_main( block_occupancy, speed, authority, switches_actual,
+         traffic_lights_actual, crossings_actual, block_numbers):
+    speed_hazard = [False] * 151  # Initialize speed hazard list for all blocks
+    switches = [False] * 6
+    traffic_lights = [False] * 14  # Updated to handle all switch entrance lights
+    crossings = [False] * 1
+
+    def speed_hazard_to_speed_authority():
+        for i in range(len(speed_hazard)):
+            for z in range(len(block_numbers)):
+                if speed_hazard[i]== True & block_numbers[z] == i:
+                    speed[i] = 0
+                    authority[i] = 0
+
+    def map_track_objects():
+        switch_mapping = {
+            12: 0,  # Switch at block 12
+            29: 1,  # Switch at block 29
+            58: 2,  # Switch at block 58 (yard connection)
+            62: 3,  # Switch at block 62 (yard connection)
+            76: 4,  # Switch at block 76 (used in main logic)
+            85: 5   # Switch at block 85 (used in main logic)
+        }
+
+        traffic_light_mapping = {
+            12: 0,   # Entrance to block 12 from block 11
+            13: 1,   # Entrance to block 13 from block 12
+            1: 2,    # Entrance to block 1 from block 2
+
+            29: 3,   # Entrance to block 29 from block 28
+            30: 4,   # Entrance to block 30 from block 29
+            150: 5,  # Entrance to block 150 from block 29
+
+            58: 6,   # Entrance to yard switch at block 58 from block 57
+
+            62: 7,   # Entrance to block 62 from yard
+
+            76: 8,   # Entrance to block 76 from block 75 - used in main logic
+            77: 9,   # Entrance to block 77 from block 76 - used in main logic
+            101: 10, # Entrance to block 101 from block 77
+
+            85: 11,  # Entrance to block 85 from block 84 - used in main logic
+            86: 12,  # Entrance to block 86 from block 85 - used in main logic
+            100: 13  # Entrance to block 100 from block 85
+        }
+
+        crossing_mapping = {
+            19: 0  # RAILWAY CROSSING at block 19 maps to crossings[0]
+        }
+
+        for i in range(len(block_numbers)):
+            block_num = i
+
+            if block_num in switch_mapping:
+                switch_index = switch_mapping[block_num]
+                if switch_index < len(switches_actual):
+                    switches_actual[switch_index] = switches[switch_index]
+
+            if block_num in traffic_light_mapping:
+                light_index = traffic_light_mapping[block_num]
+                if light_index < len(traffic_lights_actual):
+                    traffic_lights_actual[light_index] = traffic_lights[light_index]
+
+            if block_num in crossing_mapping:
+                crossing_index = crossing_mapping[block_num]
+                if crossing_index < len(crossings_actual):
+                    crossings_actual[crossing_index] = crossings[crossing_index]
+
+    def N_occupied():
+        for i in range(77, 86):
+            if block_occupancy[i]:
+                return True
+        return False
+
+    def Q_occupied():
+        for i in range(98, 101):
+            if block_occupancy[i]:
+                return True
+        return False
+
+    def M_occupied():
+        for i in range(74, 77):
+            if block_occupancy[i]:
+                return True
+        return False
+
+    def OPQ_occupied():
+        for i in range(86, 101):
+            if block_occupancy[i]:
+                return True
+        return False
+
+    def set_Q_hazard(truth_val):
+        for i in range(98, 101):
+            speed_hazard[i] = truth_val
+
+    def set_M_hazard(truth_val):
+        for i in range(74, 77):
+            speed_hazard[i] = truth_val
+
+    def J_is_hazard():
+        for i in range(58, 63):
+            if speed_hazard[i] == False:
+                return False
+        return True
+
+    def set_J_hazard(truth_val):
+        for i in range(58, 63):
+            speed_hazard[i] = truth_val
+
+    def reset_hazard():
+        for i in range(0, len(speed_hazard)):
+            speed_hazard[i] = False
+
+    J_hazard = J_is_hazard()
+
+    reset_hazard()
+
+    for i in range(36, 77):
+        speed_hazard[i] = False
+        if block_occupancy[i]== True:
+            for z in range(36,77):
+                if block_numbers[z] == i:
+                    speed_hazard[z] = True
+
+    if J_hazard == True:
+        set_J_hazard(True)
+
+    for i in range(86, 101):
+        speed_hazard[i] = False
+        if block_occupancy[i]== True:
+            for z in range(86,101):
+                if block_numbers[z] == i:
+                    speed_hazard[z] = True
+
+    for i in range(105, 117):
+        speed_hazard[i] = False
+        if block_occupancy[i]== True:
+            for z in range(105,117):
+                if block_numbers[z] == i:
+                    speed_hazard[z] = True
+
+    if N_occupied() == False and OPQ_occupied() == False:
+        switches[4] = False
+        switches[5] = True
+        traffic_lights[8] = True   # Block 76 entrance (from block 75)
+        traffic_lights[9] = False  # Block 77 entrance (from block 76)
+        traffic_lights[11] = True  # Block 85 entrance (from block 84)
+        traffic_lights[12] = False # Block 86 entrance (from block 85)
+
+        set_M_hazard(False)
+
+    elif (N_occupied() == True and not block_occupancy[76]) or OPQ_occupied() == True:
+        switches[4] = True
+        traffic_lights[8] = False  # Block 76 entrance (from block 75)
+        traffic_lights[9] = True   # Block 77 entrance (from block 76)
+        set_M_hazard(True)
+
+        if N_occupied() == True and not block_occupancy[100]:
+            switches[5] = False
+            traffic_lights[11] = False # Block 85 entrance (from block 84)
+            traffic_lights[12] = True  # Block 86 entrance (from block 85)
+
+        elif N_occupied() == False:
+            switches[5] = True
+            traffic_lights[11] = True  # Block 85 entrance (from block 84)
+            traffic_lights[12] = False # Block 86 entrance (from block 85)
+
+    crossings[0] = False # Default is up
+    for i in range(4):
+        if block_occupancy[19 - i]: # block 19 is the railroad crossing
+            crossings[0] = True # Put the crossing down
+
+    speed_hazard_to_speed_authority()
+    map_track_objects()
+
+
+def _reference_red_main(block_occupancy, speed, authority, switches_actual,
+         traffic_lights_actual, crossings_actual, block_numbers):
+    speed_hazard = [False] * 77  # Initialize speed hazard list for all Red Line blocks
+    switches = [False] * 7       # Red line has 7 switches
+    traffic_lights = [False] * 10
+    crossings = [False] * 2
+
+    def speed_hazard_to_speed_authority():
+        """Apply speed hazards to speed and authority commands."""
+        for i in range(len(speed_hazard)):
+            for z in range(len(block_numbers)):
+                if speed_hazard[i] == True & block_numbers[z] == i:
+                    speed[i] = 0
+                    authority[i] = 0
+
+    def map_track_objects():
+        """Map track objects to their physical locations."""
+        switch_mapping = {
+            9: 0,   # Yard switch at block 9
+            15: 1,  # Block 15 ↔ Block 16; Block 1 ↔ Block 16
+            27: 2,  # Block 27 ↔ Block 28; Block 27 ↔ Block 76
+            32: 3,  # Block 32 ↔ Block 33; Block 33 ↔ Block 72
+            38: 4,  # Block 38 ↔ Block 39; Block 38 ↔ Block 71
+            43: 5,  # Block 43 ↔ Block 44; Block 44 ↔ Block 67
+            52: 6   # Block 52 ↔ Block 53; Block 52 ↔ Block 66
+        }
+
+        traffic_light_mapping = {
+            9: 0,    # Yard entrance
+
+            15: 1,   # Entrance to block 15
+            16: 2,   # Entrance to block 16 from block 15
+            1: 3,    # Entrance to block 1
+
+            27: 4,   # Entrance to block 27
+            28: 5,   # Entrance to block 28 from block 27
+            76: 6,   # Entrance to block 76 from block 27
+
+            32: 7,   # Switch at block 32
+            38: 8,   # Switch at block 38
+            43: 9    # Switch at block 43
+        }
+
+        crossing_mapping = {
+            47: 0  # RAILWAY CROSSING at block 47 maps to crossings[0]
+        }
+
+        for i in range(len(block_numbers)):
+            block_num = i
+
+            if block_num in switch_mapping:
+                switch_index = switch_mapping[block_num]
+                if switch_index < len(switches_actual):
+                    switches_actual[switch_index] = switches[switch_index]
+
+            if block_num in traffic_light_mapping:
+                light_index = traffic_light_mapping[block_num]
+                if light_index < len(traffic_lights_actual):
+                    traffic_lights_actual[light_index] = traffic_lights[light_index]
+
+            if block_num in crossing_mapping:
+                crossing_index = crossing_mapping[block_num]
+                if crossing_index < len(crossings_actual):
+                    crossings_actual[crossing_index] = crossings[crossing_index]
+
+    def FGHIJ_occupied():
+        """Check if sections F, G, H, I, J (blocks 16-52) are occupied."""
+        for i in range(16, 53):
+            if block_occupancy[i] == True:
+                return True
+        return False
+
+    def ABC_occupied():
+        """Check if sections A, B, C (blocks 1-9) are occupied."""
+        for i in range(1, 10):
+            if block_occupancy[i] == True:
+                return True
+        return False
+
+    def set_N_speed_hazard(truth_value):
+        """Set speed hazard for section N (blocks 64-66)."""
+        for i in range(64, 67):
+            if i < len(speed_hazard):
+                speed_hazard[i] = truth_value
+
+    def set_A_speed_hazard(truth_value):
+        """Set speed hazard for section A (blocks 1-3)."""
+        for i in range(1, 4):
+            if i < len(speed_hazard):
+                speed_hazard[i] = truth_value
+
+    def reset_hazard():
+        """Reset all speed hazards to False."""
+        for i in range(0, len(speed_hazard)):
+            speed_hazard[i] = False
+
+    switches[1] = True
+    up_through_H = False
+
+    reset_hazard()
+
+    if block_occupancy[16] == True and not block_occupancy[17]:
+        up_through_H = False
+
+    if block_occupancy[52] == True and not block_occupancy[51]:
+        up_through_H = True
+
+    if up_through_H == True:
+        switches[2] = True   # Block 27 switch
+        switches[3] = False  # Block 32 switch
+        switches[4] = True   # Block 38 switch
+        switches[5] = False  # Block 43 switch
+
+        traffic_lights[5] = True
+        traffic_lights[6] = False
+        traffic_lights[7] = True
+        traffic_lights[8] = False
+        traffic_lights[9] = False
+    else:
+        switches[2] = False  # Block 27 switch
+        switches[3] = True   # Block 32 switch
+        switches[4] = False  # Block 38 switch
+        switches[5] = True   # Block 43 switch
+
+        traffic_lights[5] = False
+        traffic_lights[6] = True
+        traffic_lights[7] = False
+        traffic_lights[8] = True
+        traffic_lights[9] = True
+
+    if up_through_H == False:
+        for i in range(20, 53):
+            if block_occupancy[i] == True:
+                for j in range(1, 5):
+                    if (i - j) >= 0 and (i - j) < len(speed_hazard):
+                        speed_hazard[i - j] = True
+    else:
+        for i in range(20, 53):
+            if block_occupancy[i] == True:
+                for j in range(1, 5):
+                    if (i + j) < len(speed_hazard):
+                        speed_hazard[i + j] = True
+
+    if FGHIJ_occupied() == True or ABC_occupied() == True:
+        speed_hazard[0] = True
+    else:
+        speed_hazard[0] = False
+
+    if FGHIJ_occupied() == False:
+        switches[6] = True  # Block 52 switch
+        set_A_speed_hazard(False)
+
+        if ABC_occupied() == True:
+            set_N_speed_hazard(True)
+        else:
+            set_N_speed_hazard(False)
+    elif FGHIJ_occupied() == True and not block_occupancy[66] and not block_occupancy[1]:
+        switches[6] = False  # Block 52 switch
+        switches[1] = True   # Block 15 switch
+        set_A_speed_hazard(True)
+        set_N_speed_hazard(True)
+
+    crossings[0] = False  # Default is up
+    for i in range(0, 3):
+        if ((47 - i) >= 0 and block_occupancy[47 - i]) or ((47 + i) < len(block_occupancy) and block_occupancy[47 + i]):
+            crossings[0] = True  # Put the crossing down
+            break
+
+    speed_hazard_to_speed_authority()
+
+    map_track_objects()
+
+
+class TestVectorizedPlcEquivalence(unittest.TestCase):
+    """Vectorized PLC programs against the original per-block logic"""
+
+    TRIALS = 300
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+
+    def _random_inputs(self, block_count, output_length):
+        """Random occupancy (with failed blocks reading as occupied), commands and field device states"""
+        rng = self.rng
+        density = rng.choice((0.02, 0.1, 0.3))
+        occupancy = [rng.random() < density for _ in range(block_count)]
+        for block in range(block_count):
+            if rng.random() < 0.03:  # Track circuit failure reports the block occupied
+                occupancy[block] = True
+        # Commanded block numbers are mostly just ahead of or behind each block
+        block_numbers = [
+            min(max(block + rng.randint(-2, 5), 0), block_count - 1) if rng.random() < 0.8
+            else rng.randrange(block_count)
+            for block in range(block_count)
+        ]
+        return (
+            occupancy,
+            [rng.randint(0, 3) for _ in range(block_count)],
+            [rng.random() < 0.5 for _ in range(block_count)],
+            [rng.random() < 0.5 for _ in range(output_length)],
+            [rng.random() < 0.5 for _ in range(output_length)],
+            [rng.random() < 0.5 for _ in range(output_length)],
+            block_numbers
+        )
+
+    def _assert_same_outputs(self, vectorized_main, reference_main, block_count):
+        for trial in range(self.TRIALS):
+            inputs = self._random_inputs(block_count, block_count)
+            expected = copy.deepcopy(inputs)
+            actual = copy.deepcopy(inputs)
+            reference_main(*expected)
+            vectorized_main(*actual)
+            with self.subTest(trial=trial):
+                for name, want, got in zip(('occupancy', 'speed', 'authority', 'switches',
+                                            'lights', 'crossings', 'block_numbers'), expected, actual):
+                    self.assertEqual(got, want, name)
+
+    def test_green_line_matches_per_block_logic(self):
+        """Test the Green line PLC over the whole line"""
+        self._assert_same_outputs(GreenLinePlcV1.main, _reference_green_main, GreenLinePlcV1.GREEN_LINE_BLOCKS)
+
+    def test_red_line_matches_per_block_logic(self):
+        """Test the Red line PLC over the whole line"""
+        self._assert_same_outputs(RedLinePlcV1.main, _reference_red_main, RedLinePlcV1.RED_LINE_BLOCKS)
+
+    def test_green_line_switch_n_branches(self):
+        """Test each section N switch branch against the per-block logic"""
+        block_count = GreenLinePlcV1.GREEN_LINE_BLOCKS
+        for occupied_blocks in ((), (80,), (76, 80), (80, 100), (90,), (76,), (75,)):
+            occupancy = [block in occupied_blocks for block in range(block_count)]
+            inputs = (occupancy, [3] * block_count, [True] * block_count, [False] * block_count,
+                      [False] * block_count, [False] * block_count, list(range(block_count)))
+            expected = copy.deepcopy(inputs)
+            actual = copy.deepcopy(inputs)
+            _reference_green_main(*expected)
+            GreenLinePlcV1.main(*actual)
+            with self.subTest(occupied=occupied_blocks):
+                self.assertEqual(list(actual), list(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
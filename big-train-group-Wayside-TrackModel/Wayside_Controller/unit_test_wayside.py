@@ -1,12 +1,41 @@
+import copy
+import os
+import random
 import unittest
+from unittest.mock import Mock
+
+import numpy as np
 
 # Add the path to your wayside module
 
 try:
-    from Wayside_Controller.WaysideController import WaysideController
+    from Wayside_Controller.WaysideController import WaysideController, DoubleBuffer
 except ImportError:
     print("Warning: Could not import WaysideController")
     WaysideController = None
+    DoubleBuffer = None
+
+from Wayside_Controller import GreenLinePlcV1
+
+PLC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Green line split between its two controllers (see WAYSIDE_CONFIG in master_control)
+GREEN_SPLIT = (range(0, 76), range(76, 151))
+
+
+def make_green_controller(blocks, plc_num=1):
+    """Create a Green line controller covering the given blocks"""
+    blocks = set(blocks)
+    return WaysideController(
+        data={"Green": {"auto": []}},
+        line="Green",
+        mode="auto",
+        auto=True,
+        plc_num=plc_num,
+        plc_file=os.path.join(PLC_DIR, "GreenLinePlcV1.py"),
+        blocks_covered=[block in blocks for block in range(151)],
+        total_blocks=151
+    )
 
 
 class TestWaysideController(unittest.TestCase):
@@ -53,5 +82,220 @@ class TestWaysideController(unittest.TestCase):
         self.assertFalse(self.controller.isOperational)
 
 
+
+class TestPlcSectionOwnership(unittest.TestCase):
+    """PLC section selection for controllers that split a line"""
+
+    def setUp(self):
+        if WaysideController is None:
+            self.skipTest("WaysideController not available")
+        self.controllers = [make_green_controller(blocks, plc_num)
+                            for plc_num, blocks in enumerate(GREEN_SPLIT, start=1)]
+
+    def test_each_section_has_exactly_one_owner(self):
+        """Test that every Green section runs on exactly one controller"""
+        for name in GreenLinePlcV1.PLC_SECTIONS:
+            owners = [c.plcNum for c in self.controllers if name in c.plcSections]
+            with self.subTest(section=name):
+                self.assertEqual(len(owners), 1)
+
+    def test_sections_crossing_the_split(self):
+        """Test that sections writing on both sides of the split go to their owner block's controller"""
+        first, second = self.controllers
+        self.assertIn('hazard_IM', first.plcSections)
+        self.assertNotIn('hazard_IM', second.plcSections)
+        self.assertIn('switch_N', second.plcSections)
+        self.assertNotIn('switch_N', first.plcSections)
+        self.assertIn('fixed_switches', first.plcSections)
+        self.assertNotIn('fixed_switches', second.plcSections)
+
+    def test_input_blocks_cover_owned_section_reads(self):
+        """Test that each controller reads its covered blocks plus the blocks its sections read"""
+        first, second = self.controllers
+        self.assertEqual(first.plcInputRanges, [(0, 77)])
+        # Section N logic reads blocks 74 and 75 from the other controller
+        self.assertEqual(second.plcInputRanges, [(74, 151)])
+        self.assertNotIn(73, second.plcInputBlocks)
+
+    def test_track_inputs_limited_to_input_blocks(self):
+        """Test that only the PLC input blocks are read from the track model"""
+        second = self.controllers[1]
+        track = Mock()
+        track.getBlockOccupancy.return_value = [True] * 151
+        track.getFieldView.return_value = np.ones(151, dtype=np.uint8)
+        second.track_CommObj = track
+
+        second.receive_from_track_model()
+        occupancy = second.fieldStates.back['occupied']
+        self.assertTrue(all(occupancy[74:]))
+        self.assertFalse(any(occupancy[:74]))
+
+    def test_split_sections_match_whole_line(self):
+        """Test that each output written by its owning controller matches a whole-line scan"""
+        rng = random.Random(42)
+        for trial in range(50):
+            inputs = (
+                [rng.random() < 0.15 for _ in range(151)],
+                [rng.randint(0, 3) for _ in range(151)],
+                [rng.random() < 0.5 for _ in range(151)],
+                [False] * 151, [False] * 151, [False] * 151,
+                [min(block + rng.randint(0, 4), 150) for block in range(151)]
+            )
+            whole = copy.deepcopy(inputs)
+            GreenLinePlcV1.main(*whole)
+            for controller in self.controllers:
+                split = copy.deepcopy(inputs)
+                GreenLinePlcV1.main(*split, sections=controller.plcSections)
+                output_blocks = GreenLinePlcV1._get_output_blocks(controller.plcSections)
+                for mapping, index in ((GreenLinePlcV1.SWITCH_MAPPING, 3),
+                                       (GreenLinePlcV1.TRAFFIC_LIGHT_MAPPING, 4),
+                                       (GreenLinePlcV1.CROSSING_MAPPING, 5)):
+                    for block, output_index in mapping.items():
+                        if block in output_blocks:
+                            with self.subTest(trial=trial, controller=controller.plcNum, block=block):
+                                self.assertEqual(split[index][output_index], whole[index][output_index])
+                if 'speed_authority' in controller.plcSections:
+                    self.assertEqual(split[1][:2], whole[1][:2])
+                    self.assertEqual(split[2][:2], whole[2][:2])
+
+
+
+class TestEventDrivenScan(unittest.TestCase):
+    """Event-driven scans triggered by track model store changes"""
+
+    def setUp(self):
+        if WaysideController is None:
+            self.skipTest("WaysideController not available")
+        from Master_Interface.master_control import CommunicationObject
+        self.controller = make_green_controller(range(151))
+        self.controller.scanMode = 'event'
+        self.track = CommunicationObject("1", "Green")
+        self.controller.set_track_model_communication_object(self.track)
+        # First tick always scans and publishes the outputs to the track model
+        self.controller.scan_tick()
+        self.controller.update_cycle = Mock(wraps=self.controller.update_cycle)
+
+    def test_unchanged_inputs_skip_scan(self):
+        """Test that a tick with no new inputs does not run the PLC"""
+        self.controller.scan_tick()
+        self.controller.scan_tick()
+        self.controller.update_cycle.assert_not_called()
+
+    def test_rewriting_same_values_skips_scan(self):
+        """Test that rewriting the stored values unchanged does not run the PLC"""
+        self.track.setSwitchStates(self.track.getSwitchStates())
+        self.controller.scan_tick()
+        self.controller.update_cycle.assert_not_called()
+
+    def test_changed_track_input_triggers_scan(self):
+        """Test that a changed track model value runs exactly one scan"""
+        lights = self.track.getTrafficLightStates()
+        lights[5] = 1 - lights[5]
+        self.track.setTrafficLightStates(lights)
+        self.controller.scan_tick()
+        self.controller.scan_tick()
+        self.assertEqual(self.controller.update_cycle.call_count, 1)
+
+    def test_ctc_command_triggers_scan(self):
+        """Test that a CTC input still requests a scan"""
+        self.controller.request_scan()
+        self.controller.scan_tick()
+        self.assertEqual(self.controller.update_cycle.call_count, 1)
+
+
+
+class TestDoubleBuffer(unittest.TestCase):
+    """Front/back buffer handoff"""
+
+    def setUp(self):
+        if DoubleBuffer is None:
+            self.skipTest("DoubleBuffer not available")
+        self.buffer = DoubleBuffer({'speed': [0] * 5, 'occupied': [False] * 5})
+
+    def test_swap_exchanges_references(self):
+        """Test that swap publishes the back list itself rather than a copy"""
+        back_speed = self.buffer.back['speed']
+        front_speed = self.buffer.front['speed']
+        self.buffer.swap()
+        self.assertIs(self.buffer.front['speed'], back_speed)
+        self.assertIs(self.buffer.back['speed'], front_speed)
+
+    def test_marked_entries_carry_to_new_back(self):
+        """Test that writes made before a swap are in both buffers after it"""
+        with self.buffer.lock:
+            self.buffer.back['speed'][2] = 3
+            self.buffer.mark('speed', (2,))
+        self.buffer.swap()
+        self.assertEqual(self.buffer.front['speed'], [0, 0, 3, 0, 0])
+        self.assertEqual(self.buffer.back['speed'], [0, 0, 3, 0, 0])
+        # Survives the next swap with no new writes
+        self.buffer.swap()
+        self.assertEqual(self.buffer.front['speed'], [0, 0, 3, 0, 0])
+
+    def test_only_marked_entries_are_copied(self):
+        """Test that unmarked entries are not copied into the new back buffer"""
+        self.buffer.front['speed'][4] = 9  # Unmarked change to the front
+        with self.buffer.lock:
+            self.buffer.back['speed'][1] = 2
+            self.buffer.mark('speed', (1,))
+        self.buffer.swap()
+        self.assertEqual(self.buffer.back['speed'], [0, 2, 0, 0, 9])
+        self.assertEqual(self.buffer.dirty['speed'], set())
+
+    def test_mark_whole_field(self):
+        """Test that marking a field without indices copies all of it"""
+        with self.buffer.lock:
+            self.buffer.back['occupied'][:] = [True] * 5
+            self.buffer.mark('occupied')
+            self.buffer.mark('occupied', (0,))
+        self.buffer.swap()
+        self.assertEqual(self.buffer.back['occupied'], [True] * 5)
+        self.assertEqual(self.buffer.dirty['occupied'], set())
+
+
+class TestScanBufferHandoff(unittest.TestCase):
+    """CTC inputs and field states across consecutive scans"""
+
+    def setUp(self):
+        if WaysideController is None:
+            self.skipTest("WaysideController not available")
+        from Master_Interface.master_control import CommunicationObject
+        self.controller = make_green_controller(range(76))
+        self.track = CommunicationObject("1", "Green")
+        self.controller.set_track_model_communication_object(self.track)
+
+    def test_ctc_command_persists_across_scans(self):
+        """Test that a CTC command stays in the working arrays on later scans"""
+        self.controller.set_occupied(20, True)
+        self.controller.command_train_delta([(20, 2, 1, 22, 5, 2)])
+        for scan in range(3):
+            self.controller.update_cycle()
+            with self.subTest(scan=scan):
+                self.assertEqual(self.controller.speed[22], 2)
+                self.assertTrue(self.controller.authorities[22])
+                self.assertEqual(self.controller.station_numbers[22], 5)
+                self.assertEqual(self.controller.block_numbers[20], 22)
+        self.assertEqual(self.controller.ctc_suggested_speeds[22], 2)
+
+    def test_plc_stop_does_not_leak_into_ctc_inputs(self):
+        """Test that a PLC change to the working arrays is reset from the CTC input"""
+        self.controller.command_train_delta([(5, 3, 1, 0, 0, 0)])
+        self.controller.update_cycle()
+        self.assertEqual(self.controller.speed[0], 0)  # Stopped by the PLC
+        self.assertEqual(self.controller.ctc_suggested_speeds[0], 3)
+        self.controller.ctcInputs.swap()
+        self.assertEqual(self.controller.ctcInputs.front['speed'][0], 3)
+
+    def test_track_inputs_read_through_field_views(self):
+        """Test that the scan reads track states through the store views"""
+        switches = [0] * 151
+        switches[40] = 1
+        self.track.setSwitchStates(switches)
+        self.track.getSwitchStates = Mock(side_effect=AssertionError("copied whole column"))
+        self.controller.receive_from_track_model()
+        self.assertEqual(self.controller.fieldStates.back['switches'][40], 1)
+        self.assertIsInstance(self.controller.fieldStates.back['switches'][40], int)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
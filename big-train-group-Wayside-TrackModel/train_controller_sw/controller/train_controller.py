@@ -33,12 +33,17 @@ class TrackDataError(Exception):
     pass
 
 try:
-    from track_reader import TrackLayoutReader
+    try:
+        # Package import shares the layout registry with the CTC and Track Model
+        from Track_Reader.track_reader import TrackLayoutReader, get_shared_track_reader
+    except ImportError:
+        from track_reader import TrackLayoutReader, get_shared_track_reader
     TRACK_DATA_AVAILABLE = True
 except ImportError as e:
     print(f"CRITICAL ERROR: Cannot import track data loader: {e}")
     TRACK_DATA_AVAILABLE = False
     TrackLayoutReader = None
+    get_shared_track_reader = None
 
 MAX_POWER_KW = 120.0  # Update after verifying the actual maximum power of the train
 
@@ -106,8 +111,9 @@ class TrainController:
             if not os.path.exists(excel_path):
                 raise FileNotFoundError(f"Excel file not found at {excel_path}")
             
-            self.track_reader = TrackLayoutReader(excel_path)
-            self.track_data = self.track_reader.generate_controller_json(normalized_color)
+            # Shared across all trains - only the first train pays for loading the layout
+            self.track_reader = get_shared_track_reader(excel_path)
+            self.track_data = self.track_reader.get_line_view(normalized_color).controller_json
             print(f"Successfully generated track data for {normalized_color} Line")
             print(f"Track data contains {len(self.track_data['blocks'])} blocks")
         except Exception as e: